@@ -0,0 +1,119 @@
+"""
+A script to benchmark the tracking server sending an artifact file of an S3 artifact store, as
+done by the `get-artifact` endpoints.
+
+# How to run:
+
+```
+# ===== Against an in-memory S3 stand-in (moto) =====
+
+python dev/benchmarks/artifact_serving.py --file-mb 256
+
+# ===== Against a real bucket =====
+
+python dev/benchmarks/artifact_serving.py --artifact-uri s3://my-bucket/benchmarks --file-mb 1024
+```
+
+The script reports the time to the first byte and to the last byte of the response for the whole
+file and for its last MB (`Range: bytes=-1048576`), when the file is downloaded to a temporary
+directory before being sent, like the server used to do, and when it is streamed from the artifact
+store.
+
+The moto stand-in runs in the benchmark process and has no network latency, so it mostly measures
+the cost of writing and reading the temporary file. Use a real bucket for realistic numbers.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from flask import send_file
+
+from mlflow.server import app
+from mlflow.server.artifact_serving import send_artifact
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+MB = 1024 * 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark sending artifact files")
+    parser.add_argument(
+        "--artifact-uri",
+        default=None,
+        help="S3 URI to upload the artifact to. If unspecified, uploads to a moto S3 stand-in.",
+    )
+    parser.add_argument("--file-mb", type=int, default=256)
+    return parser.parse_args()
+
+
+def send_downloaded_artifact(repo, path):
+    dst_path = tempfile.mkdtemp()
+    response = send_file(repo.download_artifacts(path, dst_path), conditional=True)
+    response.call_on_close(lambda: shutil.rmtree(dst_path))
+    return response
+
+
+def benchmark(send, repo, path, headers):
+    with app.test_request_context(headers=headers):
+        start = time.time()
+        response = send(repo, path)
+        response.direct_passthrough = False
+        chunks = response.iter_encoded()
+        num_bytes = len(next(chunks))
+        first_byte = time.time() - start
+        for chunk in chunks:
+            num_bytes += len(chunk)
+        last_byte = time.time() - start
+        response.close()
+    return first_byte, last_byte, num_bytes
+
+
+def run(artifact_uri, args):
+    repo = S3ArtifactRepository("{}/{}".format(artifact_uri.rstrip("/"), uuid.uuid4().hex))
+    root = tempfile.mkdtemp()
+    try:
+        local_path = os.path.join(root, "model.bin")
+        with open(local_path, "wb") as f:
+            for _ in range(args.file_mb):
+                f.write(os.urandom(MB))
+        repo.log_artifact(local_path)
+    finally:
+        shutil.rmtree(root)
+
+    # The whole file is sent last since it is then cached by the server
+    for name, headers in [
+        ("last MB", {"Range": "bytes=-{}".format(MB)}),
+        ("whole file of {} MB".format(args.file_mb), {}),
+    ]:
+        for mode, send in [("download", send_downloaded_artifact), ("stream", send_artifact)]:
+            first_byte, last_byte, num_bytes = benchmark(send, repo, "model.bin", headers)
+            print(
+                "{} ({}): first byte {:.3f}s, last byte {:.3f}s, {} bytes".format(
+                    name, mode, first_byte, last_byte, num_bytes
+                )
+            )
+
+
+def main():
+    args = parse_args()
+    if args.artifact_uri is not None:
+        run(args.artifact_uri, args)
+        return
+
+    import boto3
+    import moto
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "NotARealAccessKey")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "NotARealSecretAccessKey")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_s3():
+        boto3.client("s3").create_bucket(Bucket="benchmark-bucket")
+        run("s3://benchmark-bucket/benchmarks", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+A script to check that `import mlflow` and `mlflow --help` stay within an import time budget.
+
+# How to run:
+
+```
+python dev/benchmarks/import_time.py --import-budget-ms 400 --cli-budget-ms 500
+```
+
+For each command, the script runs a fresh interpreter with `python -X importtime` several times
+and reports the median cumulative import time of the top-level module (`mlflow`, or `mlflow.cli`
+for `mlflow --help`) with the top-level packages that take the longest to import. It exits with a
+non-zero status if a median exceeds its budget, so that it can be used to catch import time
+regressions, e.g. a flavor or pandas being imported again by `import mlflow`.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check the import time of MLflow")
+    parser.add_argument("--import-budget-ms", type=float, default=400)
+    parser.add_argument("--cli-budget-ms", type=float, default=500)
+    parser.add_argument("--num-runs", type=int, default=5)
+    parser.add_argument("--num-slowest", type=int, default=10)
+    return parser.parse_args()
+
+
+def import_times(code):
+    """
+    Return the cumulative import time in milliseconds of each module imported by running the
+    specified code in a new interpreter, and the list of modules imported directly by the code.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            _, cumulative_us, _, module = match.groups()
+            times[module] = int(cumulative_us) / 1000.0
+    return times
+
+
+def check(name, code, module, budget_ms, args):
+    runs = [import_times(code) for _ in range(args.num_runs)]
+    runs.sort(key=lambda times: times[module])
+    median = runs[len(runs) // 2]
+    print("{}: {:.0f}ms (budget {:.0f}ms)".format(name, median[module], budget_ms))
+    slowest = sorted(
+        ((ms, m) for m, ms in median.items() if m != module and "." not in m), reverse=True
+    )[: args.num_slowest]
+    for ms, m in slowest:
+        print("    {:>8.1f}ms  {}".format(ms, m))
+    return median[module] <= budget_ms
+
+
+def main():
+    args = parse_args()
+    checks = [
+        ("import mlflow", "import mlflow", "mlflow", args.import_budget_ms),
+        (
+            "mlflow --help",
+            "import sys; from mlflow.cli import cli; sys.argv = ['mlflow', '--help']; cli()",
+            "mlflow.cli",
+            args.cli_budget_ms,
+        ),
+    ]
+    within_budget = [
+        check(name, code, module, budget, args) for name, code, module, budget in checks
+    ]
+    if not all(within_budget):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+A script to benchmark loading the same model from an S3 artifact store repeatedly, as done by
+processes serving or evaluating a model on the same host, with and without the local artifact
+cache set by `MLFLOW_ARTIFACT_CACHE_DIR`.
+
+# How to run:
+
+```
+# ===== Against an in-memory S3 stand-in (moto) =====
+
+python dev/benchmarks/repeated_model_loads.py --model-mb 256 --num-loads 5
+
+# ===== Against a real bucket =====
+
+python dev/benchmarks/repeated_model_loads.py --artifact-uri s3://my-bucket/benchmarks
+```
+
+The script logs a `python_function` model with a `--model-mb` MB weights file, then reports the
+time of each of `--num-loads` calls to `mlflow.pyfunc.load_model`. Without the cache, every load
+downloads the model. With the cache, the first load downloads the model into the cache, and the
+next ones copy it from the cache.
+
+The moto stand-in runs in the benchmark process and has no network latency, so it underestimates
+the download time. Use a real bucket for realistic numbers.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+import mlflow.pyfunc
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+MB = 1024 * 1024
+
+
+class Model(mlflow.pyfunc.PythonModel):
+    def predict(self, context, model_input):
+        return model_input
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark repeated model loads")
+    parser.add_argument(
+        "--artifact-uri",
+        default=None,
+        help="S3 URI to log the model to. If unspecified, logs to a moto S3 stand-in.",
+    )
+    parser.add_argument("--model-mb", type=int, default=256)
+    parser.add_argument("--num-loads", type=int, default=5)
+    return parser.parse_args()
+
+
+def log_model(artifact_uri, model_mb):
+    root = tempfile.mkdtemp()
+    try:
+        weights_path = os.path.join(root, "weights.bin")
+        with open(weights_path, "wb") as f:
+            for _ in range(model_mb):
+                f.write(os.urandom(MB))
+        model_path = os.path.join(root, "model")
+        mlflow.pyfunc.save_model(
+            model_path, python_model=Model(), artifacts={"weights": weights_path}
+        )
+        repo = S3ArtifactRepository("{}/{}".format(artifact_uri.rstrip("/"), uuid.uuid4().hex))
+        repo.log_artifacts(model_path, "model")
+        return repo.artifact_uri + "/model"
+    finally:
+        shutil.rmtree(root)
+
+
+def benchmark(model_uri, num_loads):
+    durations = []
+    for _ in range(num_loads):
+        start = time.time()
+        mlflow.pyfunc.load_model(model_uri)
+        durations.append(time.time() - start)
+    return durations
+
+
+def run(artifact_uri, args):
+    model_uri = log_model(artifact_uri, args.model_mb)
+    os.environ.pop("MLFLOW_ARTIFACT_CACHE_DIR", None)
+    no_cache = benchmark(model_uri, args.num_loads)
+    cache_dir = tempfile.mkdtemp()
+    try:
+        os.environ["MLFLOW_ARTIFACT_CACHE_DIR"] = cache_dir
+        cache = benchmark(model_uri, args.num_loads)
+    finally:
+        del os.environ["MLFLOW_ARTIFACT_CACHE_DIR"]
+        shutil.rmtree(cache_dir)
+    for name, durations in [("no cache", no_cache), ("cache", cache)]:
+        print(
+            "{} loads of a {} MB model ({}): first {:.2f}s, next ones {}".format(
+                args.num_loads,
+                args.model_mb,
+                name,
+                durations[0],
+                ", ".join("{:.2f}s".format(duration) for duration in durations[1:]),
+            )
+        )
+
+
+def main():
+    args = parse_args()
+    if args.artifact_uri is not None:
+        run(args.artifact_uri, args)
+        return
+
+    import boto3
+    import moto
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "NotARealAccessKey")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "NotARealSecretAccessKey")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_s3():
+        boto3.client("s3").create_bucket(Bucket="benchmark-bucket")
+        run("s3://benchmark-bucket/benchmarks", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+A script to benchmark the compression of the tracking REST API responses between a client and a
+local server.
+
+# How to run:
+
+```
+python dev/benchmarks/response_compression.py --num-runs 1000 --repeats 5
+```
+
+The script starts a tracking server with a SQLite backend store on a local port, creates
+`--num-runs` runs, then reports the bytes sent on the wire and the wall-clock time of a search of
+all the runs with each content coding supported by the server: `identity` (no compression),
+`gzip` and `zstd` if the `zstandard` package is installed. Since the server runs locally, the
+durations include the compression and decompression time but not the transfer time of a real
+network, which is estimated from the sizes for a given bandwidth with `--bandwidth-mbps`.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.server import ARTIFACT_ROOT_ENV_VAR, BACKEND_STORE_URI_ENV_VAR
+from mlflow.server.compression import _get_supported_encodings, decompress_request_data
+from mlflow.tracking import MlflowClient
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the compression of the REST API")
+    parser.add_argument("--num-runs", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--bandwidth-mbps", type=float, default=100)
+    parser.add_argument("--port", type=int, default=5055)
+    return parser.parse_args()
+
+
+def start_server(root, port):
+    env = dict(os.environ)
+    env[BACKEND_STORE_URI_ENV_VAR] = "sqlite:///" + os.path.join(root, "mlflow.db")
+    env[ARTIFACT_ROOT_ENV_VAR] = os.path.join(root, "artifacts")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            'from mlflow.server import app; app.run("127.0.0.1", {})'.format(port),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = "http://127.0.0.1:{}".format(port)
+    for _ in range(120):
+        try:
+            requests.get(url + "/health")
+            return url, process
+        except requests.ConnectionError:
+            time.sleep(0.5)
+    process.terminate()
+    raise Exception("The tracking server did not start")
+
+
+def create_runs(client, num_runs):
+    experiment_id = client.create_experiment("benchmark")
+    for i in range(num_runs):
+        run_id = client.create_run(experiment_id).info.run_id
+        client.log_batch(
+            run_id,
+            metrics=[Metric("metric_{}".format(j), float(i), 0, 0) for j in range(10)],
+            params=[Param("param_{}".format(j), str(i)) for j in range(10)],
+            tags=[RunTag("tag_{}".format(j), str(i)) for j in range(10)],
+        )
+    return experiment_id
+
+
+def search_runs(session, url, experiment_id, num_runs, encoding):
+    response = session.post(
+        url + "/api/2.0/mlflow/runs/search",
+        json={"experiment_ids": [experiment_id], "max_results": num_runs},
+        headers={"Accept-Encoding": encoding},
+        stream=True,
+    )
+    # Read the body as sent on the wire, then decode it as the client does
+    wire_bytes = response.raw.read(decode_content=False)
+    data = decompress_request_data(wire_bytes, response.headers.get("Content-Encoding"))
+    assert len(json.loads(data)["runs"]) == num_runs
+    return len(wire_bytes)
+
+
+def run(url, args):
+    experiment_id = create_runs(MlflowClient(url), args.num_runs)
+    session = requests.Session()
+    for encoding in ["identity"] + _get_supported_encodings():
+        durations = []
+        for _ in range(args.repeats):
+            start = time.time()
+            size = search_runs(session, url, experiment_id, args.num_runs, encoding)
+            durations.append(time.time() - start)
+        transfer_time = size * 8 / (args.bandwidth_mbps * 1e6)
+        print(
+            "search_runs of {} runs ({}): {} bytes, {:.3f}s, {:.3f}s at {} Mbps".format(
+                args.num_runs,
+                encoding,
+                size,
+                min(durations),
+                min(durations) + transfer_time,
+                args.bandwidth_mbps,
+            )
+        )
+
+
+def main():
+    args = parse_args()
+    root = tempfile.mkdtemp()
+    url, process = start_server(root, args.port)
+    try:
+        run(url, args)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+A script to benchmark the latency of many small `RestStore.log_metric` calls, with and without
+the pooled HTTP session used by `mlflow.utils.rest_utils.http_request`.
+
+# How to run:
+
+```
+# ===== Against a local Flask stand-in for the tracking server =====
+
+python dev/benchmarks/rest_log_metric.py --num-requests 2000
+```
+
+The stand-in server accepts every `log-metric` request without storing it, so the benchmark
+measures the client and connection overhead of each request. The "unpooled" mode opens a new
+connection for each request, as `http_request` did before it used a pooled session.
+"""
+
+import argparse
+import logging
+import socket
+import threading
+import time
+from unittest import mock
+
+import requests
+from flask import Flask, request
+from werkzeug.serving import make_server
+
+from mlflow.entities import Metric
+from mlflow.store.tracking.rest_store import RestStore
+from mlflow.utils.rest_utils import MlflowHostCreds
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark RestStore.log_metric latency")
+    parser.add_argument("--num-requests", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=0)
+    return parser.parse_args()
+
+
+def start_stand_in_server(port):
+    app = Flask(__name__)
+
+    @app.route("/api/2.0/mlflow/runs/log-metric", methods=["POST"])
+    def log_metric():  # pylint: disable=unused-variable
+        # Consume the request body so that the connection can be reused
+        request.get_data()
+        return "{}"
+
+    server = make_server("127.0.0.1", port, app, threaded=True)
+    # Keep connections alive between requests and disable Nagle's algorithm (inherited by the
+    # accepted sockets on Linux), like production WSGI servers do
+    server.RequestHandlerClass.protocol_version = "HTTP/1.1"
+    server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+_session_request = requests.Session.request
+
+
+def _unpooled_request(self, method, url, **kwargs):  # pylint: disable=unused-argument
+    # Equivalent to `requests.request`, which creates and closes a session for each request
+    with requests.Session() as session:
+        return _session_request(session, method, url, **kwargs)
+
+
+def benchmark(store, num_requests):
+    latencies = []
+    for step in range(num_requests):
+        start = time.time()
+        store.log_metric("run_id", Metric("m", float(step), int(time.time() * 1000), step))
+        latencies.append(time.time() - start)
+    latencies.sort()
+    return sum(latencies), latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    args = parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = start_stand_in_server(args.port)
+    creds = MlflowHostCreds("http://127.0.0.1:%s" % server.server_port)
+    store = RestStore(lambda: creds)
+    try:
+        with mock.patch("requests.Session.request", _unpooled_request):
+            results = [("unpooled", benchmark(store, args.num_requests))]
+        results.append(("pooled", benchmark(store, args.num_requests)))
+    finally:
+        server.shutdown()
+    for mode, (total, p50, p99) in results:
+        print(
+            "{}: {} requests in {:.2f}s ({:.0f} requests/sec, p50 {:.2f}ms, p99 {:.2f}ms)".format(
+                mode, args.num_requests, total, args.num_requests / total, p50 * 1000, p99 * 1000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
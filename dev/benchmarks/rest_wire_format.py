@@ -0,0 +1,130 @@
+"""
+A script to benchmark the throughput of the tracking REST API between a client and a local server
+with JSON and binary protobuf request and response bodies.
+
+# How to run:
+
+```
+python dev/benchmarks/rest_wire_format.py --num-runs 1000 --num-metrics 1000 --repeats 5
+```
+
+The script starts a tracking server with a SQLite backend store on a local port, creates
+`--num-runs` runs, then reports the wall-clock and client CPU time of `log_batch` calls of
+`--num-metrics` metrics and of `search_runs` calls returning all the runs, with each wire format.
+Since the server runs locally, the durations include the CPU time of both the client and the server
+but not the transfer time of a real network.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.server import ARTIFACT_ROOT_ENV_VAR, BACKEND_STORE_URI_ENV_VAR
+from mlflow.tracking import MlflowClient
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the wire formats of the REST API")
+    parser.add_argument("--num-runs", type=int, default=1000)
+    parser.add_argument("--num-metrics", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--port", type=int, default=5055)
+    return parser.parse_args()
+
+
+def start_server(root, port):
+    env = dict(os.environ)
+    env[BACKEND_STORE_URI_ENV_VAR] = "sqlite:///" + os.path.join(root, "mlflow.db")
+    env[ARTIFACT_ROOT_ENV_VAR] = os.path.join(root, "artifacts")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            'from mlflow.server import app; app.run("127.0.0.1", {})'.format(port),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = "http://127.0.0.1:{}".format(port)
+    for _ in range(120):
+        try:
+            requests.get(url + "/health")
+            return url, process
+        except requests.ConnectionError:
+            time.sleep(0.5)
+    process.terminate()
+    raise Exception("The tracking server did not start")
+
+
+def create_runs(client, num_runs):
+    experiment_id = client.create_experiment("benchmark")
+    for i in range(num_runs):
+        run_id = client.create_run(experiment_id).info.run_id
+        client.log_batch(
+            run_id,
+            metrics=[Metric("metric_{}".format(j), float(i), 0, 0) for j in range(10)],
+            params=[Param("param_{}".format(j), str(i)) for j in range(10)],
+            tags=[RunTag("tag_{}".format(j), str(i)) for j in range(10)],
+        )
+    return experiment_id, run_id
+
+
+def benchmark(func, repeats):
+    wall_times, cpu_times = [], []
+    for _ in range(repeats):
+        wall_start, cpu_start = time.time(), time.process_time()
+        func()
+        wall_times.append(time.time() - wall_start)
+        cpu_times.append(time.process_time() - cpu_start)
+    return min(wall_times), min(cpu_times)
+
+
+def run(url, args):
+    client = MlflowClient(url)
+    experiment_id, run_id = create_runs(client, args.num_runs)
+    metrics = [Metric("loss", 0.5, 0, step) for step in range(args.num_metrics)]
+    cases = [
+        (
+            "log_batch of {} metrics".format(args.num_metrics),
+            lambda: client.log_batch(run_id, metrics=metrics),
+        ),
+        (
+            "search_runs of {} runs".format(args.num_runs),
+            lambda: client.search_runs([experiment_id], max_results=args.num_runs),
+        ),
+    ]
+    for wire_format in ["json", "protobuf"]:
+        os.environ["MLFLOW_HTTP_REQUEST_PROTOBUF"] = str(wire_format == "protobuf").lower()
+        # The client learns that the server supports protobuf bodies from its first response
+        client.get_experiment(experiment_id)
+        for name, func in cases:
+            wall_time, cpu_time = benchmark(func, args.repeats)
+            print(
+                "{} ({}): {:.3f}s, client CPU {:.3f}s".format(
+                    name, wire_format, wall_time, cpu_time
+                )
+            )
+
+
+def main():
+    args = parse_args()
+    root = tempfile.mkdtemp()
+    url, process = start_server(root, args.port)
+    try:
+        run(url, args)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
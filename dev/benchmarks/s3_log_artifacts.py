@@ -0,0 +1,141 @@
+"""
+A script to benchmark `S3ArtifactRepository.log_artifacts` for a directory with many small files
+and for a single large file, with sequential and concurrent uploads.
+
+# How to run:
+
+```
+# ===== Against an in-memory S3 stand-in (moto) =====
+
+python dev/benchmarks/s3_log_artifacts.py --num-small-files 500 --large-file-mb 256
+
+# ===== Against a real bucket, with a multi-GB file =====
+
+python dev/benchmarks/s3_log_artifacts.py \
+    --artifact-uri s3://my-bucket/benchmarks \
+    --large-file-mb 4096 \
+    --multipart-chunksize-mb 64
+```
+
+For each scenario, the script reports the upload time with a single upload thread and a single
+part per request, and with `--max-upload-workers` threads and multipart uploads of
+`--multipart-chunksize-mb` MB parts sent by `--max-concurrency` threads.
+
+The moto stand-in runs in the benchmark process and has no network latency, so it only measures
+the client overhead of each mode. Use a real bucket to measure the speedup of concurrent uploads.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from boto3.s3.transfer import TransferConfig
+
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+MB = 1024 * 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark S3ArtifactRepository.log_artifacts")
+    parser.add_argument(
+        "--artifact-uri",
+        default=None,
+        help="S3 URI to upload artifacts to. If unspecified, uploads to a moto S3 stand-in.",
+    )
+    parser.add_argument("--num-small-files", type=int, default=500)
+    parser.add_argument("--small-file-kb", type=int, default=4)
+    parser.add_argument("--large-file-mb", type=int, default=256)
+    parser.add_argument("--max-upload-workers", type=int, default=8)
+    parser.add_argument("--max-concurrency", type=int, default=10)
+    parser.add_argument("--multipart-chunksize-mb", type=int, default=16)
+    return parser.parse_args()
+
+
+def make_small_files(root, num_files, file_kb):
+    local_dir = os.path.join(root, "small_files")
+    os.makedirs(local_dir)
+    for i in range(num_files):
+        with open(os.path.join(local_dir, "file{}.bin".format(i)), "wb") as f:
+            f.write(os.urandom(file_kb * 1024))
+    return local_dir
+
+
+def make_large_file(root, file_mb):
+    local_dir = os.path.join(root, "large_file")
+    os.makedirs(local_dir)
+    with open(os.path.join(local_dir, "model.bin"), "wb") as f:
+        for _ in range(file_mb):
+            f.write(os.urandom(MB))
+    return local_dir
+
+
+def benchmark(artifact_uri, local_dir, max_upload_workers, transfer_config):
+    repo = S3ArtifactRepository(
+        "{}/{}".format(artifact_uri.rstrip("/"), uuid.uuid4().hex),
+        transfer_config=transfer_config,
+        max_upload_workers=max_upload_workers,
+    )
+    start = time.time()
+    repo.log_artifacts(local_dir)
+    return time.time() - start
+
+
+def run(artifact_uri, args):
+    # A single part per request, sent by the calling thread
+    sequential_config = TransferConfig(
+        multipart_threshold=64 * 1024 * MB, max_concurrency=1, use_threads=False
+    )
+    concurrent_config = TransferConfig(
+        multipart_threshold=args.multipart_chunksize_mb * MB,
+        multipart_chunksize=args.multipart_chunksize_mb * MB,
+        max_concurrency=args.max_concurrency,
+    )
+    root = tempfile.mkdtemp()
+    try:
+        scenarios = [
+            (
+                "{} files of {} KB".format(args.num_small_files, args.small_file_kb),
+                make_small_files(root, args.num_small_files, args.small_file_kb),
+            ),
+            (
+                "1 file of {} MB".format(args.large_file_mb),
+                make_large_file(root, args.large_file_mb),
+            ),
+        ]
+        for name, local_dir in scenarios:
+            sequential = benchmark(artifact_uri, local_dir, 1, sequential_config)
+            concurrent = benchmark(
+                artifact_uri, local_dir, args.max_upload_workers, concurrent_config
+            )
+            print(
+                "{}: sequential {:.2f}s, concurrent {:.2f}s ({:.1f}x)".format(
+                    name, sequential, concurrent, sequential / concurrent
+                )
+            )
+    finally:
+        shutil.rmtree(root)
+
+
+def main():
+    args = parse_args()
+    if args.artifact_uri is not None:
+        run(args.artifact_uri, args)
+        return
+
+    import boto3
+    import moto
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "NotARealAccessKey")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "NotARealSecretAccessKey")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    with moto.mock_s3():
+        boto3.client("s3").create_bucket(Bucket="benchmark-bucket")
+        run("s3://benchmark-bucket/benchmarks", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+A script to load test the pyfunc scoring server with single-row `/invocations` requests, with and
+without dynamic request batching.
+
+# How to run:
+
+```
+# ===== With a stand-in model that has a fixed cost per `predict` call =====
+
+python dev/benchmarks/scoring_server_batching.py --num-clients 32 --num-requests 2000
+
+# ===== With a logged model =====
+
+python dev/benchmarks/scoring_server_batching.py \
+    --model-uri runs:/<run_id>/model \
+    --input-csv /path/to/inputs.csv \
+    --max-batch-size 64 \
+    --max-latency-ms 5
+```
+
+`--num-clients` threads send `--num-requests` requests in total, each with a single row of the
+input data. For each mode, the script reports the throughput and the p50/p99 latency observed by
+the clients. The stand-in model keeps the CPU busy for `--call-overhead-ms` per `predict` call plus
+`--row-cost-ms` per row, like models whose per-call framework overhead dominates for small inputs.
+"""
+
+import argparse
+import logging
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from werkzeug.serving import make_server
+
+import mlflow.pyfunc
+import mlflow.pyfunc.scoring_server as scoring_server
+from mlflow.pyfunc import PythonModel
+from mlflow.utils.file_utils import TempDir
+
+
+class StandInModel(PythonModel):
+    def __init__(self, call_overhead_ms, row_cost_ms):
+        self.call_overhead_ms = call_overhead_ms
+        self.row_cost_ms = row_cost_ms
+
+    def predict(self, context, model_input):
+        # Busy wait rather than sleep, since framework overhead usually holds the GIL
+        cost_ms = self.call_overhead_ms + self.row_cost_ms * len(model_input)
+        deadline = time.time() + cost_ms / 1000.0
+        while time.time() < deadline:
+            pass
+        return list(model_input.sum(axis=1))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the pyfunc scoring server")
+    parser.add_argument("--model-uri", default=None, help="Model to serve instead of a stand-in.")
+    parser.add_argument(
+        "--input-csv", default=None, help="Rows to score. Required with --model-uri."
+    )
+    parser.add_argument("--num-clients", type=int, default=32)
+    parser.add_argument("--num-requests", type=int, default=2000)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-latency-ms", type=float, default=5)
+    parser.add_argument("--call-overhead-ms", type=float, default=5)
+    parser.add_argument("--row-cost-ms", type=float, default=0.05)
+    return parser.parse_args()
+
+
+def start_server(model, max_batch_size, max_latency_ms):
+    app = scoring_server.init(model, max_batch_size, max_latency_ms)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    server.RequestHandlerClass.protocol_version = "HTTP/1.1"
+    server.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def benchmark(model, payloads, num_clients, max_batch_size, max_latency_ms):
+    server = start_server(model, max_batch_size, max_latency_ms)
+    url = "http://127.0.0.1:{}/invocations".format(server.server_port)
+    headers = {"Content-Type": scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED}
+    local = threading.local()
+
+    def score(payload):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        start = time.time()
+        response = local.session.post(url, data=payload, headers=headers)
+        response.raise_for_status()
+        return time.time() - start
+
+    try:
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=num_clients) as executor:
+            latencies = sorted(executor.map(score, payloads))
+        total = time.time() - start
+    finally:
+        server.shutdown()
+    return total, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def run(model, rows, args):
+    payloads = [
+        rows.iloc[[i % len(rows)]].to_json(orient="split") for i in range(args.num_requests)
+    ]
+    results = [
+        ("unbatched", benchmark(model, payloads, args.num_clients, None, None)),
+        (
+            "batched (max_batch_size={}, max_latency_ms={})".format(
+                args.max_batch_size, args.max_latency_ms
+            ),
+            benchmark(model, payloads, args.num_clients, args.max_batch_size, args.max_latency_ms),
+        ),
+    ]
+    for mode, (total, p50, p99) in results:
+        print(
+            "{}: {} requests in {:.2f}s ({:.0f} requests/sec, p50 {:.2f}ms, p99 {:.2f}ms)".format(
+                mode, args.num_requests, total, args.num_requests / total, p50 * 1000, p99 * 1000
+            )
+        )
+
+
+def main():
+    args = parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    if args.model_uri is not None:
+        if args.input_csv is None:
+            raise SystemExit("--input-csv is required with --model-uri")
+        run(mlflow.pyfunc.load_model(args.model_uri), pd.read_csv(args.input_csv), args)
+        return
+
+    with TempDir() as tmp:
+        model_path = tmp.path("model")
+        mlflow.pyfunc.save_model(
+            model_path, python_model=StandInModel(args.call_overhead_ms, args.row_cost_ms)
+        )
+        rows = pd.DataFrame({"a": range(100), "b": [0.5] * 100})
+        run(mlflow.pyfunc.load_model(model_path), rows, args)
+
+
+if __name__ == "__main__":
+    main()
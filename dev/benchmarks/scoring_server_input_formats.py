@@ -0,0 +1,85 @@
+"""
+A script to benchmark the time the pyfunc scoring server spends parsing `/invocations` inputs of
+wide numeric DataFrames in the JSON, CSV, Arrow IPC stream and Parquet formats.
+
+# How to run:
+
+```
+python dev/benchmarks/scoring_server_input_formats.py --num-rows 100 --num-columns 1000
+```
+
+For each format, the script reports the size of the request body and the average time to parse
+it, with a model signature declaring every column as a double.
+"""
+
+import argparse
+import time
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import mlflow.pyfunc.scoring_server as scoring_server
+from mlflow.types import ColSpec, Schema
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark scoring server input parsing")
+    parser.add_argument("--num-rows", type=int, default=100)
+    parser.add_argument("--num-columns", type=int, default=1000)
+    parser.add_argument("--num-iterations", type=int, default=20)
+    return parser.parse_args()
+
+
+def to_arrow_stream(df):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def benchmark(parse, body, num_iterations):
+    start = time.time()
+    for _ in range(num_iterations):
+        parse(body)
+    return (time.time() - start) / num_iterations
+
+
+def main():
+    args = parse_args()
+    df = pd.DataFrame(
+        np.random.rand(args.num_rows, args.num_columns),
+        columns=["f{}".format(i) for i in range(args.num_columns)],
+    )
+    schema = Schema([ColSpec("double", name) for name in df.columns])
+    formats = [
+        (
+            "json (split)",
+            df.to_json(orient="split"),
+            lambda body: scoring_server.parse_json_input(body, orient="split", schema=schema),
+        ),
+        (
+            "csv",
+            df.to_csv(index=False),
+            lambda body: scoring_server.parse_csv_input(StringIO(body)),
+        ),
+        (
+            "arrow",
+            to_arrow_stream(df),
+            lambda body: scoring_server.parse_arrow_stream_input(body, schema=schema),
+        ),
+        (
+            "parquet",
+            df.to_parquet(index=False),
+            lambda body: scoring_server.parse_parquet_input(body, schema=schema),
+        ),
+    ]
+    for name, body, parse in formats:
+        seconds = benchmark(parse, body, args.num_iterations)
+        print("{}: {:.0f} KB, {:.2f}ms per request".format(name, len(body) / 1024, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
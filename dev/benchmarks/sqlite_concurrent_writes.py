@@ -0,0 +1,126 @@
+"""
+A script to benchmark the sustained throughput of concurrent `log_metric` calls to a
+`SqlAlchemyStore` backed by a SQLite database, as made by the workers of `mlflow server`.
+
+# How to run:
+
+```
+python dev/benchmarks/sqlite_concurrent_writes.py --num-processes 4 --num-threads 8 --duration 20
+```
+
+Each process, like a gunicorn worker of the tracking server, opens its own store on the same
+temporary database and logs metrics from ``--num-threads`` threads, like the threads serving
+concurrent requests, for ``--duration`` seconds, while ``--num-reader-threads`` threads read the
+run with `get_run`, like the UI does. The script reports the number of metrics logged per second,
+the latency of `log_metric`, the number of runs read per second and the number of calls that
+failed, e.g. with `database is locked`.
+
+To compare implementations, run the script on both revisions.
+"""
+
+import argparse
+import collections
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from mlflow.entities import Metric
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent writes to SQLite")
+    parser.add_argument("--num-processes", type=int, default=4)
+    parser.add_argument("--num-threads", type=int, default=8)
+    parser.add_argument("--num-reader-threads", type=int, default=0)
+    parser.add_argument("--duration", type=float, default=20)
+    return parser.parse_args()
+
+
+def log_metrics(db_uri, artifact_root, run_id, worker, args, results):
+    store = SqlAlchemyStore(db_uri, artifact_root)
+    deadline = time.time() + args.duration
+    latencies = []
+    reads = []
+    errors = collections.Counter()
+
+    def read():
+        while time.time() < deadline:
+            try:
+                store.get_run(run_id)
+            except Exception as e:
+                errors[str(e).splitlines()[0][:80]] += 1
+                continue
+            reads.append(1)
+
+    def log(thread):
+        step = 0
+        while time.time() < deadline:
+            key = "worker{}_thread{}".format(worker, thread)
+            metric = Metric(key, step, int(time.time() * 1000), step)
+            start = time.time()
+            try:
+                store.log_metric(run_id, metric)
+            except Exception as e:
+                errors[str(e).splitlines()[0][:80]] += 1
+                continue
+            latencies.append(time.time() - start)
+            step += 1
+
+    threads = [threading.Thread(target=log, args=(thread,)) for thread in range(args.num_threads)]
+    threads += [threading.Thread(target=read) for _ in range(args.num_reader_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put((latencies, len(reads), errors))
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_uri = "sqlite:///" + os.path.join(tmpdir, "mlflow.db")
+        artifact_root = os.path.join(tmpdir, "artifacts")
+        store = SqlAlchemyStore(db_uri, artifact_root)
+        run_id = store.create_run("0", "benchmark", 0, []).info.run_id
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=log_metrics, args=(db_uri, artifact_root, run_id, worker, args, results)
+            )
+            for worker in range(args.num_processes)
+        ]
+        for process in processes:
+            process.start()
+        latencies = []
+        num_reads = 0
+        errors = collections.Counter()
+        for _ in processes:
+            process_latencies, process_reads, process_errors = results.get()
+            latencies.extend(process_latencies)
+            num_reads += process_reads
+            errors.update(process_errors)
+        for process in processes:
+            process.join()
+
+    latencies.sort()
+    print(
+        "{} processes x {} threads: {:.0f} metrics/s, latency p50 {:.1f}ms, p99 {:.1f}ms, "
+        "{:.0f} reads/s, {} failed calls".format(
+            args.num_processes,
+            args.num_threads,
+            len(latencies) / args.duration,
+            latencies[len(latencies) // 2] * 1000 if latencies else float("nan"),
+            latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float("nan"),
+            num_reads / args.duration,
+            sum(errors.values()),
+        )
+    )
+    for error, count in errors.most_common():
+        print("  {} x {}".format(count, error))
+
+
+if __name__ == "__main__":
+    main()
@@ -44,24 +44,27 @@ warnings.filterwarnings("ignore", message="numpy.ufunc size changed")  # noqa: E
 
 import mlflow.projects as projects  # noqa: E402
 import mlflow.tracking as tracking  # noqa: E402
-
-# model flavors
-import mlflow.fastai as fastai  # noqa: E402
-import mlflow.gluon as gluon  # noqa: E402
-import mlflow.h2o as h2o  # noqa: E402
-import mlflow.keras as keras  # noqa: E402
-import mlflow.lightgbm as lightgbm  # noqa: E402
-import mlflow.mleap as mleap  # noqa: E402
-import mlflow.onnx as onnx  # noqa: E402
-import mlflow.pyfunc as pyfunc  # noqa: E402
-import mlflow.pytorch as pytorch  # noqa: E402
-import mlflow.sklearn as sklearn  # noqa: E402
-import mlflow.spacy as spacy  # noqa: E402
-import mlflow.spark as spark  # noqa: E402
-import mlflow.statsmodels as statsmodels  # noqa: E402
-import mlflow.tensorflow as tensorflow  # noqa: E402
-import mlflow.xgboost as xgboost  # noqa: E402
-import mlflow.shap as shap  # noqa: E402
+from mlflow.utils.lazy_load import LazyLoader as _LazyLoader  # noqa: E402
+
+# model flavors, imported on first use to keep `import mlflow` fast
+fastai = _LazyLoader("fastai", globals(), "mlflow.fastai")
+gluon = _LazyLoader("gluon", globals(), "mlflow.gluon")
+h2o = _LazyLoader("h2o", globals(), "mlflow.h2o")
+keras = _LazyLoader("keras", globals(), "mlflow.keras")
+lightgbm = _LazyLoader("lightgbm", globals(), "mlflow.lightgbm")
+mleap = _LazyLoader("mleap", globals(), "mlflow.mleap")
+onnx = _LazyLoader("onnx", globals(), "mlflow.onnx")
+pyfunc = _LazyLoader("pyfunc", globals(), "mlflow.pyfunc")
+pytorch = _LazyLoader("pytorch", globals(), "mlflow.pytorch")
+sklearn = _LazyLoader("sklearn", globals(), "mlflow.sklearn")
+spacy = _LazyLoader("spacy", globals(), "mlflow.spacy")
+spark = _LazyLoader("spark", globals(), "mlflow.spark")
+statsmodels = _LazyLoader("statsmodels", globals(), "mlflow.statsmodels")
+tensorflow = _LazyLoader("tensorflow", globals(), "mlflow.tensorflow")
+xgboost = _LazyLoader("xgboost", globals(), "mlflow.xgboost")
+shap = _LazyLoader("shap", globals(), "mlflow.shap")
+# used to be imported by the flavors
+models = _LazyLoader("models", globals(), "mlflow.models")
 
 
 _configure_mlflow_loggers(root_module_name=__name__)
@@ -110,6 +113,7 @@ delete_experiment = mlflow.tracking.fluent.delete_experiment
 delete_run = mlflow.tracking.fluent.delete_run
 register_model = mlflow.tracking._model_registry.fluent.register_model
 autolog = mlflow.tracking.fluent.autolog
+flush_async_logging = mlflow.tracking.fluent.flush_async_logging
 
 
 run = projects.run
@@ -149,6 +153,7 @@ __all__ = [
     "set_registry_uri",
     "list_run_infos",
     "autolog",
+    "flush_async_logging",
     # model flavors
     "fastai",
     "gluon",
@@ -1,3 +1,4 @@
+import importlib
 import json
 import os
 import sys
@@ -6,14 +7,10 @@ import logging
 import click
 from click import UsageError
 
-import mlflow.azureml.cli
 import mlflow.db
 import mlflow.experiments
-import mlflow.models.cli
-import mlflow.deployments.cli
 import mlflow.projects as projects
 import mlflow.runs
-import mlflow.sagemaker.cli
 import mlflow.store.artifact.cli
 from mlflow import tracking
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
@@ -29,8 +26,55 @@ from mlflow.exceptions import MlflowException
 
 _logger = logging.getLogger(__name__)
 
+# Command groups whose modules import model flavors, pandas or cloud SDKs, mapped to the module
+# defining their `commands` group and to the short help shown by `mlflow --help`
+_LAZY_COMMANDS = {
+    "azureml": ("mlflow.azureml.cli", "Serve models on Azure ML."),
+    "deployments": ("mlflow.deployments.cli", "Deploy MLflow models to custom targets."),
+    "models": ("mlflow.models.cli", "Deploy MLflow models locally."),
+    "sagemaker": ("mlflow.sagemaker.cli", "Serve models on SageMaker."),
+}
 
-@click.group()
+
+class _LazyGroup(click.Group):
+    """
+    Group that imports the modules of the command groups in ``lazy_commands`` only when one of
+    their commands is run, so that ``mlflow --help`` and the other commands start quickly.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lazy_commands = kwargs.pop("lazy_commands", {})
+        super().__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, _ = self.lazy_commands[cmd_name]
+            self.add_command(importlib.import_module(module_name).commands, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        commands = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_commands and name not in self.commands:
+                commands.append((name, self.lazy_commands[name][1]))
+                continue
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                commands.append((name, command))
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [
+                (name, command if isinstance(command, str) else command.get_short_help_str(limit))
+                for name, command in commands
+            ]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=_LazyGroup, lazy_commands=_LAZY_COMMANDS)
 @click.version_option()
 def cli():
     pass
@@ -453,12 +497,45 @@ def gc(backend_store_uri, run_ids):
         print("Run with ID %s has been permanently deleted." % str(run_id))
 
 
-cli.add_command(mlflow.models.cli.commands)
-cli.add_command(mlflow.deployments.cli.commands)
-cli.add_command(mlflow.sagemaker.cli.commands)
+@cli.command(short_help="Rebuild the run index of a file-based backend store.")
+@click.option(
+    "--backend-store-uri",
+    metavar="PATH",
+    default=DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH,
+    help="URI of the file-based backend store whose run index should be rebuilt "
+    "(e.g. 'file:///absolute/path/to/directory'). By default, the run index of the "
+    "./mlruns directory is rebuilt.",
+)
+@click.option(
+    "--experiment-ids",
+    default=None,
+    help="Optional comma separated list of experiments whose run index should be rebuilt. If "
+    "experiment ids are not specified, the run indexes of all experiments are rebuilt.",
+)
+@experimental
+def rebuild_run_index(backend_store_uri, experiment_ids):
+    """
+    Rebuild the run index of the specified file-based backend store from its run directories.
+    The run index is maintained by backend stores when the MLFLOW_FILESTORE_RUN_INDEX environment
+    variable is set to ``true``. Rebuild it after runs have been logged or modified without it.
+    """
+    backend_store = _get_store(backend_store_uri, None)
+    if not hasattr(backend_store, "_rebuild_run_index"):
+        raise MlflowException("This cli can only be used with a file-based backend store")
+    if not experiment_ids:
+        experiment_ids = (
+            backend_store._get_active_experiments() + backend_store._get_deleted_experiments()
+        )
+    else:
+        experiment_ids = experiment_ids.split(",")
+
+    for experiment_id in experiment_ids:
+        num_runs = backend_store._rebuild_run_index(experiment_id)
+        print("Rebuilt the run index of experiment %s with %d runs." % (experiment_id, num_runs))
+
+
 cli.add_command(mlflow.experiments.commands)
 cli.add_command(mlflow.store.artifact.cli.commands)
-cli.add_command(mlflow.azureml.cli.commands)
 cli.add_command(mlflow.runs.commands)
 cli.add_command(mlflow.db.commands)
 
@@ -23,8 +23,11 @@ def upgrade(url):
     recover from failures.
     """
     import mlflow.store.db.utils
+    from mlflow.store.db.store_cache import clear_stores
 
     engine = mlflow.store.db.utils.create_sqlalchemy_engine_with_retry(url)
     if mlflow.store.db.utils._is_initialized_before_mlflow_1(engine):
         mlflow.store.db.utils._upgrade_db_initialized_before_mlflow_1(engine)
     mlflow.store.db.utils._upgrade_db(engine)
+    # Stores of this process created before the upgrade verified the previous schema
+    clear_stores(url)
@@ -31,7 +31,31 @@ def commands():
 @cli_args.WORKERS
 @cli_args.NO_CONDA
 @cli_args.INSTALL_MLFLOW
-def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
+@click.option(
+    "--max-batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="If greater than 1, each worker merges concurrent requests into batches of at most this"
+    " many rows and passes each batch to the model at once. Only applies to models with the"
+    " ``python_function`` flavor. Disabled by default.",
+)
+@click.option(
+    "--max-latency-ms",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Maximum time in milliseconds that a request waits for other requests to join its batch"
+    " (default: 10). Only applies if --max-batch-size is greater than 1.",
+)
+def serve(
+    model_uri,
+    port,
+    host,
+    workers,
+    no_conda=False,
+    install_mlflow=False,
+    max_batch_size=None,
+    max_latency_ms=None,
+):
     """
     Serve a model saved with MLflow by launching a webserver on the specified host and port.
     The command supports models with the ``python_function`` or ``crate`` (R Function) flavor.
@@ -50,9 +74,17 @@ def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
             "columns": ["a", "b", "c"],
             "data": [[1, 2, 3], [4, 5, 6]]
         }'
+
+    To serve many small requests efficiently, use ``--max-batch-size`` to merge concurrent
+    requests into batches, e.g. ``--max-batch-size 64 --max-latency-ms 5``.
     """
     return _get_flavor_backend(
-        model_uri, no_conda=no_conda, workers=workers, install_mlflow=install_mlflow
+        model_uri,
+        no_conda=no_conda,
+        workers=workers,
+        install_mlflow=install_mlflow,
+        max_batch_size=max_batch_size,
+        max_latency_ms=max_latency_ms,
     ).serve(model_uri=model_uri, port=port, host=host)
 
 
@@ -65,13 +97,15 @@ def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
     "--output-path",
     "-o",
     default=None,
-    help="File to output results to as json file. If not provided, output to stdout.",
+    help="File to output results to as json file, or as an Arrow IPC stream or Parquet file for"
+    " 'arrow' and 'parquet' inputs. If not provided, output to stdout.",
 )
 @click.option(
     "--content-type",
     "-t",
     default="json",
-    help="Content type of the input file. Can be one of {'json', 'csv'}.",
+    help="Content type of the input file. Can be one of {'json', 'csv', 'arrow', 'parquet'}."
+    " 'arrow' files contain an Apache Arrow IPC stream.",
 )
 @click.option(
     "--json-format",
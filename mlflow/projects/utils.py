@@ -4,9 +4,6 @@ import re
 import tempfile
 import urllib.parse
 
-
-from distutils import dir_util
-
 import mlflow.utils
 from mlflow.utils import databricks_utils
 from mlflow.entities import SourceType, Param
@@ -152,6 +149,8 @@ def _fetch_project(uri, version=None):
         if version is not None:
             raise ExecutionException("Setting a version is only supported for Git project URIs")
         if use_temp_dst_dir:
+            from distutils import dir_util
+
             dir_util.copy_tree(src=parsed_uri, dst=dst_dir)
     else:
         assert _GIT_URI_REGEX.match(parsed_uri), "Non-local URI %s should be a Git URI" % parsed_uri
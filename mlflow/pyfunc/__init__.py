@@ -283,6 +283,47 @@ def _load_model_env(path):
     return _get_flavor_configuration(model_path=path, flavor_name=FLAVOR_NAME).get(ENV, None)
 
 
+# Input values already match the schema type
+_KEEP = "keep"
+# Input values of type object must be inspected to decide whether they match the schema type
+_INSPECT_VALUES = "inspect"
+
+
+def _get_type_conversion(t: DataType, dtype):
+    """
+    Decide how input values of the given dtype are converted to the schema type ``t``. Return
+    ``_KEEP`` if they already match, the numpy type to safely upcast them to, ``_INSPECT_VALUES``
+    if the decision depends on the values or None if they cannot be safely converted.
+    """
+    if dtype == np.object:
+        return _KEEP if t == DataType.binary else _INSPECT_VALUES
+
+    # NB: Comparison of pandas and numpy data type fails when numpy data type is on the left hand
+    # side of the comparison operator. It works, however, if pandas type is on the left hand side.
+    # That is because pandas is aware of numpy.
+    if t.to_pandas() == dtype or t.to_numpy() == dtype:
+        # The types are already compatible => conversion is not necessary.
+        return _KEEP
+
+    if t == DataType.binary and dtype.kind == t.binary.to_numpy().kind:
+        # NB: bytes in numpy have variable itemsize depending on the length of the longest
+        # element in the array (column). Since MLflow binary type is length agnostic, we ignore
+        # itemsize when matching binary columns.
+        return _KEEP
+
+    numpy_type = t.to_numpy()
+    if dtype.kind == numpy_type.kind:
+        is_upcast = dtype.itemsize <= numpy_type.itemsize
+    elif dtype.kind == "u" and numpy_type.kind == "i":
+        is_upcast = dtype.itemsize < numpy_type.itemsize
+    elif dtype.kind in ("i", "u") and numpy_type == np.float64:
+        # allow (u)int => double conversion
+        is_upcast = dtype.itemsize <= 6
+    else:
+        is_upcast = False
+    return numpy_type if is_upcast else None
+
+
 def _enforce_type(name, values: pandas.Series, t: DataType):
     """
     Enforce the input column type matches the declared in model input schema.
@@ -313,39 +354,20 @@ def _enforce_type(name, values: pandas.Series, t: DataType):
                 "Failed to convert column {0} from type {1} to {2}.".format(name, values.dtype, t)
             )
 
-    # NB: Comparison of pandas and numpy data type fails when numpy data type is on the left hand
-    # side of the comparison operator. It works, however, if pandas type is on the left hand side.
-    # That is because pandas is aware of numpy.
-    if t.to_pandas() == values.dtype or t.to_numpy() == values.dtype:
-        # The types are already compatible => conversion is not necessary.
+    conversion = _get_type_conversion(t, values.dtype)
+    if conversion is _KEEP:
         return values
-
-    if t == DataType.binary and values.dtype.kind == t.binary.to_numpy().kind:
-        # NB: bytes in numpy have variable itemsize depending on the length of the longest
-        # element in the array (column). Since MLflow binary type is length agnostic, we ignore
-        # itemsize when matching binary columns.
-        return values
-
-    numpy_type = t.to_numpy()
-    if values.dtype.kind == numpy_type.kind:
-        is_upcast = values.dtype.itemsize <= numpy_type.itemsize
-    elif values.dtype.kind == "u" and numpy_type.kind == "i":
-        is_upcast = values.dtype.itemsize < numpy_type.itemsize
-    elif values.dtype.kind in ("i", "u") and numpy_type == np.float64:
-        # allow (u)int => double conversion
-        is_upcast = values.dtype.itemsize <= 6
-    else:
-        is_upcast = False
-
-    if is_upcast:
-        return values.astype(numpy_type, errors="raise")
+    elif isinstance(conversion, np.dtype):
+        return values.astype(conversion, errors="raise")
     else:
         # NB: conversion between incompatible types (e.g. floats -> ints or
         # double -> float) are not allowed. While supported by pandas and numpy,
         # these conversions alter the values significantly.
         def all_ints(xs):
-            return all([pandas.isnull(x) or int(x) == x for x in xs])
+            xs = xs.to_numpy()
+            return bool(np.all(np.isnan(xs) | (np.floor(xs) == xs)))
 
+        numpy_type = t.to_numpy()
         hint = ""
         if (
             values.dtype == np.float64
@@ -370,62 +392,164 @@ def _enforce_type(name, values: pandas.Series, t: DataType):
         )
 
 
-def _enforce_schema(pdf: PyFuncInput, input_schema: Schema):
+class _SchemaEnforcementPlan(object):
     """
-    Enforce column names and types match the input schema.
+    Enforcement of an input schema, prepared once per schema and reused for every input.
 
-    For column names, we check there are no missing columns and reorder the columns to match the
-    ordering declared in schema if necessary. Any extra columns are ignored.
-
-    For column types, we make sure the types match schema or can be safely converted to match the
-    input schema.
+    The type conversion needed for each pair of schema type and input dtype is decided once and
+    cached. Columns whose dtype already matches the schema are not converted and the other columns
+    are converted by groups, e.g. all the columns upcast to the same type at once. Inputs that
+    already conform to the schema are returned as is, without copying.
     """
-    if isinstance(pdf, (list, np.ndarray, dict)):
-        try:
-            pdf = pandas.DataFrame(pdf)
-        except Exception as e:
-            message = (
-                "This model contains a model signature, which suggests a DataFrame input."
-                "There was an error casting the input data to a DataFrame: {0}".format(str(e))
-            )
+
+    def __init__(self, input_schema: Schema):
+        self.input_schema = input_schema
+        self._has_column_names = input_schema.has_column_names()
+        self._col_names = input_schema.column_names()
+        self._col_types = input_schema.column_types()
+        self._conversions = {}
+
+    def _get_conversion(self, t, dtype):
+        key = (t, dtype)
+        if key not in self._conversions:
+            self._conversions[key] = _get_type_conversion(t, dtype)
+        return self._conversions[key]
+
+    def _get_column_positions(self, pdf):
+        # Position of the first column of each name, like pdf[name] for unique column names
+        positions = {}
+        for i, name in enumerate(pdf.columns):
+            positions.setdefault(name, i)
+        if self._has_column_names:
+            missing_cols = [c for c in self._col_names if c not in positions]
+            if missing_cols:
+                # Preserve order from the original columns, since missing/extra columns are likely
+                # to be in same order.
+                expected_names = set(self._col_names)
+                extra_cols = [c for c in pdf.columns if c not in expected_names]
+                message = (
+                    "Model input is missing columns {0}."
+                    " Note that there were extra columns: {1}".format(missing_cols, extra_cols)
+                )
+                raise MlflowException(message)
+            return [positions[c] for c in self._col_names]
+        else:
+            # The model signature does not specify column names => we can only verify column count.
+            if len(pdf.columns) < len(self._col_types):
+                message = (
+                    "Model input is missing input columns. The model signature declares "
+                    "{0} input columns but the provided input only has "
+                    "{1} columns. Note: the columns were not named in the signature so we can "
+                    "only verify their count."
+                ).format(len(self._col_types), len(pdf.columns))
+                raise MlflowException(message)
+            return list(range(len(self._col_types)))
+
+    def enforce(self, pdf: PyFuncInput):
+        """
+        Enforce column names and types match the input schema.
+
+        For column names, we check there are no missing columns and reorder the columns to match
+        the ordering declared in schema if necessary. Any extra columns are ignored.
+
+        For column types, we make sure the types match schema or can be safely converted to match
+        the input schema.
+        """
+        if isinstance(pdf, (list, np.ndarray, dict)):
+            try:
+                pdf = pandas.DataFrame(pdf)
+            except Exception as e:
+                message = (
+                    "This model contains a model signature, which suggests a DataFrame input."
+                    "There was an error casting the input data to a DataFrame: {0}".format(str(e))
+                )
+                raise MlflowException(message)
+        if not isinstance(pdf, pandas.DataFrame):
+            message = "Expected input to be DataFrame or list. Found: %s" % type(pdf).__name__
             raise MlflowException(message)
-    if not isinstance(pdf, pandas.DataFrame):
-        message = "Expected input to be DataFrame or list. Found: %s" % type(pdf).__name__
-        raise MlflowException(message)
-
-    if input_schema.has_column_names():
-        # make sure there are no missing columns
-        col_names = input_schema.column_names()
-        expected_names = set(col_names)
-        actual_names = set(pdf.columns)
-        missing_cols = expected_names - actual_names
-        extra_cols = actual_names - expected_names
-        # Preserve order from the original columns, since missing/extra columns are likely to
-        # be in same order.
-        missing_cols = [c for c in col_names if c in missing_cols]
-        extra_cols = [c for c in pdf.columns if c in extra_cols]
-        if missing_cols:
-            message = (
-                "Model input is missing columns {0}."
-                " Note that there were extra columns: {1}".format(missing_cols, extra_cols)
+
+        positions = self._get_column_positions(pdf)
+        dtypes = pdf.dtypes.tolist()
+        # Columns as (index in the schema, position in the input) pairs
+        converted_cols = []
+        inferred_cols = []
+        string_cols = []
+        conforming = True
+        for i, (position, t) in enumerate(zip(positions, self._col_types)):
+            conversion = self._get_conversion(t, dtypes[position])
+            if conversion is not _INSPECT_VALUES:
+                converted_cols.append((i, position))
+                conforming = conforming and conversion is _KEEP
+            elif t == DataType.string:
+                string_cols.append((i, position))
+            else:
+                inferred_cols.append((i, position))
+
+        if conforming and not inferred_cols and not string_cols:
+            if positions == list(range(len(pdf.columns))):
+                return pdf
+            return pdf.iloc[:, positions]
+
+        # Convert the columns by groups, then restore the column order of the schema
+        parts = self._convert_columns(pdf, converted_cols)
+        if inferred_cols:
+            # NB: the type of object columns is inferred from their values, e.g. for JSON inputs
+            inferred = pdf.iloc[:, [p for _, p in inferred_cols]].infer_objects()
+            parts += self._convert_columns(
+                inferred, [(i, j) for j, (i, _) in enumerate(inferred_cols)]
             )
-            raise MlflowException(message)
-    else:
-        # The model signature does not specify column names => we can only verify column count.
-        if len(pdf.columns) < len(input_schema.columns):
-            message = (
-                "Model input is missing input columns. The model signature declares "
-                "{0} input columns but the provided input only has "
-                "{1} columns. Note: the columns were not named in the signature so we can "
-                "only verify their count."
-            ).format(len(input_schema.columns), len(pdf.columns))
-            raise MlflowException(message)
-        col_names = pdf.columns[: len(input_schema.columns)]
-    col_types = input_schema.column_types()
-    new_pdf = pandas.DataFrame()
-    for i, x in enumerate(col_names):
-        new_pdf[x] = _enforce_type(x, pdf[x], col_types[i])
-    return new_pdf
+        if string_cols:
+            parts.append(self._convert_strings(pdf, string_cols))
+        order = [i for indices, _ in parts for i in indices]
+        result = pandas.concat([frame for _, frame in parts], axis=1, copy=False)
+        if order != sorted(order):
+            result = result.iloc[:, np.argsort(order)]
+        return result
+
+    def _convert_columns(self, pdf, cols):
+        """
+        Keep or upcast the specified columns of ``pdf``, given as (index in the schema, position
+        in ``pdf``) pairs. Return a list of (indices in the schema, DataFrame) pairs.
+        """
+        dtypes = pdf.dtypes.tolist()
+        kept_cols = []
+        cast_cols = {}
+        for i, position in cols:
+            t = self._col_types[i]
+            conversion = self._get_conversion(t, dtypes[position])
+            if conversion is _KEEP:
+                kept_cols.append((i, position))
+            elif isinstance(conversion, np.dtype):
+                cast_cols.setdefault(conversion, []).append((i, position))
+            else:
+                # Raises the appropriate error for incompatible types
+                _enforce_type(pdf.columns[position], pdf.iloc[:, position], t)
+        parts = []
+        if kept_cols:
+            parts.append(([i for i, _ in kept_cols], pdf.iloc[:, [p for _, p in kept_cols]]))
+        for numpy_type, group in cast_cols.items():
+            parts.append(
+                ([i for i, _ in group], pdf.iloc[:, [p for _, p in group]].astype(numpy_type))
+            )
+        return parts
+
+    def _convert_strings(self, pdf, cols):
+        frame = pdf.iloc[:, [p for _, p in cols]]
+        try:
+            return [i for i, _ in cols], frame.astype(DataType.string.to_pandas(), errors="raise")
+        except ValueError:
+            # Raises the error for the first column that cannot be converted
+            for j in range(len(cols)):
+                _enforce_type(frame.columns[j], frame.iloc[:, j], DataType.string)
+            raise
+
+
+def _enforce_schema(pdf: PyFuncInput, input_schema: Schema):
+    """
+    Enforce column names and types match the input schema.
+    See :py:meth:`_SchemaEnforcementPlan.enforce`.
+    """
+    return _SchemaEnforcementPlan(input_schema).enforce(pdf)
 
 
 class PyFuncModel(object):
@@ -450,6 +574,7 @@ class PyFuncModel(object):
             raise MlflowException("Model is missing metadata.")
         self._model_meta = model_meta
         self._model_impl = model_impl
+        self._enforcement_plan = None
 
     def predict(self, data: PyFuncInput) -> PyFuncOutput:
         """
@@ -465,9 +590,17 @@ class PyFuncModel(object):
         """
         input_schema = self.metadata.get_input_schema()
         if input_schema is not None:
-            data = _enforce_schema(data, input_schema)
+            data = self._get_enforcement_plan(input_schema).enforce(data)
         return self._model_impl.predict(data)
 
+    def _get_enforcement_plan(self, input_schema):
+        # The signature of the metadata can be replaced after the model is loaded
+        plan = self._enforcement_plan
+        if plan is None or plan.input_schema is not input_schema:
+            plan = _SchemaEnforcementPlan(input_schema)
+            self._enforcement_plan = plan
+        return plan
+
     @property
     def metadata(self):
         """Model metadata."""
@@ -20,11 +20,22 @@ class PyFuncBackend(FlavorBackend):
         Flavor backend implementation for the generic python models.
     """
 
-    def __init__(self, config, workers=1, no_conda=False, install_mlflow=False, **kwargs):
+    def __init__(
+        self,
+        config,
+        workers=1,
+        no_conda=False,
+        install_mlflow=False,
+        max_batch_size=None,
+        max_latency_ms=None,
+        **kwargs
+    ):
         super().__init__(config=config, **kwargs)
         self._nworkers = workers or 1
         self._no_conda = no_conda
         self._install_mlflow = install_mlflow
+        self._max_batch_size = max_batch_size
+        self._max_latency_ms = max_latency_ms
 
     def prepare_env(self, model_uri):
         local_path = _download_artifact_from_uri(model_uri)
@@ -73,19 +84,27 @@ class PyFuncBackend(FlavorBackend):
         # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
         # platform compatibility.
         local_uri = path_to_local_file_uri(local_path)
+        batching = self._max_batch_size is not None and self._max_batch_size > 1
         if os.name != "nt":
+            # Batching needs each worker to handle as many concurrent requests as fit in a batch
+            threads = "-k gthread --threads {} ".format(self._max_batch_size) if batching else ""
             command = (
-                "gunicorn --timeout=60 -b {host}:{port} -w {nworkers} ${{GUNICORN_CMD_ARGS}}"
-                " -- mlflow.pyfunc.scoring_server.wsgi:app"
-            ).format(host=host, port=port, nworkers=self._nworkers)
+                "gunicorn --timeout=60 -b {host}:{port} -w {nworkers} {threads}"
+                "${{GUNICORN_CMD_ARGS}} -- mlflow.pyfunc.scoring_server.wsgi:app"
+            ).format(host=host, port=port, nworkers=self._nworkers, threads=threads)
         else:
+            threads = "--threads={} ".format(self._max_batch_size) if batching else ""
             command = (
-                "waitress-serve --host={host} --port={port} "
+                "waitress-serve --host={host} --port={port} {threads}"
                 "--ident=mlflow mlflow.pyfunc.scoring_server.wsgi:app"
-            ).format(host=host, port=port)
+            ).format(host=host, port=port, threads=threads)
 
         command_env = os.environ.copy()
         command_env[scoring_server._SERVER_MODEL_PATH] = local_uri
+        if batching:
+            command_env[scoring_server._SERVER_MAX_BATCH_SIZE] = str(self._max_batch_size)
+            if self._max_latency_ms is not None:
+                command_env[scoring_server._SERVER_MAX_LATENCY_MS] = str(self._max_latency_ms)
         if not self._no_conda and ENV in self._config:
             conda_env_path = os.path.join(local_path, self._config[ENV])
             return _execute_in_conda_env(
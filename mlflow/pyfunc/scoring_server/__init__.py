@@ -5,10 +5,15 @@ The passed int model is expected to have function:
 
 Input, expected intext/csv or application/json format,
 is parsed into pandas.DataFrame and passed to the model.
+Inputs can also be sent in the Apache Arrow IPC stream or Apache Parquet binary formats, in which
+case the predictions are returned in the format requested by the Accept header.
 
 Defines two endpoints:
     /ping used for health check
     /invocations used for scoring
+
+Concurrent /invocations requests can optionally be merged into batches before they are passed to
+the model, see :py:mod:`mlflow.pyfunc.scoring_server.batching`.
 """
 from collections import defaultdict, OrderedDict
 import flask
@@ -34,20 +39,28 @@ try:
 except ImportError:
     from mlflow.pyfunc import load_pyfunc as load_model
 from mlflow.protos.databricks_pb2 import MALFORMED_REQUEST, BAD_REQUEST
+from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
 from mlflow.server.handlers import catch_mlflow_exception
 
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
+from io import BytesIO
 
 _SERVER_MODEL_PATH = "__pyfunc_model_path__"
+_SERVER_MAX_BATCH_SIZE = "__pyfunc_max_batch_size__"
+_SERVER_MAX_LATENCY_MS = "__pyfunc_max_latency_ms__"
+
+DEFAULT_MAX_LATENCY_MS = 10
 
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
 CONTENT_TYPE_JSON_RECORDS_ORIENTED = "application/json; format=pandas-records"
 CONTENT_TYPE_JSON_SPLIT_ORIENTED = "application/json; format=pandas-split"
 CONTENT_TYPE_JSON_SPLIT_NUMPY = "application/json-numpy-split"
+CONTENT_TYPE_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/vnd.apache.parquet"
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
@@ -55,8 +68,12 @@ CONTENT_TYPES = [
     CONTENT_TYPE_JSON_RECORDS_ORIENTED,
     CONTENT_TYPE_JSON_SPLIT_ORIENTED,
     CONTENT_TYPE_JSON_SPLIT_NUMPY,
+    CONTENT_TYPE_ARROW_STREAM,
+    CONTENT_TYPE_PARQUET,
 ]
 
+RESPONSE_CONTENT_TYPES = [CONTENT_TYPE_JSON, CONTENT_TYPE_ARROW_STREAM, CONTENT_TYPE_PARQUET]
+
 _logger = logging.getLogger(__name__)
 
 
@@ -136,6 +153,89 @@ def parse_csv_input(csv_input):
         )
 
 
+def _import_pyarrow():
+    try:
+        import pyarrow
+
+        return pyarrow
+    except ImportError:
+        _handle_serving_error(
+            error_message=(
+                "The Apache Arrow and Apache Parquet formats require the `pyarrow` package, which"
+                " is not installed in the environment of the model server."
+            ),
+            error_code=BAD_REQUEST,
+            include_traceback=False,
+        )
+
+
+def _arrow_input_source(binary_input):
+    pa = _import_pyarrow()
+    if isinstance(binary_input, (bytes, bytearray, memoryview)):
+        # Wraps the request body without copying it
+        return pa.BufferReader(binary_input)
+    return binary_input
+
+
+def _arrow_table_to_pandas(table, schema: Schema = None):
+    """
+    Convert an Arrow table into a Pandas DataFrame. Columns are converted by Arrow without
+    handling their values one by one in Python. If the model signature names its input columns,
+    only these columns are converted.
+    """
+    if schema is not None and schema.has_column_names():
+        # Extra columns are ignored by schema enforcement and missing columns are reported by it
+        input_names = set(table.column_names)
+        table = table.select([name for name in schema.column_names() if name in input_names])
+    return table.to_pandas()
+
+
+def parse_arrow_stream_input(arrow_input, schema: Schema = None):
+    """
+    :param arrow_input: A bytes-like object containing a Pandas DataFrame serialized in the Apache
+                        Arrow IPC stream format, or a binary stream or path to such a
+                        representation.
+    :param schema: Optional schema specification to be used during parsing.
+    """
+    pa = _import_pyarrow()
+    try:
+        table = pa.ipc.open_stream(_arrow_input_source(arrow_input)).read_all()
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is"
+                " a valid Apache Arrow IPC stream, e.g. produced by writing a"
+                " `pyarrow.Table` with `pyarrow.ipc.new_stream()`."
+            ),
+            error_code=MALFORMED_REQUEST,
+        )
+    return _arrow_table_to_pandas(table, schema)
+
+
+def parse_parquet_input(parquet_input, schema: Schema = None):
+    """
+    :param parquet_input: A bytes-like object containing a Pandas DataFrame serialized in the
+                          Apache Parquet format, or a binary stream or path to such a
+                          representation.
+    :param schema: Optional schema specification to be used during parsing.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    try:
+        table = pq.read_table(_arrow_input_source(parquet_input))
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is"
+                " a valid Apache Parquet file produced using the"
+                " `pandas.DataFrame.to_parquet()` method."
+            ),
+            error_code=MALFORMED_REQUEST,
+        )
+    return _arrow_table_to_pandas(table, schema)
+
+
 def parse_split_oriented_json_input_to_numpy(json_input):
     """
     :param json_input: A JSON-formatted string representation of a Pandas DataFrame with split
@@ -231,6 +331,47 @@ def predictions_to_json(raw_predictions, output):
     json.dump(predictions, output, cls=NumpyEncoder)
 
 
+def _predictions_to_arrow_table(raw_predictions):
+    pa = _import_pyarrow()
+    if isinstance(raw_predictions, pd.Series):
+        predictions = raw_predictions.to_frame(
+            name=raw_predictions.name if raw_predictions.name is not None else "predictions"
+        )
+    elif isinstance(raw_predictions, pd.DataFrame):
+        predictions = raw_predictions
+    elif isinstance(raw_predictions, dict):
+        predictions = pd.DataFrame(raw_predictions)
+    else:
+        predictions = np.asarray(raw_predictions)
+        if predictions.ndim == 1:
+            predictions = pd.DataFrame({"predictions": predictions})
+        elif predictions.ndim == 2:
+            predictions = pd.DataFrame(predictions)
+        else:
+            raise MlflowException(
+                "Predictions with {} dimensions cannot be returned as an Apache Arrow table."
+                " Request JSON predictions instead.".format(predictions.ndim),
+                error_code=BAD_REQUEST,
+            )
+    # Arrow requires string column names, e.g. for predictions of 2-dimensional arrays
+    predictions = predictions.rename(columns=str)
+    return pa.Table.from_pandas(predictions, preserve_index=False)
+
+
+def predictions_to_arrow_stream(raw_predictions, output):
+    pa = _import_pyarrow()
+    table = _predictions_to_arrow_table(raw_predictions)
+    with pa.ipc.new_stream(output, table.schema) as writer:
+        writer.write_table(table)
+
+
+def predictions_to_parquet(raw_predictions, output):
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_table(_predictions_to_arrow_table(raw_predictions), output)
+
+
 def _handle_serving_error(error_message, error_code, include_traceback=True):
     """
     Logs information about an exception thrown by model inference code that is currently being
@@ -252,13 +393,22 @@ def _handle_serving_error(error_message, error_code, include_traceback=True):
     reraise(MlflowException, e)
 
 
-def init(model: PyFuncModel):
+def init(model: PyFuncModel, max_batch_size=None, max_latency_ms=DEFAULT_MAX_LATENCY_MS):
 
     """
     Initialize the server. Loads pyfunc model from the path.
+
+    :param max_batch_size: If greater than 1, concurrent requests are merged into batches of at
+                           most this many rows before they are passed to the model.
+    :param max_latency_ms: Maximum time in milliseconds that a request waits for other requests
+                           to join its batch. Only applies if ``max_batch_size`` is greater than 1.
     """
     app = flask.Flask(__name__)
     input_schema = model.metadata.get_input_schema()
+    if max_batch_size is not None and max_batch_size > 1:
+        predict = PredictionBatcher(model.predict, max_batch_size, max_latency_ms).predict
+    else:
+        predict = model.predict
 
     @app.route("/ping", methods=["GET"])
     def ping():  # pylint: disable=unused-variable
@@ -296,6 +446,10 @@ def init(model: PyFuncModel):
             )
         elif flask.request.content_type == CONTENT_TYPE_JSON_SPLIT_NUMPY:
             data = parse_split_oriented_json_input_to_numpy(flask.request.data.decode("utf-8"))
+        elif flask.request.content_type == CONTENT_TYPE_ARROW_STREAM:
+            data = parse_arrow_stream_input(flask.request.data, schema=input_schema)
+        elif flask.request.content_type == CONTENT_TYPE_PARQUET:
+            data = parse_parquet_input(flask.request.data, schema=input_schema)
         else:
             return flask.Response(
                 response=(
@@ -312,7 +466,7 @@ def init(model: PyFuncModel):
         # Do the prediction
 
         try:
-            raw_predictions = model.predict(data)
+            raw_predictions = predict(data)
         except MlflowException as e:
             _handle_serving_error(
                 error_message=e.message, error_code=BAD_REQUEST, include_traceback=False
@@ -326,9 +480,22 @@ def init(model: PyFuncModel):
                 ),
                 error_code=BAD_REQUEST,
             )
-        result = StringIO()
-        predictions_to_json(raw_predictions, result)
-        return flask.Response(response=result.getvalue(), status=200, mimetype="application/json")
+        # Clients that do not specify the Accept header get JSON predictions
+        response_content_type = flask.request.accept_mimetypes.best_match(
+            RESPONSE_CONTENT_TYPES, default=CONTENT_TYPE_JSON
+        )
+        if response_content_type == CONTENT_TYPE_ARROW_STREAM:
+            result = BytesIO()
+            predictions_to_arrow_stream(raw_predictions, result)
+        elif response_content_type == CONTENT_TYPE_PARQUET:
+            result = BytesIO()
+            predictions_to_parquet(raw_predictions, result)
+        else:
+            result = StringIO()
+            predictions_to_json(raw_predictions, result)
+        return flask.Response(
+            response=result.getvalue(), status=200, mimetype=response_content_type
+        )
 
     return app
 
@@ -338,20 +505,34 @@ def _predict(model_uri, input_path, output_path, content_type, json_format):
     if input_path is None:
         input_path = sys.stdin
 
+    # Predictions for Arrow and Parquet inputs are written in the same binary format
+    if content_type in ("arrow", "parquet") and input_path is sys.stdin:
+        input_path = sys.stdin.buffer
+
     if content_type == "json":
         df = parse_json_input(input_path, orient=json_format)
+        write_predictions, mode = predictions_to_json, "w"
     elif content_type == "csv":
         df = parse_csv_input(input_path)
+        write_predictions, mode = predictions_to_json, "w"
+    elif content_type == "arrow":
+        df = parse_arrow_stream_input(input_path, schema=pyfunc_model.metadata.get_input_schema())
+        write_predictions, mode = predictions_to_arrow_stream, "wb"
+    elif content_type == "parquet":
+        df = parse_parquet_input(input_path, schema=pyfunc_model.metadata.get_input_schema())
+        write_predictions, mode = predictions_to_parquet, "wb"
     else:
         raise Exception("Unknown content type '{}'".format(content_type))
 
     if output_path is None:
-        predictions_to_json(pyfunc_model.predict(df), sys.stdout)
+        write_predictions(
+            pyfunc_model.predict(df), sys.stdout.buffer if mode == "wb" else sys.stdout
+        )
     else:
-        with open(output_path, "w") as fout:
-            predictions_to_json(pyfunc_model.predict(df), fout)
+        with open(output_path, mode) as fout:
+            write_predictions(pyfunc_model.predict(df), fout)
 
 
-def _serve(model_uri, port, host):
+def _serve(model_uri, port, host, max_batch_size=None, max_latency_ms=DEFAULT_MAX_LATENCY_MS):
     pyfunc_model = load_model(model_uri)
-    init(pyfunc_model).run(port=port, host=host)
+    init(pyfunc_model, max_batch_size, max_latency_ms).run(port=port, host=host, threaded=True)
@@ -0,0 +1,181 @@
+"""
+Dynamic batching of prediction requests for the pyfunc scoring server.
+
+Requests whose input is a Pandas DataFrame are queued and merged, up to a maximum number of rows
+or a maximum waiting time, into a single call to the model's ``predict`` method. The predictions
+are then split back into one result per request. Inputs of other types, such as the tensors
+parsed from TF serving requests, are predicted on their own.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+_logger = logging.getLogger(__name__)
+
+
+class _PendingRequest(object):
+    def __init__(self, data):
+        self.data = data
+        self.result = None
+        self.exception = None
+        self.done = threading.Event()
+
+
+def _batch_key(data):
+    """
+    Inputs are only merged with inputs of the same columns and types, so that merging them does
+    not change the types seen by the model or by its schema enforcement.
+    """
+    return tuple((column, str(dtype)) for column, dtype in data.dtypes.items())
+
+
+def _split_predictions(predictions, sizes):
+    """
+    Split the predictions for a merged batch into consecutive chunks of the specified sizes.
+    Return None if the predictions cannot be split, e.g. if they do not have one row per input row.
+    """
+    if isinstance(predictions, (pd.DataFrame, pd.Series)):
+        slice_rows = predictions.iloc.__getitem__
+    elif isinstance(predictions, (np.ndarray, list)):
+        slice_rows = predictions.__getitem__
+    else:
+        return None
+    if len(predictions) != sum(sizes):
+        return None
+    chunks = []
+    start = 0
+    for size in sizes:
+        chunks.append(slice_rows(slice(start, start + size)))
+        start += size
+    return chunks
+
+
+class PredictionBatcher(object):
+    """
+    Coalesces the concurrent calls to :py:meth:`predict` into batched calls to ``predict_fn``.
+
+    A background thread waits for a first request, then for more requests until the batch holds
+    ``max_batch_size`` rows or ``max_latency_ms`` milliseconds have passed. Requests of the same
+    columns and types are merged with ``pandas.concat`` and predicted at once. If the batched
+    prediction fails, or its result cannot be split back into one result per request, each request
+    of the batch is predicted on its own so that callers get the same results and errors as
+    without batching.
+
+    :param predict_fn: Function computing predictions for a Pandas DataFrame, e.g. the ``predict``
+                       method of a ``PyFuncModel``.
+    :param max_batch_size: Maximum number of rows predicted at once. Inputs with at least as many
+                           rows are predicted directly.
+    :param max_latency_ms: Maximum time a request waits for other requests to join its batch.
+    """
+
+    def __init__(self, predict_fn, max_batch_size, max_latency_ms):
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency_ms / 1000.0
+        self._queue = queue.Queue()
+        # Request taken from the queue that did not fit in the previous batch
+        self._carried_over = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._thread_pid = None
+
+    def predict(self, data):
+        if not isinstance(data, pd.DataFrame) or len(data) >= self._max_batch_size:
+            return self._predict_fn(data)
+        request = _PendingRequest(data)
+        self._ensure_thread_started()
+        self._queue.put(request)
+        request.done.wait()
+        if request.exception is not None:
+            raise request.exception
+        return request.result
+
+    def _ensure_thread_started(self):
+        # Servers that fork workers after creating the app need a thread in each worker
+        with self._lock:
+            if self._thread is None or self._thread_pid != os.getpid():
+                self._thread = threading.Thread(
+                    target=self._run, name="MlflowPredictionBatcher", daemon=True
+                )
+                self._thread_pid = os.getpid()
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                self._process(batch)
+            except Exception as e:  # pylint: disable=broad-except
+                # Never leave a caller waiting, even on unexpected errors
+                for request in batch:
+                    if not request.done.is_set():
+                        request.exception = e
+                        request.done.set()
+
+    def _next_batch(self):
+        first = self._carried_over or self._queue.get()
+        self._carried_over = None
+        batch = [first]
+        num_rows = len(first.data)
+        deadline = time.time() + self._max_latency
+        while num_rows < self._max_batch_size:
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if num_rows + len(request.data) > self._max_batch_size:
+                self._carried_over = request
+                break
+            batch.append(request)
+            num_rows += len(request.data)
+        return batch
+
+    def _process(self, batch):
+        groups = {}
+        for request in batch:
+            groups.setdefault(_batch_key(request.data), []).append(request)
+        for requests in groups.values():
+            if len(requests) == 1 or not self._predict_merged(requests):
+                for request in requests:
+                    self._predict_single(request)
+
+    def _predict_merged(self, requests):
+        """
+        Predict the inputs of the specified requests in a single call. Return False if the
+        requests must be predicted separately instead.
+        """
+        try:
+            predictions = self._predict_fn(pd.concat([request.data for request in requests]))
+        except Exception:  # pylint: disable=broad-except
+            _logger.debug(
+                "Batched prediction failed, predicting requests separately", exc_info=True
+            )
+            return False
+        chunks = _split_predictions(predictions, [len(request.data) for request in requests])
+        if chunks is None:
+            _logger.debug(
+                "Cannot split predictions of type %s into %d results, predicting requests"
+                " separately",
+                type(predictions).__name__,
+                len(requests),
+            )
+            return False
+        for request, chunk in zip(requests, chunks):
+            request.result = chunk
+            request.done.set()
+        return True
+
+    def _predict_single(self, request):
+        try:
+            request.result = self._predict_fn(request.data)
+        except Exception as e:  # pylint: disable=broad-except
+            request.exception = e
+        request.done.set()
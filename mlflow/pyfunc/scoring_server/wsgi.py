@@ -3,4 +3,10 @@ from mlflow.pyfunc import scoring_server
 from mlflow.pyfunc import load_model
 
 
-app = scoring_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]))
+app = scoring_server.init(
+    load_model(os.environ[scoring_server._SERVER_MODEL_PATH]),
+    max_batch_size=int(os.environ.get(scoring_server._SERVER_MAX_BATCH_SIZE, 1)),
+    max_latency_ms=float(
+        os.environ.get(scoring_server._SERVER_MAX_LATENCY_MS, scoring_server.DEFAULT_MAX_LATENCY_MS)
+    ),
+)
@@ -1,17 +1,21 @@
+import math
 import os
 import shlex
 import sys
 import textwrap
+import time
 
-from flask import Flask, send_from_directory, Response
+from flask import Flask, send_from_directory, Response, request
 
 from mlflow.server import handlers
+from mlflow.server.compression import compress_response
 from mlflow.server.handlers import (
     get_artifact_handler,
     STATIC_PREFIX_ENV_VAR,
     _add_static_prefix,
     get_model_version_artifact_handler,
 )
+from mlflow.store.db import read_replicas
 from mlflow.utils.process import exec_cmd
 
 # NB: These are intenrnal environment variables used for communication between
@@ -19,6 +23,9 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
+# Cookie storing the time until which the reads of a client are served by the primary database of
+# the backend store rather than by its read replicas
+READ_PRIMARY_UNTIL_COOKIE = "mlflow_read_primary_until"
 
 REL_STATIC_DIR = "js/build"
 
@@ -29,13 +36,41 @@ STATIC_DIR = os.path.join(app.root_path, REL_STATIC_DIR)
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
-if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
-    from mlflow.server.prometheus_exporter import activate_prometheus_exporter
 
-    prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
-    if not os.path.exists(prometheus_metrics_path):
-        os.makedirs(prometheus_metrics_path)
-    activate_prometheus_exporter(app)
+def _get_read_primary_until():
+    try:
+        return float(request.cookies.get(READ_PRIMARY_UNTIL_COOKIE, 0))
+    except ValueError:
+        return 0
+
+
+# Attribute the database queries of each request to its client, so that the reads following the
+# writes of a client are not served by read replicas of the backend store database that may not
+# have replicated them yet. The time until which the reads of a client go to the primary database
+# is returned to the client in a cookie rather than kept in memory, since the subsequent requests
+# of the client may be served by other worker processes. Forging the cookie only changes the
+# database serving the reads of the forging client.
+@app.before_request
+def _start_client_session():
+    read_replicas.start_client_session(_get_read_primary_until())
+
+
+@app.after_request
+def _set_read_primary_until_cookie(response):
+    read_primary_until = read_replicas.get_client_session_read_primary_until()
+    if read_primary_until is not None and read_primary_until > _get_read_primary_until():
+        response.set_cookie(
+            READ_PRIMARY_UNTIL_COOKIE,
+            repr(read_primary_until),
+            max_age=max(int(math.ceil(read_primary_until - time.time())), 1),
+            httponly=True,
+        )
+    return response
+
+
+@app.teardown_request
+def _end_client_session(exception):  # pylint: disable=unused-argument
+    read_replicas.end_client_session()
 
 
 # Provide a health check endpoint to ensure the application is responsive
@@ -87,6 +122,23 @@ def serve():
     return Response(text, mimetype="text/plain")
 
 
+# Activated once all the routes are registered, so that they can be instrumented
+if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
+    from mlflow.server.prometheus_exporter import activate_prometheus_exporter
+
+    prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
+    if not os.path.exists(prometheus_metrics_path):
+        os.makedirs(prometheus_metrics_path)
+    activate_prometheus_exporter(app)
+
+
+# Registered last so that it runs first of the functions called after each request, e.g. before
+# the Prometheus exporter measures the size of the response
+@app.after_request
+def _compress_response(response):
+    return compress_response(response)
+
+
 def _build_waitress_command(waitress_opts, host, port):
     opts = shlex.split(waitress_opts) if waitress_opts else []
     return (
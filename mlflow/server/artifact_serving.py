@@ -0,0 +1,223 @@
+"""
+Serving of artifact files by the tracking server.
+
+Files of artifact repositories implementing
+:py:meth:`mlflow.store.artifact.artifact_repo.ArtifactRepository.open_artifact_stream` are streamed
+to the client as they are read from the repository, and support conditional (``ETag``) and byte
+range (``Range``) requests. Files of remote repositories are cached in an
+:py:class:`ArtifactCache <mlflow.store.artifact.artifact_cache.ArtifactCache>`: files sent whole
+are written into the cache as they are streamed, and files of repositories that cannot stream them
+are downloaded into the cache first. Cached files are then streamed from the cache the same way.
+"""
+import atexit
+import logging
+import mimetypes
+import os
+import posixpath
+import shutil
+import tempfile
+import threading
+import unicodedata
+from urllib.parse import quote
+
+from flask import Response, request
+from werkzeug.datastructures import ContentRange
+
+from mlflow.store.artifact.artifact_cache import (
+    _get_artifact_cache,
+    get_artifact_cache,
+    get_artifact_cache_key,
+)
+from mlflow.store.artifact.artifact_repo import ArtifactStream, _artifact_file_not_found
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+_logger = logging.getLogger(__name__)
+
+_server_cache_root = None
+_server_cache_root_lock = threading.Lock()
+
+
+def send_artifact(artifact_repository, path, mimetype=None):
+    """
+    Return a response sending the artifact file at the specified path of the repository as an
+    attachment.
+
+    :param mimetype: Mimetype of the response, guessed from the name of the file if None.
+    """
+    filename = posixpath.basename(path)
+    mimetype = mimetype or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    try:
+        stream = artifact_repository.open_artifact_stream(path)
+    except NotImplementedError:
+        stream = _open_downloaded_file(artifact_repository, path)
+    else:
+        stream = _open_cached_stream(artifact_repository, path, stream)
+    try:
+        return _send_stream(stream, filename, mimetype)
+    except Exception:
+        stream.close()
+        raise
+
+
+def get_server_artifact_cache():
+    """
+    Return the artifact cache of the server, in the directory set by the
+    ``MLFLOW_ARTIFACT_CACHE_DIR`` environment variable, which can be shared by the workers of the
+    server, or else in a temporary directory of the process removed when it exits.
+    """
+    global _server_cache_root
+
+    cache = get_artifact_cache()
+    if cache is not None:
+        return cache
+    with _server_cache_root_lock:
+        if _server_cache_root is None:
+            _server_cache_root = tempfile.mkdtemp(prefix="mlflow-artifact-cache-")
+            atexit.register(shutil.rmtree, _server_cache_root, ignore_errors=True)
+    return _get_artifact_cache(_server_cache_root)
+
+
+def _open_cached_stream(artifact_repository, path, stream):
+    """
+    Return a stream reading the cached copy of the file of the stream if there is one, or else
+    the stream, caching the file as it is read whole.
+    """
+    key = get_artifact_cache_key(artifact_repository, path, [stream.size, stream.etag])
+    if key is None or stream.etag is None:
+        return stream
+    cache = get_server_artifact_cache()
+    with cache.lookup(key) as local_path:
+        if local_path is not None:
+            stream.close()
+            return _open_local_file(local_path, stream.etag)
+
+    def read_range(start, stop):
+        chunks = stream.read_range(start, stop)
+        if (start, stop) != (0, stream.size):
+            return chunks
+        return _write_into_cache(cache, key, chunks)
+
+    return ArtifactStream(stream.size, stream.etag, read_range, close=stream.close)
+
+
+def _write_into_cache(cache, key, chunks):
+    """
+    Yield the chunks, writing them into the entry with the specified key of the cache once all of
+    them are read. Failing to write them does not interrupt the iteration.
+    """
+    staging_dir = cache.mkdtemp()
+    f = open(os.path.join(staging_dir, "content"), "wb")
+    try:
+        for chunk in chunks:
+            if f is not None:
+                try:
+                    f.write(chunk)
+                except OSError:
+                    _logger.warning("Failed to write artifact into cache", exc_info=True)
+                    f.close()
+                    f = None
+            yield chunk
+        if f is not None:
+            f.close()
+            f = None
+            try:
+                cache.insert(key, staging_dir)
+            except OSError:
+                _logger.warning("Failed to write artifact into cache", exc_info=True)
+    finally:
+        if f is not None:
+            f.close()
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _open_downloaded_file(artifact_repository, path):
+    """
+    Download the artifact file at the specified path into the cache, unless it is cached, and
+    return a stream reading it.
+    """
+    parent = posixpath.dirname(path.rstrip("/"))
+    sizes = {
+        file_info.path: file_info.file_size
+        for file_info in artifact_repository.list_artifacts(parent or None)
+        if not file_info.is_dir
+    }
+    if path not in sizes:
+        raise _artifact_file_not_found(path)
+    key = get_artifact_cache_key(artifact_repository, path, sizes[path])
+    if key is None or sizes[path] is None:
+        # Files of unknown size cannot be told apart from the next versions of them
+        download_dir = tempfile.mkdtemp()
+        try:
+            return _open_local_file(artifact_repository.download_artifacts(path, download_dir))
+        finally:
+            shutil.rmtree(download_dir, ignore_errors=True)
+    with get_server_artifact_cache().get(
+        key, lambda dst_dir: artifact_repository.download_artifacts(path, dst_dir)
+    ) as local_path:
+        # Identifies the version of the file across downloads and workers
+        return _open_local_file(local_path, etag=key[:32])
+
+
+def _open_local_file(local_path, etag=None):
+    """
+    Open a stream reading the local file, which remains readable once the file is removed.
+    """
+    stream = LocalArtifactRepository(os.path.dirname(local_path)).open_artifact_stream(
+        os.path.basename(local_path)
+    )
+    if etag is not None:
+        stream.etag = etag
+    return stream
+
+
+def _send_stream(stream, filename, mimetype):
+    response = Response(mimetype=mimetype, direct_passthrough=True)
+    response.headers["Content-Disposition"] = _get_content_disposition(filename)
+    response.accept_ranges = "bytes"
+    response.call_on_close(stream.close)
+    if stream.etag is not None:
+        response.set_etag(stream.etag)
+        if request.if_none_match.contains_weak(stream.etag):
+            response.status_code = 304
+            return response
+
+    start, stop = 0, stream.size
+    if request.range is not None and _is_range_applicable(stream.etag):
+        # Requests of several ranges are answered with the whole file
+        if len(request.range.ranges) == 1:
+            byte_range = request.range.range_for_length(stream.size)
+            if byte_range is None:
+                response.status_code = 416
+                response.content_range = ContentRange("bytes", None, None, stream.size)
+                return response
+            start, stop = byte_range
+            response.status_code = 206
+            response.content_range = ContentRange("bytes", start, stop, stream.size)
+
+    response.response = stream.read_range(start, stop)
+    response.content_length = stop - start
+    return response
+
+
+def _is_range_applicable(etag):
+    """
+    Whether the ``Range`` header of the request applies to the current version of the file, i.e.
+    the request has no ``If-Range`` header or its entity tag is the one of the file. Since
+    modification dates are not known, ``If-Range`` dates never match.
+    """
+    if "If-Range" not in request.headers:
+        return True
+    if_range = request.if_range
+    return etag is not None and if_range.etag is not None and if_range.etag == etag
+
+
+def _get_content_disposition(filename):
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        # Browsers not supporting RFC 5987 fall back to the ASCII approximation of the name
+        simple = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        return "attachment; filename=\"{}\"; filename*=UTF-8''{}".format(
+            simple.replace('"', ""), quote(filename, safe="!#$&+^`|~")
+        )
+    return 'attachment; filename="{}"'.format(filename.replace("\\", "\\\\").replace('"', '\\"'))
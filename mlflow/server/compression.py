@@ -0,0 +1,186 @@
+"""
+Compression of the request and response bodies of the tracking server.
+
+Responses of the REST API whose body is at least ``MLFLOW_SERVER_COMPRESSION_MIN_SIZE`` bytes
+(1 KB by default) are compressed with the best content coding accepted by the client in its
+``Accept-Encoding`` header among ``zstd``, if the ``zstandard`` package is installed, and
+``gzip``. Streamed responses, e.g. the bulk metric history one, are compressed as they are sent
+regardless of their size. Artifact files are sent uncompressed since they support byte range
+requests.
+
+Request bodies may be compressed with the same content codings, as set by their
+``Content-Encoding`` header. They are decompressed up to ``MLFLOW_SERVER_MAX_REQUEST_SIZE`` bytes
+(16 MB by default), or a lower limit of the endpoint, and rejected beyond it.
+"""
+import gzip
+import io
+import os
+import zlib
+
+from flask import request
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MLFLOW_SERVER_COMPRESSION_MIN_SIZE_ENV_VAR = "MLFLOW_SERVER_COMPRESSION_MIN_SIZE"
+_DEFAULT_COMPRESSION_MIN_SIZE = 1024
+MLFLOW_SERVER_MAX_REQUEST_SIZE_ENV_VAR = "MLFLOW_SERVER_MAX_REQUEST_SIZE"
+_DEFAULT_MAX_REQUEST_SIZE = 16 * 1024 * 1024
+_DECOMPRESSION_CHUNK_SIZE = 64 * 1024
+# Trade a slightly worse compression ratio than the maximum levels for a much faster compression
+_GZIP_COMPRESSION_LEVEL = 6
+_ZSTD_COMPRESSION_LEVEL = 3
+_COMPRESSIBLE_MIMETYPES = frozenset(
+    ["application/json", "application/x-protobuf", "application/javascript"]
+)
+
+
+def _get_supported_encodings():
+    # In order of preference when accepted with the same quality by the client
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def _get_compression_min_size():
+    value = os.environ.get(MLFLOW_SERVER_COMPRESSION_MIN_SIZE_ENV_VAR)
+    return int(value) if value else _DEFAULT_COMPRESSION_MIN_SIZE
+
+
+def _get_max_request_size():
+    value = os.environ.get(MLFLOW_SERVER_MAX_REQUEST_SIZE_ENV_VAR)
+    return int(value) if value else _DEFAULT_MAX_REQUEST_SIZE
+
+
+def _get_compressor(encoding):
+    """
+    Return an object compressing data with the content coding, with ``compress(data)`` and
+    ``flush()`` methods returning the compressed data available so far and the remaining one.
+    """
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_COMPRESSION_LEVEL).compressobj()
+    # The gzip format is selected by adding 16 to the window size
+    return zlib.compressobj(_GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+
+def _compress(data, encoding):
+    compressor = _get_compressor(encoding)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _CompressedChunks(object):
+    """
+    Iterable compressing the chunks of a streamed response body as they are sent, which closes
+    the original body once closed.
+    """
+
+    def __init__(self, response, encoding):
+        self._chunks = response.iter_encoded()
+        self._body = response.response
+        self._encoding = encoding
+
+    def __iter__(self):
+        compressor = _get_compressor(self._encoding)
+        for chunk in self._chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    def close(self):
+        if hasattr(self._body, "close"):
+            self._body.close()
+
+
+def _is_compressible(response):
+    mimetype = response.mimetype or ""
+    return (
+        200 <= response.status_code < 300
+        and response.status_code not in (204, 206)
+        # Responses sending files as they are read, e.g. artifact files
+        and not response.direct_passthrough
+        and "Content-Encoding" not in response.headers
+        and (mimetype in _COMPRESSIBLE_MIMETYPES or mimetype.startswith("text/"))
+    )
+
+
+def compress_response(response):
+    """
+    Compress the body of the response to the current request with the best content coding
+    accepted by the client, if it is compressible and large enough or streamed.
+    """
+    if not _is_compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(_get_supported_encodings())
+    if encoding is None:
+        return response
+    if response.is_streamed:
+        response.response = _CompressedChunks(response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < _get_compression_min_size():
+            return response
+        response.set_data(_compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def _read_at_most(stream, max_size):
+    """
+    Read a stream of decompressed data chunk by chunk, so that a small compressed body expanding
+    to more than ``max_size`` bytes is rejected without holding all of it in memory.
+    """
+    chunks = []
+    size = 0
+    while True:
+        chunk = stream.read(_DECOMPRESSION_CHUNK_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        size += len(chunk)
+        if size > max_size:
+            raise MlflowException(
+                "Request bodies must be at most {} bytes once decompressed".format(max_size),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        chunks.append(chunk)
+
+
+def decompress_request_data(data, encoding, max_size=None):
+    """
+    Decompress a request body compressed with the content coding of its ``Content-Encoding``
+    header, if any.
+
+    :param max_size: Maximum size of the decompressed body, ``MLFLOW_SERVER_MAX_REQUEST_SIZE`` if
+                     unspecified. Larger bodies raise an ``MlflowException``.
+    """
+    encoding = (encoding or "identity").strip().lower()
+    if max_size is None:
+        max_size = _get_max_request_size()
+    try:
+        if encoding == "identity":
+            return data
+        if encoding == "gzip":
+            with gzip.GzipFile(fileobj=io.BytesIO(data)) as stream:
+                return _read_at_most(stream, max_size)
+        if encoding == "zstd" and zstandard is not None:
+            # Unlike `ZstdDecompressor.decompress`, supports frames without their content size
+            with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)) as stream:
+                return _read_at_most(stream, max_size)
+    except MlflowException:
+        raise
+    except Exception as e:
+        raise MlflowException(
+            "Malformed {}-compressed request body: {}".format(encoding, e),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    raise MlflowException(
+        "Unsupported request Content-Encoding '{}'. Supported encodings: {}".format(
+            encoding, ["identity"] + _get_supported_encodings()
+        ),
+        error_code=INVALID_PARAMETER_VALUE,
+    )
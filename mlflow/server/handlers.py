@@ -6,8 +6,9 @@ import re
 import logging
 from functools import wraps
 
-from flask import Response, request, send_file
+from flask import Response, has_request_context, request
 from google.protobuf import descriptor
+from google.protobuf.message import DecodeError
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
 from mlflow.entities.model_registry import RegisteredModelTag, ModelVersionTag
@@ -24,6 +25,8 @@ from mlflow.protos.service_pb2 import (
     SearchRuns,
     ListArtifacts,
     GetMetricHistory,
+    GetMetricHistoryBulk,
+    MetricHistory,
     CreateRun,
     UpdateRun,
     LogMetric,
@@ -64,19 +67,24 @@ from mlflow.protos.model_registry_pb2 import (
     DeleteModelVersionTag,
 )
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, INVALID_PARAMETER_VALUE
+from mlflow.server.artifact_serving import send_artifact
+from mlflow.server.compression import decompress_request_data
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
 from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils.rest_utils import CONTENT_TYPES_HEADER, PROTOBUF_CONTENT_TYPE
+from mlflow.utils.validation import _validate_batch_log_api_req, MAX_BATCH_LOG_REQUEST_SIZE
 from mlflow.utils.string_utils import is_string_type
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 
 _logger = logging.getLogger(__name__)
 _tracking_store = None
 _model_registry_store = None
+_store_wrapper = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+_JSON_CONTENT_TYPE = "application/json"
 
 
 class TrackingStoreRegistryWrapper(TrackingStoreRegistry):
@@ -120,6 +128,19 @@ _tracking_store_registry = TrackingStoreRegistryWrapper()
 _model_registry_store_registry = ModelRegistryStoreRegistryWrapper()
 
 
+def set_store_wrapper(wrapper):
+    """
+    Set a function applied to the tracking and model registry stores once created, returning the
+    store to use in their place, e.g. to instrument their methods.
+    """
+    global _store_wrapper
+    _store_wrapper = wrapper
+
+
+def _wrap_store(store):
+    return store if _store_wrapper is None else _store_wrapper(store)
+
+
 def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
     from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR
 
@@ -127,7 +148,7 @@ def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
     if _tracking_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
-        _tracking_store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        _tracking_store = _wrap_store(_tracking_store_registry.get_store(store_uri, artifact_root))
     return _tracking_store
 
 
@@ -137,7 +158,7 @@ def _get_model_registry_store(backend_store_uri=None):
     global _model_registry_store
     if _model_registry_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
-        _model_registry_store = _model_registry_store_registry.get_store(store_uri)
+        _model_registry_store = _wrap_store(_model_registry_store_registry.get_store(store_uri))
     return _model_registry_store
 
 
@@ -149,13 +170,40 @@ def initialize_backend_stores(backend_store_uri=None, default_artifact_root=None
         pass
 
 
+def _get_request_data(flask_request=request, max_size=None):
+    # Clients may compress large request bodies, see `mlflow.utils.rest_utils`
+    return decompress_request_data(
+        flask_request.get_data(), flask_request.headers.get("Content-Encoding"), max_size
+    )
+
+
 def _get_request_json(flask_request=request):
+    if flask_request.headers.get("Content-Encoding"):
+        try:
+            return json.loads(_get_request_data(flask_request).decode("utf-8"))
+        except ValueError:
+            return None
     return flask_request.get_json(force=True, silent=True)
 
 
+def _is_protobuf_request(flask_request=request):
+    return flask_request.mimetype == PROTOBUF_CONTENT_TYPE
+
+
 def _get_request_message(request_message, flask_request=request):
     from querystring_parser import parser
 
+    # Clients send binary protobuf request bodies to servers advertising them, see
+    # `mlflow.utils.rest_utils`
+    if flask_request.method != "GET" and _is_protobuf_request(flask_request):
+        try:
+            request_message.ParseFromString(_get_request_data(flask_request))
+        except DecodeError as e:
+            raise MlflowException(
+                "Malformed protobuf request body: {}".format(e), error_code=INVALID_PARAMETER_VALUE
+            )
+        return request_message
+
     if flask_request.method == "GET" and len(flask_request.query_string) > 0:
         # This is a hack to make arrays of length 1 work with the parser.
         # for example experiment_ids%5B%5D=0 should be parsed to {experiment_ids: [0]}
@@ -197,14 +245,13 @@ def _get_request_message(request_message, flask_request=request):
 
 
 def _send_artifact(artifact_repository, path):
-    filename = os.path.abspath(artifact_repository.download_artifacts(path))
-    extension = os.path.splitext(filename)[-1].replace(".", "")
+    extension = os.path.splitext(path)[-1].replace(".", "")
     # Always send artifacts as attachments to prevent the browser from displaying them on our web
     # server's domain, which might enable XSS.
     if extension in _TEXT_EXTENSIONS:
-        return send_file(filename, mimetype="text/plain", as_attachment=True)
+        return send_artifact(artifact_repository, path, mimetype="text/plain")
     else:
-        return send_file(filename, as_attachment=True)
+        return send_artifact(artifact_repository, path)
 
 
 def catch_mlflow_exception(func):
@@ -263,9 +310,7 @@ def _create_experiment():
     )
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -274,9 +319,7 @@ def _get_experiment():
     response_message = GetExperiment.Response()
     experiment = _get_tracking_store().get_experiment(request_message.experiment_id).to_proto()
     response_message.experiment.MergeFrom(experiment)
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -291,9 +334,7 @@ def _get_experiment_by_name():
         )
     experiment = store_exp.to_proto()
     response_message.experiment.MergeFrom(experiment)
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -301,9 +342,7 @@ def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_tracking_store().delete_experiment(request_message.experiment_id)
     response_message = DeleteExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -311,9 +350,7 @@ def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_tracking_store().restore_experiment(request_message.experiment_id)
     response_message = RestoreExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -324,9 +361,7 @@ def _update_experiment():
             request_message.experiment_id, request_message.new_name
         )
     response_message = UpdateExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -343,9 +378,7 @@ def _create_run():
 
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -356,9 +389,7 @@ def _update_run():
         run_id, request_message.status, request_message.end_time
     )
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -366,9 +397,7 @@ def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_tracking_store().delete_run(request_message.run_id)
     response_message = DeleteRun.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -376,9 +405,7 @@ def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_tracking_store().restore_run(request_message.run_id)
     response_message = RestoreRun.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -390,9 +417,7 @@ def _log_metric():
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_metric(run_id, metric)
     response_message = LogMetric.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -402,9 +427,7 @@ def _log_param():
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_param(run_id, param)
     response_message = LogParam.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -413,9 +436,7 @@ def _set_experiment_tag():
     tag = ExperimentTag(request_message.key, request_message.value)
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
     response_message = SetExperimentTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -425,9 +446,7 @@ def _set_tag():
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().set_tag(run_id, tag)
     response_message = SetTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -435,9 +454,7 @@ def _delete_tag():
     request_message = _get_request_message(DeleteTag())
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
     response_message = DeleteTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -446,9 +463,7 @@ def _get_run():
     response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
     response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -469,9 +484,7 @@ def _search_runs():
     response_message.runs.extend([r.to_proto() for r in run_entities])
     if run_entities.token:
         response_message.next_page_token = run_entities.token
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -487,9 +500,7 @@ def _list_artifacts():
     artifact_entities = _get_artifact_repo(run).list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = _get_artifact_repo(run).artifact_uri
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -497,11 +508,83 @@ def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
     response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    metric_entites = _get_tracking_store().get_metric_history(run_id, request_message.metric_key)
+    metric_entites = _get_tracking_store().get_metric_history(
+        run_id,
+        request_message.metric_key,
+        max_results=(
+            request_message.max_results if request_message.HasField("max_results") else None
+        ),
+        sampling=request_message.sampling if request_message.HasField("sampling") else None,
+    )
     response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
+
+
+@catch_mlflow_exception
+def _get_metric_history_bulk():
+    request_message = _get_request_message(GetMetricHistoryBulk())
+
+    def get_optional_field(field):
+        return getattr(request_message, field) if request_message.HasField(field) else None
+
+    histories = _get_tracking_store().get_metric_history_bulk(
+        run_ids=list(request_message.run_ids),
+        metric_keys=list(request_message.metric_keys),
+        start_step=get_optional_field("start_step"),
+        end_step=get_optional_field("end_step"),
+        max_results=get_optional_field("max_results"),
+        sampling=get_optional_field("sampling"),
+    )
+
+    def iter_histories():
+        for run_id, run_histories in histories.items():
+            for metric_key, metrics in run_histories.items():
+                yield MetricHistory(
+                    run_id=run_id,
+                    metric_key=metric_key,
+                    metrics=[metric.to_proto() for metric in metrics],
+                )
+
+    def stream_json_response():
+        # The JSON of a GetMetricHistoryBulk.Response, serialized one history at a time so that
+        # the response of many long histories is neither built nor buffered at once
+        yield '{"metric_histories": ['
+        separator = ""
+        for history in iter_histories():
+            yield separator + message_to_json(history)
+            separator = ", "
+        yield "]}"
+
+    def stream_protobuf_response():
+        # A serialized message is the concatenation of its serialized fields, so the histories
+        # can be serialized one at a time as well
+        field_number = GetMetricHistoryBulk.Response.DESCRIPTOR.fields_by_name[
+            "metric_histories"
+        ].number
+        for history in iter_histories():
+            yield _serialize_message_field(field_number, history)
+
+    if _accepts_protobuf():
+        response = Response(stream_protobuf_response(), mimetype=PROTOBUF_CONTENT_TYPE)
+    else:
+        response = Response(stream_json_response(), mimetype=_JSON_CONTENT_TYPE)
+    return _advertise_content_types(response)
+
+
+def _serialize_message_field(field_number, message):
+    """
+    Serialize a message field of a message, i.e. its tag, the length of the serialized message
+    and the serialized message.
+    """
+    data = message.SerializeToString()
+    prefix = bytearray()
+    # Varints of the tag, with the wire type of length-delimited fields, and of the length
+    for value in [(field_number << 3) | 2, len(data)]:
+        while value > 0x7F:
+            prefix.append((value & 0x7F) | 0x80)
+            value >>= 7
+        prefix.append(value)
+    return bytes(prefix) + data
 
 
 @catch_mlflow_exception
@@ -510,9 +593,7 @@ def _list_experiments():
     experiment_entities = _get_tracking_store().list_experiments(request_message.view_type)
     response_message = ListExperiments.Response()
     response_message.experiments.extend([e.to_proto() for e in experiment_entities])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -522,7 +603,8 @@ def _get_artifact_repo(run):
 
 @catch_mlflow_exception
 def _log_batch():
-    _validate_batch_log_api_req(_get_request_json())
+    # The size of the request body, whatever its format, without decompressing more than the limit
+    _validate_batch_log_api_req(_get_request_data(max_size=MAX_BATCH_LOG_REQUEST_SIZE))
     request_message = _get_request_message(LogBatch())
     metrics = [Metric.from_proto(proto_metric) for proto_metric in request_message.metrics]
     params = [Param.from_proto(proto_param) for proto_param in request_message.params]
@@ -531,9 +613,7 @@ def _log_batch():
         run_id=request_message.run_id, metrics=metrics, params=params, tags=tags
     )
     response_message = LogBatch.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -561,15 +641,34 @@ def _log_model():
         run_id=request_message.run_id, mlflow_model=Model.from_dict(model)
     )
     response_message = LogModel.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    return _wrap_response(response_message)
+
+
+def _accepts_protobuf():
+    """
+    Whether the client of the current request prefers binary protobuf response bodies to JSON
+    ones, which remain the default.
+    """
+    if not has_request_context():
+        return False
+    accepted = request.accept_mimetypes.best_match([_JSON_CONTENT_TYPE, PROTOBUF_CONTENT_TYPE])
+    return accepted == PROTOBUF_CONTENT_TYPE
+
+
+def _advertise_content_types(response):
+    response.headers[CONTENT_TYPES_HEADER] = ", ".join([_JSON_CONTENT_TYPE, PROTOBUF_CONTENT_TYPE])
+    response.vary.add("Accept")
     return response
 
 
 def _wrap_response(response_message):
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    if _accepts_protobuf():
+        response = Response(mimetype=PROTOBUF_CONTENT_TYPE)
+        response.set_data(response_message.SerializeToString())
+    else:
+        response = Response(mimetype=_JSON_CONTENT_TYPE)
+        response.set_data(message_to_json(response_message))
+    return _advertise_content_types(response)
 
 
 @catch_mlflow_exception
@@ -857,6 +956,7 @@ HANDLERS = {
     SearchRuns: _search_runs,
     ListArtifacts: _list_artifacts,
     GetMetricHistory: _get_metric_history,
+    GetMetricHistoryBulk: _get_metric_history_bulk,
     ListExperiments: _list_experiments,
     # Model Registry APIs
     CreateRegisteredModel: _create_registered_model,
@@ -313,6 +313,27 @@ export class MlflowService {
     });
   }
 
+  /**
+   * @param {GetMetricHistoryBulk} data: Immutable Record
+   * @param {function} success
+   * @param {function} error
+   * @return {Promise}
+   */
+  static getMetricHistoryBulk({ data, success, error }) {
+    return $.ajax(Utils.getAjaxUrl('ajax-api/2.0/preview/mlflow/metrics/get-history-bulk'), {
+      type: 'POST',
+      contentType: 'application/json; charset=utf-8',
+      dataType: 'json',
+      converters: {
+        'text json': StrictJsonBigInt.parse,
+      },
+      data: JSON.stringify(data),
+      jsonp: false,
+      success: success,
+      error: error,
+    });
+  }
+
   /**
    * @param {SetTag} data: Immutable Record
    * @param {function} success
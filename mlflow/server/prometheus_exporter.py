@@ -1,32 +1,233 @@
-from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
-from flask import request
-
-
-def activate_prometheus_exporter(app):
-    metrics = GunicornInternalPrometheusMetrics(app, export_defaults=False)
-
-    endpoint = app.view_functions
-    histogram = metrics.histogram(
-        "mlflow_requests_by_status_and_path",
-        "Request latencies and count by status and path",
-        labels={
-            "status": lambda r: r.status_code,
-            "path": lambda: change_path_for_metric(request.path),
-        },
-    )
-    for func_name, func in endpoint.items():
-        if func_name in ["_search_runs", "_log_metric", "_log_param", "_set_tag", "_create_run"]:
-            app.view_functions[func_name] = histogram(func)
-
-    return app
-
-
-def change_path_for_metric(path):
-    """
-    Replace the '/' in the metric path by '_' so grafana can correctly use it.
-    :param path: path of the metric (example: runs/search)
-    :return: path with '_' instead of '/'
-    """
-    if "mlflow/" in path:
-        path = path.split("mlflow/")[-1]
-    return path.replace("/", "_")
+import time
+from functools import wraps
+
+import sqlalchemy
+from flask import request
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+
+from mlflow.server import handlers
+from mlflow.store.db import utils as db_utils
+from mlflow.store.model_registry.abstract_store import AbstractStore as AbstractModelRegistryStore
+from mlflow.store.tracking.abstract_store import AbstractStore as AbstractTrackingStore
+
+# View functions of the artifact routes, registered by `mlflow.server` besides the endpoints of
+# `mlflow.server.handlers.get_endpoints()`
+_ARTIFACT_VIEW_FUNCTIONS = ["serve_artifacts", "serve_model_version_artifact"]
+
+# Payload sizes from 100 B to 1 GB
+_SIZE_BUCKETS = tuple(10 ** exponent for exponent in range(2, 10)) + (float("inf"),)
+
+_REQUEST_SIZE = Histogram(
+    "mlflow_request_size_bytes",
+    "Size in bytes of the request bodies by path",
+    ["path"],
+    buckets=_SIZE_BUCKETS,
+)
+_RESPONSE_SIZE = Histogram(
+    "mlflow_response_size_bytes",
+    "Size in bytes of the response bodies sent by path",
+    ["path"],
+    buckets=_SIZE_BUCKETS,
+)
+_ARTIFACT_BYTES_SERVED = Counter(
+    "mlflow_artifact_bytes_served", "Bytes of artifact files sent by path", ["path"]
+)
+_STORE_METHOD_DURATION = Histogram(
+    "mlflow_store_method_duration_seconds",
+    "Duration in seconds of the calls to the backend store methods by store and method",
+    ["store", "method"],
+)
+# Gauges of the connection pools are summed over the live server processes
+_POOL_CHECKED_OUT = Gauge(
+    "mlflow_sqlalchemy_pool_checked_out_connections",
+    "Connections checked out of the SQLAlchemy connection pools by database",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+_POOL_OVERFLOW = Gauge(
+    "mlflow_sqlalchemy_pool_overflow_connections",
+    "Connections opened beyond the size of the SQLAlchemy connection pools by database",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+_POOL_WAIT_TIME = Histogram(
+    "mlflow_sqlalchemy_pool_wait_seconds",
+    "Time in seconds to check out connections of the SQLAlchemy connection pools by database",
+    ["database"],
+)
+
+
+def activate_prometheus_exporter(app):
+    metrics = GunicornInternalPrometheusMetrics(app, export_defaults=False)
+
+    endpoint = app.view_functions
+    histogram = metrics.histogram(
+        "mlflow_requests_by_status_and_path",
+        "Request latencies and count by status and path",
+        labels={
+            "status": lambda r: r.status_code,
+            "path": lambda: change_path_for_metric(request.path),
+        },
+    )
+    instrumented = {handler.__name__ for _, handler, _ in handlers.get_endpoints()}
+    instrumented.update(_ARTIFACT_VIEW_FUNCTIONS)
+    for func_name, func in endpoint.items():
+        if func_name in instrumented:
+            app.view_functions[func_name] = histogram(func)
+
+    @app.before_request
+    def _record_request_size():
+        if request.endpoint in instrumented:
+            path = change_path_for_metric(request.path)
+            _REQUEST_SIZE.labels(path).observe(request.content_length or 0)
+
+    @app.after_request
+    def _record_response_size(response):
+        if request.endpoint not in instrumented:
+            return response
+        path = change_path_for_metric(request.path)
+        if request.endpoint in _ARTIFACT_VIEW_FUNCTIONS:
+            served = _ARTIFACT_BYTES_SERVED.labels(path)
+        else:
+            served = None
+        if response.is_streamed:
+            # The size of streamed responses is only known once they are sent
+            response.response = _SentBytesIterable(
+                response.response, _RESPONSE_SIZE.labels(path), served
+            )
+        else:
+            size = response.calculate_content_length() or 0
+            _RESPONSE_SIZE.labels(path).observe(size)
+            if served is not None:
+                served.inc(size)
+        return response
+
+    handlers.set_store_wrapper(instrument_store)
+    db_utils.register_engine_hook(instrument_engine)
+
+    return app
+
+
+def change_path_for_metric(path):
+    """
+    Replace the '/' in the metric path by '_' so grafana can correctly use it.
+    :param path: path of the metric (example: runs/search)
+    :return: path with '_' instead of '/'
+    """
+    if "mlflow/" in path:
+        path = path.split("mlflow/")[-1]
+    return path.replace("/", "_")
+
+
+class _SentBytesIterable(object):
+    """
+    Iterable over the chunks of a streamed response that records their total size once the
+    response is closed.
+    """
+
+    def __init__(self, iterable, size_histogram, served_counter=None):
+        self._iterable = iterable
+        self._size_histogram = size_histogram
+        self._served_counter = served_counter
+        self._num_bytes = 0
+        self._closed = False
+
+    def __iter__(self):
+        for chunk in self._iterable:
+            self._num_bytes += len(chunk)
+            if self._served_counter is not None:
+                self._served_counter.inc(len(chunk))
+            yield chunk
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._size_histogram.observe(self._num_bytes)
+        if hasattr(self._iterable, "close"):
+            self._iterable.close()
+
+
+class _InstrumentedStore(object):
+    """
+    Proxy of a backend store that times the calls to the methods of its abstract store class.
+    """
+
+    def __init__(self, store, store_name, abstract_store_class):
+        self._store = store
+        self._store_name = store_name
+        self._methods = {
+            name
+            for name in dir(abstract_store_class)
+            if not name.startswith("_") and callable(getattr(abstract_store_class, name))
+        }
+
+    def __getattr__(self, name):
+        attribute = getattr(self._store, name)
+        if name not in self._methods:
+            return attribute
+        histogram = _STORE_METHOD_DURATION.labels(self._store_name, name)
+
+        @wraps(attribute)
+        def timed(*args, **kwargs):
+            with histogram.time():
+                return attribute(*args, **kwargs)
+
+        return timed
+
+
+def instrument_store(store):
+    """
+    Return a proxy of the tracking or model registry store that times the calls to its methods.
+    """
+    if isinstance(store, AbstractTrackingStore):
+        return _InstrumentedStore(store, "tracking", AbstractTrackingStore)
+    if isinstance(store, AbstractModelRegistryStore):
+        return _InstrumentedStore(store, "model_registry", AbstractModelRegistryStore)
+    return store
+
+
+def instrument_engine(engine):
+    """
+    Export the number of checked out and overflow connections of the pool of the SQLAlchemy
+    engine, and the time to check out its connections.
+    """
+    # Without the password of the URL
+    database = repr(engine.url)
+    checked_out = _POOL_CHECKED_OUT.labels(database)
+    overflow = _POOL_OVERFLOW.labels(database)
+    wait_time = _POOL_WAIT_TIME.labels(database)
+
+    def update_overflow():
+        # Only pools with a bounded size, e.g. `QueuePool`, have overflow connections
+        if hasattr(engine.pool, "overflow"):
+            overflow.set(max(engine.pool.overflow(), 0))
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+        update_overflow()
+
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+        update_overflow()
+
+    def time_checkouts(pool):
+        connect = pool.connect
+
+        @wraps(connect)
+        def timed_connect():
+            start = time.time()
+            try:
+                return connect()
+            finally:
+                wait_time.observe(time.time() - start)
+
+        pool.connect = timed_connect
+
+    # The pool listeners of the engine are carried over to the pools that replace its pool when
+    # it is disposed, unlike the timer of its checkouts, which is set on the new pool instead
+    sqlalchemy.event.listen(engine, "checkout", on_checkout)
+    sqlalchemy.event.listen(engine, "checkin", on_checkin)
+    sqlalchemy.event.listen(engine, "engine_disposed", lambda engine: time_checkouts(engine.pool))
+    time_checkouts(engine.pool)
@@ -0,0 +1,328 @@
+"""
+Local on-disk cache of artifacts downloaded from remote artifact repositories.
+
+An :py:class:`ArtifactCache` stores each artifact under a key derived from the resolved URI of its
+repository, its path and its version (see :py:func:`get_artifact_cache_key`), so that an artifact
+that changes is stored under a new key rather than served stale. The cache is bounded by the total
+size of its entries, evicting the least recently used ones, and can be shared by several processes,
+e.g. the workers of the tracking server or the processes loading models on a host:
+
+- Entries are populated in a staging directory, then atomically renamed into place, so that they
+  are never read while incomplete.
+- Reading an entry holds a shared lock on the cache, and evicting entries an exclusive one, so that
+  entries are never removed while being read.
+- Populating an entry holds an exclusive lock on its key, so that concurrent misses download it
+  once.
+
+Locks are advisory ``fcntl`` file locks, and are no-ops on platforms without ``fcntl``.
+"""
+import collections
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+
+from mlflow.store.artifact.artifact_repo import _get_positive_int_env_var
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+ARTIFACT_CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+ARTIFACT_CACHE_MAX_BYTES_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_BYTES"
+_DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+ArtifactCacheStats = collections.namedtuple("ArtifactCacheStats", ["hits", "misses", "evictions"])
+
+
+@contextmanager
+def _file_lock(path, shared=False):
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _get_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(dir_path, file_name))
+        for dir_path, _, file_names in os.walk(path)
+        for file_name in file_names
+    )
+
+
+class ArtifactCache(object):
+    """
+    Least recently used cache of artifact files and directories in a local directory, bounded by
+    the total size of its entries.
+
+    :param root: Local directory of the cache, created if it does not exist.
+    :param max_bytes: Maximum total size in bytes of the entries. Entries are evicted once they
+                      are no longer read, so an entry larger than the cache can still be read
+                      once.
+    """
+
+    def __init__(self, root, max_bytes=_DEFAULT_ARTIFACT_CACHE_MAX_BYTES):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self._entries_dir = os.path.join(self.root, "entries")
+        self._staging_dir = os.path.join(self.root, "staging")
+        self._locks_dir = os.path.join(self.root, "locks")
+        for path in [self._entries_dir, self._staging_dir, self._locks_dir]:
+            os.makedirs(path, exist_ok=True)
+        self._cache_lock_path = os.path.join(self.root, "cache.lock")
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self):
+        """
+        :py:class:`ArtifactCacheStats` of the hits, misses and evictions of this process.
+        """
+        with self._stats_lock:
+            return ArtifactCacheStats(self._hits, self._misses, self._evictions)
+
+    def _count(self, hits=0, misses=0, evictions=0):
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
+            self._evictions += evictions
+
+    def _get_entry_dir(self, key):
+        return os.path.join(self._entries_dir, key)
+
+    def _read_entry(self, key):
+        """
+        Return the path of the content of the entry and mark it as recently used, or None if
+        there is no such entry. Must be called while holding the cache lock.
+        """
+        entry_dir = self._get_entry_dir(key)
+        try:
+            os.utime(os.path.join(entry_dir, "size"))
+        except OSError:
+            return None
+        return os.path.join(entry_dir, "content")
+
+    @contextmanager
+    def lookup(self, key):
+        """
+        Yield the local path of the artifact file or directory of the entry with the specified
+        key, or None if there is no such entry. The entry cannot be evicted until this returns,
+        and it must not be modified.
+        """
+        with _file_lock(self._cache_lock_path, shared=True):
+            path = self._read_entry(key)
+            if path is None:
+                self._count(misses=1)
+            else:
+                self._count(hits=1)
+            yield path
+
+    @contextmanager
+    def get(self, key, download):
+        """
+        Yield the local path of the artifact file or directory of the entry with the specified
+        key like :py:meth:`lookup`, calling ``download(dst_dir)`` on a miss to populate the entry.
+        ``download`` must download the artifact into the existing ``dst_dir`` directory and return
+        its local path, e.g. ``ArtifactRepository.download_artifacts``.
+        """
+        with self.lookup(key) as path:
+            if path is not None:
+                yield path
+                return
+        with _file_lock(os.path.join(self._locks_dir, key)):
+            staging_dir = self.mkdtemp()
+            try:
+                # Unless it was populated by another process while waiting for the lock
+                with _file_lock(self._cache_lock_path, shared=True):
+                    populated = self._read_entry(key) is not None
+                if not populated:
+                    download_dir = os.path.join(staging_dir, "download")
+                    os.mkdir(download_dir)
+                    downloaded_path = os.path.abspath(download(download_dir))
+                    os.rename(downloaded_path, os.path.join(staging_dir, "content"))
+                    self._insert(key, staging_dir)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+        try:
+            with _file_lock(self._cache_lock_path, shared=True):
+                path = self._read_entry(key)
+                if path is None:
+                    # Evicted by another process meanwhile, which is only expected if the cache
+                    # is too small for the entries read concurrently
+                    raise IOError("The artifact cache entry {} was evicted".format(key))
+                yield path
+        finally:
+            self.evict()
+
+    def mkdtemp(self):
+        """
+        Create a staging directory, on the file system of the cache, in which to write the content
+        of an entry before calling :py:meth:`insert`.
+        """
+        return tempfile.mkdtemp(dir=self._staging_dir)
+
+    def insert(self, key, staging_dir):
+        """
+        Atomically move the artifact file or directory at ``<staging_dir>/content`` into the entry
+        with the specified key, unless it already exists, then remove the staging directory and
+        evict the least recently used entries.
+        """
+        try:
+            self._insert(key, staging_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        self.evict()
+
+    def _insert(self, key, staging_dir):
+        with open(os.path.join(staging_dir, "size"), "w") as f:
+            f.write(str(_get_size(os.path.join(staging_dir, "content"))))
+        entry_dir = self._get_entry_dir(key)
+        try:
+            os.rename(staging_dir, entry_dir)
+        except OSError:
+            # Renaming a directory onto an existing one fails, in which case the new one is
+            # discarded by the caller
+            if not os.path.exists(entry_dir):
+                raise
+
+    def evict(self):
+        """
+        Evict the least recently used entries until their total size fits in the cache.
+        """
+        with _file_lock(self._cache_lock_path):
+            entries = []
+            for key in os.listdir(self._entries_dir):
+                size_path = os.path.join(self._get_entry_dir(key), "size")
+                try:
+                    with open(size_path) as f:
+                        size = int(f.read())
+                    entries.append((os.path.getmtime(size_path), key, size))
+                except (OSError, ValueError):
+                    # Partially removed entry
+                    entries.append((0, key, 0))
+            total_bytes = sum(size for _, _, size in entries)
+            for _, key, size in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                # Moved away before being removed, so that it is never seen partially removed
+                evicted_dir = os.path.join(self._staging_dir, uuid.uuid4().hex)
+                try:
+                    os.rename(self._get_entry_dir(key), evicted_dir)
+                except OSError:
+                    continue
+                shutil.rmtree(evicted_dir, ignore_errors=True)
+                try:
+                    os.remove(os.path.join(self._locks_dir, key))
+                except OSError:
+                    pass
+                total_bytes -= size
+                self._count(evictions=1)
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def _get_artifact_cache(root):
+    max_bytes = _get_positive_int_env_var(
+        ARTIFACT_CACHE_MAX_BYTES_ENV_VAR, _DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+    )
+    with _caches_lock:
+        if root not in _caches:
+            _caches[root] = ArtifactCache(root)
+        cache = _caches[root]
+    cache.max_bytes = max_bytes
+    return cache
+
+
+def get_artifact_cache():
+    """
+    Return the :py:class:`ArtifactCache` in the directory set by the ``MLFLOW_ARTIFACT_CACHE_DIR``
+    environment variable, with the maximum size in bytes set by ``MLFLOW_ARTIFACT_CACHE_MAX_BYTES``
+    (1 GiB by default), or None if the environment variable is not set.
+    """
+    root = os.environ.get(ARTIFACT_CACHE_DIR_ENV_VAR)
+    if not root:
+        return None
+    return _get_artifact_cache(os.path.abspath(root))
+
+
+def _resolve_repository(artifact_repository):
+    # runs:/ and models:/ URIs resolve to the repository of the run or model version
+    while isinstance(artifact_repository, (RunsArtifactRepository, ModelsArtifactRepository)):
+        artifact_repository = artifact_repository.repo
+    return artifact_repository
+
+
+def is_artifact_repository_cacheable(artifact_repository):
+    """
+    Return whether the artifacts of the repository can be cached, i.e. unless they are stored on
+    the local file system or the repository cannot be resolved to a URI identifying their content.
+    """
+    repository = _resolve_repository(artifact_repository)
+    if isinstance(repository, LocalArtifactRepository):
+        return False
+    uri = repository.artifact_uri
+    if RunsArtifactRepository.is_runs_uri(uri) or ModelsArtifactRepository.is_models_uri(uri):
+        return False
+    return True
+
+
+def get_artifact_cache_key(artifact_repository, artifact_path, version):
+    """
+    Return the cache key of an artifact of the repository, or None if the artifact should not be
+    cached (see :py:func:`is_artifact_repository_cacheable`).
+
+    :param version: JSON-serializable identifier of the version of the artifact, e.g. the size and
+                    entity tag of a file.
+    """
+    if not is_artifact_repository_cacheable(artifact_repository):
+        return None
+    uri = _resolve_repository(artifact_repository).artifact_uri
+    identifier = json.dumps([uri, artifact_path.strip("/"), version])
+    return hashlib.sha256(identifier.encode("utf-8")).hexdigest()
+
+
+def get_artifact_version(artifact_repository, artifact_path):
+    """
+    Return the version identifier of an artifact file or directory, derived from the sizes of its
+    files and, for a file of a repository that can stream it, its entity tag, or None if some
+    sizes are unknown.
+    """
+    repository = _resolve_repository(artifact_repository)
+    if repository._is_directory(artifact_path):
+        version = sorted(
+            [file_info.path, file_info.file_size]
+            for file_info in repository._list_artifacts_recursive(artifact_path)
+            if not file_info.is_dir
+        )
+        if any(size is None for _, size in version):
+            return None
+        return version
+    try:
+        with repository.open_artifact_stream(artifact_path) as stream:
+            return [stream.size, stream.etag]
+    except NotImplementedError:
+        pass
+    parent = os.path.dirname(artifact_path.rstrip("/"))
+    for file_info in repository.list_artifacts(parent or None):
+        if file_info.path == artifact_path and not file_info.is_dir:
+            return file_info.file_size
+    return None
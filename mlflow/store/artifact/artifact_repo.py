@@ -1,14 +1,194 @@
+import logging
 import os
 import posixpath
 import tempfile
+import threading
 from abc import abstractmethod, ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 
+from mlflow.entities import FileInfo
 from mlflow.utils.validation import path_not_unique, bad_path_message
 from mlflow.utils.annotations import experimental
+from mlflow.utils.file_utils import relative_path_to_artifact_path
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
 
+_logger = logging.getLogger(__name__)
+
+# Maximum number of threads used to download the files of an artifact directory concurrently
+_ARTIFACT_DOWNLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS"
+# Maximum number of threads used to upload the files of a local directory concurrently
+_ARTIFACT_UPLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS"
+_DEFAULT_DOWNLOAD_MAX_WORKERS = 8
+_DEFAULT_UPLOAD_MAX_WORKERS = 8
+# Size in bytes of the chunks of artifact streams
+_ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_positive_int_env_var(env_var, default):
+    value = os.environ.get(env_var)
+    if not value:
+        return default
+    try:
+        parsed_value = int(value)
+    except ValueError:
+        parsed_value = 0
+    if parsed_value < 1:
+        raise MlflowException(
+            "The value of the {} environment variable must be a positive integer, got"
+            " '{}'".format(env_var, value),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return parsed_value
+
+
+def _get_download_max_workers():
+    return _get_positive_int_env_var(
+        _ARTIFACT_DOWNLOAD_MAX_WORKERS_ENV_VAR, _DEFAULT_DOWNLOAD_MAX_WORKERS
+    )
+
+
+def _get_upload_max_workers():
+    return _get_positive_int_env_var(
+        _ARTIFACT_UPLOAD_MAX_WORKERS_ENV_VAR, _DEFAULT_UPLOAD_MAX_WORKERS
+    )
+
+
+def _run_concurrently(func, args_list, max_workers, action):
+    """
+    Call ``func(*args)`` for each element of ``args_list`` in a pool of at most ``max_workers``
+    threads. The first element of each ``args`` tuple names the file being transferred in the
+    error raised if any of the calls fail. A single call is made in the calling thread and its
+    exceptions are raised as is.
+
+    :param action: Verb describing the transfer in error messages, e.g. "download".
+    """
+    if len(args_list) == 1:
+        func(*args_list[0])
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+        futures = [(args[0], executor.submit(func, *args)) for args in args_list]
+    failures = [(name, future.exception()) for name, future in futures if future.exception()]
+    if failures:
+        for name, exc in failures:
+            _logger.debug("Failed to %s artifact %s", action, name, exc_info=exc)
+        raise MlflowException(
+            "Failed to {} {} of {} artifacts: {}".format(
+                action,
+                len(failures),
+                len(args_list),
+                "; ".join("{}: {}".format(name, exc) for name, exc in failures),
+            )
+        )
+
+
+def _list_local_files(local_dir, dest_path):
+    """
+    Return a ``(local_file, remote_path)`` tuple for every file under ``local_dir``, where the
+    remote path is the relative path of the file in ``local_dir`` joined to ``dest_path``.
+    """
+    local_dir = os.path.abspath(local_dir)
+    local_and_remote_paths = []
+    for (root, _, filenames) in os.walk(local_dir):
+        upload_path = dest_path
+        if root != local_dir:
+            rel_path = os.path.relpath(root, local_dir)
+            rel_path = relative_path_to_artifact_path(rel_path)
+            upload_path = posixpath.join(dest_path, rel_path)
+        for f in filenames:
+            local_and_remote_paths.append((os.path.join(root, f), posixpath.join(upload_path, f)))
+    return local_and_remote_paths
+
+
+class TransferProgress(object):
+    """
+    Accounting of the files and bytes transferred by a multi-file upload. Backends call
+    :py:meth:`update` as bytes are sent, from any thread, and an optional callback receives this
+    object after each update.
+    """
+
+    def __init__(self, total_files, total_bytes, callback=None):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.transferred_files = 0
+        self.transferred_bytes = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def update(self, num_bytes):
+        """
+        Record that ``num_bytes`` more bytes were transferred.
+        """
+        with self._lock:
+            self.transferred_bytes += num_bytes
+        if self._callback is not None:
+            self._callback(self)
+
+    def _complete_file(self):
+        with self._lock:
+            self.transferred_files += 1
+        if self._callback is not None:
+            self._callback(self)
+
+    def __repr__(self):
+        return "<TransferProgress: {}/{} files, {}/{} bytes>".format(
+            self.transferred_files, self.total_files, self.transferred_bytes, self.total_bytes
+        )
+
+
+class ArtifactStream(object):
+    """
+    An artifact file opened with :py:meth:`ArtifactRepository.open_artifact_stream`, whose bytes
+    are read in chunks with :py:meth:`read_range`. It must be closed once read.
+
+    :param size: Size of the file in bytes.
+    :param etag: Opaque tag that changes whenever the content of the file changes, without quotes,
+                 or None if the backend does not provide one.
+    :param read_range: Function returning an iterator over the chunks of bytes of the file from
+                       the ``start`` offset included to the ``stop`` offset excluded. Backends
+                       should only request the bytes of the file once it is iterated over, and
+                       fail rather than return the bytes of a different version of the file.
+    :param close: Optional function releasing the resources held by the stream.
+    """
+
+    def __init__(self, size, etag, read_range, close=None):
+        self.size = size
+        self.etag = etag
+        self._read_range = read_range
+        self._close = close
+
+    def read_range(self, start=0, stop=None):
+        """
+        Return an iterator over the chunks of bytes of the file from ``start`` included to ``stop``
+        excluded, or to the end of the file if ``stop`` is None.
+        """
+        stop = self.size if stop is None else stop
+        if not 0 <= start <= stop <= self.size:
+            raise MlflowException(
+                "Invalid byte range [{}, {}) of a file of {} bytes".format(start, stop, self.size),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        if start == stop:
+            return iter([])
+        return self._read_range(start, stop)
+
+    def close(self):
+        if self._close is not None:
+            self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _artifact_file_not_found(artifact_path):
+    return MlflowException(
+        "No artifact file found at '{}'".format(artifact_path), error_code=RESOURCE_DOES_NOT_EXIST
+    )
+
 
 class ArtifactRepository:
     """
@@ -92,20 +272,22 @@ class ArtifactRepository:
 
         def download_artifact_dir(dir_path):
             local_dir = os.path.join(dst_path, dir_path)
-            dir_content = [  # prevent infinite loop, sometimes the dir is recursively included
-                file_info
-                for file_info in self.list_artifacts(dir_path)
-                if file_info.path != "." and file_info.path != dir_path
-            ]
-            if not dir_content:  # empty dir
-                if not os.path.exists(local_dir):
-                    os.makedirs(local_dir)
-            else:
-                for file_info in dir_content:
-                    if file_info.is_dir:
-                        download_artifact_dir(dir_path=file_info.path)
-                    else:
-                        download_file(file_info.path)
+            # Create every local directory before downloading the files concurrently
+            local_dirs = {local_dir}
+            file_paths = []
+            for file_info in self._list_artifacts_recursive(dir_path):
+                path = file_info.path.rstrip("/")
+                if file_info.is_dir:
+                    local_dirs.add(os.path.join(dst_path, path))
+                else:
+                    local_dirs.add(os.path.join(dst_path, posixpath.dirname(path)))
+                    file_paths.append(path)
+            for local_dir_path in local_dirs:
+                if not os.path.exists(local_dir_path):
+                    os.makedirs(local_dir_path)
+            self._download_files(
+                [(file_path, os.path.join(dst_path, file_path)) for file_path in file_paths]
+            )
             return local_dir
 
         if dst_path is None:
@@ -135,6 +317,88 @@ class ArtifactRepository:
         else:
             return download_file(artifact_path)
 
+    def _list_artifacts_recursive(self, path):
+        """
+        Return all the files under the specified directory, at any depth, as well as its empty
+        subdirectories. Backends that can list every object under a prefix in a single request
+        override this method, by default each directory is listed with ``list_artifacts``.
+
+        :param path: Relative source path of the directory to list.
+
+        :return: List of FileInfo objects. Only empty directories have ``is_dir`` set to true.
+        """
+        infos = []
+        dir_paths = [path]
+        while dir_paths:
+            dir_path = dir_paths.pop()
+            dir_content = [  # prevent infinite loop, sometimes the dir is recursively included
+                file_info
+                for file_info in self.list_artifacts(dir_path)
+                if file_info.path != "." and file_info.path != dir_path
+            ]
+            if not dir_content:  # empty dir
+                infos.append(FileInfo(dir_path, True, None))
+            for file_info in dir_content:
+                if file_info.is_dir:
+                    dir_paths.append(file_info.path)
+                else:
+                    infos.append(file_info)
+        return infos
+
+    def _download_files(self, remote_and_local_paths):
+        """
+        Download files concurrently with ``_download_file``, using at most as many threads as
+        specified by the ``MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS`` environment variable. The parent
+        directories of the local paths must already exist.
+
+        :param remote_and_local_paths: List of ``(remote_file_path, local_path)`` tuples.
+        """
+        if remote_and_local_paths:
+            _run_concurrently(
+                self._download_file,
+                remote_and_local_paths,
+                max_workers=_get_download_max_workers(),
+                action="download",
+            )
+
+    def _upload_files(
+        self, upload_file, local_and_remote_paths, max_workers=None, progress_callback=None
+    ):
+        """
+        Upload files concurrently with ``upload_file(local_file, remote_path, progress)``, which
+        must report the bytes it sends through ``progress.update``.
+
+        :param upload_file: Function uploading a single file. It may be called concurrently from
+                            several threads.
+        :param local_and_remote_paths: List of ``(local_file, remote_path)`` tuples.
+        :param max_workers: Maximum number of files uploaded at the same time. Defaults to the
+                            value of the ``MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS`` environment
+                            variable, or 8.
+        :param progress_callback: Optional function called with a :py:class:`TransferProgress`
+                                  object as the upload progresses.
+
+        :return: The :py:class:`TransferProgress` of the upload.
+        """
+        total_bytes = sum(os.path.getsize(local_file) for local_file, _ in local_and_remote_paths)
+        progress = TransferProgress(
+            total_files=len(local_and_remote_paths),
+            total_bytes=total_bytes,
+            callback=progress_callback,
+        )
+
+        def upload(local_file, remote_path):
+            upload_file(local_file, remote_path, progress)
+            progress._complete_file()
+
+        if local_and_remote_paths:
+            _run_concurrently(
+                upload,
+                local_and_remote_paths,
+                max_workers=max_workers or _get_upload_max_workers(),
+                action="upload",
+            )
+        return progress
+
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
         """
@@ -144,9 +408,25 @@ class ArtifactRepository:
         :param remote_file_path: Source path to the remote file, relative to the root
                                  directory of the artifact repository.
         :param local_path: The path to which to save the downloaded file.
+
+        This method may be called concurrently from several threads.
         """
         pass
 
+    def open_artifact_stream(self, artifact_path):
+        """
+        Open the artifact file at the specified path in order to read byte ranges of it without
+        downloading the whole file, e.g. to serve it from the tracking server. Backends that
+        cannot read byte ranges of files raise ``NotImplementedError``, which is the default.
+
+        :param artifact_path: Relative source path of the file.
+
+        :return: An :py:class:`ArtifactStream`. An ``MlflowException`` with the
+                 ``RESOURCE_DOES_NOT_EXIST`` error code is raised if there is no file at the path,
+                 e.g. if it is a directory.
+        """
+        raise NotImplementedError("{} cannot stream artifacts".format(self.__class__.__name__))
+
     @experimental
     def delete_artifacts(self, artifact_path=None):
         """
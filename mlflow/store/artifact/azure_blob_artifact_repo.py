@@ -5,7 +5,12 @@ import urllib.parse
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStream,
+    _artifact_file_not_found,
+    _list_local_files,
+)
 
 
 class AzureBlobArtifactRepository(ArtifactRepository):
@@ -16,10 +21,19 @@ class AzureBlobArtifactRepository(ArtifactRepository):
     ``wasbs://<container-name>@<ystorage-account-name>.blob.core.windows.net/<path>``,
     following the same URI scheme as Hadoop on Azure blob storage. It requires that your Azure
     storage access key be available in the environment variable ``AZURE_STORAGE_ACCESS_KEY``.
+
+    :param max_upload_workers: Maximum number of files uploaded at the same time by
+                               ``log_artifacts``. Defaults to the value of the
+                               ``MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS`` environment variable, or 8.
+    :param progress_callback: Optional function called with a
+                              :py:class:`mlflow.store.artifact.artifact_repo.TransferProgress`
+                              object as uploads progress.
     """
 
-    def __init__(self, artifact_uri, client=None):
+    def __init__(self, artifact_uri, client=None, max_upload_workers=None, progress_callback=None):
         super().__init__(artifact_uri)
+        self._max_upload_workers = max_upload_workers
+        self._progress_callback = progress_callback
 
         # Allow override for testing
         if client:
@@ -62,31 +76,33 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             path = path[1:]
         return container, storage_account, path
 
+    def _upload_files_to_container(self, local_and_remote_paths, container):
+        container_client = self.client.get_container_client(container)
+
+        def upload_file(local_file, remote_path, progress):
+            with open(local_file, "rb") as file:
+                container_client.upload_blob(remote_path, file)
+            progress.update(os.path.getsize(local_file))
+
+        return self._upload_files(
+            upload_file,
+            local_and_remote_paths,
+            max_workers=self._max_upload_workers,
+            progress_callback=self._progress_callback,
+        )
+
     def log_artifact(self, local_file, artifact_path=None):
         (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
-        container_client = self.client.get_container_client(container)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         dest_path = posixpath.join(dest_path, os.path.basename(local_file))
-        with open(local_file, "rb") as file:
-            container_client.upload_blob(dest_path, file)
+        self._upload_files_to_container([(local_file, dest_path)], container)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
-        container_client = self.client.get_container_client(container)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                remote_file_path = posixpath.join(upload_path, f)
-                local_file_path = os.path.join(root, f)
-                with open(local_file_path, "rb") as file:
-                    container_client.upload_blob(remote_file_path, file)
+        self._upload_files_to_container(_list_local_files(local_dir, dest_path), container)
 
     def list_artifacts(self, path=None):
         # Newer versions of `azure-storage-blob` (>= 12.4.0) provide a public
@@ -128,6 +144,26 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             return []
         return sorted(infos, key=lambda f: f.path)
 
+    def _list_artifacts_recursive(self, path):
+        # List every blob under the directory prefix at once, instead of walking the hierarchy
+        (container, _, artifact_path) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        infos = []
+        prefix = dest_path.rstrip("/") + "/" if dest_path else ""
+        for r in container_client.list_blobs(name_starts_with=prefix):
+            if not r.name.startswith(artifact_path):
+                raise MlflowException(
+                    "The name of the listed Azure blob does not begin with the specified"
+                    " artifact path. Artifact path: {artifact_path}. Blob name:"
+                    " {blob_name}".format(artifact_path=artifact_path, blob_name=r.name)
+                )
+            file_name = posixpath.relpath(path=r.name, start=artifact_path)
+            infos.append(FileInfo(file_name, False, r.size))
+        return infos
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
@@ -135,5 +171,32 @@ class AzureBlobArtifactRepository(ArtifactRepository):
         with open(local_path, "wb") as file:
             container_client.download_blob(remote_full_path).readinto(file)
 
+    def open_artifact_stream(self, artifact_path):
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceNotFoundError
+
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob_client = self.client.get_container_client(container).get_blob_client(remote_full_path)
+        try:
+            properties = blob_client.get_blob_properties()
+        except ResourceNotFoundError:
+            raise _artifact_file_not_found(artifact_path)
+
+        def read_range(start, stop):
+            # Fails if the blob was overwritten since it was opened
+            downloader = blob_client.download_blob(
+                offset=start,
+                length=stop - start,
+                etag=properties.etag,
+                match_condition=MatchConditions.IfNotModified,
+            )
+            for chunk in downloader.chunks():
+                yield chunk
+
+        return ArtifactStream(
+            size=properties.size, etag=properties.etag.strip('"'), read_range=read_range
+        )
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
@@ -1,11 +1,17 @@
 import os
+import threading
 
 import posixpath
 import urllib.parse
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStream,
+    _ARTIFACT_STREAM_CHUNK_SIZE,
+    _artifact_file_not_found,
+    _list_local_files,
+)
 from mlflow.exceptions import MlflowException
 
 
@@ -15,9 +21,18 @@ class GCSArtifactRepository(ArtifactRepository):
 
     Assumes the google credentials are available in the environment,
     see https://google-cloud.readthedocs.io/en/latest/core/auth.html.
+
+    :param max_upload_workers: Maximum number of files uploaded at the same time by
+                               ``log_artifacts``. Defaults to the value of the
+                               ``MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS`` environment variable, or 8.
+    :param progress_callback: Optional function called with a
+                              :py:class:`mlflow.store.artifact.artifact_repo.TransferProgress`
+                              object as uploads progress.
     """
 
-    def __init__(self, artifact_uri, client=None):
+    def __init__(self, artifact_uri, client=None, max_upload_workers=None, progress_callback=None):
+        self._max_upload_workers = max_upload_workers
+        self._progress_callback = progress_callback
         if client:
             self.gcs = client
         else:
@@ -46,32 +61,35 @@ class GCSArtifactRepository(ArtifactRepository):
             storage_client = self.gcs.Client.create_anonymous_client()
         return storage_client.bucket(bucket)
 
+    def _upload_files_to_bucket(self, local_and_remote_paths, bucket):
+        # Storage clients are not thread-safe, each upload thread uses its own client
+        thread_local = threading.local()
+
+        def upload_file(local_file, remote_path, progress):
+            if not hasattr(thread_local, "bucket"):
+                thread_local.bucket = self._get_bucket(bucket)
+            thread_local.bucket.blob(remote_path).upload_from_filename(local_file)
+            progress.update(os.path.getsize(local_file))
+
+        return self._upload_files(
+            upload_file,
+            local_and_remote_paths,
+            max_workers=self._max_upload_workers,
+            progress_callback=self._progress_callback,
+        )
+
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         dest_path = posixpath.join(dest_path, os.path.basename(local_file))
-
-        gcs_bucket = self._get_bucket(bucket)
-        blob = gcs_bucket.blob(dest_path)
-        blob.upload_from_filename(local_file)
+        self._upload_files_to_bucket([(local_file, dest_path)], bucket)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        gcs_bucket = self._get_bucket(bucket)
-
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
+        self._upload_files_to_bucket(_list_local_files(local_dir, dest_path), bucket)
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
@@ -103,11 +121,48 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return [FileInfo(path[len(artifact_path) + 1 : -1], True, None) for path in dir_paths]
 
+    def _list_artifacts_recursive(self, path):
+        # List every blob under the directory prefix at once, without a delimiter
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+
+        infos = []
+        for result in self._get_bucket(bucket).list_blobs(prefix=prefix):
+            blob_path = result.name[len(artifact_path) + 1 :]
+            # Blobs ending with a slash are placeholders for (possibly empty) directories
+            if result.name.endswith("/"):
+                infos.append(FileInfo(blob_path.rstrip("/"), True, None))
+            else:
+                infos.append(FileInfo(blob_path, False, result.size))
+        return infos
+
     def _download_file(self, remote_file_path, local_path):
         (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
         gcs_bucket = self._get_bucket(bucket)
         gcs_bucket.blob(remote_full_path).download_to_filename(local_path)
 
+    def open_artifact_stream(self, artifact_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob = self._get_bucket(bucket).get_blob(remote_full_path)
+        if blob is None:
+            raise _artifact_file_not_found(artifact_path)
+
+        def read_range(start, stop):
+            for offset in range(start, stop, _ARTIFACT_STREAM_CHUNK_SIZE):
+                # The end offset is inclusive. Fails if the blob was overwritten since it was
+                # opened, as its generation changed
+                yield blob.download_as_bytes(
+                    start=offset,
+                    end=min(offset + _ARTIFACT_STREAM_CHUNK_SIZE, stop) - 1,
+                    if_generation_match=blob.generation,
+                )
+
+        return ArtifactStream(size=blob.size, etag=blob.etag, read_range=read_range)
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
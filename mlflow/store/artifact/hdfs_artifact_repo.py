@@ -1,12 +1,16 @@
 import os
 import posixpath
 import tempfile
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 import urllib.parse
 
 from mlflow.entities import FileInfo
-from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStream,
+    _ARTIFACT_STREAM_CHUNK_SIZE,
+    _artifact_file_not_found,
+)
 from mlflow.utils.file_utils import mkdir, relative_path_to_artifact_path
 
 
@@ -134,6 +138,7 @@ class HdfsArtifactRepository(ArtifactRepository):
                 _download_hdfs_file(hdfs, hdfs_base_path, local_path)
                 return local_path
 
+            remote_and_local_paths = []
             for path, is_dir, _ in self._walk_path(hdfs, hdfs_base_path):
 
                 relative_path = _relative_path_remote(hdfs_base_path, path)
@@ -142,11 +147,46 @@ class HdfsArtifactRepository(ArtifactRepository):
                 if is_dir:
                     mkdir(local_path)
                 else:
-                    _download_hdfs_file(hdfs, path, local_path)
-            return local_dir
+                    mkdir(os.path.dirname(local_path))
+                    remote_and_local_paths.append(
+                        (_relative_path_remote(self.path, path), local_path)
+                    )
+
+        self._download_files(remote_and_local_paths)
+        return local_dir
 
     def _download_file(self, remote_file_path, local_path):
-        raise MlflowException("This is not implemented. Should never be called.")
+        hdfs_path = _resolve_base_path(self.path, remote_file_path)
+        with hdfs_system(scheme=self.scheme, host=self.host, port=self.port) as hdfs:
+            _download_hdfs_file(hdfs, hdfs_path, local_path)
+
+    def open_artifact_stream(self, artifact_path):
+        hdfs_path = _resolve_base_path(self.path, artifact_path)
+        # The connection stays open until the stream is closed
+        with ExitStack() as stack:
+            hdfs = stack.enter_context(hdfs_system(self.scheme, self.host, self.port))
+            if not hdfs.exists(hdfs_path) or hdfs.isdir(hdfs_path):
+                raise _artifact_file_not_found(artifact_path)
+            info = hdfs.info(hdfs_path)
+            f = stack.enter_context(hdfs.open(hdfs_path, "rb"))
+            resources = stack.pop_all()
+
+        def read_range(start, stop):
+            f.seek(start)
+            offset = start
+            while offset < stop:
+                chunk = f.read(min(_ARTIFACT_STREAM_CHUNK_SIZE, stop - offset))
+                if not chunk:
+                    raise IOError("Unexpected end of file '{}'".format(hdfs_path))
+                offset += len(chunk)
+                yield chunk
+
+        return ArtifactStream(
+            size=info["size"],
+            etag="{:x}-{:x}".format(int(info["last_modified"]), info["size"]),
+            read_range=read_range,
+            close=resources.close,
+        )
 
     def delete_artifacts(self, artifact_path=None):
         path = posixpath.join(self.path, artifact_path) if artifact_path else self.path
@@ -1,8 +1,14 @@
-import distutils.dir_util as dir_util
 import os
 import shutil
+import threading
 
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStream,
+    verify_artifact_path,
+    _ARTIFACT_STREAM_CHUNK_SIZE,
+    _artifact_file_not_found,
+)
 from mlflow.utils.file_utils import (
     mkdir,
     list_all,
@@ -55,6 +61,9 @@ class LocalArtifactRepository(ArtifactRepository):
         )
         if not os.path.exists(artifact_dir):
             mkdir(artifact_dir)
+        # distutils is slow to import, and only needed to upload directories
+        import distutils.dir_util as dir_util
+
         dir_util.copy_tree(src=local_dir, dst=artifact_dir, preserve_mode=0, preserve_times=0)
 
     def download_artifacts(self, artifact_path, dst_path=None):
@@ -103,6 +112,35 @@ class LocalArtifactRepository(ArtifactRepository):
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
         shutil.copyfile(remote_file_path, local_path)
 
+    def open_artifact_stream(self, artifact_path):
+        # NOTE: The artifact_path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        if not os.path.isfile(local_artifact_path):
+            raise _artifact_file_not_found(artifact_path)
+        # Read from the same open file whatever happens to the path afterwards
+        f = open(local_artifact_path, "rb")
+        stat = os.fstat(f.fileno())
+        lock = threading.Lock()
+
+        def read_range(start, stop):
+            offset = start
+            while offset < stop:
+                with lock:
+                    f.seek(offset)
+                    chunk = f.read(min(_ARTIFACT_STREAM_CHUNK_SIZE, stop - offset))
+                if not chunk:
+                    raise IOError("Unexpected end of file '{}'".format(local_artifact_path))
+                offset += len(chunk)
+                yield chunk
+
+        return ArtifactStream(
+            size=stat.st_size,
+            etag="{:x}-{:x}".format(stat.st_mtime_ns, stat.st_size),
+            read_range=read_range,
+            close=f.close,
+        )
+
     def delete_artifacts(self, artifact_path=None):
         artifact_path = (
             os.path.join(self._artifact_dir, artifact_path) if artifact_path else self._artifact_dir
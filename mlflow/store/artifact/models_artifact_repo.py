@@ -120,5 +120,8 @@ class ModelsArtifactRepository(ArtifactRepository):
         """
         self.repo._download_file(remote_file_path, local_path)
 
+    def open_artifact_stream(self, artifact_path):
+        return self.repo.open_artifact_stream(artifact_path)
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
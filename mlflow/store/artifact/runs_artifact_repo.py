@@ -135,5 +135,8 @@ class RunsArtifactRepository(ArtifactRepository):
         """
         self.repo._download_file(remote_file_path, local_path)
 
+    def open_artifact_stream(self, artifact_path):
+        return self.repo.open_artifact_stream(artifact_path)
+
     def delete_artifacts(self, artifact_path=None):
         self.repo.delete_artifacts(artifact_path)
@@ -1,4 +1,5 @@
 import os
+import threading
 from mimetypes import guess_type
 
 import posixpath
@@ -7,12 +8,50 @@ import urllib.parse
 from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStream,
+    _ARTIFACT_STREAM_CHUNK_SIZE,
+    _artifact_file_not_found,
+    _get_upload_max_workers,
+    _list_local_files,
+)
+
+# Creating boto3 clients from the default session is not thread-safe
+_s3_client_lock = threading.Lock()
+
+# Size in bytes from which files are transferred in several parts
+_S3_MULTIPART_THRESHOLD_ENV_VAR = "MLFLOW_S3_MULTIPART_THRESHOLD"
+# Size in bytes of each part of a multipart transfer
+_S3_MULTIPART_CHUNKSIZE_ENV_VAR = "MLFLOW_S3_MULTIPART_CHUNKSIZE"
+# Maximum number of threads transferring the parts of a single file
+_S3_MAX_CONCURRENCY_ENV_VAR = "MLFLOW_S3_MAX_CONCURRENCY"
 
 
 class S3ArtifactRepository(ArtifactRepository):
-    """Stores artifacts on Amazon S3."""
+    """
+    Stores artifacts on Amazon S3.
+
+    :param artifact_uri: S3 URI of the artifact root, e.g. ``s3://bucket/path``.
+    :param transfer_config: ``boto3.s3.transfer.TransferConfig`` used for uploads and downloads.
+                            Defaults to the boto3 defaults, overridden by the
+                            ``MLFLOW_S3_MULTIPART_THRESHOLD``, ``MLFLOW_S3_MULTIPART_CHUNKSIZE``
+                            and ``MLFLOW_S3_MAX_CONCURRENCY`` environment variables.
+    :param max_upload_workers: Maximum number of files uploaded at the same time by
+                               ``log_artifacts``. Defaults to the value of the
+                               ``MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS`` environment variable, or 8.
+    :param progress_callback: Optional function called with a
+                              :py:class:`mlflow.store.artifact.artifact_repo.TransferProgress`
+                              object as uploads progress.
+    """
+
+    def __init__(
+        self, artifact_uri, transfer_config=None, max_upload_workers=None, progress_callback=None
+    ):
+        super().__init__(artifact_uri)
+        self._transfer_config = transfer_config
+        self._max_upload_workers = max_upload_workers
+        self._progress_callback = progress_callback
 
     @staticmethod
     def parse_s3_uri(uri):
@@ -35,6 +74,22 @@ class S3ArtifactRepository(ArtifactRepository):
         else:
             return None
 
+    def _get_transfer_config(self):
+        if self._transfer_config is not None:
+            return self._transfer_config
+        from boto3.s3.transfer import TransferConfig
+
+        transfer_kwargs = {}
+        for env_var, kwarg in [
+            (_S3_MULTIPART_THRESHOLD_ENV_VAR, "multipart_threshold"),
+            (_S3_MULTIPART_CHUNKSIZE_ENV_VAR, "multipart_chunksize"),
+            (_S3_MAX_CONCURRENCY_ENV_VAR, "max_concurrency"),
+        ]:
+            value = os.environ.get(env_var)
+            if value:
+                transfer_kwargs[kwarg] = int(value)
+        return TransferConfig(**transfer_kwargs)
+
     def _get_s3_client(self):
         import boto3
         from botocore.client import Config
@@ -49,14 +104,22 @@ class S3ArtifactRepository(ArtifactRepository):
         # NOTE: If you need to specify this env variable, please file an issue at
         # https://github.com/mlflow/mlflow/issues so we know your use-case!
         signature_version = os.environ.get("MLFLOW_EXPERIMENTAL_S3_SIGNATURE_VERSION", "s3v4")
-        return boto3.client(
-            "s3",
-            config=Config(signature_version=signature_version),
-            endpoint_url=s3_endpoint_url,
-            verify=verify,
+        # Keep a connection open for each thread of concurrent multipart transfers
+        max_upload_workers = self._max_upload_workers or _get_upload_max_workers()
+        max_pool_connections = max(
+            10, self._get_transfer_config().max_request_concurrency * max_upload_workers
         )
+        with _s3_client_lock:
+            return boto3.client(
+                "s3",
+                config=Config(
+                    signature_version=signature_version, max_pool_connections=max_pool_connections
+                ),
+                endpoint_url=s3_endpoint_url,
+                verify=verify,
+            )
 
-    def _upload_file(self, s3_client, local_file, bucket, key):
+    def _upload_file(self, s3_client, local_file, bucket, key, callback=None):
         extra_args = dict()
         guessed_type, guessed_encoding = guess_type(local_file)
         if guessed_type is not None:
@@ -66,36 +129,46 @@ class S3ArtifactRepository(ArtifactRepository):
         environ_extra_args = self.get_s3_file_upload_extra_args()
         if environ_extra_args is not None:
             extra_args.update(environ_extra_args)
-        s3_client.upload_file(Filename=local_file, Bucket=bucket, Key=key, ExtraArgs=extra_args)
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs=extra_args,
+            Callback=callback,
+            Config=self._get_transfer_config(),
+        )
+
+    def _upload_files_to_bucket(self, local_and_remote_paths, bucket):
+        s3_client = self._get_s3_client()
+
+        def upload_file(local_file, key, progress):
+            self._upload_file(
+                s3_client=s3_client,
+                local_file=local_file,
+                bucket=bucket,
+                key=key,
+                callback=progress.update,
+            )
+
+        return self._upload_files(
+            upload_file,
+            local_and_remote_paths,
+            max_workers=self._max_upload_workers,
+            progress_callback=self._progress_callback,
+        )
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         dest_path = posixpath.join(dest_path, os.path.basename(local_file))
-        self._upload_file(
-            s3_client=self._get_s3_client(), local_file=local_file, bucket=bucket, key=dest_path
-        )
+        self._upload_files_to_bucket([(local_file, dest_path)], bucket)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                self._upload_file(
-                    s3_client=s3_client,
-                    local_file=os.path.join(root, f),
-                    bucket=bucket,
-                    key=posixpath.join(upload_path, f),
-                )
+        self._upload_files_to_bucket(_list_local_files(local_dir, dest_path), bucket)
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
@@ -129,6 +202,30 @@ class S3ArtifactRepository(ArtifactRepository):
                 infos.append(FileInfo(file_rel_path, False, file_size))
         return sorted(infos, key=lambda f: f.path)
 
+    def _list_artifacts_recursive(self, path):
+        # List every object under the directory prefix at once, without a delimiter
+        (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        infos = []
+        prefix = dest_path + "/" if dest_path else ""
+        s3_client = self._get_s3_client()
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in result.get("Contents", []):
+                file_path = obj.get("Key")
+                self._verify_listed_object_contains_artifact_path_prefix(
+                    listed_object_path=file_path, artifact_path=artifact_path
+                )
+                file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
+                # Keys ending with a slash are placeholders for (possibly empty) directories
+                if file_path.endswith("/"):
+                    infos.append(FileInfo(file_rel_path, True, None))
+                else:
+                    infos.append(FileInfo(file_rel_path, False, int(obj.get("Size"))))
+        return infos
+
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
         if not listed_object_path.startswith(artifact_path):
@@ -144,7 +241,39 @@ class S3ArtifactRepository(ArtifactRepository):
         (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
         s3_full_path = posixpath.join(s3_root_path, remote_file_path)
         s3_client = self._get_s3_client()
-        s3_client.download_file(bucket, s3_full_path, local_path)
+        s3_client.download_file(
+            bucket, s3_full_path, local_path, Config=self._get_transfer_config()
+        )
+
+    def open_artifact_stream(self, artifact_path):
+        from botocore.exceptions import ClientError
+
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        key = posixpath.join(s3_root_path, artifact_path)
+        s3_client = self._get_s3_client()
+        try:
+            head = s3_client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+                raise _artifact_file_not_found(artifact_path)
+            raise
+        etag = head["ETag"].strip('"')
+
+        def read_range(start, stop):
+            # Fails with a 412 error if the object was overwritten since it was opened
+            body = s3_client.get_object(
+                Bucket=bucket,
+                Key=key,
+                Range="bytes={}-{}".format(start, stop - 1),
+                IfMatch=head["ETag"],
+            )["Body"]
+            try:
+                for chunk in body.iter_chunks(_ARTIFACT_STREAM_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                body.close()
+
+        return ArtifactStream(size=head["ContentLength"], etag=etag, read_range=read_range)
 
     def delete_artifacts(self, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
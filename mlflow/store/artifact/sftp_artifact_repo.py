@@ -1,11 +1,16 @@
 import os
 import sys
+import threading
 
 import posixpath
 import urllib.parse
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    _get_download_max_workers,
+    _run_concurrently,
+)
 from mlflow.exceptions import MlflowException
 
 
@@ -34,6 +39,11 @@ class SFTPArtifactRepository(ArtifactRepository):
             "password": parsed.password,
         }
         self.path = parsed.path
+        # pysftp connections are not thread-safe, so concurrent downloads open a connection per
+        # thread, which is closed once the download is done. A client passed to the constructor is
+        # shared and used by one thread at a time
+        self._client_lock = threading.Lock()
+        self._shared_client = client is not None
 
         if client:
             self.sftp = client
@@ -107,7 +117,39 @@ class SFTPArtifactRepository(ArtifactRepository):
 
     def _download_file(self, remote_file_path, local_path):
         remote_full_path = posixpath.join(self.path, remote_file_path)
-        self.sftp.get(remote_full_path, local_path)
+        with self._client_lock:
+            self.sftp.get(remote_full_path, local_path)
+
+    def _download_files(self, remote_and_local_paths):
+        if self._shared_client or len(remote_and_local_paths) <= 1:
+            super()._download_files(remote_and_local_paths)
+            return
+
+        import pysftp
+
+        thread_local = threading.local()
+        clients = []
+        clients_lock = threading.Lock()
+
+        def download_file(remote_file_path, local_path):
+            sftp = getattr(thread_local, "sftp", None)
+            if sftp is None:
+                sftp = pysftp.Connection(**self.config)
+                with clients_lock:
+                    clients.append(sftp)
+                thread_local.sftp = sftp
+            sftp.get(posixpath.join(self.path, remote_file_path), local_path)
+
+        try:
+            _run_concurrently(
+                download_file,
+                remote_and_local_paths,
+                max_workers=_get_download_max_workers(),
+                action="download",
+            )
+        finally:
+            for sftp in clients:
+                sftp.close()
 
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
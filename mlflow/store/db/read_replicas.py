@@ -0,0 +1,140 @@
+"""
+Routing of the read-only queries of the stores backed by a database to read replicas of it.
+
+Read-only queries, e.g. the ones of ``get_run`` and ``search_runs``, are spread round-robin over
+the replicas while writes always go to the primary database. Since replicas lag behind the
+primary, the reads of a client session that wrote to the primary during the last
+``read_your_writes_seconds`` also go to the primary, so that clients always read their own writes.
+A replica that cannot be connected to is not used for ``unhealthy_seconds``, during which reads
+go to the other replicas, or to the primary if none of them is healthy.
+
+Queries are attributed to the client session started for the current thread with
+:py:func:`start_client_session`, e.g. by the tracking server for the client of each request, or
+to a single session shared by the whole process otherwise. The state of a client session is the
+time until which its reads go to the primary, which the tracking server stores in a cookie of the
+client rather than in its own memory, so that it is shared by all the server processes, e.g. the
+gunicorn workers, that serve the client.
+"""
+import logging
+import threading
+import time
+
+import sqlalchemy
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_UNHEALTHY_SECONDS = 30
+
+_client_session = threading.local()
+
+
+def start_client_session(read_primary_until=0):
+    """
+    Attribute the queries made by the current thread to a client session whose reads are served
+    by the primary database until the ``read_primary_until`` timestamp, in seconds since the epoch.
+    """
+    _client_session.read_primary_until = read_primary_until
+
+
+def end_client_session():
+    """
+    Attribute the queries made by the current thread to the session shared by the whole process.
+    """
+    _client_session.read_primary_until = None
+
+
+def get_client_session_read_primary_until():
+    """
+    :return: The timestamp until which the reads of the client session of the current thread are
+             served by the primary database, which is updated by its writes, or None if no client
+             session was started for the current thread.
+    """
+    return getattr(_client_session, "read_primary_until", None)
+
+
+class ReadReplicaRouter(object):
+    """
+    Chooses the database engine that serves each read-only query of a store.
+
+    :param primary_engine: SQLAlchemy engine of the primary database, which serves all the writes.
+    :param replica_engines: SQLAlchemy engines of the read replicas of the primary database.
+    :param read_your_writes_seconds: Number of seconds after a write during which the reads of
+                                     the same client session go to the primary. 0 disables it.
+    :param unhealthy_seconds: Number of seconds during which a replica that could not be
+                              connected to is not used.
+    """
+
+    def __init__(
+        self,
+        primary_engine,
+        replica_engines,
+        read_your_writes_seconds,
+        unhealthy_seconds=_DEFAULT_UNHEALTHY_SECONDS,
+    ):
+        self.primary_engine = primary_engine
+        self.replica_engines = list(replica_engines)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.unhealthy_seconds = unhealthy_seconds
+        self._lock = threading.Lock()
+        self._next_replica = 0
+        self._unhealthy_until = [0] * len(self.replica_engines)
+        # Time until which the reads of the session shared by the whole process go to the primary
+        self._read_primary_until = 0
+
+    def record_write(self):
+        """
+        Record that the client session of the current thread wrote to the primary database.
+        """
+        if self.read_your_writes_seconds <= 0:
+            return
+        read_primary_until = time.time() + self.read_your_writes_seconds
+        if get_client_session_read_primary_until() is not None:
+            _client_session.read_primary_until = max(
+                _client_session.read_primary_until, read_primary_until
+            )
+        else:
+            with self._lock:
+                self._read_primary_until = max(self._read_primary_until, read_primary_until)
+
+    def _wrote_recently(self):
+        read_primary_until = get_client_session_read_primary_until()
+        if read_primary_until is None:
+            read_primary_until = self._read_primary_until
+        return time.time() < read_primary_until
+
+    def _get_healthy_replicas(self):
+        """
+        Return the indices of the healthy replicas, starting from the next one in round-robin
+        order.
+        """
+        now = time.time()
+        with self._lock:
+            start = self._next_replica
+            self._next_replica = (start + 1) % len(self.replica_engines)
+            return [
+                index % len(self.replica_engines)
+                for index in range(start, start + len(self.replica_engines))
+                if self._unhealthy_until[index % len(self.replica_engines)] <= now
+            ]
+
+    def connect_for_read(self):
+        """
+        Return a connection to the database that should serve a read-only query of the client
+        session of the current thread. The caller must close it.
+        """
+        if self.replica_engines and not self._wrote_recently():
+            for index in self._get_healthy_replicas():
+                engine = self.replica_engines[index]
+                try:
+                    return engine.connect()
+                except sqlalchemy.exc.DBAPIError as e:
+                    _logger.warning(
+                        "Failed to connect to the read replica %s, which will not be used for %s "
+                        "seconds: %s",
+                        repr(engine.url),
+                        self.unhealthy_seconds,
+                        e,
+                    )
+                    with self._lock:
+                        self._unhealthy_until[index] = time.time() + self.unhealthy_seconds
+        return self.primary_engine.connect()
@@ -0,0 +1,128 @@
+"""
+Serialization of the writes of the stores backed by a SQLite database.
+
+SQLite allows a single writer per database at a time: a transaction that cannot acquire the write
+lock within the busy timeout of its connection fails with ``database is locked``. The write
+sessions of the threads of a process are therefore serialized by a :py:class:`SqliteWriter`
+shared by all the stores of the process backed by the same database, so that they never contend
+for the lock of the database, while the connections of other processes wait for it with the busy
+timeout configured by :py:func:`mlflow.store.db.utils.create_sqlalchemy_engine`.
+
+Since a write then only waits for the writes before it, frequent small writes, e.g. the ones of
+``log_metric``, can be submitted with :py:meth:`SqliteWriter.submit`, which writes the ones
+submitted concurrently in a single transaction.
+"""
+import threading
+from contextlib import contextmanager
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INTERNAL_ERROR
+
+_MAX_GROUP_SIZE = 1000
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_sqlite_writer(database):
+    """
+    Return the :py:class:`SqliteWriter` of the SQLite database at the specified path, which is
+    shared by all the stores of the process.
+    """
+    with _writers_lock:
+        if database not in _writers:
+            _writers[database] = SqliteWriter()
+        return _writers[database]
+
+
+class _PendingWrite(object):
+    def __init__(self, item):
+        self.item = item
+        self.done = False
+        self.error = None
+
+
+class SqliteWriter(object):
+    """
+    Serializes the write sessions of the threads of a process to a SQLite database, and groups the
+    writes submitted concurrently with :py:meth:`submit` into shared transactions.
+
+    :param max_group_size: Maximum number of submitted writes per transaction.
+    """
+
+    def __init__(self, max_group_size=_MAX_GROUP_SIZE):
+        self.max_group_size = max_group_size
+        # Reentrant so that a write session can be opened while holding the lock, e.g. by the
+        # operation of a group of submitted writes
+        self._lock = threading.RLock()
+        # Guards the queued writes, and notifies their threads when a group is written
+        self._condition = threading.Condition()
+        self._pending = {}
+        self._writing_group = False
+
+    @contextmanager
+    def session(self, make_session):
+        """
+        Open a session with ``make_session``, a managed session maker, once the write sessions
+        opened before by the other threads are closed.
+        """
+        with self._lock, make_session() as session:
+            yield session
+
+    def submit(self, make_session, operation, item):
+        """
+        Write ``item`` by calling ``operation(session, items)`` with a write session opened with
+        ``make_session`` and a list of items containing it, then return once it is committed.
+
+        While a group of items is being written, the items submitted for the same operation by the
+        other threads are queued, then written together in the next group by one of these
+        threads. If writing a group fails, its items are written one by one, so that only
+        the calls that submitted a failing item raise.
+        """
+        write = _PendingWrite(item)
+        with self._condition:
+            self._pending.setdefault(operation, []).append(write)
+        while True:
+            with self._condition:
+                # Wait until the item is written in the group of another thread, or no group is
+                # being written
+                while self._writing_group and not write.done:
+                    self._condition.wait()
+                if write.done:
+                    break
+                self._writing_group = True
+                pending = self._pending[operation]
+                group = pending[: self.max_group_size]
+                self._pending[operation] = pending[self.max_group_size :]
+            try:
+                self._write_group(make_session, operation, group)
+            finally:
+                with self._condition:
+                    # Unless they were written, e.g. if the thread was interrupted
+                    for pending_write in group:
+                        if not pending_write.done:
+                            pending_write.error = MlflowException(
+                                "The write was interrupted", error_code=INTERNAL_ERROR
+                            )
+                            pending_write.done = True
+                    self._writing_group = False
+                    self._condition.notify_all()
+        if write.error is not None:
+            raise write.error
+
+    def _write_group(self, make_session, operation, group):
+        try:
+            with self.session(make_session) as session:
+                operation(session, [write.item for write in group])
+        except Exception as e:
+            if len(group) == 1:
+                group[0].error = e
+            else:
+                for write in group:
+                    try:
+                        with self.session(make_session) as session:
+                            operation(session, [write.item])
+                    except Exception as item_error:
+                        write.error = item_error
+        for write in group:
+            write.done = True
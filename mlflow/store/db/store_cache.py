@@ -0,0 +1,104 @@
+"""
+Process-wide cache of the stores backed by a database.
+
+Creating a database-backed store creates a SQLAlchemy engine, inspects the tables of the database
+and verifies its schema, which takes from tens of milliseconds for a local SQLite file to seconds
+for a remote database. Since ``MlflowClient`` creates a store each time it is constructed, stores
+are created once per process for each database URI and store arguments, e.g. the default artifact
+root, and shared by all the clients and threads of the process.
+
+Stores created by a parent process are never used by a forked child process, e.g. a gunicorn
+worker or a ``multiprocessing`` worker, which creates its own stores instead: the pooled
+connections of the parent's engines must neither be used nor closed by the child.
+"""
+import os
+import threading
+
+import sqlalchemy
+
+_stores = {}
+# Locks held while creating the store of a given key, so that concurrent callers wait for the
+# store being created rather than creating it several times
+_creation_locks = {}
+_stores_lock = threading.Lock()
+_stores_pid = os.getpid()
+# Stores inherited from parent processes. They are kept referenced so that garbage collecting
+# their engines does not close connections that the parent process still uses.
+_inherited_stores = []
+
+
+def _normalize_db_uri(db_uri):
+    """
+    Return the key under which the stores of the specified database URI are cached, or None if
+    they must not be cached, e.g. for in-memory SQLite databases that are distinct for each engine.
+    """
+    url = sqlalchemy.engine.url.make_url(db_uri)
+    if url.get_backend_name() == "sqlite":
+        database = url.database
+        if (
+            not database
+            or database == ":memory:"
+            or url.query.get("mode") == "memory"
+            or url.query.get("uri") == "true"
+        ):
+            return None
+        # Relative paths are relative to the working directory at the time the store is created.
+        # URLs are immutable as of SQLAlchemy 1.4.
+        database = os.path.abspath(database)
+        if hasattr(url, "set"):
+            url = url.set(database=database)
+        else:
+            url.database = database
+    return str(url)
+
+
+def _reset_if_forked():
+    # Must be called with `_stores_lock` held
+    global _stores, _creation_locks, _stores_pid
+    if _stores_pid != os.getpid():
+        _inherited_stores.extend(_stores.values())
+        _stores = {}
+        _creation_locks = {}
+        _stores_pid = os.getpid()
+
+
+def get_or_create_store(store_class, db_uri, *args):
+    """
+    Return the store created by ``store_class(db_uri, *args)`` in this process, creating it if
+    this is the first call for the specified class, database URI and arguments.
+    """
+    normalized_uri = _normalize_db_uri(db_uri)
+    if normalized_uri is None:
+        return store_class(db_uri, *args)
+    key = (store_class, normalized_uri, args)
+    with _stores_lock:
+        _reset_if_forked()
+        store = _stores.get(key)
+        if store is not None:
+            return store
+        creation_lock = _creation_locks.setdefault(key, threading.Lock())
+    with creation_lock:
+        with _stores_lock:
+            _reset_if_forked()
+            store = _stores.get(key)
+        if store is None:
+            store = store_class(db_uri, *args)
+            with _stores_lock:
+                _reset_if_forked()
+                _stores.setdefault(key, store)
+    return store
+
+
+def clear_stores(db_uri=None):
+    """
+    Remove the cached stores of the specified database URI, or all cached stores if ``db_uri`` is
+    None, so that the next clients create new stores, e.g. after the database has been upgraded or
+    recreated. Clients that were already constructed keep using the stores they were created with.
+    """
+    normalized_uri = None if db_uri is None else _normalize_db_uri(db_uri)
+    with _stores_lock:
+        _reset_if_forked()
+        for key in list(_stores):
+            if db_uri is None or key[1] == normalized_uri:
+                del _stores[key]
+                _creation_locks.pop(key, None)
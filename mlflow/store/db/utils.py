@@ -1,3 +1,4 @@
+import functools
 import os
 import time
 
@@ -10,16 +11,34 @@ import sqlalchemy
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.tracking.dbmodels.initial_models import Base as InitialBase
-from mlflow.protos.databricks_pb2 import INTERNAL_ERROR
+from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from mlflow.store.db.db_types import SQLITE
+from mlflow.store.db.read_replicas import ReadReplicaRouter
+from mlflow.store.db.sqlite_writer import get_sqlite_writer
 
 _logger = logging.getLogger(__name__)
 
 
 MLFLOW_SQLALCHEMYSTORE_POOL_SIZE = "MLFLOW_SQLALCHEMYSTORE_POOL_SIZE"
 MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW = "MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW"
+# Comma-separated URIs of read replicas of the database, which serve the read-only queries
+MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS = "MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS"
+# Number of seconds after a write during which the reads of the same client go to the primary
+MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS = "MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS"
+_DEFAULT_READ_YOUR_WRITES_SECONDS = 5
+# Number of seconds during which a SQLite connection waits for the write lock of the database
+MLFLOW_SQLALCHEMYSTORE_SQLITE_BUSY_TIMEOUT = "MLFLOW_SQLALCHEMYSTORE_SQLITE_BUSY_TIMEOUT"
+# Journal mode of SQLite databases, e.g. ``DELETE`` for databases on network file systems, which do
+# not support the ``WAL`` mode
+MLFLOW_SQLALCHEMYSTORE_SQLITE_JOURNAL_MODE = "MLFLOW_SQLALCHEMYSTORE_SQLITE_JOURNAL_MODE"
+_DEFAULT_SQLITE_BUSY_TIMEOUT = 30
+_DEFAULT_SQLITE_JOURNAL_MODE = "WAL"
+_SQLITE_JOURNAL_MODES = ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
 MAX_RETRY_COUNT = 15
 
+# Functions called with each engine created by `create_sqlalchemy_engine`
+_engine_hooks = []
+
 
 def _get_package_dir():
     """Returns directory containing MLflow python package."""
@@ -60,25 +79,29 @@ def _verify_schema(engine):
         )
 
 
-def _get_managed_session_maker(SessionMaker, db_type):
+def _get_managed_session_maker(SessionMaker, db_type, after_commit=None):
     """
     Creates a factory for producing exception-safe SQLAlchemy sessions that are made available
     using a context manager. Any session produced by this factory is automatically committed
     if no exceptions are encountered within its associated context. If an exception is
     encountered, the session is rolled back. Finally, any session produced by this factory is
     automatically closed when the session's associated context is exited.
+
+    :param after_commit: Optional function called after each session is committed.
     """
 
     @contextmanager
-    def make_managed_session():
+    def make_managed_session(**session_kwargs):
         """Provide a transactional scope around a series of operations."""
-        session = SessionMaker()
+        session = SessionMaker(**session_kwargs)
         try:
             if db_type == SQLITE:
                 session.execute("PRAGMA foreign_keys = ON;")
                 session.execute("PRAGMA case_sensitive_like = true;")
             yield session
             session.commit()
+            if after_commit is not None:
+                after_commit()
         except MlflowException:
             session.rollback()
             raise
@@ -91,6 +114,51 @@ def _get_managed_session_maker(SessionMaker, db_type):
     return make_managed_session
 
 
+def _get_session_makers(engine, db_type):
+    """
+    Creates the factories of the managed sessions of a store backed by the database of the
+    specified engine, see :py:func:`_get_managed_session_maker`.
+
+    :return: A tuple ``(ManagedSessionMaker, ReadSessionMaker)``. ``ReadSessionMaker`` produces
+             sessions for read-only queries, which are served by the read replicas configured
+             with the ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS`` environment variable, if any,
+             as routed by :py:class:`mlflow.store.db.read_replicas.ReadReplicaRouter`. For SQLite
+             databases, the sessions of ``ManagedSessionMaker`` are serialized by the
+             :py:class:`mlflow.store.db.sqlite_writer.SqliteWriter` of the database.
+    """
+    SessionMaker = sqlalchemy.orm.sessionmaker(bind=engine)
+    router = create_read_replica_router(engine)
+    if router is None:
+        ManagedSessionMaker = _get_managed_session_maker(SessionMaker, db_type)
+        ReadSessionMaker = ManagedSessionMaker
+    else:
+        ManagedSessionMaker = _get_managed_session_maker(
+            SessionMaker, db_type, after_commit=router.record_write
+        )
+        ReadOnlySessionMaker = _get_managed_session_maker(SessionMaker, db_type)
+
+        @contextmanager
+        def make_read_session():
+            """Provide a transactional scope around a series of read-only queries."""
+            try:
+                connection = router.connect_for_read()
+            except sqlalchemy.exc.SQLAlchemyError as e:
+                raise MlflowException(message=e, error_code=INTERNAL_ERROR)
+            try:
+                with ReadOnlySessionMaker(bind=connection) as session:
+                    yield session
+            finally:
+                connection.close()
+
+        ReadSessionMaker = make_read_session
+
+    if db_type == SQLITE:
+        # Reads are not serialized: in the WAL journal mode, they do not wait for the writes
+        writer = get_sqlite_writer(engine.url.database)
+        ManagedSessionMaker = functools.partial(writer.session, ManagedSessionMaker)
+    return ManagedSessionMaker, ReadSessionMaker
+
+
 def _get_alembic_config(db_url, alembic_dir=None):
     """
     Constructs an alembic Config object referencing the specified database and migration script
@@ -208,7 +276,22 @@ def create_sqlalchemy_engine_with_retry(db_uri):
             raise
 
 
+def register_engine_hook(hook):
+    """
+    Register a function called with each engine created by :py:func:`create_sqlalchemy_engine`,
+    e.g. to listen to the events of its connection pool.
+    """
+    _engine_hooks.append(hook)
+
+
 def create_sqlalchemy_engine(db_uri):
+    engine = _create_sqlalchemy_engine(db_uri)
+    for hook in _engine_hooks:
+        hook(engine)
+    return engine
+
+
+def _create_sqlalchemy_engine(db_uri):
     pool_size = os.environ.get(MLFLOW_SQLALCHEMYSTORE_POOL_SIZE)
     pool_max_overflow = os.environ.get(MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW)
     pool_kwargs = {}
@@ -220,4 +303,83 @@ def create_sqlalchemy_engine(db_uri):
         pool_kwargs["max_overflow"] = int(pool_max_overflow)
     if pool_kwargs:
         _logger.info("Create SQLAlchemy engine with pool options %s", pool_kwargs)
+    # The scheme of the URI is ``<dialect>+<driver>``
+    if db_uri.split(":", 1)[0].split("+", 1)[0] == SQLITE:
+        return _create_sqlite_engine(db_uri, pool_kwargs)
     return sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **pool_kwargs)
+
+
+def _create_sqlite_engine(db_uri, pool_kwargs):
+    """
+    Create an engine for a SQLite database that supports concurrent writes from several processes,
+    e.g. the workers of the tracking server:
+
+    - Connections wait for the write lock of the database for
+      ``MLFLOW_SQLALCHEMYSTORE_SQLITE_BUSY_TIMEOUT`` seconds rather than failing with
+      ``database is locked``.
+    - Transactions acquire the write lock with ``BEGIN IMMEDIATE`` before their first write, so
+      that the time they wait is covered by the busy timeout.
+    - The ``WAL`` journal mode lets reads proceed during writes, and ``synchronous=NORMAL``
+      avoids syncing the database file on each commit, which is safe in this mode.
+    """
+    busy_timeout = os.environ.get(MLFLOW_SQLALCHEMYSTORE_SQLITE_BUSY_TIMEOUT)
+    journal_mode = os.environ.get(
+        MLFLOW_SQLALCHEMYSTORE_SQLITE_JOURNAL_MODE, _DEFAULT_SQLITE_JOURNAL_MODE
+    ).upper()
+    if journal_mode not in _SQLITE_JOURNAL_MODES:
+        raise MlflowException(
+            "Invalid value '{}' for {}. Supported journal modes: {}".format(
+                journal_mode, MLFLOW_SQLALCHEMYSTORE_SQLITE_JOURNAL_MODE, _SQLITE_JOURNAL_MODES
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    connect_args = {"isolation_level": "IMMEDIATE"}
+    # The timeout can also be set with the ``timeout`` query parameter of the URI
+    if busy_timeout or "timeout" not in sqlalchemy.engine.url.make_url(db_uri).query:
+        connect_args["timeout"] = (
+            float(busy_timeout) if busy_timeout else _DEFAULT_SQLITE_BUSY_TIMEOUT
+        )
+    engine = sqlalchemy.create_engine(
+        db_uri, pool_pre_ping=True, connect_args=connect_args, **pool_kwargs
+    )
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode = {}".format(journal_mode))
+            if journal_mode == "WAL":
+                cursor.execute("PRAGMA synchronous = NORMAL")
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def create_read_replica_router(primary_engine):
+    """
+    Create a :py:class:`mlflow.store.db.read_replicas.ReadReplicaRouter` over the read replicas
+    of the database of ``primary_engine`` configured with the
+    ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS`` environment variable.
+
+    :return: The router, or None if no read replica is configured.
+    """
+    replica_uris = [
+        uri.strip()
+        for uri in os.environ.get(MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS, "").split(",")
+        if uri.strip()
+    ]
+    if not replica_uris:
+        return None
+    read_your_writes_seconds = os.environ.get(MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS)
+    # Unlike the primary engine, replica engines are created without waiting for the replicas to
+    # be reachable: the router falls back to the primary while they are not
+    return ReadReplicaRouter(
+        primary_engine,
+        [create_sqlalchemy_engine(uri) for uri in replica_uris],
+        read_your_writes_seconds=(
+            float(read_your_writes_seconds)
+            if read_your_writes_seconds
+            else _DEFAULT_READ_YOUR_WRITES_SECONDS
+        ),
+    )
@@ -0,0 +1,44 @@
+"""add search and metric history indexes
+
+Revision ID: ba9788700f47
+Revises: a8c4a736bde6
+Create Date: 2026-10-16 10:12:41.512348
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "ba9788700f47"
+down_revision = "a8c4a736bde6"
+branch_labels = None
+depends_on = None
+
+# (index name, table name, indexed columns)
+_INDEXES = [
+    (
+        "index_runs_experiment_id_lifecycle_stage_start_time",
+        "runs",
+        ["experiment_id", "lifecycle_stage", "start_time"],
+    ),
+    ("index_params_key_value", "params", ["key", "value"]),
+    ("index_params_run_uuid", "params", ["run_uuid"]),
+    ("index_tags_run_uuid", "tags", ["run_uuid"]),
+    ("index_latest_metrics_key_value", "latest_metrics", ["key", "value"]),
+    ("index_latest_metrics_run_uuid", "latest_metrics", ["run_uuid"]),
+    (
+        "index_metrics_run_uuid_key_step_timestamp",
+        "metrics",
+        ["run_uuid", "key", "step", "timestamp"],
+    ),
+]
+
+
+def upgrade():
+    for index_name, table_name, columns in _INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade():
+    for index_name, table_name, _ in reversed(_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
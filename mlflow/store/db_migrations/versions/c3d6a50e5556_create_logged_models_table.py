@@ -0,0 +1,122 @@
+"""create logged models table
+
+Revision ID: c3d6a50e5556
+Revises: ba9788700f47
+Create Date: 2026-10-17 09:41:27.630214
+
+"""
+import json
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+from mlflow.exceptions import MlflowException
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
+
+_logger = logging.getLogger(__name__)
+
+# revision identifiers, used by Alembic.
+revision = "c3d6a50e5556"
+down_revision = "ba9788700f47"
+branch_labels = None
+depends_on = None
+
+# Length of the ``value`` column of the ``tags`` table
+_MAX_TAG_VALUE_LENGTH = 5000
+
+_tags = sa.table(
+    "tags", sa.column("key", sa.String), sa.column("value", sa.String), sa.column("run_uuid")
+)
+_logged_models = sa.table(
+    "logged_models", sa.column("id"), sa.column("run_uuid"), sa.column("model")
+)
+
+
+def _parse_model_list(value):
+    try:
+        models = json.loads(value)
+    except ValueError:
+        return None
+    return models if isinstance(models, list) else None
+
+
+def upgrade():
+    op.create_table(
+        "logged_models",
+        sa.Column("id", sa.Integer(), nullable=False, autoincrement=True),
+        sa.Column("run_uuid", sa.String(length=32), sa.ForeignKey("runs.run_uuid"), nullable=False),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name="logged_model_pk"),
+    )
+    op.create_index("index_logged_models_run_uuid", "logged_models", ["run_uuid"], unique=False)
+
+    # Move the models listed by the ``mlflow.log-model.history`` tag of each run to the table, in
+    # the same order. Tags that are not lists of models, which can only have been set manually, are
+    # left in place.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select([_tags.c.run_uuid, _tags.c.value]).where(_tags.c.key == MLFLOW_LOGGED_MODELS)
+    ).fetchall()
+    migrated_run_uuids = []
+    for run_uuid, value in rows:
+        models = _parse_model_list(value)
+        if models is None:
+            _logger.warning(
+                "Not migrating the '%s' tag of run %s, which is not a list of models",
+                MLFLOW_LOGGED_MODELS,
+                run_uuid,
+            )
+            continue
+        if models:
+            bind.execute(
+                _logged_models.insert(),
+                [{"run_uuid": run_uuid, "model": json.dumps(model)} for model in models],
+            )
+        migrated_run_uuids.append(run_uuid)
+    for run_uuid in migrated_run_uuids:
+        bind.execute(
+            _tags.delete().where(
+                sa.and_(_tags.c.key == MLFLOW_LOGGED_MODELS, _tags.c.run_uuid == run_uuid)
+            )
+        )
+
+
+def downgrade():
+    # Move the models back to the ``mlflow.log-model.history`` tag of each run. Runs that recorded
+    # models both before and after the upgrade, which only uses the table, are not expected.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select([_logged_models.c.run_uuid, _logged_models.c.model]).order_by(
+            _logged_models.c.run_uuid, _logged_models.c.id
+        )
+    ).fetchall()
+    models_by_run_uuid = {}
+    for run_uuid, model in rows:
+        models_by_run_uuid.setdefault(run_uuid, []).append(model)
+    values_by_run_uuid = {
+        run_uuid: "[" + ", ".join(models) + "]" for run_uuid, models in models_by_run_uuid.items()
+    }
+    # Fail before modifying the database rather than truncating the models of some runs
+    too_long_run_uuids = sorted(
+        run_uuid
+        for run_uuid, value in values_by_run_uuid.items()
+        if len(value) > _MAX_TAG_VALUE_LENGTH
+    )
+    if too_long_run_uuids:
+        raise MlflowException(
+            "Cannot downgrade the database: the models logged by {} run(s) do not fit in the "
+            "{}-character '{}' tag. Delete the models of these runs from the 'logged_models' "
+            "table to downgrade. Runs: {}".format(
+                len(too_long_run_uuids),
+                _MAX_TAG_VALUE_LENGTH,
+                MLFLOW_LOGGED_MODELS,
+                ", ".join(too_long_run_uuids),
+            )
+        )
+    for run_uuid, value in values_by_run_uuid.items():
+        bind.execute(
+            _tags.insert(), {"key": MLFLOW_LOGGED_MODELS, "value": value, "run_uuid": run_uuid}
+        )
+    op.drop_index("index_logged_models_run_uuid", table_name="logged_models")
+    op.drop_table("logged_models")
@@ -93,10 +93,10 @@ class SqlAlchemyStore(AbstractStore):
         # Verify that all model registry tables exist.
         SqlAlchemyStore._verify_registry_tables_exist(self.engine)
         Base.metadata.bind = self.engine
-        SessionMaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
-        self.ManagedSessionMaker = mlflow.store.db.utils._get_managed_session_maker(
-            SessionMaker, self.db_type
-        )
+        # Read-only queries use ``ReadSessionMaker``, whose sessions are served by the read
+        # replicas of the database if any are configured
+        session_makers = mlflow.store.db.utils._get_session_makers(self.engine, self.db_type)
+        self.ManagedSessionMaker, self.ReadSessionMaker = session_makers
         # TODO: verify schema here once we add logic to initialize the registry tables if they
         # don't exist (schema verification will fail in tests otherwise)
         # mlflow.store.db.utils._verify_schema(self.engine)
@@ -363,7 +363,7 @@ class SqlAlchemyStore(AbstractStore):
                 + sample_query,
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             query = (
                 session.query(SqlRegisteredModel)
                 .filter(*conditions)
@@ -422,7 +422,7 @@ class SqlAlchemyStore(AbstractStore):
         :param name: Registered model name.
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             return self._get_registered_model(session, name, eager=True).to_mlflow_entity()
 
     def get_latest_versions(self, name, stages=None):
@@ -435,7 +435,7 @@ class SqlAlchemyStore(AbstractStore):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, name)
             # Convert to RegisteredModel entity first and then extract latest_versions
             latest_versions = sql_registered_model.to_mlflow_entity().latest_versions
@@ -711,7 +711,7 @@ class SqlAlchemyStore(AbstractStore):
         :param version: Registered model version.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             sql_model_version = self._get_sql_model_version(session, name, version, eager=True)
             return sql_model_version.to_mlflow_entity()
 
@@ -725,7 +725,7 @@ class SqlAlchemyStore(AbstractStore):
         :param version: Registered model version.
         :return: A single URI location that allows reads for downloading.
         """
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             sql_model_version = self._get_sql_model_version(session, name, version)
             return sql_model_version.source
 
@@ -774,7 +774,7 @@ class SqlAlchemyStore(AbstractStore):
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             conditions.append(SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL)
             sql_model_version = session.query(SqlModelVersion).filter(*conditions).all()
             model_versions = [mv.to_mlflow_entity() for mv in sql_model_version]
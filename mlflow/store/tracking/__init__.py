@@ -5,6 +5,10 @@ artifacts like models, plots, images, etc.
 
 Several constants are used by multiple backend store implementations.
 """
+import json
+
+from mlflow.entities import RunTag
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 # Path to default location for backend when using local FileStore or ArtifactStore.
 # Also used as default location for artifacts, when not provided, in non local file based backends
@@ -12,3 +16,31 @@ Several constants are used by multiple backend store implementations.
 DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH = "./mlruns"
 SEARCH_MAX_RESULTS_DEFAULT = 1000
 SEARCH_MAX_RESULTS_THRESHOLD = 50000
+
+
+def _add_logged_models_tag(tags, logged_models):
+    """
+    Add the ``mlflow.log-model.history`` tag listing the models recorded for a run to its tags.
+    Backend stores record models in a dedicated table or file rather than in this tag, whose
+    repeated rewriting made recording a model take time linear in the number of models of the run,
+    and expose the tag for compatibility. Models listed by an existing tag, e.g. set by an older
+    version of MLflow, are listed first.
+
+    :param tags: List of :py:class:`mlflow.entities.RunTag` of the run.
+    :param logged_models: List of the JSON serializations of the models recorded for the run, in
+                          the order in which they were recorded.
+    :return: The list of tags of the run.
+    """
+    if not logged_models:
+        return tags
+    # Same as ``json.dumps`` of the list of models, without deserializing them
+    value = "[" + ", ".join(logged_models) + "]"
+    other_tags = [tag for tag in tags if tag.key != MLFLOW_LOGGED_MODELS]
+    for tag in tags:
+        if tag.key == MLFLOW_LOGGED_MODELS:
+            try:
+                value = json.dumps(json.loads(tag.value) + json.loads(value))
+            except (ValueError, TypeError):
+                # The tag was set manually to something else than a list of models
+                pass
+    return other_tags + [RunTag(MLFLOW_LOGGED_MODELS, value)]
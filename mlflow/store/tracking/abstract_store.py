@@ -3,7 +3,9 @@ from abc import abstractmethod, ABCMeta
 from mlflow.entities import ViewType
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.utils import metric_sampling
 from mlflow.utils.annotations import experimental
+from mlflow.utils.validation import _validate_metric_history_bulk_args
 
 
 class AbstractStore:
@@ -195,17 +197,64 @@ class AbstractStore:
         self.log_batch(run_id, metrics=[], params=[], tags=[tag])
 
     @abstractmethod
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_results=None, sampling=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param max_results: If specified, the maximum number of values to return. Metrics with more
+                            logged values are downsampled with the ``sampling`` method.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
+                         One of ``lttb`` (the default), ``min_max`` or ``every_nth``, see
+                         :py:mod:`mlflow.utils.metric_sampling`.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
         pass
 
+    def get_metric_history_bulk(
+        self, run_ids, metric_keys, start_step=None, end_step=None, max_results=None, sampling=None
+    ):
+        """
+        Return the values logged for several metrics of several runs. The default implementation
+        calls :py:func:`get_metric_history` for each metric of each run, and should be overridden
+        by stores that can fetch the histories of many runs at once.
+
+        :param run_ids: List of unique identifiers of runs
+        :param metric_keys: List of metric names to fetch for each run
+        :param start_step: If specified, only values logged at this step or later are returned.
+        :param end_step: If specified, only values logged at this step or earlier are returned.
+        :param max_results: If specified, the maximum number of values to return for each metric of
+                            each run. Metrics with more values in the step range are downsampled
+                            with the ``sampling`` method, as in :py:func:`get_metric_history`.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
+
+        :return: A dictionary mapping each run ID to a dictionary mapping each metric name to a list
+                 of :py:class:`mlflow.entities.Metric` entities ordered by step and timestamp,
+                 which is empty if the run has not logged the metric. An
+                 :py:class:`mlflow.exceptions.MlflowException` with error code
+                 ``RESOURCE_DOES_NOT_EXIST`` is raised if one of the runs does not exist.
+        """
+        _validate_metric_history_bulk_args(run_ids, metric_keys, start_step, end_step)
+        sampling = metric_sampling.validate_sampling(max_results, sampling)
+        for run_id in set(run_ids):
+            # Raises if the run does not exist, while `get_metric_history` may return no values
+            self.get_run(run_id)
+        return {
+            run_id: {
+                metric_key: metric_sampling.sample_metric_history(
+                    self.get_metric_history(run_id, metric_key),
+                    max_results,
+                    sampling,
+                    start_step,
+                    end_step,
+                )
+                for metric_key in metric_keys
+            }
+            for run_id in run_ids
+        }
+
     def search_runs(
         self,
         experiment_ids,
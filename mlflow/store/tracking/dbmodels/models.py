@@ -10,6 +10,8 @@ from sqlalchemy import (
     BigInteger,
     PrimaryKeyConstraint,
     Boolean,
+    Index,
+    Text,
 )
 from mlflow.entities import (
     Experiment,
@@ -26,6 +28,7 @@ from mlflow.entities import (
 )
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.store.db.base_sql_model import Base
+from mlflow.store.tracking import _add_logged_models_tag
 
 SourceTypes = [
     SourceType.to_string(SourceType.NOTEBOOK),
@@ -172,6 +175,14 @@ class SqlRun(Base):
             name="runs_lifecycle_stage",
         ),
         PrimaryKeyConstraint("run_uuid", name="run_pk"),
+        # Serves the experiment and lifecycle stage filters of `search_runs`, and its default
+        # ordering by start time
+        Index(
+            "index_runs_experiment_id_lifecycle_stage_start_time",
+            "experiment_id",
+            "lifecycle_stage",
+            "start_time",
+        ),
     )
 
     @staticmethod
@@ -190,7 +201,24 @@ class SqlRun(Base):
 
         :return: :py:class:`mlflow.entities.Run`.
         """
-        run_info = RunInfo(
+        run_data = RunData(
+            metrics=[m.to_mlflow_entity() for m in self.latest_metrics],
+            params=[p.to_mlflow_entity() for p in self.params],
+            tags=_add_logged_models_tag(
+                [t.to_mlflow_entity() for t in self.tags], [m.model for m in self.logged_models]
+            ),
+        )
+
+        return Run(run_info=self.to_run_info(), run_data=run_data)
+
+    def to_run_info(self):
+        """
+        Convert the attributes of the DB model, without its metrics, params and tags, to the
+        corresponding MLflow entity.
+
+        :return: :py:class:`mlflow.entities.RunInfo`.
+        """
+        return RunInfo(
             run_uuid=self.run_uuid,
             run_id=self.run_uuid,
             experiment_id=str(self.experiment_id),
@@ -202,14 +230,6 @@ class SqlRun(Base):
             artifact_uri=self.artifact_uri,
         )
 
-        run_data = RunData(
-            metrics=[m.to_mlflow_entity() for m in self.latest_metrics],
-            params=[p.to_mlflow_entity() for p in self.params],
-            tags=[t.to_mlflow_entity() for t in self.tags],
-        )
-
-        return Run(run_info=run_info, run_data=run_data)
-
 
 class SqlExperimentTag(Base):
     """
@@ -274,7 +294,12 @@ class SqlTag(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="tag_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="tag_pk"),
+        # Tag values are too long to be indexed by every supported database, so filters on tags
+        # are served by the primary key
+        Index("index_tags_run_uuid", "run_uuid"),
+    )
 
     def __repr__(self):
         return "<SqlRunTag({}, {})>".format(self.key, self.value)
@@ -326,6 +351,8 @@ class SqlMetric(Base):
         PrimaryKeyConstraint(
             "key", "timestamp", "step", "run_uuid", "value", "is_nan", name="metric_pk"
         ),
+        # Serves `get_metric_history`, which the primary key cannot since it starts with the key
+        Index("index_metrics_run_uuid_key_step_timestamp", "run_uuid", "key", "step", "timestamp"),
     )
 
     def __repr__(self):
@@ -379,7 +406,11 @@ class SqlLatestMetric(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),
+        Index("index_latest_metrics_key_value", "key", "value"),
+        Index("index_latest_metrics_run_uuid", "run_uuid"),
+    )
 
     def __repr__(self):
         return "<SqlLatestMetric({}, {}, {}, {})>".format(
@@ -421,7 +452,11 @@ class SqlParam(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="param_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="param_pk"),
+        Index("index_params_key_value", "key", "value"),
+        Index("index_params_run_uuid", "run_uuid"),
+    )
 
     def __repr__(self):
         return "<SqlParam({}, {})>".format(self.key, self.value)
@@ -433,3 +468,36 @@ class SqlParam(Base):
         :return: :py:class:`mlflow.entities.Param`.
         """
         return Param(key=self.key, value=self.value)
+
+
+class SqlLoggedModel(Base):
+    __tablename__ = "logged_models"
+
+    id = Column(Integer, autoincrement=True)
+    """
+    Logged model ID: `Integer`. *Primary Key* for ``logged_models`` table. Increases in the order in
+                     which models are recorded.
+    """
+    run_uuid = Column(String(32), ForeignKey("runs.run_uuid"), nullable=False)
+    """
+    Run UUID for which this model was recorded: *Foreign Key* into ``runs`` table.
+    """
+    model = Column(Text, nullable=False)
+    """
+    Model: `Text`. JSON serialization of the dictionary representation of the
+           :py:class:`mlflow.models.Model`. Defined as *Non-null* in schema.
+    """
+    run = relationship(
+        "SqlRun", backref=backref("logged_models", cascade="all", order_by="SqlLoggedModel.id")
+    )
+    """
+    SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint("id", name="logged_model_pk"),
+        Index("index_logged_models_run_uuid", "run_uuid"),
+    )
+
+    def __repr__(self):
+        return "<SqlLoggedModel({}, {})>".format(self.run_uuid, self.id)
@@ -1,3 +1,4 @@
+import heapq
 import json
 import logging
 import os
@@ -5,6 +6,8 @@ import sys
 import shutil
 
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.entities import (
     Experiment,
@@ -23,10 +26,19 @@ from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.entities.run_info import check_run_is_active, check_run_is_deleted
 from mlflow.exceptions import MlflowException, MissingConfigException
 import mlflow.protos.databricks_pb2 as databricks_pb2
-from mlflow.models import Model
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, RESOURCE_DOES_NOT_EXIST
-from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, SEARCH_MAX_RESULTS_THRESHOLD
+from mlflow.store.tracking import (
+    DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH,
+    SEARCH_MAX_RESULTS_THRESHOLD,
+    _add_logged_models_tag,
+)
 from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.file_store_index import (
+    RUN_INDEX_FILE_NAME,
+    ExperimentRunIndex,
+    RunLocationIndex,
+    is_run_index_enabled,
+)
 from mlflow.utils.validation import (
     _validate_metric_name,
     _validate_param_name,
@@ -35,7 +47,10 @@ from mlflow.utils.validation import (
     _validate_experiment_id,
     _validate_batch_log_limits,
     _validate_batch_log_data,
+    _validate_metric_history_bulk_args,
+    path_not_unique,
 )
+from mlflow.utils import metric_sampling
 from mlflow.utils.env import get_env
 from mlflow.utils.file_utils import (
     is_directory,
@@ -56,11 +71,13 @@ from mlflow.utils.file_utils import (
     local_file_uri_to_path,
     path_to_local_file_uri,
 )
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import append_to_uri_path
-from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
+# Maximum number of threads used to read the metric files of several runs concurrently
+_METRIC_HISTORY_BULK_MAX_WORKERS = 8
 
 
 def _default_root_dir():
@@ -121,6 +138,7 @@ class FileStore(AbstractStore):
     EXPERIMENT_TAGS_FOLDER_NAME = "tags"
     RESERVED_EXPERIMENT_FOLDERS = [EXPERIMENT_TAGS_FOLDER_NAME]
     META_DATA_FILE_NAME = "meta.yaml"
+    LOGGED_MODELS_FILE_NAME = "logged_models"
     DEFAULT_EXPERIMENT_ID = "0"
 
     def __init__(self, root_directory=None, artifact_root_uri=None):
@@ -142,6 +160,10 @@ class FileStore(AbstractStore):
         # Create trash folder if needed
         if not exists(self.trash_folder):
             mkdir(self.trash_folder)
+        self._use_run_index = is_run_index_enabled()
+        self._run_location_index = RunLocationIndex(
+            os.path.join(self.root_directory, RUN_INDEX_FILE_NAME)
+        )
 
     def _check_root_dir(self):
         """
@@ -207,6 +229,12 @@ class FileStore(AbstractStore):
             self._get_run_dir(experiment_id, run_uuid), FileStore.TAGS_FOLDER_NAME, tag_name
         )
 
+    def _get_logged_models_path(self, experiment_id, run_uuid):
+        _validate_run_id(run_uuid)
+        return os.path.join(
+            self._get_run_dir(experiment_id, run_uuid), FileStore.LOGGED_MODELS_FILE_NAME
+        )
+
     def _get_artifact_dir(self, experiment_id, run_uuid):
         _validate_run_id(run_uuid)
         return append_to_uri_path(
@@ -400,8 +428,11 @@ class FileStore(AbstractStore):
         Permanently delete a run (metadata and metrics, tags, parameters).
         This is used by the ``mlflow gc`` command line and is not intended to be used elsewhere.
         """
-        _, run_dir = self._find_run_root(run_id)
+        experiment_id, run_dir = self._find_run_root(run_id)
         shutil.rmtree(run_dir)
+        if self._use_run_index:
+            self._get_run_index(experiment_id).delete_run(run_id)
+            self._run_location_index.delete_run(run_id)
 
     def _get_deleted_runs(self):
         experiment_ids = self._get_active_experiments() + self._get_deleted_experiments()
@@ -432,12 +463,20 @@ class FileStore(AbstractStore):
     def _find_run_root(self, run_uuid):
         _validate_run_id(run_uuid)
         self._check_root_dir()
+        if self._use_run_index:
+            experiment_id = self._run_location_index.get_experiment_id(run_uuid)
+            experiment_dir = experiment_id and self._get_experiment_path(experiment_id)
+            if experiment_dir and exists(os.path.join(experiment_dir, run_uuid)):
+                return experiment_id, os.path.join(experiment_dir, run_uuid)
         all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
         for experiment_dir in all_experiments:
             runs = find(experiment_dir, run_uuid, full_path=True)
             if len(runs) == 0:
                 continue
-            return os.path.basename(os.path.abspath(experiment_dir)), runs[0]
+            experiment_id = os.path.basename(os.path.abspath(experiment_dir))
+            if self._use_run_index:
+                self._run_location_index.set_experiment_id(run_uuid, experiment_id)
+            return experiment_id, runs[0]
         return None, None
 
     def update_run_info(self, run_id, run_status, end_time):
@@ -486,6 +525,9 @@ class FileStore(AbstractStore):
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
+        if self._use_run_index:
+            self._get_run_index(experiment_id).put_run_info(run_info)
+            self._run_location_index.set_experiment_id(run_uuid, experiment_id)
         for tag in tags:
             self.set_tag(run_uuid, tag)
         return self.get_run(run_id=run_uuid)
@@ -517,7 +559,16 @@ class FileStore(AbstractStore):
             raise MlflowException(
                 "Run '%s' not found" % run_uuid, databricks_pb2.RESOURCE_DOES_NOT_EXIST
             )
-        run_info = self._get_run_info_from_dir(run_dir)
+        run_info = None
+        if self._use_run_index:
+            run_index = self._get_run_index(exp_id, os.path.dirname(run_dir))
+            run_info = run_index.get_run_info(run_uuid)
+        if run_info is None:
+            run_info = self._get_run_info_from_dir(run_dir)
+            if self._use_run_index and run_info.experiment_id == exp_id:
+                # The run was created by a process that did not maintain the run index
+                run_index.put_run_info(run_info)
+                run_index.log_metrics(run_uuid, self._get_all_metrics(run_info))
         if run_info.experiment_id != exp_id:
             raise MlflowException(
                 "Run '%s' metadata is in invalid state." % run_uuid, databricks_pb2.INVALID_STATE
@@ -607,11 +658,44 @@ class FileStore(AbstractStore):
         step = int(metric_parts[2]) if len(metric_parts) == 3 else 0
         return Metric(key=metric_name, value=val, timestamp=ts, step=step)
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_results=None, sampling=None):
         _validate_run_id(run_id)
         _validate_metric_name(metric_key)
+        sampling = metric_sampling.validate_sampling(max_results, sampling)
         run_info = self._get_run_info(run_id)
-        return self._get_metric_history(run_info, metric_key)
+        metrics = self._get_metric_history(run_info, metric_key)
+        if sampling is None:
+            return metrics
+        return metric_sampling.sample_metric_history(metrics, max_results, sampling)
+
+    def get_metric_history_bulk(
+        self, run_ids, metric_keys, start_step=None, end_step=None, max_results=None, sampling=None
+    ):
+        _validate_metric_history_bulk_args(run_ids, metric_keys, start_step, end_step)
+        sampling = metric_sampling.validate_sampling(max_results, sampling)
+
+        def get_run_metric_histories(run_id):
+            parent_path, metric_files = self._get_run_files(self._get_run_info(run_id), "metric")
+            histories = {}
+            for metric_key in metric_keys:
+                metrics = (
+                    [
+                        FileStore._get_metric_from_line(metric_key, line)
+                        for line in read_file_lines(parent_path, metric_key)
+                    ]
+                    if metric_key in metric_files
+                    else []
+                )
+                histories[metric_key] = metric_sampling.sample_metric_history(
+                    metrics, max_results, sampling, start_step, end_step
+                )
+            return histories
+
+        # Each run is stored in its own directory, whose metric files are read in a separate thread
+        run_ids = list(OrderedDict.fromkeys(run_ids))
+        max_workers = min(_METRIC_HISTORY_BULK_MAX_WORKERS, len(run_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(run_ids, executor.map(get_run_metric_histories, run_ids)))
 
     def _get_metric_history(self, run_info, metric_key):
         parent_path, metric_files = self._get_run_files(run_info, "metric")
@@ -673,12 +757,55 @@ class FileStore(AbstractStore):
         tags = []
         for tag_file in tag_files:
             tags.append(self._get_tag_from_file(parent_path, tag_file))
-        return tags
+        run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
+        return _add_logged_models_tag(tags, self._get_logged_models(run_dir))
+
+    @staticmethod
+    def _get_logged_models(run_dir):
+        """
+        Return the JSON serializations of the models recorded for the run, which are written to
+        its ``logged_models`` file one per line.
+        """
+        if not exists(os.path.join(run_dir, FileStore.LOGGED_MODELS_FILE_NAME)):
+            return []
+        lines = read_file_lines(run_dir, FileStore.LOGGED_MODELS_FILE_NAME)
+        return [line.rstrip("\n") for line in lines]
+
+    def _get_run_index(self, experiment_id, experiment_dir=None):
+        """
+        Return the run index of the specified experiment, building it from the run directories of
+        the experiment if it does not exist yet.
+        """
+        experiment_dir = experiment_dir or self._get_experiment_path(
+            experiment_id, assert_exists=True
+        )
+        run_index = ExperimentRunIndex(os.path.join(experiment_dir, RUN_INDEX_FILE_NAME))
+        if not run_index.exists():
+            self._rebuild_run_index(experiment_id, run_index)
+        return run_index
 
-    def _list_run_infos(self, experiment_id, view_type):
+    def _rebuild_run_index(self, experiment_id, run_index=None):
+        """
+        Rebuild the run index of the specified experiment from its run directories.
+        This is used by the ``mlflow rebuild-run-index`` command line and is not intended to be used
+        elsewhere.
+
+        :return: The number of runs in the rebuilt index.
+        """
+        if run_index is None:
+            experiment_dir = self._get_experiment_path(experiment_id, assert_exists=True)
+            run_index = ExperimentRunIndex(os.path.join(experiment_dir, RUN_INDEX_FILE_NAME))
+        run_infos = self._list_run_infos(experiment_id, ViewType.ALL, use_run_index=False)
+        run_index.rebuild((run_info, self._get_all_metrics(run_info)) for run_info in run_infos)
+        self._run_location_index.rebuild(experiment_id, [r.run_id for r in run_infos])
+        return len(run_infos)
+
+    def _list_run_infos(self, experiment_id, view_type, use_run_index=True):
         self._check_root_dir()
         if not self._has_experiment(experiment_id):
             return []
+        if use_run_index and self._use_run_index:
+            return self._get_run_index(experiment_id).list_run_infos(view_type)
         experiment_dir = self._get_experiment_path(experiment_id, assert_exists=True)
         run_dirs = list_all(
             experiment_dir,
@@ -727,14 +854,109 @@ class FileStore(AbstractStore):
                 "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD, max_results),
                 databricks_pb2.INVALID_PARAMETER_VALUE,
             )
+        parsed_filters = SearchUtils.parse_search_filter(filter_string)
+        sort_key = SearchUtils.get_sort_key_for_runs(order_by)
+        start_offset, after = SearchUtils.parse_page_token_for_search_runs(page_token, order_by)
+        final_offset = start_offset + max_results
+        after_sort_key = (
+            None if after is None else SearchUtils.get_sort_key_from_sort_values(order_by, after)
+        )
+
+        # Only the metrics, params and tags referenced by the filter and the order_by clauses are
+        # read from disk while searching; the remaining run data is read for the returned page.
+        referenced_keys = {
+            SearchUtils._METRIC_IDENTIFIER: set(),
+            SearchUtils._PARAM_IDENTIFIER: set(),
+            SearchUtils._TAG_IDENTIFIER: set(),
+        }
+        for key_type, key in [(f["type"], f["key"]) for f in parsed_filters] + [
+            SearchUtils.parse_order_by_for_search_runs(o)[:2] for o in order_by or []
+        ]:
+            if key_type in referenced_keys:
+                referenced_keys[key_type].add(key)
+        attribute_filters = [
+            f for f in parsed_filters if f["type"] == SearchUtils._ATTRIBUTE_IDENTIFIER
+        ]
+        entity_filters = [
+            f for f in parsed_filters if f["type"] != SearchUtils._ATTRIBUTE_IDENTIFIER
+        ]
+
         runs = []
         for experiment_id in experiment_ids:
             run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
-        filtered = SearchUtils.filter(runs, filter_string)
-        sorted_runs = SearchUtils.sort(filtered, order_by)
-        runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
-        return runs, next_page_token
+            if not run_infos:
+                continue
+            experiment_dir = self._get_experiment_path(experiment_id, assert_exists=True)
+            latest_metrics = None
+            if self._use_run_index:
+                run_index = self._get_run_index(experiment_id, experiment_dir)
+                latest_metrics = run_index.get_latest_metrics(
+                    referenced_keys[SearchUtils._METRIC_IDENTIFIER]
+                )
+            for run_info in run_infos:
+                # Attribute filters only depend on the contents of meta.yaml
+                run = Run(run_info, RunData())
+                if not all(SearchUtils._does_run_match_clause(run, f) for f in attribute_filters):
+                    continue
+                run = Run(
+                    run_info,
+                    self._get_partial_run_data(
+                        os.path.join(experiment_dir, run_info.run_id),
+                        metric_keys=referenced_keys[SearchUtils._METRIC_IDENTIFIER],
+                        param_keys=referenced_keys[SearchUtils._PARAM_IDENTIFIER],
+                        tag_keys=referenced_keys[SearchUtils._TAG_IDENTIFIER],
+                        metrics=None
+                        if latest_metrics is None
+                        else latest_metrics.get(run_info.run_id, []),
+                    ),
+                )
+                if not all(SearchUtils._does_run_match_clause(run, f) for f in entity_filters):
+                    continue
+                # Skip the runs up to the last run of the previous page
+                if after_sort_key is None or sort_key(run) > after_sort_key:
+                    runs.append(run)
+
+        # Select the runs up to the end of the requested page without sorting all matching runs
+        top_runs = heapq.nsmallest(final_offset, runs, key=sort_key)[start_offset:]
+        page = [self._get_run_from_info(run.info) for run in top_runs]
+        next_page_token = None
+        if top_runs and final_offset < len(runs):
+            next_page_token = SearchUtils.create_page_token_for_search_runs(
+                SearchUtils.get_sort_values_for_run(top_runs[-1], order_by), order_by
+            )
+        return page, next_page_token
+
+    def _get_partial_run_data(self, run_dir, metric_keys, param_keys, tag_keys, metrics=None):
+        """
+        Read the latest values of the specified metrics and the specified params and tags of a
+        run, skipping keys that have not been logged to the run. If ``metrics`` is specified, it is
+        used instead of reading the metrics from disk.
+        """
+
+        def read_entities(subfolder_name, keys, read_fn):
+            parent_path = os.path.join(run_dir, subfolder_name)
+            entities = []
+            for key in keys:
+                if path_not_unique(key) or not os.path.isfile(os.path.join(parent_path, key)):
+                    continue
+                entities.append(read_fn(parent_path, key))
+            return entities
+
+        if metrics is None:
+            metrics = read_entities(
+                FileStore.METRICS_FOLDER_NAME, metric_keys, self._get_metric_from_file
+            )
+        tags = read_entities(FileStore.TAGS_FOLDER_NAME, tag_keys, self._get_tag_from_file)
+        if MLFLOW_LOGGED_MODELS in tag_keys:
+            # The tag is built from the models recorded for the run, as in ``get_run``
+            tags = _add_logged_models_tag(tags, self._get_logged_models(run_dir))
+        return RunData(
+            metrics=metrics,
+            params=read_entities(
+                FileStore.PARAMS_FOLDER_NAME, param_keys, self._get_param_from_file
+            ),
+            tags=tags,
+        )
 
     def log_metric(self, run_id, metric):
         _validate_run_id(run_id)
@@ -742,6 +964,8 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._log_run_metric(run_info, metric)
+        if self._use_run_index:
+            self._get_run_index(run_info.experiment_id).log_metrics(run_id, [metric])
 
     def _log_run_metric(self, run_info, metric):
         metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric.key)
@@ -835,18 +1059,25 @@ class FileStore(AbstractStore):
         _validate_run_id(run_id)
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
-        tag_path = self._get_tag_path(run_info.experiment_id, run_id, key)
-        if not exists(tag_path):
+        paths = [self._get_tag_path(run_info.experiment_id, run_id, key)]
+        if key == MLFLOW_LOGGED_MODELS:
+            # The models recorded for the run are deleted along with the tag built from them
+            paths.append(self._get_logged_models_path(run_info.experiment_id, run_id))
+        paths = [path for path in paths if exists(path)]
+        if not paths:
             raise MlflowException(
                 "No tag with name: {} in run with id {}".format(key, run_id),
                 error_code=RESOURCE_DOES_NOT_EXIST,
             )
-        os.remove(tag_path)
+        for path in paths:
+            os.remove(path)
 
     def _overwrite_run_info(self, run_info):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
         run_info_dict = _make_persisted_run_info_dict(run_info)
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=True)
+        if self._use_run_index:
+            self._get_run_index(run_info.experiment_id).put_run_info(run_info)
 
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
@@ -861,10 +1092,14 @@ class FileStore(AbstractStore):
                 self._log_run_metric(run_info, metric)
             for tag in tags:
                 self._set_run_tag(run_info, tag)
+            if self._use_run_index and metrics:
+                self._get_run_index(run_info.experiment_id).log_metrics(run_id, metrics)
         except Exception as e:
             raise MlflowException(e, INTERNAL_ERROR)
 
     def record_logged_model(self, run_id, mlflow_model):
+        from mlflow.models import Model
+
         if not isinstance(mlflow_model, Model):
             raise TypeError(
                 "Argument 'mlflow_model' should be mlflow.models.Model, got '{}'".format(
@@ -874,17 +1109,10 @@ class FileStore(AbstractStore):
         _validate_run_id(run_id)
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
-        model_dict = mlflow_model.to_dict()
-        run_info = self._get_run_info(run_id)
-        path = self._get_tag_path(run_info.experiment_id, run_info.run_id, MLFLOW_LOGGED_MODELS)
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                model_list = json.loads(f.read())
-        else:
-            model_list = []
-        tag = RunTag(MLFLOW_LOGGED_MODELS, json.dumps(model_list + [model_dict]))
-
+        # Models are appended to the ``logged_models`` file of the run, from which ``get_run`` and
+        # ``search_runs`` build the ``mlflow.log-model.history`` tag
+        path = self._get_logged_models_path(run_info.experiment_id, run_info.run_id)
         try:
-            self._set_run_tag(run_info, tag)
+            append_to(path, json.dumps(mlflow_model.to_dict()) + "\n")
         except Exception as e:
             raise MlflowException(e, INTERNAL_ERROR)
@@ -0,0 +1,298 @@
+"""
+Optional on-disk indexes that speed up reads from a :py:class:`FileStore
+<mlflow.store.tracking.file_store.FileStore>`.
+
+Each experiment directory contains a SQLite database next to its ``meta.yaml`` that caches the
+metadata of the runs of the experiment and the latest value of each of their metrics, and the root
+directory of the store contains a SQLite database that maps run IDs to experiment IDs. The indexes
+are maintained incrementally by the ``FileStore`` when the ``MLFLOW_FILESTORE_RUN_INDEX``
+environment variable is set to ``true``, and can be rebuilt from the run directories with the
+``mlflow rebuild-run-index`` command.
+"""
+import math
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from mlflow.entities import Metric, RunInfo
+from mlflow.entities.lifecycle_stage import LifecycleStage
+
+# Enables the FileStore run index if set to "true"
+_RUN_INDEX_ENV_VAR = "MLFLOW_FILESTORE_RUN_INDEX"
+RUN_INDEX_FILE_NAME = "run_index.sqlite"
+# Number of seconds to wait for a lock held by another process writing to the same index
+_LOCK_TIMEOUT_SECONDS = 60
+
+_RUN_INFO_COLUMNS = [
+    "run_uuid",
+    "experiment_id",
+    "user_id",
+    "status",
+    "start_time",
+    "end_time",
+    "lifecycle_stage",
+    "artifact_uri",
+]
+
+
+def is_run_index_enabled():
+    """
+    :return: True if FileStores should maintain and read from the run index, as configured by the
+             ``MLFLOW_FILESTORE_RUN_INDEX`` environment variable.
+    """
+    return os.environ.get(_RUN_INDEX_ENV_VAR, "false").lower() == "true"
+
+
+def _metric_sort_key(metric):
+    # Consistent with the ordering used by FileStore to compute the latest value of a metric
+    return metric.step, metric.timestamp, metric.value
+
+
+class _SqliteIndex(object):
+    _SCHEMA = ""
+
+    def __init__(self, path):
+        self.path = path
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    @contextmanager
+    def _connect(self, create=False):
+        """
+        Open a transaction on the index.
+
+        :param create: If True, create the tables of the index if they do not exist. This is only
+                       done by operations that create or rebuild the index, so that reads do not
+                       run DDL statements or take a write lock.
+        """
+        conn = sqlite3.connect(self.path, timeout=_LOCK_TIMEOUT_SECONDS)
+        try:
+            if create:
+                conn.executescript(self._SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+class RunLocationIndex(_SqliteIndex):
+    """Maps run IDs to the IDs of the experiments that contain them."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS run_locations (
+            run_id TEXT PRIMARY KEY,
+            experiment_id TEXT NOT NULL
+        );
+    """
+
+    def get_experiment_id(self, run_id):
+        """
+        :return: The ID of the experiment containing the specified run, or None if the run is not
+                 in the index.
+        """
+        if not self.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT experiment_id FROM run_locations WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_experiment_id(self, run_id, experiment_id):
+        with self._connect(create=not self.exists()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO run_locations (run_id, experiment_id) VALUES (?, ?)",
+                (run_id, experiment_id),
+            )
+
+    def delete_run(self, run_id):
+        if not self.exists():
+            return
+        with self._connect() as conn:
+            conn.execute("DELETE FROM run_locations WHERE run_id = ?", (run_id,))
+
+    def rebuild(self, experiment_id, run_ids):
+        """
+        Replace the locations of the runs of the specified experiment.
+        """
+        with self._connect(create=True) as conn:
+            conn.execute("DELETE FROM run_locations WHERE experiment_id = ?", (experiment_id,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO run_locations (run_id, experiment_id) VALUES (?, ?)",
+                [(run_id, experiment_id) for run_id in run_ids],
+            )
+
+
+class ExperimentRunIndex(_SqliteIndex):
+    """
+    Caches the metadata of the runs of an experiment and the latest value of each of their metrics.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_uuid TEXT PRIMARY KEY,
+            experiment_id TEXT NOT NULL,
+            user_id TEXT,
+            status TEXT,
+            start_time INTEGER,
+            end_time INTEGER,
+            lifecycle_stage TEXT,
+            artifact_uri TEXT
+        );
+        CREATE TABLE IF NOT EXISTS latest_metrics (
+            run_uuid TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value REAL,
+            is_nan INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            step INTEGER NOT NULL,
+            PRIMARY KEY (run_uuid, key)
+        );
+    """
+
+    @staticmethod
+    def _run_info_from_row(row):
+        return RunInfo(
+            run_uuid=row[0],
+            run_id=row[0],
+            experiment_id=row[1],
+            user_id=row[2],
+            status=row[3],
+            start_time=row[4],
+            end_time=row[5],
+            lifecycle_stage=row[6],
+            artifact_uri=row[7],
+        )
+
+    @staticmethod
+    def _metric_from_row(row):
+        key, value, is_nan, timestamp, step = row
+        return Metric(key, float("nan") if is_nan else value, timestamp, step)
+
+    @staticmethod
+    def _put_run_infos(conn, run_infos):
+        conn.executemany(
+            "INSERT OR REPLACE INTO runs ({}) VALUES ({})".format(
+                ", ".join(_RUN_INFO_COLUMNS), ", ".join(["?"] * len(_RUN_INFO_COLUMNS))
+            ),
+            [
+                tuple(getattr(run_info, column) for column in _RUN_INFO_COLUMNS)
+                for run_info in run_infos
+            ],
+        )
+
+    @staticmethod
+    def _put_latest_metrics(conn, run_id, metrics):
+        conn.executemany(
+            "INSERT OR REPLACE INTO latest_metrics (run_uuid, key, value, is_nan, timestamp, step) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    run_id,
+                    m.key,
+                    None if math.isnan(m.value) else m.value,
+                    int(math.isnan(m.value)),
+                    m.timestamp,
+                    m.step,
+                )
+                for m in metrics
+            ],
+        )
+
+    def get_run_info(self, run_id):
+        """
+        :return: The :py:class:`mlflow.entities.RunInfo` of the specified run, or None if the run is
+                 not in the index.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT {} FROM runs WHERE run_uuid = ?".format(", ".join(_RUN_INFO_COLUMNS)),
+                (run_id,),
+            ).fetchone()
+        return self._run_info_from_row(row) if row else None
+
+    def list_run_infos(self, view_type):
+        """
+        :return: The :py:class:`mlflow.entities.RunInfo` of each run of the experiment that matches
+                 the specified :py:class:`mlflow.entities.ViewType`.
+        """
+        stages = list(LifecycleStage.view_type_to_stages(view_type))
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT {} FROM runs WHERE lifecycle_stage IN ({})".format(
+                    ", ".join(_RUN_INFO_COLUMNS), ", ".join(["?"] * len(stages))
+                ),
+                stages,
+            ).fetchall()
+        return [self._run_info_from_row(row) for row in rows]
+
+    def get_latest_metrics(self, keys):
+        """
+        :return: Dictionary mapping the ID of each run of the experiment to the latest values of
+                 the specified metrics logged to the run.
+        """
+        keys = list(keys)
+        latest_metrics = {}
+        if not keys:
+            return latest_metrics
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT run_uuid, key, value, is_nan, timestamp, step FROM latest_metrics "
+                "WHERE key IN ({})".format(", ".join(["?"] * len(keys))),
+                keys,
+            ).fetchall()
+        for row in rows:
+            latest_metrics.setdefault(row[0], []).append(self._metric_from_row(row[1:]))
+        return latest_metrics
+
+    def put_run_info(self, run_info):
+        """
+        Insert or update the metadata of the specified run.
+        """
+        with self._connect() as conn:
+            self._put_run_infos(conn, [run_info])
+
+    def log_metrics(self, run_id, metrics):
+        """
+        Update the latest values of the metrics of the specified run with the specified metrics.
+        """
+        latest = {}
+        for metric in metrics:
+            if metric.key not in latest or _metric_sort_key(metric) > _metric_sort_key(
+                latest[metric.key]
+            ):
+                latest[metric.key] = metric
+        if not latest:
+            return
+        keys = list(latest)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, value, is_nan, timestamp, step FROM latest_metrics "
+                "WHERE run_uuid = ? AND key IN ({})".format(", ".join(["?"] * len(keys))),
+                [run_id] + keys,
+            ).fetchall()
+            for row in rows:
+                existing = self._metric_from_row(row)
+                if not _metric_sort_key(latest[existing.key]) > _metric_sort_key(existing):
+                    del latest[existing.key]
+            self._put_latest_metrics(conn, run_id, latest.values())
+
+    def delete_run(self, run_id):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM latest_metrics WHERE run_uuid = ?", (run_id,))
+            conn.execute("DELETE FROM runs WHERE run_uuid = ?", (run_id,))
+
+    def rebuild(self, runs):
+        """
+        Replace the contents of the index.
+
+        :param runs: Iterable of ``(run_info, latest_metrics)`` tuples, where ``latest_metrics`` is
+                     a list containing the latest value of each metric of the run.
+        """
+        with self._connect(create=True) as conn:
+            conn.execute("DELETE FROM latest_metrics")
+            conn.execute("DELETE FROM runs")
+            for run_info, latest_metrics in runs:
+                self._put_run_infos(conn, [run_info])
+                self._put_latest_metrics(conn, run_info.run_id, latest_metrics)
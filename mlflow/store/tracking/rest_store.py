@@ -9,6 +9,7 @@ from mlflow.protos.service_pb2 import (
     SearchRuns,
     ListExperiments,
     GetMetricHistory,
+    GetMetricHistoryBulk,
     LogMetric,
     LogParam,
     SetTag,
@@ -26,7 +27,6 @@ from mlflow.protos.service_pb2 import (
     GetExperimentByName,
 )
 from mlflow.store.tracking.abstract_store import AbstractStore
-from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import (
     call_endpoint,
     extract_api_info_for_service,
@@ -58,7 +58,7 @@ class RestStore(AbstractStore):
         """
         :return: a list of all known Experiment objects
         """
-        req_body = message_to_json(ListExperiments(view_type=view_type))
+        req_body = ListExperiments(view_type=view_type)
         response_proto = self._call_endpoint(ListExperiments, req_body)
         return [
             Experiment.from_proto(experiment_proto)
@@ -74,7 +74,7 @@ class RestStore(AbstractStore):
 
         :return: experiment_id (string) for the newly created experiment if successful, else None
         """
-        req_body = message_to_json(CreateExperiment(name=name, artifact_location=artifact_location))
+        req_body = CreateExperiment(name=name, artifact_location=artifact_location)
         response_proto = self._call_endpoint(CreateExperiment, req_body)
         return response_proto.experiment_id
 
@@ -87,22 +87,20 @@ class RestStore(AbstractStore):
         :return: A single :py:class:`mlflow.entities.Experiment` object if it exists,
         otherwise raises an Exception.
         """
-        req_body = message_to_json(GetExperiment(experiment_id=str(experiment_id)))
+        req_body = GetExperiment(experiment_id=str(experiment_id))
         response_proto = self._call_endpoint(GetExperiment, req_body)
         return Experiment.from_proto(response_proto.experiment)
 
     def delete_experiment(self, experiment_id):
-        req_body = message_to_json(DeleteExperiment(experiment_id=str(experiment_id)))
+        req_body = DeleteExperiment(experiment_id=str(experiment_id))
         self._call_endpoint(DeleteExperiment, req_body)
 
     def restore_experiment(self, experiment_id):
-        req_body = message_to_json(RestoreExperiment(experiment_id=str(experiment_id)))
+        req_body = RestoreExperiment(experiment_id=str(experiment_id))
         self._call_endpoint(RestoreExperiment, req_body)
 
     def rename_experiment(self, experiment_id, new_name):
-        req_body = message_to_json(
-            UpdateExperiment(experiment_id=str(experiment_id), new_name=new_name)
-        )
+        req_body = UpdateExperiment(experiment_id=str(experiment_id), new_name=new_name)
         self._call_endpoint(UpdateExperiment, req_body)
 
     def get_run(self, run_id):
@@ -113,15 +111,13 @@ class RestStore(AbstractStore):
 
         :return: A single Run object if it exists, otherwise raises an Exception
         """
-        req_body = message_to_json(GetRun(run_uuid=run_id, run_id=run_id))
+        req_body = GetRun(run_uuid=run_id, run_id=run_id)
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
     def update_run_info(self, run_id, run_status, end_time):
         """ Updates the metadata of the specified run. """
-        req_body = message_to_json(
-            UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status, end_time=end_time)
-        )
+        req_body = UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status, end_time=end_time)
         response_proto = self._call_endpoint(UpdateRun, req_body)
         return RunInfo.from_proto(response_proto.run_info)
 
@@ -137,13 +133,11 @@ class RestStore(AbstractStore):
         :return: The created Run object
         """
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
-            CreateRun(
-                experiment_id=str(experiment_id),
-                user_id=user_id,
-                start_time=start_time,
-                tags=tag_protos,
-            )
+        req_body = CreateRun(
+            experiment_id=str(experiment_id),
+            user_id=user_id,
+            start_time=start_time,
+            tags=tag_protos,
         )
         response_proto = self._call_endpoint(CreateRun, req_body)
         run = Run.from_proto(response_proto.run)
@@ -156,15 +150,13 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param metric: Metric instance to log
         """
-        req_body = message_to_json(
-            LogMetric(
-                run_uuid=run_id,
-                run_id=run_id,
-                key=metric.key,
-                value=metric.value,
-                timestamp=metric.timestamp,
-                step=metric.step,
-            )
+        req_body = LogMetric(
+            run_uuid=run_id,
+            run_id=run_id,
+            key=metric.key,
+            value=metric.value,
+            timestamp=metric.timestamp,
+            step=metric.step,
         )
         self._call_endpoint(LogMetric, req_body)
 
@@ -175,9 +167,7 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param param: Param instance to log
         """
-        req_body = message_to_json(
-            LogParam(run_uuid=run_id, run_id=run_id, key=param.key, value=param.value)
-        )
+        req_body = LogParam(run_uuid=run_id, run_id=run_id, key=param.key, value=param.value)
         self._call_endpoint(LogParam, req_body)
 
     def set_experiment_tag(self, experiment_id, tag):
@@ -187,9 +177,7 @@ class RestStore(AbstractStore):
         :param experiment_id: String ID of the experiment
         :param tag: ExperimentRunTag instance to log
         """
-        req_body = message_to_json(
-            SetExperimentTag(experiment_id=experiment_id, key=tag.key, value=tag.value)
-        )
+        req_body = SetExperimentTag(experiment_id=experiment_id, key=tag.key, value=tag.value)
         self._call_endpoint(SetExperimentTag, req_body)
 
     def set_tag(self, run_id, tag):
@@ -199,9 +187,7 @@ class RestStore(AbstractStore):
         :param run_id: String ID of the run
         :param tag: RunTag instance to log
         """
-        req_body = message_to_json(
-            SetTag(run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value)
-        )
+        req_body = SetTag(run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value)
         self._call_endpoint(SetTag, req_body)
 
     def delete_tag(self, run_id, key):
@@ -210,29 +196,71 @@ class RestStore(AbstractStore):
         :param run_id: String ID of the run
         :param key: Name of the tag
         """
-        req_body = message_to_json(DeleteTag(run_id=run_id, key=key))
+        req_body = DeleteTag(run_id=run_id, key=key)
         self._call_endpoint(DeleteTag, req_body)
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_results=None, sampling=None):
         """
         Return all logged values for a given metric.
 
         :param run_id: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param max_results: If specified, the maximum number of values to return. Metrics with more
+                            logged values are downsampled by the server.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        req_body = message_to_json(
-            GetMetricHistory(run_uuid=run_id, run_id=run_id, metric_key=metric_key)
+        req_body = GetMetricHistory(
+            run_uuid=run_id,
+            run_id=run_id,
+            metric_key=metric_key,
+            max_results=max_results,
+            sampling=sampling,
         )
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric) for metric in response_proto.metrics]
 
+    def get_metric_history_bulk(
+        self, run_ids, metric_keys, start_step=None, end_step=None, max_results=None, sampling=None
+    ):
+        """
+        Return the values logged for several metrics of several runs with a single request.
+
+        :param run_ids: List of unique identifiers of runs
+        :param metric_keys: List of metric names to fetch for each run
+        :param start_step: If specified, only values logged at this step or later are returned.
+        :param end_step: If specified, only values logged at this step or earlier are returned.
+        :param max_results: If specified, the maximum number of values to return for each metric of
+                            each run. Metrics with more values are downsampled by the server.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
+
+        :return: A dictionary mapping each run ID to a dictionary mapping each metric name to a list
+                 of :py:class:`mlflow.entities.Metric` entities ordered by step and timestamp,
+                 which is empty if the run has not logged the metric. The server responds with a
+                 ``RESOURCE_DOES_NOT_EXIST`` error if one of the runs does not exist.
+        """
+        req_body = GetMetricHistoryBulk(
+            run_ids=run_ids,
+            metric_keys=metric_keys,
+            start_step=start_step,
+            end_step=end_step,
+            max_results=max_results,
+            sampling=sampling,
+        )
+        response_proto = self._call_endpoint(GetMetricHistoryBulk, req_body)
+        histories = {run_id: {metric_key: [] for metric_key in metric_keys} for run_id in run_ids}
+        for history in response_proto.metric_histories:
+            histories.setdefault(history.run_id, {})[history.metric_key] = [
+                Metric.from_proto(metric) for metric in history.metrics
+            ]
+        return histories
+
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
         experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
-        sr = SearchRuns(
+        req_body = SearchRuns(
             experiment_ids=experiment_ids,
             filter=filter_string,
             run_view_type=ViewType.to_proto(run_view_type),
@@ -240,7 +268,6 @@ class RestStore(AbstractStore):
             order_by=order_by,
             page_token=page_token,
         )
-        req_body = message_to_json(sr)
         response_proto = self._call_endpoint(SearchRuns, req_body)
         runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
         # If next_page_token is not set, we will see it as "". We need to convert this to None.
@@ -250,16 +277,16 @@ class RestStore(AbstractStore):
         return runs, next_page_token
 
     def delete_run(self, run_id):
-        req_body = message_to_json(DeleteRun(run_id=run_id))
+        req_body = DeleteRun(run_id=run_id)
         self._call_endpoint(DeleteRun, req_body)
 
     def restore_run(self, run_id):
-        req_body = message_to_json(RestoreRun(run_id=run_id))
+        req_body = RestoreRun(run_id=run_id)
         self._call_endpoint(RestoreRun, req_body)
 
     def get_experiment_by_name(self, experiment_name):
         try:
-            req_body = message_to_json(GetExperimentByName(experiment_name=experiment_name))
+            req_body = GetExperimentByName(experiment_name=experiment_name)
             response_proto = self._call_endpoint(GetExperimentByName, req_body)
             return Experiment.from_proto(response_proto.experiment)
         except MlflowException as e:
@@ -281,13 +308,13 @@ class RestStore(AbstractStore):
         metric_protos = [metric.to_proto() for metric in metrics]
         param_protos = [param.to_proto() for param in params]
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
-            LogBatch(metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id)
+        req_body = LogBatch(
+            metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id
         )
         self._call_endpoint(LogBatch, req_body)
 
     def record_logged_model(self, run_id, mlflow_model):
-        req_body = message_to_json(LogModel(run_id=run_id, model_json=mlflow_model.to_json()))
+        req_body = LogModel(run_id=run_id, model_json=mlflow_model.to_json())
         self._call_endpoint(LogModel, req_body)
 
 
@@ -302,7 +329,7 @@ class DatabricksRestStore(RestStore):
 
     def get_experiment_by_name(self, experiment_name):
         try:
-            req_body = message_to_json(GetExperimentByName(experiment_name=experiment_name))
+            req_body = GetExperimentByName(experiment_name=experiment_name)
             response_proto = self._call_endpoint(GetExperimentByName, req_body)
             return Experiment.from_proto(response_proto.experiment)
         except MlflowException as e:
@@ -1,16 +1,21 @@
+import itertools
 import json
 import logging
 import uuid
+from collections import defaultdict
 
 import math
+import operator
+import sqlite3
 import sqlalchemy
 import sqlalchemy.sql.expression as sql
 
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.models import Model
-from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.db.db_types import MYSQL, MSSQL
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD, _add_logged_models_tag
+from mlflow.store.db.db_types import MYSQL, MSSQL, SQLITE
 import mlflow.store.db.utils
+from mlflow.store.db.sqlite_writer import get_sqlite_writer
 from mlflow.store.tracking.dbmodels.models import (
     SqlExperiment,
     SqlRun,
@@ -19,9 +24,19 @@ from mlflow.store.tracking.dbmodels.models import (
     SqlTag,
     SqlExperimentTag,
     SqlLatestMetric,
+    SqlLoggedModel,
 )
 from mlflow.store.db.base_sql_model import Base
-from mlflow.entities import RunStatus, SourceType, Experiment
+from mlflow.entities import (
+    Experiment,
+    Metric,
+    Param,
+    Run,
+    RunData,
+    RunStatus,
+    RunTag,
+    SourceType,
+)
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
@@ -32,8 +47,10 @@ from mlflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
     INTERNAL_ERROR,
 )
+from mlflow.utils import metric_sampling
 from mlflow.utils.uri import is_local_uri, extract_db_type_from_uri
 from mlflow.utils.file_utils import mkdir, local_file_uri_to_path
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import append_to_uri_path
@@ -44,11 +61,16 @@ from mlflow.utils.validation import (
     _validate_metric,
     _validate_experiment_tag,
     _validate_tag,
+    _validate_metric_history_bulk_args,
 )
-from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of entity keys bound to a single ``IN`` clause by the batched logging queries
+_MAX_KEYS_PER_QUERY = 500
+# Number of rows of metric histories fetched from the database at once
+_METRIC_HISTORY_FETCH_SIZE = 10000
+
 # For each database table, fetch its columns and define an appropriate attribute for each column
 # on the table's associated object representation (Mapper). This is necessary to ensure that
 # columns defined via backreference are available as Mapper instance attributes (e.g.,
@@ -117,17 +139,23 @@ class SqlAlchemyStore(AbstractStore):
         if any([table not in inspected_tables for table in expected_tables]):
             mlflow.store.db.utils._initialize_tables(self.engine)
         Base.metadata.bind = self.engine
-        SessionMaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
-        self.ManagedSessionMaker = mlflow.store.db.utils._get_managed_session_maker(
-            SessionMaker, self.db_type
+        # Read-only queries use ``ReadSessionMaker``, whose sessions are served by the read
+        # replicas of the database if any are configured
+        session_makers = mlflow.store.db.utils._get_session_makers(self.engine, self.db_type)
+        self.ManagedSessionMaker, self.ReadSessionMaker = session_makers
+        # Concurrent writes to SQLite databases are serialized, see ``log_metric``
+        self._sqlite_writer = (
+            get_sqlite_writer(self.engine.url.database) if self.db_type == SQLITE else None
         )
         mlflow.store.db.utils._verify_schema(self.engine)
 
         if is_local_uri(default_artifact_root):
             mkdir(local_file_uri_to_path(default_artifact_root))
 
-        if len(self.list_experiments()) == 0:
-            with self.ManagedSessionMaker() as session:
+        # Check the primary rather than a replica, which may not have replicated the default
+        # experiment yet
+        with self.ManagedSessionMaker() as session:
+            if len(self._list_experiments(session)) == 0:
                 self._create_default_experiment(session)
 
     def _set_zero_value_insertion_for_autoincrement_column(self, session):
@@ -253,7 +281,7 @@ class SqlAlchemyStore(AbstractStore):
         return session.query(SqlExperiment).options(*query_options).filter(*conditions).all()
 
     def list_experiments(self, view_type=ViewType.ACTIVE_ONLY):
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             return [
                 exp.to_mlflow_entity()
                 for exp in self._list_experiments(session=session, view_type=view_type, eager=True)
@@ -301,7 +329,7 @@ class SqlAlchemyStore(AbstractStore):
         ]
 
     def get_experiment(self, experiment_id):
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             return self._get_experiment(
                 session, experiment_id, ViewType.ALL, eager=True
             ).to_mlflow_entity()
@@ -310,7 +338,7 @@ class SqlAlchemyStore(AbstractStore):
         """
         Specialized implementation for SQL backed store.
         """
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             stages = LifecycleStage.view_type_to_stages(ViewType.ALL)
             experiment = (
                 session.query(SqlExperiment)
@@ -404,7 +432,8 @@ class SqlAlchemyStore(AbstractStore):
     def _get_eager_run_query_options():
         """
         :return: A list of SQLAlchemy query options that can be used to eagerly load the following
-                 run attributes when fetching a run: ``latest_metrics``, ``params``, and ``tags``.
+                 run attributes when fetching a run: ``latest_metrics``, ``params``, ``tags``, and
+                 ``logged_models``.
         """
         return [
             # Use a subquery load rather than a joined load in order to minimize the memory overhead
@@ -414,6 +443,7 @@ class SqlAlchemyStore(AbstractStore):
             sqlalchemy.orm.subqueryload(SqlRun.latest_metrics),
             sqlalchemy.orm.subqueryload(SqlRun.params),
             sqlalchemy.orm.subqueryload(SqlRun.tags),
+            sqlalchemy.orm.subqueryload(SqlRun.logged_models),
         ]
 
     def _check_run_is_active(self, run):
@@ -465,7 +495,7 @@ class SqlAlchemyStore(AbstractStore):
         return None if not tags else tags[0]
 
     def get_run(self, run_id):
-        with self.ManagedSessionMaker() as session:
+        with self.ReadSessionMaker() as session:
             # Load the run with the specified id and eagerly load its summary metrics, params, and
             # tags. These attributes are referenced during the invocation of
             # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
@@ -505,8 +535,12 @@ class SqlAlchemyStore(AbstractStore):
             )
             return [run_id[0] for run_id in run_ids]
 
-    def log_metric(self, run_id, metric):
-        _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+    @staticmethod
+    def _get_metric_value_details(metric):
+        """
+        :return: A tuple ``(value, is_nan)`` containing the representation of ``metric.value``
+                 that is stored in the database and whether the original value was NaN.
+        """
         is_nan = math.isnan(metric.value)
         if is_nan:
             value = 0
@@ -515,6 +549,19 @@ class SqlAlchemyStore(AbstractStore):
             value = 1.7976931348623157e308 if metric.value > 0 else -1.7976931348623157e308
         else:
             value = metric.value
+        return value, is_nan
+
+    def log_metric(self, run_id, metric):
+        _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+        if self._sqlite_writer is not None:
+            # Since SQLite serializes writes, the metrics logged concurrently, e.g. by the workers
+            # of the tracking server, are written in shared transactions rather than queuing for
+            # the write lock one by one
+            self._sqlite_writer.submit(
+                self.ManagedSessionMaker, self._log_metrics_of_runs, (run_id, metric)
+            )
+            return
+        value, is_nan = self._get_metric_value_details(metric)
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
@@ -535,6 +582,19 @@ class SqlAlchemyStore(AbstractStore):
             if just_created:
                 self._update_latest_metric_if_necessary(logged_metric, session)
 
+    def _log_metrics_of_runs(self, session, run_metrics):
+        """
+        Log metrics to several runs given a list of ``(run_id, metric)`` tuples, e.g. the metrics
+        of concurrent ``log_metric`` calls grouped by the SQLite writer.
+        """
+        metrics_by_run_id = defaultdict(list)
+        for run_id, metric in run_metrics:
+            metrics_by_run_id[run_id].append(metric)
+        for run_id, metrics in metrics_by_run_id.items():
+            run = self._get_run(run_uuid=run_id, session=session)
+            self._check_run_is_active(run)
+            self._log_metrics(session, run_id, metrics)
+
     @staticmethod
     def _update_latest_metric_if_necessary(logged_metric, session):
         def _compare_metrics(metric_a, metric_b):
@@ -572,10 +632,139 @@ class SqlAlchemyStore(AbstractStore):
                 )
             )
 
-    def get_metric_history(self, run_id, metric_key):
-        with self.ManagedSessionMaker() as session:
-            metrics = session.query(SqlMetric).filter_by(run_uuid=run_id, key=metric_key).all()
-            return [metric.to_mlflow_entity() for metric in metrics]
+    def get_metric_history(self, run_id, metric_key, max_results=None, sampling=None):
+        sampling = metric_sampling.validate_sampling(max_results, sampling)
+        history_filter = [SqlMetric.run_uuid == run_id, SqlMetric.key == metric_key]
+        with self.ReadSessionMaker() as session:
+            if sampling is not None:
+                num_values = (
+                    session.query(sqlalchemy.func.count(SqlMetric.step))
+                    .filter(*history_filter)
+                    .scalar()
+                )
+                if num_values > max_results:
+                    return self._get_sampled_metric_history(
+                        session, history_filter, num_values, max_results, sampling
+                    )
+            return [
+                _metric_from_row(row)
+                for row in _select_metric_history(session, history_filter).fetchall()
+            ]
+
+    def _can_sample_in_database(self, sampling):
+        """
+        Whether to downsample metric histories with the ``sampling`` method in the database, which
+        requires window functions (introduced by SQLite 3.25, MySQL 8.0 and MariaDB 10.2), rather
+        than to load them and downsample them with NumPy.
+        """
+        if sampling == metric_sampling.LTTB:
+            # LTTB chooses each value depending on the value chosen from the previous bucket, which
+            # SQL cannot express efficiently
+            return False
+        if self.db_type == SQLITE:
+            # SQLite runs in process, so loading a history costs much less than on a database
+            # server, and less than sorting each bucket by value twice for ``min_max``
+            return sampling == metric_sampling.EVERY_NTH and sqlite3.sqlite_version_info >= (3, 25)
+        if self.db_type == MYSQL:
+            dialect = self.engine.dialect
+            min_version = (10, 2) if getattr(dialect, "_is_mariadb", False) else (8, 0)
+            return tuple(dialect.server_version_info or ()) >= min_version
+        return True
+
+    def _get_sampled_metric_history(
+        self, session, history_filter, num_values, max_results, sampling
+    ):
+        """
+        Downsample the ``num_values`` values of a metric history to at most ``max_results`` values.
+        When possible, ``every_nth`` and ``min_max`` are computed by the database with window
+        functions, so that only the sampled values are transferred. They match the NumPy
+        implementations of :py:mod:`mlflow.utils.metric_sampling`.
+        """
+        if not self._can_sample_in_database(sampling):
+            rows = _select_metric_history(session, history_filter).fetchall()
+            return [_metric_from_row(row) for row in _sample_rows(rows, max_results, sampling)]
+
+        columns = list(_METRIC_HISTORY_COLUMNS)
+        ordering = [SqlMetric.step, SqlMetric.timestamp]
+        position = sqlalchemy.func.row_number().over(order_by=ordering).label("position")
+        if sampling == metric_sampling.EVERY_NTH:
+            numbered = session.query(*(columns + [position])).filter(*history_filter).subquery()
+            stride = metric_sampling.get_every_nth_stride(num_values, max_results)
+            sampled = session.query(numbered).filter((numbered.c.position - 1) % stride == 0)
+            return [_metric_from_row(row) for row in sampled.order_by(numbered.c.position)]
+
+        num_buckets = metric_sampling.get_num_min_max_buckets(max_results)
+        bucket = sqlalchemy.func.ntile(num_buckets).over(order_by=ordering).label("bucket")
+        bucketed = session.query(*(columns + [position, bucket])).filter(*history_filter).subquery()
+        c = bucketed.c
+        min_rank = sqlalchemy.func.row_number().over(
+            partition_by=c.bucket, order_by=[c.is_nan, c.value, c.position]
+        )
+        max_rank = sqlalchemy.func.row_number().over(
+            partition_by=c.bucket, order_by=[c.is_nan, c.value.desc(), c.position]
+        )
+        ranked = session.query(
+            bucketed, min_rank.label("min_rank"), max_rank.label("max_rank")
+        ).subquery()
+        sampled = session.query(ranked).filter(
+            sql.or_(ranked.c.min_rank == 1, ranked.c.max_rank == 1)
+        )
+        return [_metric_from_row(row) for row in sampled.order_by(ranked.c.position)]
+
+    def get_metric_history_bulk(
+        self, run_ids, metric_keys, start_step=None, end_step=None, max_results=None, sampling=None
+    ):
+        """
+        Fetch the histories with a single query per batch of runs, ordered so that the rows of each
+        history are consecutive, and downsample each history with NumPy.
+        """
+        _validate_metric_history_bulk_args(run_ids, metric_keys, start_step, end_step)
+        sampling = metric_sampling.validate_sampling(max_results, sampling)
+        histories = {run_id: {metric_key: [] for metric_key in metric_keys} for run_id in run_ids}
+        history_filter = [SqlMetric.key.in_(set(metric_keys))]
+        if start_step is not None:
+            history_filter.append(SqlMetric.step >= start_step)
+        if end_step is not None:
+            history_filter.append(SqlMetric.step <= end_step)
+        with self.ReadSessionMaker() as session:
+            for run_id_batch in _chunks(list(histories), _MAX_KEYS_PER_QUERY):
+                existing_run_ids = {
+                    run_id
+                    for (run_id,) in session.query(SqlRun.run_uuid).filter(
+                        SqlRun.run_uuid.in_(run_id_batch)
+                    )
+                }
+                for run_id in run_id_batch:
+                    if run_id not in existing_run_ids:
+                        raise MlflowException(
+                            "Run with id={} not found".format(run_id), RESOURCE_DOES_NOT_EXIST
+                        )
+                result = session.execute(
+                    sql.select(_METRIC_HISTORY_COLUMNS + [SqlMetric.run_uuid])
+                    .where(sql.and_(SqlMetric.run_uuid.in_(run_id_batch), *history_filter))
+                    .order_by(
+                        SqlMetric.run_uuid, SqlMetric.key, SqlMetric.step, SqlMetric.timestamp
+                    )
+                )
+                # Fetching rows one at a time is several times slower than fetching them in chunks
+                rows = itertools.chain.from_iterable(
+                    iter(lambda: result.fetchmany(_METRIC_HISTORY_FETCH_SIZE), [])
+                )
+                batch_histories = {}
+                for (metric_key, run_id), history in itertools.groupby(
+                    rows, operator.itemgetter(0, len(_METRIC_HISTORY_COLUMNS))
+                ):
+                    if metric_key not in histories.get(run_id, {}):
+                        # Matched by a case-insensitive collation, e.g. on MySQL
+                        continue
+                    # With a case-insensitive collation, the rows of keys that only differ by case
+                    # may be interleaved, splitting a history into several groups
+                    batch_histories.setdefault((run_id, metric_key), []).extend(history)
+                for (run_id, metric_key), history in batch_histories.items():
+                    if sampling is not None and len(history) > max_results:
+                        history = _sample_rows(history, max_results, sampling)
+                    histories[run_id][metric_key] = [_metric_from_row(row) for row in history]
+        return histories
 
     def log_param(self, run_id, param):
         with self.ManagedSessionMaker() as session:
@@ -664,7 +853,15 @@ class SqlAlchemyStore(AbstractStore):
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
             filtered_tags = session.query(SqlTag).filter_by(run_uuid=run_id, key=key).all()
-            if len(filtered_tags) == 0:
+            num_logged_models = 0
+            if key == MLFLOW_LOGGED_MODELS:
+                # The models recorded for the run are deleted along with the tag built from them
+                num_logged_models = (
+                    session.query(SqlLoggedModel)
+                    .filter(SqlLoggedModel.run_uuid == run_id)
+                    .delete(synchronize_session=False)
+                )
+            if len(filtered_tags) == 0 and num_logged_models == 0:
                 raise MlflowException(
                     "No tag with name: {} in run with id {}".format(key, run_id),
                     error_code=RESOURCE_DOES_NOT_EXIST,
@@ -676,16 +873,21 @@ class SqlAlchemyStore(AbstractStore):
                     "See https://mlflow.org/docs/latest/tracking.html#adding-tags-to-runs",
                     error_code=INVALID_STATE,
                 )
-            session.delete(filtered_tags[0])
+            for tag in filtered_tags:
+                session.delete(tag)
 
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
-        def compute_next_token(current_size):
+        def compute_next_token(rows):
             next_token = None
-            if max_results == current_size:
-                final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
+            if rows and max_results == len(rows):
+                # The value of an order_by clause is not compared when its rank is not 0
+                sort_values = list(rows[-1][1:])
+                for i in range(0, 2 * len(order_by or []), 2):
+                    if sort_values[i] != 0:
+                        sort_values[i + 1] = None
+                next_token = SearchUtils.create_page_token_for_search_runs(sort_values, order_by)
 
             return next_token
 
@@ -698,40 +900,42 @@ class SqlAlchemyStore(AbstractStore):
 
         stages = set(LifecycleStage.view_type_to_stages(run_view_type))
 
-        with self.ManagedSessionMaker() as session:
-            # Fetch the appropriate runs and eagerly load their summary metrics, params, and
-            # tags. These run attributes are referenced during the invocation of
-            # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
-            # that are otherwise executed at attribute access time under a lazy loading model.
+        with self.ReadSessionMaker() as session:
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
-            parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
-
-            query = session.query(SqlRun)
-            for j in _get_sqlalchemy_filter_clauses(parsed_filters, session):
-                query = query.join(j)
+            parsed_orderby, sorting_joins, sort_columns = _get_orderby_clauses(order_by, session)
+
+            # Select the IDs of the runs of the requested page first, so that the database filters,
+            # sorts and paginates narrow rows. Filters on metrics, params and tags are ``EXISTS``
+            # subqueries, and each sorting join matches at most one row per run, so the query does
+            # not need a ``DISTINCT`` clause. The values the runs are sorted by are selected too,
+            # as the token of the next page encodes those of the last run of the page.
+            query = session.query(SqlRun.run_uuid)
             # using an outer join is necessary here because we want to be able to sort
             # on a column (tag, metric or param) without removing the lines that
             # do not have a value for this column (which is what inner join would do)
             for j in sorting_joins:
                 query = query.outerjoin(j)
+            query = query.add_columns(*[column for column, _ in sort_columns])
 
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
-            queried_runs = (
-                query.distinct()
-                .options(*self._get_eager_run_query_options())
-                .filter(
+            offset, after = SearchUtils.parse_page_token_for_search_runs(page_token, order_by)
+            if after is not None:
+                query = query.filter(_get_keyset_filtering_clause(sort_columns, after))
+            query = (
+                query.filter(
                     SqlRun.experiment_id.in_(experiment_ids),
                     SqlRun.lifecycle_stage.in_(stages),
-                    *_get_attributes_filtering_clauses(parsed_filters)
+                    *_get_attributes_filtering_clauses(parsed_filters),
+                    *_get_sqlalchemy_filter_clauses(parsed_filters)
                 )
                 .order_by(*parsed_orderby)
                 .offset(offset)
                 .limit(max_results)
-                .all()
             )
+            rows = query.all()
+            run_ids = [row[0] for row in rows]
 
-            runs = [run.to_mlflow_entity() for run in queried_runs]
-            next_page_token = compute_next_token(len(runs))
+            runs = _load_runs(session, run_ids)
+            next_page_token = compute_next_token(rows)
 
         return runs, next_page_token
 
@@ -742,17 +946,199 @@ class SqlAlchemyStore(AbstractStore):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
+            try:
+                self._log_params(session, run_id, params)
+                self._log_metrics(session, run_id, metrics)
+                self._set_tags(session, run_id, tags)
+            except MlflowException as e:
+                raise e
+            except Exception as e:
+                raise MlflowException(e, INTERNAL_ERROR)
+
+    def _log_params(self, session, run_id, params):
+        """
+        Insert ``params`` for the specified run with a single multi-row ``INSERT``, skipping
+        params that have already been logged with the same value. If a param value differs from
+        a previously-logged value, the params preceding it in the batch are committed and an
+        exception is raised, matching the behavior of repeated ``log_param`` calls.
+        """
+        if not params:
+            return
+
+        existing_params = self._get_param_values(session, run_id, [param.key for param in params])
+        new_params = []
+        for param in params:
+            if param.key in existing_params:
+                old_value = existing_params[param.key]
+                if old_value == param.value:
+                    continue
+                self._insert_params(session, run_id, new_params)
+                session.commit()
+                _raise_param_value_conflict(run_id, param, old_value)
+            existing_params[param.key] = param.value
+            new_params.append({"run_uuid": run_id, "key": param.key, "value": param.value})
+        self._insert_params(session, run_id, new_params)
+
+    @staticmethod
+    def _get_param_values(session, run_id, keys):
+        """
+        :return: A dictionary mapping each of the specified param ``keys`` that has been logged
+                 for the run to its value.
+        """
+        param_values = {}
+        for key_batch in _chunks(keys, _MAX_KEYS_PER_QUERY):
+            param_values.update(
+                session.query(SqlParam.key, SqlParam.value)
+                .filter(SqlParam.run_uuid == run_id, SqlParam.key.in_(key_batch))
+                .all()
+            )
+        return param_values
+
+    def _insert_params(self, session, run_id, rows):
+        """
+        Insert param ``rows`` that were absent from the run when it was last read. If another
+        client logs some of these params concurrently, the insert fails with an integrity error;
+        in this case, the stored values are read again and params that were logged with the same
+        value are skipped, while a different value is reported as a param value conflict.
+        """
         try:
-            for param in params:
-                self.log_param(run_id, param)
-            for metric in metrics:
-                self.log_metric(run_id, metric)
-            for tag in tags:
-                self.set_tag(run_id, tag)
-        except MlflowException as e:
-            raise e
-        except Exception as e:
-            raise MlflowException(e, INTERNAL_ERROR)
+            _bulk_insert(session, SqlParam, rows)
+        except sqlalchemy.exc.IntegrityError:
+            # Roll back the current session to make it usable for further transactions
+            session.rollback()
+            existing_params = self._get_param_values(session, run_id, [row["key"] for row in rows])
+            if not existing_params:
+                raise
+            remaining_rows = []
+            for row in rows:
+                if row["key"] not in existing_params:
+                    remaining_rows.append(row)
+                elif existing_params[row["key"]] != row["value"]:
+                    _raise_param_value_conflict(
+                        run_id, Param(row["key"], row["value"]), existing_params[row["key"]]
+                    )
+            _bulk_insert(session, SqlParam, remaining_rows)
+
+    def _log_metrics(self, session, run_id, metrics):
+        """
+        Insert ``metrics`` for the specified run with a single multi-row ``INSERT`` and update the
+        ``latest_metrics`` table accordingly. Metrics that are identical to an already-logged
+        metric (same key, value, timestamp and step) are skipped, matching the behavior of
+        repeated ``log_metric`` calls.
+        """
+        if not metrics:
+            return
+
+        new_metrics = {}
+        for metric in metrics:
+            value, is_nan = self._get_metric_value_details(metric)
+            row = (metric.key, value, metric.timestamp, metric.step, is_nan)
+            new_metrics[row] = {
+                "run_uuid": run_id,
+                "key": metric.key,
+                "value": value,
+                "timestamp": metric.timestamp,
+                "step": metric.step,
+                "is_nan": is_nan,
+            }
+
+        # Exclude metrics that are already present in the ``metrics`` table. The lookup is
+        # restricted to the range of steps and timestamps covered by the batch in order to avoid
+        # loading the full history of each metric
+        steps = [m.step for m in metrics]
+        timestamps = [m.timestamp for m in metrics]
+        metric_keys = list({m.key for m in metrics})
+        for key_batch in _chunks(metric_keys, _MAX_KEYS_PER_QUERY):
+            existing_metrics = session.query(
+                SqlMetric.key,
+                SqlMetric.value,
+                SqlMetric.timestamp,
+                SqlMetric.step,
+                SqlMetric.is_nan,
+            ).filter(
+                SqlMetric.run_uuid == run_id,
+                SqlMetric.key.in_(key_batch),
+                SqlMetric.step.between(min(steps), max(steps)),
+                SqlMetric.timestamp.between(min(timestamps), max(timestamps)),
+            )
+            for row in existing_metrics:
+                new_metrics.pop(tuple(row), None)
+
+        metric_rows = list(new_metrics.values())
+        _bulk_insert(session, SqlMetric, metric_rows)
+        self._update_latest_metrics_if_necessary(session, run_id, metric_rows)
+
+    @staticmethod
+    def _update_latest_metrics_if_necessary(session, run_id, metric_rows):
+        """
+        Update the ``latest_metrics`` table of the specified run given a list of newly-inserted
+        metric rows. The current latest values of all affected keys are fetched with one query,
+        and the new latest values are written with one bulk ``INSERT`` and one bulk ``UPDATE``.
+        """
+        if not metric_rows:
+            return
+
+        def _sort_key(row):
+            return (row["step"], row["timestamp"], row["value"])
+
+        candidates = {}
+        for row in metric_rows:
+            candidate = candidates.get(row["key"])
+            if candidate is None or _sort_key(row) > _sort_key(candidate):
+                candidates[row["key"]] = row
+
+        # Fetch the latest metric values corresponding to the specified run_id and metric keys
+        # and lock their associated rows for the remainder of the transaction in order to ensure
+        # isolation
+        latest_metrics = {}
+        for key_batch in _chunks(sorted(candidates), _MAX_KEYS_PER_QUERY):
+            latest_metrics_batch = (
+                session.query(SqlLatestMetric)
+                .filter(SqlLatestMetric.run_uuid == run_id, SqlLatestMetric.key.in_(key_batch))
+                .with_for_update()
+                .all()
+            )
+            for m in latest_metrics_batch:
+                latest_metrics[m.key] = {"step": m.step, "timestamp": m.timestamp, "value": m.value}
+
+        inserts = []
+        updates = []
+        for key, candidate in candidates.items():
+            latest_metric = latest_metrics.get(key)
+            if latest_metric is None:
+                inserts.append(candidate)
+            elif _sort_key(candidate) > _sort_key(latest_metric):
+                updates.append(candidate)
+        _bulk_insert(session, SqlLatestMetric, inserts)
+        if updates:
+            session.bulk_update_mappings(SqlLatestMetric, updates)
+
+    def _set_tags(self, session, run_id, tags):
+        """
+        Upsert ``tags`` for the specified run, using one bulk ``INSERT`` for new keys and one
+        bulk ``UPDATE`` for existing keys. If a key occurs several times in ``tags``, the last
+        value wins, matching the behavior of repeated ``set_tag`` calls.
+        """
+        if not tags:
+            return
+
+        tag_values = {tag.key: tag.value for tag in tags}
+        existing_keys = set()
+        for key_batch in _chunks(list(tag_values), _MAX_KEYS_PER_QUERY):
+            existing_keys.update(
+                key
+                for (key,) in session.query(SqlTag.key).filter(
+                    SqlTag.run_uuid == run_id, SqlTag.key.in_(key_batch)
+                )
+            )
+
+        rows = [
+            {"run_uuid": run_id, "key": key, "value": value} for key, value in tag_values.items()
+        ]
+        _bulk_insert(session, SqlTag, [row for row in rows if row["key"] not in existing_keys])
+        updates = [row for row in rows if row["key"] in existing_keys]
+        if updates:
+            session.bulk_update_mappings(SqlTag, updates)
 
     def record_logged_model(self, run_id, mlflow_model):
         if not isinstance(mlflow_model, Model):
@@ -761,17 +1147,169 @@ class SqlAlchemyStore(AbstractStore):
                     type(mlflow_model)
                 )
             )
-        model_dict = mlflow_model.to_dict()
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
-            previous_tag = [t for t in run.tags if t.key == MLFLOW_LOGGED_MODELS]
-            if previous_tag:
-                value = json.dumps(json.loads(previous_tag[0].value) + [model_dict])
-            else:
-                value = json.dumps([model_dict])
-            _validate_tag(MLFLOW_LOGGED_MODELS, value)
-            session.merge(SqlTag(key=MLFLOW_LOGGED_MODELS, value=value, run_uuid=run_id))
+            # Models are appended to the ``logged_models`` table, from which ``get_run`` and
+            # ``search_runs`` build the ``mlflow.log-model.history`` tag
+            session.add(SqlLoggedModel(run_uuid=run_id, model=json.dumps(mlflow_model.to_dict())))
+
+
+def _raise_param_value_conflict(run_id, param, old_value):
+    raise MlflowException(
+        "Changing param values is not allowed. Param with key='{}' was already"
+        " logged with value='{}' for run ID='{}'. Attempted logging new value"
+        " '{}'.".format(param.key, old_value, run_id, param.value),
+        INVALID_PARAMETER_VALUE,
+    )
+
+
+def _bulk_insert(session, model, rows):
+    """
+    Insert ``rows`` (a list of column-value dictionaries) into the table of ``model`` using a
+    single ``executemany`` statement, bypassing the ORM unit of work.
+    """
+    if rows:
+        session.bulk_insert_mappings(model, rows)
+
+
+def _chunks(items, size):
+    """
+    Split ``items`` into lists of at most ``size`` elements in order to avoid binding too many
+    parameters to a single SQL query, which can exceed the limits of certain database platforms.
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+_METRIC_HISTORY_COLUMNS = [
+    SqlMetric.key,
+    SqlMetric.value,
+    SqlMetric.timestamp,
+    SqlMetric.step,
+    SqlMetric.is_nan,
+]
+
+
+def _select_metric_history(session, history_filter):
+    """
+    Select the values of a metric history ordered by step and timestamp as plain rows, which is
+    several times faster than loading ORM instances for long histories.
+    """
+    return session.execute(
+        sql.select(_METRIC_HISTORY_COLUMNS)
+        .where(sql.and_(*history_filter))
+        .order_by(SqlMetric.step, SqlMetric.timestamp)
+    )
+
+
+def _sample_rows(rows, max_results, sampling):
+    """
+    Downsample the rows of a metric history ordered by step and timestamp with NumPy, and return
+    the rows to keep.
+    """
+    import numpy as np
+
+    columns = dict(zip(rows[0].keys(), zip(*rows)))
+    steps = np.array(columns["step"], dtype=np.float64)
+    values = np.where(
+        np.array(columns["is_nan"], dtype=bool), np.nan, np.array(columns["value"], dtype=float)
+    )
+    return [rows[i] for i in metric_sampling.sample_indices(steps, values, max_results, sampling)]
+
+
+def _metric_from_row(row):
+    """
+    Build a metric from a row whose first columns are the ``_METRIC_HISTORY_COLUMNS``. Accessing
+    the columns by position is an order of magnitude faster than by name.
+    """
+    key, value, timestamp, step, is_nan = row[: len(_METRIC_HISTORY_COLUMNS)]
+    return Metric(key, value if not is_nan else float("nan"), timestamp, step)
+
+
+def _load_runs(session, run_ids):
+    """
+    Load the runs with the specified IDs as :py:class:`mlflow.entities.Run` entities, in the order
+    of ``run_ids``. Runs that no longer exist, e.g. because they were deleted after their IDs were
+    selected, are skipped. Summary metrics, params, and tags are fetched with ``IN`` queries on
+    the run IDs as plain rows rather than ORM instances, since building an ORM instance for each of
+    the thousands of metrics of a page of runs is much slower than querying them.
+    """
+    sql_runs = {}
+    metrics = defaultdict(list)
+    params = defaultdict(list)
+    tags = defaultdict(list)
+    logged_models = defaultdict(list)
+    for run_id_batch in _chunks(run_ids, _MAX_KEYS_PER_QUERY):
+        for sql_run in session.query(SqlRun).filter(SqlRun.run_uuid.in_(run_id_batch)):
+            sql_runs[sql_run.run_uuid] = sql_run
+        for run_id, key, value, timestamp, step, is_nan in session.query(
+            SqlLatestMetric.run_uuid,
+            SqlLatestMetric.key,
+            SqlLatestMetric.value,
+            SqlLatestMetric.timestamp,
+            SqlLatestMetric.step,
+            SqlLatestMetric.is_nan,
+        ).filter(SqlLatestMetric.run_uuid.in_(run_id_batch)):
+            metrics[run_id].append(
+                Metric(key, value if not is_nan else float("nan"), timestamp, step)
+            )
+        for run_id, key, value in session.query(
+            SqlParam.run_uuid, SqlParam.key, SqlParam.value
+        ).filter(SqlParam.run_uuid.in_(run_id_batch)):
+            params[run_id].append(Param(key, value))
+        for run_id, key, value in session.query(SqlTag.run_uuid, SqlTag.key, SqlTag.value).filter(
+            SqlTag.run_uuid.in_(run_id_batch)
+        ):
+            tags[run_id].append(RunTag(key, value))
+        for run_id, model in (
+            session.query(SqlLoggedModel.run_uuid, SqlLoggedModel.model)
+            .filter(SqlLoggedModel.run_uuid.in_(run_id_batch))
+            .order_by(SqlLoggedModel.id)
+        ):
+            logged_models[run_id].append(model)
+
+    return [
+        Run(
+            run_info=sql_runs[run_id].to_run_info(),
+            run_data=RunData(
+                metrics=metrics[run_id],
+                params=params[run_id],
+                tags=_add_logged_models_tag(tags[run_id], logged_models[run_id]),
+            ),
+        )
+        for run_id in run_ids
+        if run_id in sql_runs
+    ]
+
+
+def _get_keyset_filtering_clause(sort_columns, after):
+    """
+    Creates a clause selecting the runs that are ordered after the run with the sort values
+    ``after`` by the ``(column, ascending)`` pairs of ``sort_columns``, i.e. the lexicographic
+    comparison ``(c1, c2, ..., run_uuid) > (v1, v2, ..., run_id)`` for mixed sort directions.
+    """
+    # The value of an order_by clause is NULL (or the placeholder stored for NaN metrics) exactly
+    # when its rank is not 0, in which case the value is the same for all the runs of the same
+    # rank and is not compared
+    comparisons = [
+        (column, ascending, value)
+        for (column, ascending), value in zip(sort_columns, after)
+        if value is not None
+    ]
+    clauses = []
+    for i, (column, ascending, value) in enumerate(comparisons):
+        preceding_columns_equal = [c == v for c, _, v in comparisons[:i]]
+        clauses.append(sql.and_(*(preceding_columns_equal + [_compare(column, ascending, value)])))
+    keyset_clause = sql.or_(*clauses)
+    if comparisons:
+        # Bounding the first column separately lets the database seek into an index on it
+        column, ascending, value = comparisons[0]
+        keyset_clause = sql.and_(column >= value if ascending else column <= value, keyset_clause)
+    return keyset_clause
+
+
+def _compare(column, ascending, value):
+    return column > value if ascending else column < value
 
 
 def _get_attributes_filtering_clauses(parsed):
@@ -794,7 +1332,7 @@ def _get_attributes_filtering_clauses(parsed):
     return clauses
 
 
-def _to_sqlalchemy_filtering_statement(sql_statement, session):
+def _to_sqlalchemy_filtering_statement(sql_statement):
     key_type = sql_statement.get("type")
     key_name = sql_statement.get("key")
     value = sql_statement.get("value")
@@ -806,6 +1344,8 @@ def _to_sqlalchemy_filtering_statement(sql_statement, session):
     elif SearchUtils.is_param(key_type, comparator):
         entity = SqlParam
     elif SearchUtils.is_tag(key_type, comparator):
+        if key_name == MLFLOW_LOGGED_MODELS:
+            return _get_logged_models_filtering_statement(comparator, value)
         entity = SqlTag
     elif SearchUtils.is_attribute(key_type, comparator):
         return None
@@ -816,34 +1356,69 @@ def _to_sqlalchemy_filtering_statement(sql_statement, session):
 
     if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
         op = SearchUtils.get_sql_filter_ops(entity.value, comparator)
-        return session.query(entity).filter(entity.key == key_name, op(value)).subquery()
+        value_clause = op(value)
     elif comparator in SearchUtils.filter_ops:
         op = SearchUtils.filter_ops.get(comparator)
-        return (
-            session.query(entity).filter(entity.key == key_name, op(entity.value, value)).subquery()
-        )
+        value_clause = op(entity.value, value)
     else:
         return None
+    return sql.exists().where(
+        sql.and_(entity.run_uuid == SqlRun.run_uuid, entity.key == key_name, value_clause)
+    )
 
 
-def _get_sqlalchemy_filter_clauses(parsed, session):
-    """creates SqlAlchemy subqueries
-    that will be inner-joined to SQLRun to act as multi-clause filters."""
+def _get_logged_models_filtering_statement(comparator, value):
+    """
+    Create a filter on the ``mlflow.log-model.history`` tag, which is built from the
+    ``logged_models`` table rather than stored in the ``tags`` table. ``LIKE`` and ``ILIKE``
+    patterns are matched against the JSON representation of each model recorded for a run, and
+    against the tag of runs that set it to something else than a list of models.
+    """
+    if comparator not in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+        raise MlflowException(
+            "Invalid comparator '{}' for tag '{}'. Only {} filters are supported on the models "
+            "logged by runs".format(
+                comparator,
+                MLFLOW_LOGGED_MODELS,
+                " and ".join(sorted(SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS)),
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    model_clause = SearchUtils.get_sql_filter_ops(SqlLoggedModel.model, comparator)(value)
+    tag_clause = SearchUtils.get_sql_filter_ops(SqlTag.value, comparator)(value)
+    return sql.or_(
+        sql.exists().where(sql.and_(SqlLoggedModel.run_uuid == SqlRun.run_uuid, model_clause)),
+        sql.exists().where(
+            sql.and_(
+                SqlTag.run_uuid == SqlRun.run_uuid, SqlTag.key == MLFLOW_LOGGED_MODELS, tag_clause
+            )
+        ),
+    )
+
+
+def _get_sqlalchemy_filter_clauses(parsed):
+    """creates SqlAlchemy ``EXISTS`` subqueries, correlated with SqlRun,
+    that act as multi-clause filters on metrics, params and tags."""
     filters = []
     for sql_statement in parsed:
-        filter_query = _to_sqlalchemy_filtering_statement(sql_statement, session)
-        if filter_query is not None:
-            filters.append(filter_query)
+        filter_clause = _to_sqlalchemy_filtering_statement(sql_statement)
+        if filter_clause is not None:
+            filters.append(filter_clause)
     return filters
 
 
 def _get_orderby_clauses(order_by_list, session):
     """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
     Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
+
+    :return: A tuple ``(clauses, ordering_joins, sort_columns)``, where ``sort_columns`` is the list
+             of ``(column, ascending)`` pairs the runs are ordered by. The values of these columns
+             are the sort values returned by ``SearchUtils.get_sort_values_for_run``.
     """
 
     clauses = []
     ordering_joins = []
+    sort_columns = []
     clause_id = 0
     observed_order_by_clauses = set()
     # contrary to filters, it is not easily feasible to separately handle sorting
@@ -875,20 +1450,25 @@ def _get_orderby_clauses(order_by_list, session):
                 order_value = subquery.c.value
 
             # sqlite does not support NULLS LAST expression, so we sort first by
-            # presence of the field (and is_nan for metrics), then by actual value
+            # presence of the field (and is_nan for metrics), then by actual value.
+            # Missing values are ranked before NaN metrics in ascending order and after them in
+            # descending order, like in SearchUtils._get_value_for_sort.
             # As the subqueries are created independently and used later in the
             # same main query, the CASE WHEN columns need to have unique names to
             # avoid ambiguity
             if SearchUtils.is_metric(key_type, "="):
-                clauses.append(
-                    sql.case(
-                        [(subquery.c.is_nan.is_(True), 1), (order_value.is_(None), 1)], else_=0
-                    ).label("clause_%s" % clause_id)
+                missing_rank, nan_rank = (1, 2) if ascending else (2, 1)
+                rank = sql.case(
+                    [
+                        (order_value.is_(None), missing_rank),
+                        (subquery.c.is_nan.is_(True), nan_rank),
+                    ],
+                    else_=0,
                 )
             else:  # other entities do not have an 'is_nan' field
-                clauses.append(
-                    sql.case([(order_value.is_(None), 1)], else_=0).label("clause_%s" % clause_id)
-                )
+                rank = sql.case([(order_value.is_(None), 1)], else_=0)
+            clauses.append(rank.label("clause_%s" % clause_id))
+            sort_columns.append((rank, True))
 
             if (key_type, key) in observed_order_by_clauses:
                 raise MlflowException(
@@ -900,8 +1480,11 @@ def _get_orderby_clauses(order_by_list, session):
                 clauses.append(order_value)
             else:
                 clauses.append(order_value.desc())
+            sort_columns.append((order_value, ascending))
 
     if (SearchUtils._ATTRIBUTE_IDENTIFIER, SqlRun.start_time.key) not in observed_order_by_clauses:
         clauses.append(SqlRun.start_time.desc())
+        sort_columns.append((SqlRun.start_time, False))
     clauses.append(SqlRun.run_uuid)
-    return clauses, ordering_joins
+    sort_columns.append((SqlRun.run_uuid, True))
+    return clauses, ordering_joins, sort_columns
@@ -11,7 +11,6 @@ import os
 import shutil
 import yaml
 import logging
-import concurrent.futures
 import warnings
 import atexit
 import time
@@ -19,7 +18,6 @@ import tempfile
 from collections import namedtuple
 import pandas
 from distutils.version import LooseVersion
-from threading import RLock
 
 import mlflow
 import mlflow.keras
@@ -32,6 +30,7 @@ from mlflow.models.utils import ModelInputExample, _save_example
 from mlflow.protos.databricks_pb2 import DIRECTORY_NOT_EMPTY
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.annotations import keyword_only, experimental
+from mlflow.utils.async_logging import AsyncLoggingQueue
 from mlflow.utils.environment import _mlflow_conda_env
 from mlflow.utils.file_utils import _copy_file_or_tree
 from mlflow.utils.model_utils import _get_flavor_configuration
@@ -58,10 +57,21 @@ _MAX_METRIC_QUEUE_SIZE = 500
 
 _LOG_EVERY_N_STEPS = 100
 
-_metric_queue_lock = RLock()
-_metric_queue = []
 
-_thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+def _log_metric_batch(run_id, metrics, params, tags):
+    try_mlflow_log(
+        mlflow.tracking.MlflowClient().log_batch, run_id, metrics=metrics, params=params, tags=tags
+    )
+
+
+# Metrics extracted from TensorBoard events are logged in batches by a background thread, which
+# prevents MLflow API calls from blocking TensorBoard event logging
+_metric_queue = AsyncLoggingQueue(
+    _log_metric_batch,
+    max_queue_size=None,
+    flush_interval=None,
+    flush_threshold=_MAX_METRIC_QUEUE_SIZE,
+)
 
 # For tracking if the run was started by autologging.
 _AUTOLOG_RUN_ID = None
@@ -595,48 +605,20 @@ def _log_artifacts_with_warning(**kwargs):
     try_mlflow_log(mlflow.log_artifacts, **kwargs)
 
 
-def _assoc_list_to_map(lst):
-    """
-    Convert an association list to a dictionary.
-    """
-    d = {}
-    for run_id, metric in lst:
-        d[run_id] = d[run_id] + [metric] if run_id in d else [metric]
-    return d
-
-
 def _flush_queue():
     """
-    Flush the metric queue and log contents in batches to MLflow.
-    Queue is divided into batches according to run id.
+    Block until all metrics in the metric queue have been logged to MLflow.
     """
-    try:
-        # Multiple queue flushes may be scheduled simultaneously on different threads
-        # (e.g., if the queue is at its flush threshold and several more items
-        # are added before a flush occurs). For correctness and efficiency, only one such
-        # flush operation should proceed; all others are redundant and should be dropped
-        acquired_lock = _metric_queue_lock.acquire(blocking=False)
-        if acquired_lock:
-            global _metric_queue
-            client = mlflow.tracking.MlflowClient()
-            dic = _assoc_list_to_map(_metric_queue)
-            for key in dic:
-                try_mlflow_log(client.log_batch, key, metrics=dic[key], params=[], tags=[])
-            _metric_queue = []
-    finally:
-        if acquired_lock:
-            _metric_queue_lock.release()
+    _metric_queue.flush()
 
 
 def _add_to_queue(key, value, step, time, run_id):
     """
-    Add a metric to the metric queue. Flush the queue if it exceeds
-    max size.
+    Add a metric to the metric queue. The queue is flushed by a background thread once it
+    contains ``_MAX_METRIC_QUEUE_SIZE`` metrics.
     """
     met = Metric(key=key, value=value, timestamp=time, step=step)
-    _metric_queue.append((run_id, met))
-    if len(_metric_queue) > _MAX_METRIC_QUEUE_SIZE:
-        _thread_pool.submit(_flush_queue)
+    _metric_queue.log_batch(run_id, metrics=[met])
 
 
 def _log_event(event):
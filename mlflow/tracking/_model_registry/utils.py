@@ -114,9 +114,10 @@ def _resolve_registry_uri(registry_uri=None, tracking_uri=None):
 
 
 def _get_sqlalchemy_store(store_uri):
+    from mlflow.store.db.store_cache import get_or_create_store
     from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
 
-    return SqlAlchemyStore(store_uri)
+    return get_or_create_store(SqlAlchemyStore, store_uri)
 
 
 def _get_rest_store(store_uri, **_):
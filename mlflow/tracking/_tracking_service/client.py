@@ -7,7 +7,6 @@ exposed in the :py:mod:`mlflow.tracking` module.
 import time
 import os
 
-from mlflow.models import Model
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._tracking_service import utils
 from mlflow.utils.validation import (
@@ -54,16 +53,51 @@ class TrackingServiceClient(object):
         _validate_run_id(run_id)
         return self.store.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_metric_history(self, run_id, key, max_results=None, sampling=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param max_results: If specified, the maximum number of values to return. Metrics with more
+                            logged values are downsampled with the ``sampling`` method.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
+                         One of ``lttb`` (the default), ``min_max`` or ``every_nth``.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        return self.store.get_metric_history(run_id=run_id, metric_key=key)
+        return self.store.get_metric_history(
+            run_id=run_id, metric_key=key, max_results=max_results, sampling=sampling
+        )
+
+    def get_metric_history_bulk(
+        self, run_ids, keys, start_step=None, end_step=None, max_results=None, sampling=None
+    ):
+        """
+        Return the values logged for several metrics of several runs.
+
+        :param run_ids: List of unique identifiers of runs
+        :param keys: List of metric names to fetch for each run
+        :param start_step: If specified, only values logged at this step or later are returned.
+        :param end_step: If specified, only values logged at this step or earlier are returned.
+        :param max_results: If specified, the maximum number of values to return for each metric of
+                            each run. Metrics with more values are downsampled with the
+                            ``sampling`` method.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
+                         One of ``lttb`` (the default), ``min_max`` or ``every_nth``.
+
+        :return: A dictionary mapping each run ID to a dictionary mapping each metric name to a list
+                 of :py:class:`mlflow.entities.Metric` entities, which is empty if the run has not
+                 logged the metric.
+        """
+        return self.store.get_metric_history_bulk(
+            run_ids=run_ids,
+            metric_keys=keys,
+            start_step=start_step,
+            end_step=end_step,
+            max_results=max_results,
+            sampling=sampling,
+        )
 
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
@@ -246,6 +280,8 @@ class TrackingServiceClient(object):
         self.store.log_batch(run_id=run_id, metrics=metrics, params=params, tags=tags)
 
     def _record_logged_model(self, run_id, mlflow_model):
+        from mlflow.models import Model
+
         if not isinstance(mlflow_model, Model):
             raise TypeError(
                 "Argument 'mlflow_model' should be of type mlflow.models.Model but was "
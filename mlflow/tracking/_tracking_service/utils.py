@@ -110,11 +110,12 @@ def _get_file_store(store_uri, **_):
 
 
 def _get_sqlalchemy_store(store_uri, artifact_uri):
+    from mlflow.store.db.store_cache import get_or_create_store
     from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 
     if artifact_uri is None:
         artifact_uri = DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
-    return SqlAlchemyStore(store_uri, artifact_uri)
+    return get_or_create_store(SqlAlchemyStore, store_uri, artifact_uri)
 
 
 def _get_default_host_creds(store_uri):
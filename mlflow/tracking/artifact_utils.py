@@ -1,6 +1,7 @@
 """
 Utilities for dealing with artifacts in the context of a Run.
 """
+import os
 import pathlib
 import posixpath
 import shutil
@@ -9,6 +10,12 @@ import urllib.parse
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_cache import (
+    get_artifact_cache,
+    get_artifact_cache_key,
+    get_artifact_version,
+    is_artifact_repository_cacheable,
+)
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.dbfs_artifact_repo import DbfsRestArtifactRepository
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
@@ -76,9 +83,43 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
         parsed_uri = parsed_uri._replace(path=posixpath.dirname(parsed_uri.path))
         root_uri = prefix + urllib.parse.urlunparse(parsed_uri)
 
-    return get_artifact_repository(artifact_uri=root_uri).download_artifacts(
-        artifact_path=artifact_path, dst_path=output_path
-    )
+    artifact_repository = get_artifact_repository(artifact_uri=root_uri)
+    cache = get_artifact_cache()
+    # Versioning an artifact requires extra requests, which are only worth it if it can be cached
+    if cache is not None and is_artifact_repository_cacheable(artifact_repository):
+        version = get_artifact_version(artifact_repository, artifact_path)
+        if version is not None:
+            key = get_artifact_cache_key(artifact_repository, artifact_path, version)
+            return _copy_cached_artifact(
+                cache, key, artifact_repository, artifact_path, output_path
+            )
+    return artifact_repository.download_artifacts(artifact_path=artifact_path, dst_path=output_path)
+
+
+def _copy_cached_artifact(cache, key, artifact_repository, artifact_path, output_path):
+    """
+    Copy the artifact from the cache to the output path, downloading it into the cache unless it
+    is cached, and return its local path like ``download_artifacts``. The caller owns the copy,
+    so that it can be modified, and the cached artifact evicted.
+    """
+    output_path = os.path.abspath(output_path or tempfile.mkdtemp())
+    local_path = os.path.join(output_path, artifact_path)
+    with cache.get(
+        key, lambda dst_dir: artifact_repository.download_artifacts(artifact_path, dst_dir)
+    ) as cached_path:
+        if os.path.isdir(cached_path):
+            # Merged into the output path like download_artifacts does
+            for dir_path, _, file_names in os.walk(cached_path):
+                local_dir = os.path.join(local_path, os.path.relpath(dir_path, cached_path))
+                os.makedirs(local_dir, exist_ok=True)
+                for file_name in file_names:
+                    shutil.copyfile(
+                        os.path.join(dir_path, file_name), os.path.join(local_dir, file_name)
+                    )
+        else:
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            shutil.copyfile(cached_path, local_path)
+    return local_path
 
 
 def _upload_artifacts_to_databricks(
@@ -25,6 +25,7 @@ from mlflow.tracking._tracking_service import utils
 from mlflow.tracking._tracking_service.client import TrackingServiceClient
 from mlflow.tracking.artifact_utils import _upload_artifacts_to_databricks
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
+from mlflow.utils import async_logging
 from mlflow.utils.databricks_utils import (
     is_databricks_default_tracking_uri,
     is_in_databricks_job,
@@ -141,12 +142,25 @@ class MlflowClient(object):
         """
         return self._tracking_client.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_metric_history(self, run_id, key, max_results=None, sampling=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param max_results: If specified, the maximum number of values to return, e.g. the number
+                            of points of a plot. Metrics with more logged values are downsampled
+                            by the tracking server or store, with the ``sampling`` method.
+        :param sampling: How to choose the values returned when ``max_results`` is specified:
+
+                         - ``lttb`` (default): Largest-Triangle-Three-Buckets, which preserves the
+                           visual shape of the history.
+                         - ``min_max``: The smallest and the largest value of each of
+                           ``max_results / 2`` buckets of consecutive values, which preserves
+                           spikes.
+                         - ``every_nth``: Every n-th value.
+
+                         The returned values are a subset of the logged values, ordered by step.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
 
@@ -206,7 +220,70 @@ class MlflowClient(object):
             timestamp: 1603423788610
             --
         """
-        return self._tracking_client.get_metric_history(run_id, key)
+        return self._tracking_client.get_metric_history(
+            run_id, key, max_results=max_results, sampling=sampling
+        )
+
+    def get_metric_history_bulk(
+        self, run_ids, keys, start_step=None, end_step=None, max_results=None, sampling=None
+    ):
+        """
+        Return the values logged for several metrics of several runs, e.g. to compare the training
+        curves of many runs. The histories are fetched with a single request to the tracking server,
+        rather than a :py:func:`get_metric_history` request for each metric of each run.
+
+        :param run_ids: List of unique identifiers of runs, of up to 1000 runs.
+        :param keys: List of metric names to fetch for each run, of up to 100 metrics.
+        :param start_step: If specified, only values logged at this step or later are returned.
+        :param end_step: If specified, only values logged at this step or earlier are returned.
+        :param max_results: If specified, the maximum number of values to return for each metric of
+                            each run. Metrics with more values in the step range are downsampled
+                            with the ``sampling`` method, as in :py:func:`get_metric_history`.
+        :param sampling: How to choose the values returned when ``max_results`` is specified.
+                         One of ``lttb`` (the default), ``min_max`` or ``every_nth``, see
+                         :py:func:`get_metric_history`.
+
+        :return: A dictionary mapping each run ID to a dictionary mapping each metric name to a list
+                 of :py:class:`mlflow.entities.Metric` entities ordered by step, which is empty if
+                 the run has not logged the metric.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow.tracking import MlflowClient
+
+            client = MlflowClient()
+            run_ids = []
+            for lr in [0.1, 0.01]:
+                run = client.create_run(experiment_id="0")
+                for step in range(100):
+                    client.log_metric(run.info.run_id, "loss", lr * (100 - step), step=step)
+                client.set_terminated(run.info.run_id)
+                run_ids.append(run.info.run_id)
+
+            histories = client.get_metric_history_bulk(
+                run_ids, ["loss", "accuracy"], start_step=10, max_results=5, sampling="every_nth"
+            )
+            for run_id in run_ids:
+                print("loss: {}".format([m.value for m in histories[run_id]["loss"]]))
+                print("accuracy: {}".format(histories[run_id]["accuracy"]))
+
+        .. code-block:: text
+            :caption: Output
+
+            loss: [9.0, 7.2, 5.4, 3.6, 1.8]
+            accuracy: []
+            loss: [0.9, 0.72, 0.54, 0.36, 0.18]
+            accuracy: []
+        """
+        return self._tracking_client.get_metric_history_bulk(
+            run_ids,
+            keys,
+            start_step=start_step,
+            end_step=end_step,
+            max_results=max_results,
+            sampling=sampling,
+        )
 
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
@@ -784,7 +861,7 @@ class MlflowClient(object):
         """
         self._tracking_client.delete_tag(run_id, key)
 
-    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+    def log_batch(self, run_id, metrics=(), params=(), tags=(), synchronous=True):
         """
         Log multiple metrics, params, and/or tags.
 
@@ -792,6 +869,10 @@ class MlflowClient(object):
         :param metrics: If provided, List of Metric(key, value, timestamp) instances.
         :param params: If provided, List of Param(key, value) instances.
         :param tags: If provided, List of RunTag(key, value) instances.
+        :param synchronous: If ``False``, the entities are submitted to a process-wide queue and
+                            logged from a background thread, coalesced with other pending
+                            entities. Errors are then raised by
+                            :py:func:`mlflow.flush_async_logging()` rather than by this method.
 
         Raises an MlflowException if any errors occur.
         :return: None
@@ -835,6 +916,10 @@ class MlflowClient(object):
             tags: {'t': 't'}
             status: FINISHED
         """
+        if not synchronous:
+            queue = async_logging.get_async_logging_queue(self._tracking_client.tracking_uri)
+            queue.log_batch(run_id, metrics, params, tags)
+            return
         self._tracking_client.log_batch(run_id, metrics, params, tags)
 
     def log_artifact(self, run_id, local_path, artifact_path=None):
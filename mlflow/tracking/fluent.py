@@ -8,8 +8,6 @@ import atexit
 import time
 import logging
 import inspect
-import numpy as np
-import pandas as pd
 
 from mlflow.entities import Run, RunStatus, Param, RunTag, Metric, ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
@@ -19,6 +17,7 @@ from mlflow.tracking import artifact_utils, _get_store
 from mlflow.tracking.context import registry as context_registry
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.utils import env
+from mlflow.utils.async_logging import is_async_logging_enabled, flush_async_logging as _flush
 from mlflow.utils.autologging_utils import _is_testing, autologging_integration
 from mlflow.utils.databricks_utils import is_in_databricks_notebook, get_notebook_id
 from mlflow.utils.import_hooks import register_post_import_hook
@@ -26,19 +25,6 @@ from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID, MLFLOW_RUN_NAME
 from mlflow.utils.validation import _validate_run_id
 from mlflow.utils.annotations import experimental
 
-from mlflow import (
-    tensorflow,
-    keras,
-    gluon,
-    xgboost,
-    lightgbm,
-    statsmodels,
-    spark,
-    sklearn,
-    fastai,
-    pytorch,
-)
-
 _EXPERIMENT_ID_ENV_VAR = "MLFLOW_EXPERIMENT_ID"
 _EXPERIMENT_NAME_ENV_VAR = "MLFLOW_EXPERIMENT_NAME"
 _RUN_ID_ENV_VAR = "MLFLOW_RUN_ID"
@@ -275,12 +261,55 @@ def end_run(status=RunStatus.to_string(RunStatus.FINISHED)):
         # Clear out the global existing run environment variable as well.
         env.unset_variable(_RUN_ID_ENV_VAR)
         run = _active_run_stack.pop()
-        MlflowClient().set_terminated(run.info.run_id, status)
+        try:
+            _flush()
+        finally:
+            MlflowClient().set_terminated(run.info.run_id, status)
 
 
 atexit.register(end_run)
 
 
+def flush_async_logging():
+    """
+    Block until all metrics, params and tags that were submitted for asynchronous logging have
+    been logged. Asynchronous logging is enabled by setting the ``MLFLOW_ENABLE_ASYNC_LOGGING``
+    environment variable to ``true``, in which case :py:func:`mlflow.log_metric`,
+    :py:func:`mlflow.log_metrics`, :py:func:`mlflow.log_param`, :py:func:`mlflow.log_params`,
+    :py:func:`mlflow.set_tag` and :py:func:`mlflow.set_tags` return immediately and the logged
+    entities are sent to the tracking server by a background thread. Pending entities are also
+    flushed by :py:func:`mlflow.end_run` and when the Python process exits.
+
+    :raises: py:class:`mlflow.exceptions.MlflowException` if any entity failed to be logged since
+             the last flush.
+
+    .. code-block:: python
+        :caption: Example
+
+        import os
+        import mlflow
+
+        os.environ["MLFLOW_ENABLE_ASYNC_LOGGING"] = "true"
+
+        with mlflow.start_run():
+            for step in range(100):
+                mlflow.log_metric("loss", 1.0 / (step + 1), step=step)
+            # Wait for all pending metrics to be logged
+            mlflow.flush_async_logging()
+    """
+    _flush()
+
+
+def _log_batch(run_id, metrics=(), params=(), tags=()):
+    MlflowClient().log_batch(
+        run_id=run_id,
+        metrics=metrics,
+        params=params,
+        tags=tags,
+        synchronous=not is_async_logging_enabled(),
+    )
+
+
 def active_run():
     """Get the currently active ``Run``, or None if no such run exists.
 
@@ -357,7 +386,10 @@ def log_param(key, value):
             mlflow.log_param("learning_rate", 0.01)
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_param(run_id, key, value)
+    if is_async_logging_enabled():
+        _log_batch(run_id, params=[Param(key, str(value))])
+    else:
+        MlflowClient().log_param(run_id, key, value)
 
 
 def set_tag(key, value):
@@ -377,7 +409,10 @@ def set_tag(key, value):
            mlflow.set_tag("release.version", "2.2.0")
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().set_tag(run_id, key, value)
+    if is_async_logging_enabled():
+        _log_batch(run_id, tags=[RunTag(key, str(value))])
+    else:
+        MlflowClient().set_tag(run_id, key, value)
 
 
 def delete_tag(key):
@@ -425,7 +460,11 @@ def log_metric(key, value, step=None):
             mlflow.log_metric("mse", 2500.00)
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_metric(run_id, key, value, int(time.time() * 1000), step or 0)
+    timestamp = int(time.time() * 1000)
+    if is_async_logging_enabled():
+        _log_batch(run_id, metrics=[Metric(key, value, timestamp, step or 0)])
+    else:
+        MlflowClient().log_metric(run_id, key, value, timestamp, step or 0)
 
 
 def log_metrics(metrics, step=None):
@@ -456,7 +495,7 @@ def log_metrics(metrics, step=None):
     run_id = _get_or_start_run().info.run_id
     timestamp = int(time.time() * 1000)
     metrics_arr = [Metric(key, value, timestamp, step or 0) for key, value in metrics.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=metrics_arr, params=[], tags=[])
+    _log_batch(run_id=run_id, metrics=metrics_arr)
 
 
 def log_params(params):
@@ -481,7 +520,7 @@ def log_params(params):
     """
     run_id = _get_or_start_run().info.run_id
     params_arr = [Param(key, str(value)) for key, value in params.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=params_arr, tags=[])
+    _log_batch(run_id=run_id, params=params_arr)
 
 
 def set_tags(tags):
@@ -508,7 +547,7 @@ def set_tags(tags):
     """
     run_id = _get_or_start_run().info.run_id
     tags_arr = [RunTag(key, str(value)) for key, value in tags.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=[], tags=tags_arr)
+    _log_batch(run_id=run_id, tags=tags_arr)
 
 
 def log_artifact(local_path, artifact_path=None):
@@ -1021,6 +1060,10 @@ def search_runs(
 
     runs = _paginate(pagination_wrapper_func, NUM_RUNS_PER_PAGE_PANDAS, max_results)
 
+    # Imported here rather than at module level to keep `import mlflow` fast
+    import numpy as np
+    import pandas as pd
+
     info = {
         "run_id": [],
         "experiment_id": [],
@@ -1297,6 +1340,19 @@ def autolog(
     """
     locals_copy = locals().items()
 
+    from mlflow import (
+        tensorflow,
+        keras,
+        gluon,
+        xgboost,
+        lightgbm,
+        statsmodels,
+        spark,
+        sklearn,
+        fastai,
+        pytorch,
+    )
+
     # Mapping of library module name to specific autolog function
     # eg: mxnet.gluon is the actual library, mlflow.gluon.autolog is our autolog function for it
     LIBRARY_TO_AUTOLOG_FN = {
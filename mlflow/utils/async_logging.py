@@ -0,0 +1,378 @@
+"""
+Internal utilities for logging metrics, params and tags to MLflow from a background thread.
+
+Entities submitted to an :py:class:`AsyncLoggingQueue` are buffered in memory and coalesced per run
+into ``log_batch`` calls that respect the batch limits defined in :py:mod:`mlflow.utils.validation`.
+The fluent tracking API uses a process-wide queue per tracking URI when the
+``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``true``.
+"""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque, namedtuple
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.validation import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Enables asynchronous logging for the fluent tracking API if set to "true"
+_ASYNC_LOGGING_ENV_VAR = "MLFLOW_ENABLE_ASYNC_LOGGING"
+# Maximum number of metrics, params and tags buffered in memory by each queue
+_ASYNC_LOGGING_QUEUE_SIZE_ENV_VAR = "MLFLOW_ASYNC_LOGGING_QUEUE_SIZE"
+# Behavior when the queue is full: one of "block", "drop" or "spill"
+_ASYNC_LOGGING_ON_FULL_ENV_VAR = "MLFLOW_ASYNC_LOGGING_ON_FULL"
+# Maximum number of seconds that buffered entities wait before being logged
+_ASYNC_LOGGING_FLUSH_INTERVAL_ENV_VAR = "MLFLOW_ASYNC_LOGGING_FLUSH_INTERVAL"
+
+ON_FULL_BLOCK = "block"
+ON_FULL_DROP = "drop"
+ON_FULL_SPILL = "spill"
+_ON_FULL_BEHAVIORS = [ON_FULL_BLOCK, ON_FULL_DROP, ON_FULL_SPILL]
+
+_DEFAULT_QUEUE_SIZE = 100000
+_DEFAULT_FLUSH_INTERVAL = 1.0
+
+_PendingBatch = namedtuple("_PendingBatch", ["run_id", "metrics", "params", "tags"])
+
+
+def _split_into_batches(run_id, metrics, params, tags):
+    """
+    Split the specified entities into ``_PendingBatch`` objects that satisfy the limits enforced
+    by the ``log_batch`` API.
+    """
+    metrics, params, tags = list(metrics), list(params), list(tags)
+    batches = []
+    while metrics or params or tags:
+        num_params = min(len(params), MAX_PARAMS_TAGS_PER_BATCH)
+        num_tags = min(len(tags), MAX_PARAMS_TAGS_PER_BATCH, MAX_ENTITIES_PER_BATCH - num_params)
+        num_metrics = min(
+            len(metrics), MAX_METRICS_PER_BATCH, MAX_ENTITIES_PER_BATCH - num_params - num_tags
+        )
+        batches.append(
+            _PendingBatch(run_id, metrics[:num_metrics], params[:num_params], tags[:num_tags])
+        )
+        metrics, params, tags = metrics[num_metrics:], params[num_params:], tags[num_tags:]
+    return batches
+
+
+def _coalesce(batches):
+    """
+    Merge pending batches by run ID, preserving the order in which entities were submitted, and
+    split the result into batches that satisfy the limits enforced by the ``log_batch`` API.
+    """
+    merged = OrderedDict()
+    for batch in batches:
+        metrics, params, tags = merged.setdefault(batch.run_id, ([], [], []))
+        metrics.extend(batch.metrics)
+        params.extend(batch.params)
+        tags.extend(batch.tags)
+    coalesced = []
+    for run_id, (metrics, params, tags) in merged.items():
+        coalesced.extend(_split_into_batches(run_id, metrics, params, tags))
+    return coalesced
+
+
+def _batch_size(batch):
+    return len(batch.metrics) + len(batch.params) + len(batch.tags)
+
+
+def _batch_to_json(batch):
+    return json.dumps(
+        {
+            "run_id": batch.run_id,
+            "metrics": [[m.key, m.value, m.timestamp, m.step] for m in batch.metrics],
+            "params": [[p.key, p.value] for p in batch.params],
+            "tags": [[t.key, t.value] for t in batch.tags],
+        }
+    )
+
+
+def _batch_from_json(line):
+    batch_dict = json.loads(line)
+    return _PendingBatch(
+        run_id=batch_dict["run_id"],
+        metrics=[Metric(*m) for m in batch_dict["metrics"]],
+        params=[Param(*p) for p in batch_dict["params"]],
+        tags=[RunTag(*t) for t in batch_dict["tags"]],
+    )
+
+
+class AsyncLoggingQueue(object):
+    """
+    A bounded in-memory queue of metrics, params and tags that are logged by a background thread.
+
+    Pending entities are coalesced per run into as few ``log_batch`` calls as possible. The
+    background thread logs pending entities as soon as a full batch is available, when
+    ``flush_interval`` seconds have elapsed since the last flush, or when :py:meth:`flush` is
+    called.
+
+    :param log_batch_fn: Function with the signature ``(run_id, metrics, params, tags)`` that
+                         synchronously logs a batch of entities, e.g. ``MlflowClient.log_batch``.
+    :param max_queue_size: Maximum number of entities buffered in memory, or ``None`` for an
+                           unbounded queue.
+    :param on_full: Behavior when an entity is submitted to a full queue. ``"block"`` waits for
+                    the background thread to free up space, ``"drop"`` discards the entity
+                    with a warning, and ``"spill"`` appends the entity to a file in
+                    ``spill_dir`` from which it is logged later.
+    :param flush_interval: Maximum number of seconds that entities wait in the queue before being
+                           logged, or ``None`` to only log full batches and explicit flushes.
+    :param flush_threshold: Number of pending entities that triggers a flush.
+    :param spill_dir: Directory used for spilled entities when ``on_full`` is ``"spill"``. A
+                      temporary directory is created if unspecified.
+    """
+
+    def __init__(
+        self,
+        log_batch_fn,
+        max_queue_size=_DEFAULT_QUEUE_SIZE,
+        on_full=ON_FULL_BLOCK,
+        flush_interval=_DEFAULT_FLUSH_INTERVAL,
+        flush_threshold=MAX_ENTITIES_PER_BATCH,
+        spill_dir=None,
+    ):
+        if on_full not in _ON_FULL_BEHAVIORS:
+            raise MlflowException(
+                "Invalid async logging backpressure behavior '{}'. Must be one of {}.".format(
+                    on_full, _ON_FULL_BEHAVIORS
+                ),
+                INVALID_PARAMETER_VALUE,
+            )
+        self._log_batch_fn = log_batch_fn
+        self._max_queue_size = max_queue_size
+        self._on_full = on_full
+        self._flush_interval = flush_interval
+        self._flush_threshold = (
+            flush_threshold if max_queue_size is None else min(flush_threshold, max_queue_size)
+        )
+        self._spill_dir = spill_dir
+        self._spill_path = None
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._pending_size = 0
+        self._num_spilled = 0
+        self._num_enqueued = 0
+        self._num_processed = 0
+        self._num_dropped = 0
+        self._num_waiters = 0
+        self._errors = []
+        self._thread = None
+
+    @property
+    def num_dropped(self):
+        """Number of entities discarded because the queue was full."""
+        return self._num_dropped
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Submit metrics, params and tags to be logged asynchronously against the specified run.
+        Depending on the ``on_full`` behavior of the queue, this method may block until space is
+        available in the queue.
+        """
+        batch = _PendingBatch(run_id, list(metrics), list(params), list(tags))
+        size = _batch_size(batch)
+        if size == 0:
+            return
+        with self._cond:
+            self._ensure_worker_started()
+            if self._num_spilled == 0 and not self._is_full(size):
+                self._enqueue(batch, size)
+            elif self._on_full == ON_FULL_BLOCK:
+                self._num_waiters += 1
+                self._cond.notify_all()
+                try:
+                    self._cond.wait_for(lambda: not self._is_full(size))
+                finally:
+                    self._num_waiters -= 1
+                self._enqueue(batch, size)
+            elif self._on_full == ON_FULL_SPILL:
+                self._spill(batch)
+            else:
+                if self._num_dropped == 0:
+                    _logger.warning(
+                        "The MLflow async logging queue is full. Metrics, params and tags are "
+                        "being dropped. Consider increasing %s.",
+                        _ASYNC_LOGGING_QUEUE_SIZE_ENV_VAR,
+                    )
+                self._num_dropped += size
+
+    def flush(self):
+        """
+        Block until all entities submitted before this call have been logged.
+
+        :raises: py:class:`mlflow.exceptions.MlflowException` if any batch logged since the last
+                 call to ``flush()`` failed.
+        """
+        with self._cond:
+            target = self._num_enqueued
+            self._num_waiters += 1
+            self._cond.notify_all()
+            try:
+                self._cond.wait_for(lambda: self._num_processed >= target)
+            finally:
+                self._num_waiters -= 1
+            errors, self._errors = self._errors, []
+        if errors:
+            raise MlflowException(
+                "Failed to asynchronously log {} batch(es) of metrics, params and tags. "
+                "First error: {}".format(len(errors), errors[0])
+            )
+
+    def _is_full(self, size):
+        if self._max_queue_size is None or self._pending_size == 0:
+            return False
+        return self._pending_size + size > self._max_queue_size
+
+    def _enqueue(self, batch, size):
+        self._pending.append(batch)
+        self._pending_size += size
+        self._num_enqueued += 1
+        if self._pending_size >= self._flush_threshold:
+            self._cond.notify_all()
+
+    def _spill(self, batch):
+        if self._spill_path is None:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix="mlflow-async-logging-")
+            os.makedirs(self._spill_dir, exist_ok=True)
+            self._spill_path = os.path.join(self._spill_dir, "spill-{}.jsonl".format(id(self)))
+        with open(self._spill_path, "a") as f:
+            f.write(_batch_to_json(batch) + "\n")
+        self._num_spilled += 1
+        self._num_enqueued += 1
+
+    def _read_spilled(self, path):
+        if path is None:
+            return []
+        with open(path) as f:
+            batches = [_batch_from_json(line) for line in f if line.strip()]
+        os.remove(path)
+        return batches
+
+    def _ensure_worker_started(self):
+        # The worker thread is not inherited by processes forked from this one, in which case a
+        # new thread is started on the first submission from the child process
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="MlflowAsyncLogging")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _should_flush(self):
+        return (
+            self._pending_size >= self._flush_threshold
+            or self._num_spilled > 0
+            or (self._num_waiters > 0 and self._num_processed < self._num_enqueued)
+        )
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(self._should_flush, timeout=self._flush_interval)
+                batches = list(self._pending)
+                self._pending.clear()
+                self._pending_size = 0
+                spill_path = None
+                num_spilled = self._num_spilled
+                if num_spilled > 0:
+                    spill_path = self._spill_path + ".flushing"
+                    os.replace(self._spill_path, spill_path)
+                    self._num_spilled = 0
+                # Wake up producers that are blocked on a full queue
+                self._cond.notify_all()
+            if not batches and spill_path is None:
+                continue
+            # Spilled batches are already accounted for by `num_spilled`
+            num_processed = len(batches) + num_spilled
+            errors = []
+            try:
+                batches.extend(self._read_spilled(spill_path))
+            except Exception as e:
+                _logger.warning("Failed to read spilled metrics, params and tags: %s", e)
+                errors.append(e)
+            errors.extend(self._log(batches))
+            with self._cond:
+                self._errors.extend(errors)
+                self._num_processed += num_processed
+                self._cond.notify_all()
+
+    def _log(self, batches):
+        errors = []
+        for batch in _coalesce(batches):
+            try:
+                self._log_batch_fn(batch.run_id, batch.metrics, batch.params, batch.tags)
+            except Exception as e:
+                _logger.warning(
+                    "Failed to asynchronously log a batch of metrics, params and tags to run "
+                    "'%s': %s",
+                    batch.run_id,
+                    e,
+                )
+                errors.append(e)
+        return errors
+
+
+_queues = {}
+_queues_lock = threading.Lock()
+
+
+def is_async_logging_enabled():
+    """
+    :return: True if the fluent tracking API should log metrics, params and tags asynchronously,
+             as configured by the ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable.
+    """
+    return os.environ.get(_ASYNC_LOGGING_ENV_VAR, "false").lower() == "true"
+
+
+def _get_queue_config_from_env():
+    queue_size = os.environ.get(_ASYNC_LOGGING_QUEUE_SIZE_ENV_VAR)
+    flush_interval = os.environ.get(_ASYNC_LOGGING_FLUSH_INTERVAL_ENV_VAR)
+    return {
+        "max_queue_size": int(queue_size) if queue_size else _DEFAULT_QUEUE_SIZE,
+        "on_full": os.environ.get(_ASYNC_LOGGING_ON_FULL_ENV_VAR, ON_FULL_BLOCK).lower(),
+        "flush_interval": float(flush_interval) if flush_interval else _DEFAULT_FLUSH_INTERVAL,
+    }
+
+
+def get_async_logging_queue(tracking_uri):
+    """
+    :return: The process-wide :py:class:`AsyncLoggingQueue` that logs to the specified tracking
+             URI, creating it if necessary.
+    """
+    with _queues_lock:
+        queue = _queues.get(tracking_uri)
+        if queue is None:
+            from mlflow.tracking.client import MlflowClient
+
+            client = MlflowClient(tracking_uri)
+            queue = AsyncLoggingQueue(client.log_batch, **_get_queue_config_from_env())
+            if not _queues:
+                atexit.register(_drain_queues_at_exit)
+            _queues[tracking_uri] = queue
+        return queue
+
+
+def flush_async_logging():
+    """
+    Block until all metrics, params and tags submitted for asynchronous logging in this process
+    have been logged.
+    """
+    with _queues_lock:
+        queues = list(_queues.values())
+    for queue in queues:
+        queue.flush()
+
+
+def _drain_queues_at_exit():
+    try:
+        flush_async_logging()
+    except Exception as e:
+        _logger.warning("Failed to log pending metrics, params and tags at exit: %s", e)
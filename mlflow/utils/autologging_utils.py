@@ -18,6 +18,7 @@ from mlflow.entities.run_status import RunStatus
 from mlflow.entities import Metric
 from mlflow.tracking.client import MlflowClient
 from mlflow.utils import gorilla
+from mlflow.utils.async_logging import is_async_logging_enabled
 from mlflow.utils.mlflow_tags import MLFLOW_AUTOLOGGING
 from mlflow.utils.validation import MAX_METRICS_PER_BATCH
 
@@ -208,6 +209,9 @@ class BatchMetricsLogger:
     from `mlflow.active_run()` each time `record_metrics()` or `flush()` is called; in this
     case, callers must ensure that an active run is present before invoking
     `record_metrics()` or `flush()`.
+    If asynchronous logging is enabled via the `MLFLOW_ENABLE_ASYNC_LOGGING` environment
+    variable, flushed metrics are handed off to the process-wide async logging queue instead of
+    being logged synchronously.
     """
 
     def __init__(self, run_id=None):
@@ -234,6 +238,11 @@ class BatchMetricsLogger:
             current_run_id = self.run_id
 
         start = time.time()
+        if is_async_logging_enabled():
+            MlflowClient().log_batch(run_id=current_run_id, metrics=self.data, synchronous=False)
+            self.total_log_batch_time += time.time() - start
+            return
+
         metrics_slices = [
             self.data[i : i + MAX_METRICS_PER_BATCH]
             for i in range(0, len(self.data), MAX_METRICS_PER_BATCH)
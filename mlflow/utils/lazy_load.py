@@ -0,0 +1,51 @@
+"""
+Utility for deferring the import of a module until one of its attributes is accessed.
+"""
+import importlib
+import types
+
+
+class LazyLoader(types.ModuleType):
+    """
+    Module placeholder that imports the module it stands for on first attribute access, and then
+    replaces itself with that module in the namespace of the parent module. This keeps
+    ``import mlflow`` cheap while ``mlflow.sklearn``, ``from mlflow import pyfunc`` etc. keep
+    working as if the modules were imported eagerly.
+
+    :param local_name: Name under which the module is bound in ``parent_module_globals``.
+    :param parent_module_globals: ``globals()`` of the module binding the placeholder.
+    :param name: Fully qualified name of the module to import.
+    """
+
+    def __init__(self, local_name, parent_module_globals, name):
+        self._local_name = local_name
+        self._parent_module_globals = parent_module_globals
+        self._module = None
+        super().__init__(str(name))
+
+    def _load(self):
+        if self._module is None:
+            # Importing a submodule also binds it as an attribute of its parent package, which
+            # replaces this placeholder when the parent is the module that created it
+            module = importlib.import_module(self.__name__)
+            self._parent_module_globals[self._local_name] = module
+            # References to the placeholder taken before the first access, e.g. through
+            # `from mlflow import sklearn`, keep delegating attribute lookups to the module
+            self._module = module
+        return self._module
+
+    def __getattr__(self, item):
+        # Only called for attributes that are not set on the placeholder itself
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self._module is None:
+            return "<module '{}' (not yet loaded)>".format(self.__name__)
+        return repr(self._module)
+
+    def __reduce__(self):
+        # Pickle references to the module like references to the module itself
+        return importlib.import_module, (self.__name__,)
@@ -0,0 +1,188 @@
+"""
+Utilities for downsampling the history of a metric to a bounded number of values, e.g. to plot a
+metric logged at millions of steps with a few hundred points. All the sampling methods select a
+subset of the logged values rather than aggregating them, so that the returned values are actual
+:py:class:`mlflow.entities.Metric` entities.
+"""
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+# Largest-Triangle-Three-Buckets: keeps the first and last values, and from each of
+# ``max_results - 2`` buckets of consecutive values the one forming the largest triangle with the
+# value kept from the previous bucket and the average of the next bucket. Preserves the visual
+# shape of the series.
+LTTB = "lttb"
+# Keeps the smallest and the largest value of each of ``max_results // 2`` buckets of consecutive
+# values. Preserves spikes.
+MIN_MAX = "min_max"
+# Keeps every n-th value, starting from the first one.
+EVERY_NTH = "every_nth"
+
+SAMPLING_METHODS = [LTTB, MIN_MAX, EVERY_NTH]
+DEFAULT_SAMPLING = LTTB
+
+_MIN_MAX_RESULTS = {LTTB: 3, MIN_MAX: 2, EVERY_NTH: 1}
+
+
+def validate_sampling(max_results, sampling):
+    """
+    Validate the ``max_results`` and ``sampling`` arguments of ``get_metric_history``.
+
+    :return: The sampling method to use, or None if the full history is requested.
+    """
+    if max_results is None:
+        if sampling is not None:
+            raise MlflowException(
+                "Sampling method '{}' was specified without max_results".format(sampling),
+                INVALID_PARAMETER_VALUE,
+            )
+        return None
+    sampling = sampling or DEFAULT_SAMPLING
+    if sampling not in SAMPLING_METHODS:
+        raise MlflowException(
+            "Invalid sampling method '{}'. Must be one of {}".format(sampling, SAMPLING_METHODS),
+            INVALID_PARAMETER_VALUE,
+        )
+    if not isinstance(max_results, int) or max_results < _MIN_MAX_RESULTS[sampling]:
+        raise MlflowException(
+            "Invalid value for max_results with sampling method '{}'. It must be an integer of at "
+            "least {}, but got value {}".format(sampling, _MIN_MAX_RESULTS[sampling], max_results),
+            INVALID_PARAMETER_VALUE,
+        )
+    return sampling
+
+
+def get_every_nth_stride(num_values, max_results):
+    """
+    Return the distance between consecutive values kept by the ``every_nth`` method.
+    """
+    return -(-num_values // max_results)
+
+
+def get_num_min_max_buckets(max_results):
+    """
+    Return the number of buckets of the ``min_max`` method, which keeps up to two values per bucket.
+    """
+    return max_results // 2
+
+
+def sample_metric_history(metrics, max_results, sampling, start_step=None, end_step=None):
+    """
+    Downsample a metric history to at most ``max_results`` values.
+
+    :param metrics: List of :py:class:`mlflow.entities.Metric` entities logged for a metric.
+    :param max_results: Maximum number of values to return, or None to return all values.
+    :param sampling: One of :py:data:`SAMPLING_METHODS`. Must be validated with
+                     :py:func:`validate_sampling`.
+    :param start_step: If specified, values logged before this step are discarded before sampling.
+    :param end_step: If specified, values logged after this step are discarded before sampling.
+
+    :return: A list of :py:class:`mlflow.entities.Metric` entities ordered by step and timestamp.
+    """
+    if start_step is not None or end_step is not None:
+        metrics = [
+            metric
+            for metric in metrics
+            if (start_step is None or metric.step >= start_step)
+            and (end_step is None or metric.step <= end_step)
+        ]
+    metrics = sorted(metrics, key=lambda metric: (metric.step, metric.timestamp))
+    if max_results is None or len(metrics) <= max_results:
+        return metrics
+    import numpy as np
+
+    steps = np.fromiter((metric.step for metric in metrics), dtype=np.float64, count=len(metrics))
+    values = np.fromiter((metric.value for metric in metrics), dtype=np.float64, count=len(metrics))
+    return [metrics[i] for i in sample_indices(steps, values, max_results, sampling)]
+
+
+def sample_indices(steps, values, max_results, sampling):
+    """
+    Return the sorted indices of the values to keep from a metric history with more than
+    ``max_results`` values.
+
+    :param steps: NumPy array of the steps of the values, in ascending order.
+    :param values: NumPy array of the values. NaN values are only kept by ``min_max`` for buckets
+                   that have no other values, and are treated as 0 by ``lttb``.
+    """
+    import numpy as np
+
+    num_values = len(values)
+    if sampling == EVERY_NTH:
+        return np.arange(0, num_values, get_every_nth_stride(num_values, max_results))
+    if sampling == MIN_MAX:
+        return _min_max_indices(values, get_num_min_max_buckets(max_results))
+    return _lttb_indices(steps, values, max_results)
+
+
+def _ntile(num_values, num_buckets):
+    """
+    Return the bucket of each of ``num_values`` consecutive values split into ``num_buckets``
+    buckets whose sizes differ by at most one, larger buckets first, like the SQL ``NTILE`` window
+    function.
+    """
+    import numpy as np
+
+    size, num_larger = divmod(num_values, num_buckets)
+    positions = np.arange(num_values)
+    larger_end = num_larger * (size + 1)
+    return np.where(
+        positions < larger_end,
+        positions // (size + 1),
+        num_larger + (positions - larger_end) // max(size, 1),
+    )
+
+
+def _min_max_indices(values, num_buckets):
+    import numpy as np
+
+    buckets = _ntile(len(values), num_buckets)
+    is_nan = np.isnan(values)
+    filled = np.where(is_nan, 0.0, values)
+    # Sorting is stable, so ties are broken by position and the first value of each bucket in each
+    # ordering is its smallest (resp. largest) non-NaN value, matching the SQL implementation
+    by_value = np.lexsort((filled, is_nan, buckets))
+    by_value_desc = np.lexsort((-filled, is_nan, buckets))
+    bucket_starts = np.flatnonzero(np.r_[True, buckets[by_value][1:] != buckets[by_value][:-1]])
+    return np.union1d(by_value[bucket_starts], by_value_desc[bucket_starts])
+
+
+def _lttb_indices(steps, values, max_results):
+    import numpy as np
+
+    # Infinite values are replaced by the largest finite ones, whose sums and products may still
+    # overflow to infinite or NaN areas. NaN areas are treated as 0.
+    with np.errstate(over="ignore", invalid="ignore"):
+        return _lttb_indices_finite(steps, np.nan_to_num(values), max_results)
+
+
+def _lttb_indices_finite(steps, values, max_results):
+    import numpy as np
+
+    num_values = len(values)
+    # Boundaries of the ``max_results - 2`` buckets splitting the values between the first and the
+    # last one. Each bucket is non-empty since there are more values than buckets.
+    edges = np.linspace(1, num_values - 1, max_results - 1).astype(np.int64)
+    sizes = np.diff(edges)
+    step_means = np.add.reduceat(steps[:-1], edges[:-1]) / sizes
+    value_means = np.add.reduceat(values[:-1], edges[:-1]) / sizes
+    # The last bucket is followed by the last value
+    next_steps = np.r_[step_means[1:], steps[-1]]
+    next_values = np.r_[value_means[1:], values[-1]]
+
+    indices = np.empty(max_results, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = num_values - 1
+    selected = 0
+    for bucket, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        # Twice the area of the triangles formed by the selected value of the previous bucket,
+        # each value of this bucket, and the average of the next bucket
+        areas = np.abs(
+            (steps[selected] - next_steps[bucket]) * (values[start:end] - values[selected])
+            - (steps[selected] - steps[start:end]) * (next_values[bucket] - values[selected])
+        )
+        # NaN areas are treated as 0. ``fmax`` is much cheaper than ``nan_to_num`` on the small
+        # arrays of each bucket, which matters when sampling many short histories.
+        selected = start + int(np.argmax(np.fmax(areas, 0.0)))
+        indices[bucket + 1] = selected
+    return indices
@@ -1,13 +1,18 @@
 import base64
+import typing
 
 from json import JSONEncoder
 
 from google.protobuf.json_format import MessageToJson, ParseDict
-import numpy as np
-import pandas as pd
 
-from mlflow.types import DataType
-from mlflow.types.schema import Schema
+from mlflow.utils.lazy_load import LazyLoader
+
+if typing.TYPE_CHECKING:
+    from mlflow.types.schema import Schema  # pylint: disable=unused-import
+
+# Only needed to (de)serialize model inputs and outputs, not protobuf messages
+np = LazyLoader("np", globals(), "numpy")
+pd = LazyLoader("pd", globals(), "pandas")
 
 
 def message_to_json(message):
@@ -83,8 +88,8 @@ class NumpyEncoder(JSONEncoder):
 
 
 def _dataframe_from_json(
-    path_or_str, schema: Schema = None, pandas_orient: str = "split", precise_float=False
-) -> pd.DataFrame:
+    path_or_str, schema: "Schema" = None, pandas_orient: str = "split", precise_float=False
+) -> "pd.DataFrame":
     """
     Parse json into pandas.DataFrame. User can pass schema to ensure correct type parsing and to
     make any necessary conversions (e.g. string -> binary for binary columns).
@@ -94,6 +99,8 @@ def _dataframe_from_json(
     :param pandas_orient: pandas data frame convention used to store the data.
     :return: pandas.DataFrame.
     """
+    from mlflow.types import DataType
+
     if schema is not None:
         dtypes = dict(zip(schema.column_names(), schema.pandas_types()))
         df = pd.read_json(
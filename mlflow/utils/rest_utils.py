@@ -1,14 +1,22 @@
 import base64
-import time
+import gzip
 import logging
 import json
+import os
+import random
+import threading
+import warnings
 
 import requests
+from google.protobuf.message import Message
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
-from mlflow.utils.proto_json_utils import parse_dict
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
 
@@ -17,23 +25,177 @@ RESOURCE_DOES_NOT_EXIST = "RESOURCE_DOES_NOT_EXIST"
 
 _logger = logging.getLogger(__name__)
 
-_DEFAULT_HEADERS = {"User-Agent": "mlflow-python-client/%s" % __version__}
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+# Response header with which tracking servers advertise the content types of the request and
+# response bodies they support, e.g. binary protobuf ones
+CONTENT_TYPES_HEADER = "X-MLflow-Content-Types"
+
+_DEFAULT_HEADERS = {
+    "User-Agent": "mlflow-python-client/%s" % __version__,
+    # Content codings of the response bodies that urllib3 decodes: gzip and deflate, as well as br
+    # and zstd with urllib3 2 if the `brotli` and `zstandard` packages are installed
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+}
+
+# Maximum number of retries of a request that failed with a transient error
+_MLFLOW_HTTP_REQUEST_MAX_RETRIES_ENV_VAR = "MLFLOW_HTTP_REQUEST_MAX_RETRIES"
+# Backoff factor of the exponential backoff between retries, in seconds
+_MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR_ENV_VAR = "MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR"
+# Number of hosts for which connection pools are kept open
+_MLFLOW_HTTP_POOL_CONNECTIONS_ENV_VAR = "MLFLOW_HTTP_POOL_CONNECTIONS"
+# Maximum number of connections kept open to each host
+_MLFLOW_HTTP_POOL_MAXSIZE_ENV_VAR = "MLFLOW_HTTP_POOL_MAXSIZE"
+# Minimum size in bytes of JSON request bodies that are gzip-compressed. Unset to disable.
+_MLFLOW_HTTP_REQUEST_GZIP_MIN_SIZE_ENV_VAR = "MLFLOW_HTTP_REQUEST_GZIP_MIN_SIZE"
+# Whether request and response bodies are binary protobuf messages rather than JSON when the server
+# supports them. Set to "false" to always use JSON.
+_MLFLOW_HTTP_REQUEST_PROTOBUF_ENV_VAR = "MLFLOW_HTTP_REQUEST_PROTOBUF"
+
+# Same number of tries (3) and total delay between them (about 6 seconds) as the fixed 3 second
+# interval between the retries of earlier versions
+_DEFAULT_MAX_RETRIES = 2
+_DEFAULT_BACKOFF_FACTOR = 2
+_DEFAULT_POOL_CONNECTIONS = 10
+_DEFAULT_POOL_MAXSIZE = 10
+_TRANSIENT_FAILURE_RESPONSE_CODES = frozenset([429, 500, 502, 503, 504])
+
+_request_sessions = {}
+_request_sessions_lock = threading.Lock()
+# Hosts that advertised support for protobuf request and response bodies
+_protobuf_hosts = set()
+
+
+class _JitteredRetry(Retry):
+    """
+    ``urllib3`` retry configuration that randomizes the exponential backoff between retries, so
+    that clients failing at the same time do not retry in lockstep.
+
+    Responses with a status code in ``status_forcelist`` are retried regardless of the HTTP method
+    of the request, whereas read errors are only retried for idempotent methods, since the server
+    may have processed a request whose response was lost (e.g. a ``POST`` creating a run).
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if self.status_forcelist and status_code in self.status_forcelist:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self):
+        backoff_time = super().get_backoff_time()
+        return backoff_time / 2 + random.uniform(0, backoff_time / 2)
+
+
+def _get_int_env_var(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _get_request_session(max_retries, backoff_factor, retry_codes):
+    """
+    Return a ``requests.Session`` that retries requests failing with transient errors and keeps
+    a pool of connections open to each host. Sessions are shared by all the requests that use the
+    same retry configuration in the current process, and send back the cookies set by each host,
+    e.g. the one with which a tracking server serves the reads that follow the writes of the
+    client from the primary database of its backend store.
+    """
+    key = (os.getpid(), max_retries, backoff_factor, retry_codes)
+    with _request_sessions_lock:
+        session = _request_sessions.get(key)
+        if session is None:
+            retry_kwargs = {
+                "total": max_retries,
+                "connect": max_retries,
+                # Read errors are only retried for the idempotent methods allowed by default
+                "read": max_retries,
+                "redirect": max_retries,
+                "status": max_retries,
+                "status_forcelist": retry_codes,
+                "backoff_factor": backoff_factor,
+                # Return the last response once retries are exhausted
+                "raise_on_status": False,
+            }
+            adapter = HTTPAdapter(
+                pool_connections=_get_int_env_var(
+                    _MLFLOW_HTTP_POOL_CONNECTIONS_ENV_VAR, _DEFAULT_POOL_CONNECTIONS
+                ),
+                pool_maxsize=_get_int_env_var(
+                    _MLFLOW_HTTP_POOL_MAXSIZE_ENV_VAR, _DEFAULT_POOL_MAXSIZE
+                ),
+                max_retries=_JitteredRetry(**retry_kwargs),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _request_sessions[key] = session
+    return session
 
 
 def http_request(
-    host_creds, endpoint, retries=3, retry_interval=3, max_rate_limit_interval=60, **kwargs
+    host_creds,
+    endpoint,
+    max_retries=None,
+    backoff_factor=None,
+    retry_codes=_TRANSIENT_FAILURE_RESPONSE_CODES,
+    retries=None,
+    retry_interval=None,
+    max_rate_limit_interval=None,
+    **kwargs
 ):
     """
-    Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
-    error code (429) will be retried with an exponential back off (1, 2, 4, ... seconds) for at most
-    `max_rate_limit_interval` seconds.  Internal errors (500s) will be retried up to `retries` times
-    , waiting `retry_interval` seconds between successive retries. Parses the API response
-    (assumed to be JSON) into a Python object and returns it.
+    Makes an HTTP request with the specified method to the specified hostname/endpoint. Requests
+    are sent through a pooled ``requests.Session`` that keeps connections to the host alive.
+    Connection errors, read errors of idempotent requests (e.g. ``GET``) and responses with a
+    status code in ``retry_codes`` are retried up to ``max_retries`` times with a jittered
+    exponential backoff of at most ``backoff_factor`` * (2 ** retry) seconds, honoring the
+    ``Retry-After`` header of rate-limited responses. With the defaults, a request is tried 3 times
+    and waits at most about 6 seconds between tries in total. Parses the API response (assumed to
+    be JSON) into a Python object and returns it.
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param max_retries: Maximum number of retries. Defaults to the value of the
+        ``MLFLOW_HTTP_REQUEST_MAX_RETRIES`` environment variable, or 2.
+    :param backoff_factor: Backoff factor of the exponential backoff between retries. Defaults to
+        the value of the ``MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR`` environment variable, or 2.
+    :param retry_codes: HTTP response status codes that are retried.
+    :param retries: Deprecated, use ``max_retries`` instead. Total number of tries of the request.
+    :param retry_interval: Deprecated, use ``backoff_factor`` instead.
+    :param max_rate_limit_interval: Deprecated and ignored. Rate-limited responses are retried like
+        other transient failures.
     :return: Parsed API response
     """
+    if retries is not None:
+        warnings.warn(
+            "The `retries` argument of `http_request` is deprecated, use `max_retries` instead.",
+            FutureWarning,
+            stacklevel=2,
+        )
+        if max_retries is None:
+            max_retries = max(retries - 1, 0)
+    if retry_interval is not None:
+        warnings.warn(
+            "The `retry_interval` argument of `http_request` is deprecated, use `backoff_factor` "
+            "instead.",
+            FutureWarning,
+            stacklevel=2,
+        )
+        if backoff_factor is None:
+            backoff_factor = retry_interval
+    if max_rate_limit_interval is not None:
+        warnings.warn(
+            "The `max_rate_limit_interval` argument of `http_request` is deprecated and ignored. "
+            "Rate-limited responses are retried up to `max_retries` times.",
+            FutureWarning,
+            stacklevel=2,
+        )
+    if max_retries is None:
+        max_retries = _get_int_env_var(
+            _MLFLOW_HTTP_REQUEST_MAX_RETRIES_ENV_VAR, _DEFAULT_MAX_RETRIES
+        )
+    if backoff_factor is None:
+        backoff_factor = float(
+            os.environ.get(_MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR_ENV_VAR) or _DEFAULT_BACKOFF_FACTOR
+        )
     hostname = host_creds.host
     auth_str = None
     if host_creds.username and host_creds.password:
@@ -43,6 +205,7 @@ def http_request(
         auth_str = "Bearer %s" % host_creds.token
 
     headers = dict(_DEFAULT_HEADERS)
+    headers.update(kwargs.pop("headers", None) or {})
     if auth_str:
         headers["Authorization"] = auth_str
 
@@ -54,45 +217,22 @@ def http_request(
     if host_creds.client_cert_path is not None:
         kwargs["cert"] = host_creds.client_cert_path
 
-    def request_with_ratelimit_retries(max_rate_limit_interval, **kwargs):
-        response = requests.request(**kwargs)
-        time_left = max_rate_limit_interval
-        sleep = 1
-        while response.status_code == 429 and time_left > 0:
-            _logger.warning(
-                "API request to {path} returned status code 429 (Rate limit exceeded). "
-                "Retrying in %d seconds. "
-                "Will continue to retry 429s for up to %d seconds.",
-                sleep,
-                time_left,
-            )
-            time.sleep(sleep)
-            time_left -= sleep
-            response = requests.request(**kwargs)
-            sleep = min(time_left, sleep * 2)  # sleep for 1, 2, 4, ... seconds;
-        return response
-
     cleaned_hostname = strip_suffix(hostname, "/")
     url = "%s%s" % (cleaned_hostname, endpoint)
-    for i in range(retries):
-        response = request_with_ratelimit_retries(
-            max_rate_limit_interval, url=url, headers=headers, verify=verify, **kwargs
+    session = _get_request_session(max_retries, backoff_factor, frozenset(retry_codes))
+    response = session.request(url=url, headers=headers, verify=verify, **kwargs)
+    if response.status_code >= 500:
+        _logger.error(
+            "API request to %s failed with code %s != 200 after %s retries. API response body: %s",
+            url,
+            response.status_code,
+            max_retries,
+            response.text,
         )
-        if response.status_code >= 200 and response.status_code < 500:
-            return response
-        else:
-            _logger.error(
-                "API request to %s failed with code %s != 200, retrying up to %s more times. "
-                "API response body: %s",
-                url,
-                response.status_code,
-                retries - i - 1,
-                response.text,
-            )
-            time.sleep(retry_interval)
-    raise MlflowException(
-        "API request to %s failed to return code 200 after %s tries" % (url, retries)
-    )
+        raise MlflowException(
+            "API request to %s failed to return code 200 after %s tries" % (url, max_retries + 1)
+        )
+    return response
 
 
 def _can_parse_as_json(string):
@@ -124,8 +264,12 @@ def verify_rest_response(response, endpoint):
             raise MlflowException("%s. Response body: '%s'" % (base_msg, response.text))
 
     # Skip validation for endpoints (e.g. DBFS file-download API) which may return a non-JSON
-    # response
-    if endpoint.startswith(_REST_API_PATH_PREFIX) and not _can_parse_as_json(response.text):
+    # response, and for binary protobuf responses
+    if (
+        endpoint.startswith(_REST_API_PATH_PREFIX)
+        and _get_content_type(response) != PROTOBUF_CONTENT_TYPE
+        and not _can_parse_as_json(response.text)
+    ):
         base_msg = (
             "API request to endpoint was successful but the response body was not "
             "in a valid JSON format"
@@ -151,21 +295,98 @@ def extract_api_info_for_service(service, path_prefix):
     return res
 
 
+def _get_compressed_body_kwargs(data, content_type):
+    """
+    Return the keyword arguments of ``http_request`` that send the specified body, which is
+    gzip-compressed if it is at least as large as the ``MLFLOW_HTTP_REQUEST_GZIP_MIN_SIZE``
+    environment variable, or None if it is not.
+    """
+    gzip_min_size = os.environ.get(_MLFLOW_HTTP_REQUEST_GZIP_MIN_SIZE_ENV_VAR)
+    if not gzip_min_size or len(data) < int(gzip_min_size):
+        return None
+    return {
+        "data": gzip.compress(data),
+        "headers": {"Content-Type": content_type, "Content-Encoding": "gzip"},
+    }
+
+
+def _get_json_body_kwargs(json_body):
+    """
+    Return the keyword arguments of ``http_request`` that send the specified JSON body,
+    gzip-compressed if large enough (see :py:func:`_get_compressed_body_kwargs`).
+    """
+    if json_body is None or not os.environ.get(_MLFLOW_HTTP_REQUEST_GZIP_MIN_SIZE_ENV_VAR):
+        return {"json": json_body}
+    data = json.dumps(json_body).encode("utf-8")
+    return _get_compressed_body_kwargs(data, "application/json") or {"json": json_body}
+
+
+def _get_protobuf_body_kwargs(request_message):
+    """
+    Return the keyword arguments of ``http_request`` that send the specified message as a binary
+    protobuf body, gzip-compressed if large enough (see :py:func:`_get_compressed_body_kwargs`).
+    """
+    data = request_message.SerializeToString()
+    return _get_compressed_body_kwargs(data, PROTOBUF_CONTENT_TYPE) or {
+        "data": data,
+        "headers": {"Content-Type": PROTOBUF_CONTENT_TYPE},
+    }
+
+
+def _get_content_type(response):
+    # Stand-ins of responses, e.g. in tests, may not have headers
+    headers = getattr(response, "headers", None) or {}
+    return headers.get("Content-Type", "").split(";")[0].strip()
+
+
+def _use_protobuf(host_creds):
+    enabled = os.environ.get(_MLFLOW_HTTP_REQUEST_PROTOBUF_ENV_VAR, "true").lower() != "false"
+    return enabled and host_creds.host in _protobuf_hosts
+
+
+def _record_content_types(host_creds, response):
+    headers = getattr(response, "headers", None) or {}
+    content_types = headers.get(CONTENT_TYPES_HEADER, "")
+    if PROTOBUF_CONTENT_TYPE in [content_type.strip() for content_type in content_types.split(",")]:
+        _protobuf_hosts.add(host_creds.host)
+
+
 def call_endpoint(host_creds, endpoint, method, json_body, response_proto):
-    # Convert json string to json dictionary, to pass to requests
-    if json_body:
-        json_body = json.loads(json_body)
-    if method == "GET":
-        response = http_request(
-            host_creds=host_creds, endpoint=endpoint, method=method, params=json_body
-        )
+    """
+    Call the REST API endpoint and parse its response into ``response_proto``.
+
+    :param json_body: JSON string of the request message, or the request message itself. Request
+                      messages are sent as binary protobuf bodies, and binary protobuf response
+                      bodies are requested, once the host advertised support for them with the
+                      ``X-MLflow-Content-Types`` header of a response, unless the
+                      ``MLFLOW_HTTP_REQUEST_PROTOBUF`` environment variable is ``false``. JSON
+                      bodies are used otherwise.
+    """
+    use_protobuf = _use_protobuf(host_creds)
+    headers = {"Accept": PROTOBUF_CONTENT_TYPE} if use_protobuf else {}
+    if use_protobuf and method != "GET" and isinstance(json_body, Message):
+        body_kwargs = _get_protobuf_body_kwargs(json_body)
     else:
-        response = http_request(
-            host_creds=host_creds, endpoint=endpoint, method=method, json=json_body
-        )
+        if isinstance(json_body, Message):
+            json_body = message_to_json(json_body)
+        # Convert json string to json dictionary, to pass to requests
+        if json_body:
+            json_body = json.loads(json_body)
+        if method == "GET":
+            body_kwargs = {"params": json_body}
+        else:
+            body_kwargs = _get_json_body_kwargs(json_body)
+    headers.update(body_kwargs.pop("headers", {}))
+    if headers:
+        body_kwargs["headers"] = headers
+    response = http_request(host_creds=host_creds, endpoint=endpoint, method=method, **body_kwargs)
+    _record_content_types(host_creds, response)
     response = verify_rest_response(response, endpoint)
-    js_dict = json.loads(response.text)
-    parse_dict(js_dict=js_dict, message=response_proto)
+    if _get_content_type(response) == PROTOBUF_CONTENT_TYPE:
+        response_proto.ParseFromString(response.content)
+    else:
+        js_dict = json.loads(response.text)
+        parse_dict(js_dict=js_dict, message=response_proto)
     return response_proto
 
 
@@ -184,10 +405,10 @@ class MlflowHostCreds(object):
         true in production.
         If this is set to true ``server_cert_path`` must not be set.
     :param client_cert_path: Path to ssl client cert file (.pem).
-        Sets the cert param of the ``requests.request``
+        Sets the cert param of the ``requests.Session.request``
         function (see https://requests.readthedocs.io/en/master/api/).
     :param server_cert_path: Path to a CA bundle to use.
-        Sets the verify param of the ``requests.request``
+        Sets the verify param of the ``requests.Session.request``
         function (see https://requests.readthedocs.io/en/master/api/).
         If this is set ``ignore_tls_verification`` must be false.
     """
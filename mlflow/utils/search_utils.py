@@ -24,6 +24,21 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 import math
 
 
+class _ReversedSortValue(object):
+    """Wraps a sort value so that it is ordered in descending order by ascending sorts."""
+
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
 class SearchUtils(object):
     LIKE_OPERATOR = "LIKE"
     ILIKE_OPERATOR = "ILIKE"
@@ -475,7 +490,13 @@ class SearchUtils(object):
 
     @classmethod
     def _get_value_for_sort(cls, run, key_type, key, ascending):
-        """Returns a tuple suitable to be used as a sort key for runs."""
+        """Returns a ``(rank, value)`` pair suitable to be used as a sort key for runs.
+
+        Runs are ordered by rank first, then by value. Runs that have a value are ranked first.
+        Runs without a value are ranked before runs with a NaN metric value in ascending order, and
+        after them in descending order. ``value`` is None for runs without a (non-NaN) value, so
+        that such runs are ordered by the next sort keys.
+        """
         sort_value = None
         if key_type == cls._METRIC_IDENTIFIER:
             sort_value = run.data.metrics.get(key)
@@ -490,42 +511,91 @@ class SearchUtils(object):
                 "Invalid order_by entity type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
             )
 
-        # Return a key such that None values are always at the end.
-        is_null_or_nan = sort_value is None or (
-            isinstance(sort_value, float) and math.isnan(sort_value)
+        if sort_value is None:
+            return (1 if ascending else 2, None)
+        if isinstance(sort_value, float) and math.isnan(sort_value):
+            return (2 if ascending else 1, None)
+        return (0, sort_value)
+
+    @classmethod
+    def _parse_order_by_list_for_search_runs(cls, order_by_list):
+        return [
+            cls.parse_order_by_for_search_runs(order_by_clause)
+            for order_by_clause in order_by_list or []
+        ]
+
+    @classmethod
+    def get_sort_values_for_run(cls, run, order_by_list):
+        """Returns the values that determine the position of a run in the results of a search, as a
+        JSON-serializable list: the ``(rank, value)`` pair of each order_by clause, then the start
+        time of the run unless it is ordered by an order_by clause, then the run id. These are the
+        values encoded into keyset page tokens by :py:func:`create_page_token_for_search_runs`.
+        """
+        parsed_order_by = cls._parse_order_by_list_for_search_runs(order_by_list)
+        values = []
+        for key_type, key_name, ascending in parsed_order_by:
+            values.extend(cls._get_value_for_sort(run, key_type, key_name, ascending))
+        if not cls._is_ordered_by_start_time(parsed_order_by):
+            values.append(run.info.start_time)
+        values.append(run.info.run_uuid)
+        return values
+
+    @classmethod
+    def _is_ordered_by_start_time(cls, parsed_order_by):
+        return any(
+            key_type == cls._ATTRIBUTE_IDENTIFIER and key_name == "start_time"
+            for key_type, key_name, _ in parsed_order_by
         )
-        if ascending:
-            return (is_null_or_nan, sort_value)
-        return (not is_null_or_nan, sort_value)
+
+    @classmethod
+    def _get_sort_key_from_values(cls, parsed_order_by, values):
+        key = []
+        for i, (_, _, ascending) in enumerate(parsed_order_by):
+            rank, value = values[2 * i : 2 * i + 2]
+            key.append(rank)
+            key.append(value if ascending else _ReversedSortValue(value))
+        if not cls._is_ordered_by_start_time(parsed_order_by):
+            key.append(_ReversedSortValue(values[-2]))
+        key.append(values[-1])
+        return tuple(key)
+
+    @classmethod
+    def get_sort_key_for_runs(cls, order_by_list):
+        """Returns a function that computes a sort key for a run, such that sorting runs by their
+        keys in ascending order orders them by the specified order_bys, then by start time
+        descending, then by run id for tie-breaking. The key function can be used with
+        :py:func:`heapq.nsmallest` to select the first runs of a search without sorting all of them.
+        """
+        parsed_order_by = cls._parse_order_by_list_for_search_runs(order_by_list)
+
+        def sort_key(run):
+            values = []
+            for key_type, key_name, ascending in parsed_order_by:
+                values.extend(cls._get_value_for_sort(run, key_type, key_name, ascending))
+            values.append(run.info.start_time)
+            values.append(run.info.run_uuid)
+            return cls._get_sort_key_from_values(parsed_order_by, values)
+
+        return sort_key
+
+    @classmethod
+    def get_sort_key_from_sort_values(cls, order_by_list, sort_values):
+        """Returns the sort key, as computed by the function returned by
+        :py:func:`get_sort_key_for_runs`, of a run with the specified sort values, as returned by
+        :py:func:`get_sort_values_for_run`.
+        """
+        parsed_order_by = cls._parse_order_by_list_for_search_runs(order_by_list)
+        return cls._get_sort_key_from_values(parsed_order_by, sort_values)
 
     @classmethod
     def sort(cls, runs, order_by_list):
         """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
         Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
         """
-        runs = sorted(runs, key=lambda run: (-run.info.start_time, run.info.run_uuid))
-        if not order_by_list:
-            return runs
-        # NB: We rely on the stability of Python's sort function, so that we can apply
-        # the ordering conditions in reverse order.
-        for order_by_clause in reversed(order_by_list):
-            (key_type, key, ascending) = cls.parse_order_by_for_search_runs(order_by_clause)
-            # pylint: disable=cell-var-from-loop
-            runs = sorted(
-                runs,
-                key=lambda run: cls._get_value_for_sort(run, key_type, key, ascending),
-                reverse=not ascending,
-            )
-        return runs
+        return sorted(runs, key=cls.get_sort_key_for_runs(order_by_list))
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -544,7 +614,15 @@ class SearchUtils(object):
                 "Invalid page token, decoded value=%s" % decoded_token,
                 error_code=INVALID_PARAMETER_VALUE,
             )
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return parsed_token
 
+    @classmethod
+    def _get_offset_from_parsed_page_token(cls, parsed_token):
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -562,10 +640,63 @@ class SearchUtils(object):
 
         return offset
 
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
+
+        return cls._get_offset_from_parsed_page_token(cls._decode_page_token(page_token))
+
     @classmethod
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
 
+    @classmethod
+    def parse_page_token_for_search_runs(cls, page_token, order_by_list):
+        """Parses a page token of a run search. Returns a pair ``(offset, after)``: ``after`` is the
+        list of sort values of the last run of the previous page for keyset tokens, and None for
+        the offset tokens created by previous versions of MLflow, in which case ``offset`` is the
+        number of runs to skip. ``offset`` is 0 for keyset tokens.
+        """
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "after": [...], "order_by": [...] }, or { "offset": xxx }. However, this format is not
+        # stable, so it should not be relied upon outside of this method.
+        if not page_token:
+            return 0, None
+
+        parsed_token = cls._decode_page_token(page_token)
+        if "after" not in parsed_token:
+            return cls._get_offset_from_parsed_page_token(parsed_token), None
+
+        after = parsed_token["after"]
+        parsed_order_by = cls._parse_order_by_list_for_search_runs(order_by_list)
+        num_values = 2 * len(parsed_order_by) + 1
+        if not cls._is_ordered_by_start_time(parsed_order_by):
+            num_values += 1
+        if parsed_token.get("order_by") != list(order_by_list or []):
+            raise MlflowException(
+                "Invalid page token, it was created for the order_by clauses {} but the search "
+                "specifies {}".format(parsed_token.get("order_by"), list(order_by_list or [])),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        if not isinstance(after, list) or len(after) != num_values:
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return 0, after
+
+    @classmethod
+    def create_page_token_for_search_runs(cls, after, order_by_list):
+        """Creates a keyset page token for the page of a run search that follows the run with the
+        sort values ``after``, as returned by :py:func:`get_sort_values_for_run`.
+        """
+        token = {"after": list(after), "order_by": list(order_by_list or [])}
+        return base64.b64encode(json.dumps(token).encode("utf-8"))
+
     @classmethod
     def paginate(cls, runs, page_token, max_results):
         """Paginates a set of runs based on an offset encoded into the page_token and a max
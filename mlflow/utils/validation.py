@@ -33,6 +33,8 @@ MAX_EXPERIMENT_TAG_VAL_LENGTH = 5000
 MAX_ENTITY_KEY_LENGTH = 250
 MAX_MODEL_REGISTRY_TAG_KEY_LENGTH = 250
 MAX_MODEL_REGISTRY_TAG_VALUE_LENGTH = 5000
+MAX_RUN_IDS_PER_METRIC_HISTORY_BULK = 1000
+MAX_METRIC_KEYS_PER_METRIC_HISTORY_BULK = 100
 
 _UNSUPPORTED_DB_TYPE_MSG = "Supported database engines are {%s}" % ", ".join(DATABASE_ENGINES)
 
@@ -243,6 +245,31 @@ def _validate_batch_log_api_req(json_req):
         raise MlflowException(error_msg, error_code=INVALID_PARAMETER_VALUE)
 
 
+def _validate_metric_history_bulk_args(run_ids, metric_keys, start_step, end_step):
+    """Validate the arguments of a request for the metric histories of several runs."""
+    for entity_name, items, limit in [
+        ("run IDs", run_ids, MAX_RUN_IDS_PER_METRIC_HISTORY_BULK),
+        ("metric keys", metric_keys, MAX_METRIC_KEYS_PER_METRIC_HISTORY_BULK),
+    ]:
+        if not items or len(items) > limit:
+            raise MlflowException(
+                "A metric history bulk request must contain between 1 and {limit} {name}. "
+                "Got {count} {name}.".format(name=entity_name, limit=limit, count=len(items or [])),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+    for run_id in run_ids:
+        _validate_run_id(run_id)
+    for metric_key in metric_keys:
+        _validate_metric_name(metric_key)
+    if start_step is not None and end_step is not None and start_step > end_step:
+        raise MlflowException(
+            "Invalid step range: start_step {} is greater than end_step {}".format(
+                start_step, end_step
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
 def _validate_experiment_name(experiment_name):
     """Check that `experiment_name` is a valid string and raise an exception if it isn't."""
     if experiment_name == "" or experiment_name is None:
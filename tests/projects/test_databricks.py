@@ -429,7 +429,7 @@ class MockProfileConfigProvider:
         return DatabricksConfig("host", "user", "pass", None, insecure=False)
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 @mock.patch("databricks_cli.configure.provider.get_config")
 @mock.patch.object(
     databricks_cli.configure.provider, "ProfileConfigProvider", MockProfileConfigProvider
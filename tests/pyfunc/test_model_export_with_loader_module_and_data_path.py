@@ -384,6 +384,76 @@ def test_schema_enforcement_no_col_names():
     assert pyfunc_model.predict(d).equals(pd.DataFrame(d))
 
 
+def test_schema_enforcement_returns_conforming_input_without_copying():
+    class TestModel(object):
+        @staticmethod
+        def predict(pdf):
+            return pdf
+
+    m = Model()
+    m.signature = ModelSignature(inputs=Schema([ColSpec("long", "a"), ColSpec("double", "b")]))
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+
+    pdf = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+    assert pyfunc_model.predict(pdf) is pdf
+
+    # Reordered columns are selected, extra columns are dropped
+    pdf = pd.DataFrame({"b": [1.0, 2.0], "x": ["u", "v"], "a": [1, 2]})
+    res = pyfunc_model.predict(pdf)
+    assert list(res.columns) == ["a", "b"]
+    assert res.equals(pdf[["a", "b"]])
+
+
+def test_schema_enforcement_does_not_modify_input():
+    class TestModel(object):
+        @staticmethod
+        def predict(pdf):
+            return pdf
+
+    m = Model()
+    m.signature = ModelSignature(
+        inputs=Schema([ColSpec("long", "a"), ColSpec("double", "b"), ColSpec("string", "c")])
+    )
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+    pdf = pd.DataFrame(
+        {
+            "c": np.array(["x", "y"], dtype=object),
+            "b": np.array([1, 2], dtype=np.int32),
+            "a": np.array([1, 2], dtype=np.int32),
+        }
+    )
+    input_dtypes = pdf.dtypes.to_dict()
+
+    res = pyfunc_model.predict(pdf)
+
+    assert list(res.columns) == ["a", "b", "c"]
+    assert res.dtypes.to_dict() == dict(zip(["a", "b", "c"], m.signature.inputs.pandas_types()))
+    assert pdf.dtypes.to_dict() == input_dtypes
+    assert res["b"].tolist() == [1.0, 2.0]
+    assert res["c"].tolist() == ["x", "y"]
+
+
+def test_schema_enforcement_plan_is_reused_until_signature_changes():
+    class TestModel(object):
+        @staticmethod
+        def predict(pdf):
+            return pdf
+
+    m = Model()
+    m.signature = ModelSignature(inputs=Schema([ColSpec("double", "a")]))
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+    pdf = pd.DataFrame({"a": np.array([1, 2], dtype=np.int32)})
+
+    assert pyfunc_model.predict(pdf)["a"].dtype == np.float64
+    plan = pyfunc_model._enforcement_plan
+    pyfunc_model.predict(pdf)
+    assert pyfunc_model._enforcement_plan is plan
+
+    m.signature = ModelSignature(inputs=Schema([ColSpec("integer", "a")]))
+    assert pyfunc_model.predict(pdf) is pdf
+    assert pyfunc_model._enforcement_plan is not plan
+
+
 @pytest.mark.large
 def test_model_log_load(sklearn_knn_model, iris_data, tmpdir):
     sk_model_path = os.path.join(str(tmpdir), "knn.pkl")
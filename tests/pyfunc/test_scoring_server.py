@@ -619,3 +619,377 @@ def test_get_jsonnable_obj():
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
     np_ary = _get_jsonable_obj(np.array(py_ary, dtype=type(str)))
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
+
+
+class _RecordingModel(PythonModel):
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, context, model_input):
+        self.batch_sizes.append(len(model_input))
+        return list(model_input["x"] * 2)
+
+
+def _log_and_load_recording_model():
+    with mlflow.start_run():
+        mlflow.pyfunc.log_model("model", python_model=_RecordingModel())
+        model_uri = mlflow.get_artifact_uri("model")
+    return mlflow.pyfunc.load_model(model_uri)
+
+
+def _score_concurrently(app, payloads, content_type):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def score(payload):
+        with app.test_client() as client:
+            return client.post("/invocations", data=payload, headers={"Content-Type": content_type})
+
+    with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        return list(executor.map(score, payloads))
+
+
+def test_scoring_server_with_batching_merges_concurrent_requests():
+    model = _log_and_load_recording_model()
+    python_model = model._model_impl.python_model
+    app = pyfunc_scoring_server.init(model, max_batch_size=64, max_latency_ms=500)
+    payloads = [pd.DataFrame({"x": [i, i + 100]}).to_json(orient="split") for i in range(8)]
+
+    responses = _score_concurrently(
+        app, payloads, pyfunc_scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED
+    )
+
+    for i, response in enumerate(responses):
+        assert response.status_code == 200
+        assert json.loads(response.data) == [2 * i, 2 * (i + 100)]
+    assert sum(python_model.batch_sizes) == 16
+    assert len(python_model.batch_sizes) < 8
+
+
+def test_scoring_server_with_batching_accepts_csv_and_records_inputs():
+    model = _log_and_load_recording_model()
+    app = pyfunc_scoring_server.init(model, max_batch_size=64, max_latency_ms=100)
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=pd.DataFrame({"x": [1, 2]}).to_csv(index=False),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_CSV},
+        )
+        assert json.loads(response.data) == [2, 4]
+        response = client.post(
+            "/invocations",
+            data=json.dumps([{"x": 3}]),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON_RECORDS_ORIENTED},
+        )
+        assert json.loads(response.data) == [6]
+
+
+def test_scoring_server_with_batching_reports_schema_errors_per_request():
+    model = _log_and_load_recording_model()
+    model.metadata.signature = ModelSignature(Schema([ColSpec("long", "x")]))
+    app = pyfunc_scoring_server.init(model, max_batch_size=64, max_latency_ms=200)
+    payloads = [
+        pd.DataFrame({"x": [1]}).to_json(orient="split"),
+        pd.DataFrame({"y": [1]}).to_json(orient="split"),
+    ]
+
+    ok_response, bad_response = _score_concurrently(
+        app, payloads, pyfunc_scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED
+    )
+
+    assert ok_response.status_code == 200
+    assert json.loads(ok_response.data) == [2]
+    assert bad_response.status_code == 400
+    assert "x" in json.loads(bad_response.data)["message"]
+
+
+def test_prediction_batcher_splits_merged_predictions():
+    from concurrent.futures import ThreadPoolExecutor
+    from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
+
+    batch_sizes = []
+
+    def predict_fn(data):
+        batch_sizes.append(len(data))
+        return data.values.sum(axis=1)
+
+    batcher = PredictionBatcher(predict_fn, max_batch_size=100, max_latency_ms=500)
+    inputs = [pd.DataFrame({"a": [i] * (i + 1), "b": [1] * (i + 1)}) for i in range(6)]
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        results = list(executor.map(batcher.predict, inputs))
+
+    for i, result in enumerate(results):
+        np.testing.assert_array_equal(result, np.full(i + 1, i + 1))
+    assert sum(batch_sizes) == 21
+    assert len(batch_sizes) < 6
+
+
+def test_prediction_batcher_respects_max_batch_size():
+    from concurrent.futures import ThreadPoolExecutor
+    from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
+
+    batch_sizes = []
+
+    def predict_fn(data):
+        batch_sizes.append(len(data))
+        return list(data["a"])
+
+    batcher = PredictionBatcher(predict_fn, max_batch_size=4, max_latency_ms=200)
+    inputs = [pd.DataFrame({"a": [i, i]}) for i in range(10)]
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        results = list(executor.map(batcher.predict, inputs))
+
+    assert results == [[i, i] for i in range(10)]
+    assert max(batch_sizes) <= 4
+    assert sum(batch_sizes) == 20
+
+
+def test_prediction_batcher_predicts_separately_when_merged_prediction_fails():
+    from concurrent.futures import ThreadPoolExecutor
+    from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
+
+    def predict_fn(data):
+        if (data["a"] < 0).any():
+            raise MlflowException("Negative input")
+        return data["a"]
+
+    batcher = PredictionBatcher(predict_fn, max_batch_size=100, max_latency_ms=300)
+    inputs = [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [-1]}), pd.DataFrame({"a": [2]})]
+
+    def predict(data):
+        try:
+            return list(batcher.predict(data))
+        except MlflowException as e:
+            return e.message
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        results = list(executor.map(predict, inputs))
+
+    assert results == [[1], "Negative input", [2]]
+
+
+def test_prediction_batcher_predicts_separately_when_predictions_cannot_be_split():
+    from concurrent.futures import ThreadPoolExecutor
+    from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
+
+    batch_sizes = []
+
+    def predict_fn(data):
+        batch_sizes.append(len(data))
+        return {"num_rows": len(data)}
+
+    batcher = PredictionBatcher(predict_fn, max_batch_size=100, max_latency_ms=300)
+    inputs = [pd.DataFrame({"a": [0] * (i + 1)}) for i in range(3)]
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        results = list(executor.map(batcher.predict, inputs))
+
+    assert results == [{"num_rows": 1}, {"num_rows": 2}, {"num_rows": 3}]
+    # Every request is eventually predicted on its own
+    assert {1, 2, 3} <= set(batch_sizes)
+
+
+def test_prediction_batcher_does_not_merge_inputs_of_different_types():
+    from concurrent.futures import ThreadPoolExecutor
+    from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
+
+    seen_dtypes = []
+
+    def predict_fn(data):
+        seen_dtypes.append(str(data["a"].dtype))
+        return data["a"]
+
+    batcher = PredictionBatcher(predict_fn, max_batch_size=100, max_latency_ms=300)
+    inputs = [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": ["x"]}), pd.DataFrame({"a": [2]})]
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        results = [list(r) for r in executor.map(batcher.predict, inputs)]
+
+    assert results == [[1], ["x"], [2]]
+    assert set(seen_dtypes) == {"int64", "object"}
+
+
+def test_prediction_batcher_predicts_large_and_non_dataframe_inputs_directly():
+    from mlflow.pyfunc.scoring_server.batching import PredictionBatcher
+
+    def predict_fn(data):
+        return data
+
+    batcher = PredictionBatcher(predict_fn, max_batch_size=2, max_latency_ms=10)
+    tensor_input = {"a": np.array([1, 2, 3])}
+    large_input = pd.DataFrame({"a": [1, 2, 3]})
+    assert batcher.predict(tensor_input) is tensor_input
+    assert batcher.predict(large_input) is large_input
+    assert batcher._thread is None
+
+
+class _ColumnTypesModel(PythonModel):
+    def predict(self, context, model_input):
+        return pd.DataFrame(
+            {
+                "column": list(model_input.columns),
+                "dtype": [str(dtype) for dtype in model_input.dtypes],
+                "sum": [str(model_input[c].iloc[0]) for c in model_input.columns],
+            }
+        )
+
+
+def _arrow_stream_bytes(df):
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _read_arrow_stream(data):
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(pa.BufferReader(data)).read_all().to_pandas()
+
+
+def _read_parquet(data):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    return pq.read_table(pa.BufferReader(data)).to_pandas()
+
+
+@pytest.fixture
+def model_with_schema():
+    with mlflow.start_run():
+        mlflow.pyfunc.log_model(
+            "model",
+            python_model=_ColumnTypesModel(),
+            signature=ModelSignature(
+                Schema([ColSpec("double", "a"), ColSpec("long", "b"), ColSpec("string", "c")])
+            ),
+        )
+        model_uri = mlflow.get_artifact_uri("model")
+    return mlflow.pyfunc.load_model(model_uri)
+
+
+@pytest.mark.parametrize(
+    "content_type, serialize",
+    [
+        (pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM, _arrow_stream_bytes),
+        (pyfunc_scoring_server.CONTENT_TYPE_PARQUET, lambda df: df.to_parquet(index=False)),
+    ],
+)
+def test_scoring_server_parses_binary_inputs_with_schema(
+    model_with_schema, content_type, serialize
+):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {"extra": [1, 2], "c": ["x", "y"], "b": np.array([1, 2], dtype=np.int32), "a": [0.5, 1.5]}
+    )
+    app = pyfunc_scoring_server.init(model_with_schema)
+    with app.test_client() as client:
+        response = client.post("/invocations", data=serialize(df), content_type=content_type)
+
+    assert response.status_code == 200
+    assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_JSON
+    assert json.loads(response.data) == [
+        {"column": "a", "dtype": "float64", "sum": "0.5"},
+        {"column": "b", "dtype": "int64", "sum": "1"},
+        {"column": "c", "dtype": str(DataType.string.to_pandas()), "sum": "x"},
+    ]
+
+
+def test_scoring_server_reports_missing_columns_in_binary_inputs(model_with_schema):
+    pytest.importorskip("pyarrow")
+    app = pyfunc_scoring_server.init(model_with_schema)
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=_arrow_stream_bytes(pd.DataFrame({"a": [0.5], "b": [1]})),
+            content_type=pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM,
+        )
+
+    assert response.status_code == 400
+    response_json = json.loads(response.data)
+    assert response_json["error_code"] == ErrorCode.Name(BAD_REQUEST)
+    assert "missing columns ['c']" in response_json["message"]
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM, pyfunc_scoring_server.CONTENT_TYPE_PARQUET],
+)
+def test_scoring_server_responds_to_malformed_binary_input_with_error_code(
+    model_with_schema, content_type
+):
+    pytest.importorskip("pyarrow")
+    app = pyfunc_scoring_server.init(model_with_schema)
+    with app.test_client() as client:
+        response = client.post("/invocations", data=b"not a table", content_type=content_type)
+
+    response_json = json.loads(response.data)
+    assert response_json["error_code"] == ErrorCode.Name(MALFORMED_REQUEST)
+    assert "stack_trace" in response_json
+
+
+@pytest.mark.parametrize(
+    "accept, read_predictions",
+    [
+        (pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM, _read_arrow_stream),
+        (pyfunc_scoring_server.CONTENT_TYPE_PARQUET, _read_parquet),
+    ],
+)
+def test_scoring_server_returns_binary_predictions_for_accept_header(accept, read_predictions):
+    pytest.importorskip("pyarrow")
+    model = _log_and_load_recording_model()
+    app = pyfunc_scoring_server.init(model)
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=pd.DataFrame({"x": [1, 2, 3]}).to_json(orient="split"),
+            content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED,
+            headers={"Accept": accept},
+        )
+
+    assert response.status_code == 200
+    assert response.mimetype == accept
+    pd.testing.assert_frame_equal(
+        read_predictions(response.data), pd.DataFrame({"predictions": [2, 4, 6]})
+    )
+
+
+def test_predictions_to_arrow_table_handles_prediction_types():
+    pytest.importorskip("pyarrow")
+    from mlflow.pyfunc.scoring_server import _predictions_to_arrow_table
+
+    def to_pandas(predictions):
+        return _predictions_to_arrow_table(predictions).to_pandas()
+
+    pd.testing.assert_frame_equal(
+        to_pandas(pd.Series([1.0, 2.0], name="score")), pd.DataFrame({"score": [1.0, 2.0]})
+    )
+    pd.testing.assert_frame_equal(
+        to_pandas(np.array([[1, 2], [3, 4]])), pd.DataFrame({"0": [1, 3], "1": [2, 4]})
+    )
+    pd.testing.assert_frame_equal(
+        to_pandas({"a": np.array([1, 2]), "b": np.array(["x", "y"])}),
+        pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+    )
+    with pytest.raises(MlflowException, match="3 dimensions"):
+        _predictions_to_arrow_table(np.zeros((2, 2, 2)))
+
+
+@pytest.mark.parametrize("content_type", ["arrow", "parquet"])
+def test_predict_writes_binary_predictions_for_binary_input_files(tmpdir, content_type):
+    pytest.importorskip("pyarrow")
+    with mlflow.start_run():
+        mlflow.pyfunc.log_model("model", python_model=_RecordingModel())
+        model_uri = mlflow.get_artifact_uri("model")
+    input_path = tmpdir.join("input").strpath
+    output_path = tmpdir.join("output").strpath
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    with open(input_path, "wb") as f:
+        f.write(_arrow_stream_bytes(df) if content_type == "arrow" else df.to_parquet())
+
+    pyfunc_scoring_server._predict(model_uri, input_path, output_path, content_type, "split")
+
+    with open(output_path, "rb") as f:
+        data = f.read()
+    predictions = _read_arrow_stream(data) if content_type == "arrow" else _read_parquet(data)
+    pd.testing.assert_frame_equal(predictions, pd.DataFrame({"predictions": [2, 4, 6]}))
@@ -97,6 +97,15 @@ CREATE TABLE latest_metrics (
 )
 
 
+CREATE TABLE logged_models (
+	id INTEGER NOT NULL,
+	run_uuid VARCHAR(32) NOT NULL,
+	model TEXT NOT NULL,
+	CONSTRAINT logged_model_pk PRIMARY KEY (id),
+	FOREIGN KEY(run_uuid) REFERENCES runs (run_uuid)
+)
+
+
 CREATE TABLE metrics (
 	key VARCHAR(250) NOT NULL,
 	value FLOAT NOT NULL,
@@ -0,0 +1,253 @@
+import os
+from unittest import mock
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.server import app
+from mlflow.server.artifact_serving import get_server_artifact_cache, send_artifact
+from mlflow.server.handlers import _send_artifact
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+_CONTENT = b"0123456789"
+
+
+class _NonStreamingRepository(ArtifactRepository):
+    """
+    Repository of the files of a local directory that cannot stream them.
+    """
+
+    def __init__(self, artifact_uri):
+        super().__init__(artifact_uri)
+        self._local_repo = LocalArtifactRepository(artifact_uri)
+        self.downloads = []
+
+    def log_artifact(self, local_file, artifact_path=None):
+        self._local_repo.log_artifact(local_file, artifact_path)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        self._local_repo.log_artifacts(local_dir, artifact_path)
+
+    def list_artifacts(self, path):
+        return self._local_repo.list_artifacts(path)
+
+    def _download_file(self, remote_file_path, local_path):
+        self.downloads.append(remote_file_path)
+        self._local_repo._download_file(remote_file_path, local_path)
+
+
+class _StreamingRepository(_NonStreamingRepository):
+    """
+    Repository of the files of a local directory that streams them like a remote repository.
+    """
+
+    def __init__(self, artifact_uri):
+        super().__init__(artifact_uri)
+        self.reads = []
+
+    def open_artifact_stream(self, artifact_path):
+        stream = self._local_repo.open_artifact_stream(artifact_path)
+        read_range = stream._read_range
+
+        def record_read_range(start, stop):
+            self.reads.append((start, stop))
+            return read_range(start, stop)
+
+        stream._read_range = record_read_range
+        return stream
+
+
+@pytest.fixture
+def artifact_dir(tmpdir):
+    os.mkdir(os.path.join(str(tmpdir), "subdir"))
+    for path, content in [("subdir/a.bin", _CONTENT), ("b.txt", b"text")]:
+        with open(os.path.join(str(tmpdir), path), "wb") as f:
+            f.write(content)
+    return str(tmpdir)
+
+
+@pytest.fixture(params=["streaming", "non_streaming"])
+def artifact_repo(request, artifact_dir):
+    if request.param == "streaming":
+        return LocalArtifactRepository(artifact_dir)
+    return _NonStreamingRepository(artifact_dir)
+
+
+@pytest.fixture(autouse=True)
+def artifact_cache(tmpdir):
+    with mock.patch.dict(
+        os.environ,
+        {
+            "MLFLOW_ARTIFACT_CACHE_DIR": os.path.join(str(tmpdir), "cache"),
+            "MLFLOW_ARTIFACT_CACHE_MAX_BYTES": "1024",
+        },
+    ):
+        yield get_server_artifact_cache()
+
+
+def _read(response):
+    return b"".join(response.iter_encoded())
+
+
+def _send(artifact_repo, path, headers=None):
+    with app.test_request_context(headers=headers):
+        response = send_artifact(artifact_repo, path)
+        try:
+            return response, _read(response)
+        finally:
+            response.close()
+
+
+def test_send_artifact_sends_file_as_attachment(artifact_repo):
+    response, data = _send(artifact_repo, "subdir/a.bin")
+    assert response.status_code == 200
+    assert data == _CONTENT
+    assert response.content_length == 10
+    assert response.headers["Content-Disposition"] == 'attachment; filename="a.bin"'
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.mimetype == "application/octet-stream"
+    assert response.get_etag()[0]
+
+    with app.test_request_context():
+        response = _send_artifact(artifact_repo, "b.txt")
+        assert response.mimetype == "text/plain"
+        assert _read(response) == b"text"
+        response.close()
+
+
+def test_get_artifact_handler_streams_artifact(artifact_dir):
+    run = mock.Mock()
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as store, mock.patch(
+        "mlflow.server.handlers._get_artifact_repo",
+        return_value=LocalArtifactRepository(artifact_dir),
+    ):
+        store.return_value.get_run.return_value = run
+        client = app.test_client()
+        response = client.get(
+            "/get-artifact", query_string={"run_id": "run", "path": "subdir/a.bin"}
+        )
+        assert response.status_code == 200
+        assert response.data == _CONTENT
+        response = client.get(
+            "/get-artifact",
+            query_string={"run_id": "run", "path": "subdir/a.bin"},
+            headers={"Range": "bytes=-4"},
+        )
+        assert response.status_code == 206
+        assert response.data == b"6789"
+        response = client.get("/get-artifact", query_string={"run_id": "run", "path": "subdir"})
+        assert response.status_code == 404
+        assert response.json["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_send_artifact_sends_requested_byte_range(artifact_repo):
+    for range_header, expected_data, content_range in [
+        ("bytes=2-5", b"2345", "bytes 2-5/10"),
+        ("bytes=7-", b"789", "bytes 7-9/10"),
+        ("bytes=-3", b"789", "bytes 7-9/10"),
+        ("bytes=8-100", b"89", "bytes 8-9/10"),
+    ]:
+        response, data = _send(artifact_repo, "subdir/a.bin", {"Range": range_header})
+        assert response.status_code == 206
+        assert data == expected_data
+        assert response.content_length == len(expected_data)
+        assert response.headers["Content-Range"] == content_range
+
+    response, data = _send(artifact_repo, "subdir/a.bin", {"Range": "bytes=10-"})
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == "bytes */10"
+
+    # Several ranges are answered with the whole file
+    response, data = _send(artifact_repo, "subdir/a.bin", {"Range": "bytes=0-1,4-5"})
+    assert response.status_code == 200
+    assert data == _CONTENT
+
+
+def test_send_artifact_handles_conditional_requests(artifact_repo):
+    etag = _send(artifact_repo, "subdir/a.bin")[0].get_etag()[0]
+
+    response, data = _send(artifact_repo, "subdir/a.bin", {"If-None-Match": '"{}"'.format(etag)})
+    assert response.status_code == 304
+    assert data == b""
+
+    response, data = _send(
+        artifact_repo, "subdir/a.bin", {"Range": "bytes=2-5", "If-Range": '"{}"'.format(etag)}
+    )
+    assert response.status_code == 206
+    assert data == b"2345"
+
+    for if_range in ['"outdated"', "Wed, 21 Oct 2015 07:28:00 GMT"]:
+        response, data = _send(
+            artifact_repo, "subdir/a.bin", {"Range": "bytes=2-5", "If-Range": if_range}
+        )
+        assert response.status_code == 200
+        assert data == _CONTENT
+
+
+def test_send_artifact_encodes_non_ascii_file_names(artifact_dir):
+    with open(os.path.join(artifact_dir, "résumé.txt"), "wb") as f:
+        f.write(b"text")
+    response, _ = _send(LocalArtifactRepository(artifact_dir), "résumé.txt")
+    assert response.headers["Content-Disposition"] == (
+        "attachment; filename=\"resume.txt\"; filename*=UTF-8''r%C3%A9sum%C3%A9.txt"
+    )
+
+
+def test_send_artifact_raises_for_missing_files_and_directories(artifact_repo):
+    for path in ["subdir", "missing.txt", "subdir/missing.txt"]:
+        with pytest.raises(MlflowException, match="No artifact file found") as exc:
+            _send(artifact_repo, path)
+        assert exc.value.error_code == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_non_streaming_repository_files_are_cached_until_evicted(artifact_dir, artifact_cache):
+    artifact_repo = _NonStreamingRepository(artifact_dir)
+    etags = set()
+    for _ in range(3):
+        response, data = _send(artifact_repo, "subdir/a.bin")
+        assert data == _CONTENT
+        etags.add(response.get_etag()[0])
+    assert artifact_repo.downloads == ["subdir/a.bin"]
+    assert len(etags) == 1
+
+    # A file overwritten with a file of a different size is downloaded again
+    with open(os.path.join(artifact_dir, "subdir", "a.bin"), "wb") as f:
+        f.write(b"01234")
+    assert _send(artifact_repo, "subdir/a.bin")[1] == b"01234"
+    assert artifact_repo.downloads == ["subdir/a.bin"] * 2
+
+    # Files not fitting in the cache are sent, then evicted
+    with open(os.path.join(artifact_dir, "c.bin"), "wb") as f:
+        f.write(_CONTENT)
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_CACHE_MAX_BYTES": "8"}):
+        with app.test_request_context():
+            response = send_artifact(artifact_repo, "c.bin")
+            assert os.listdir(os.path.join(artifact_cache.root, "entries")) == []
+            # The evicted file can still be read by the response
+            assert _read(response) == _CONTENT
+            response.close()
+    assert artifact_repo.downloads == ["subdir/a.bin", "subdir/a.bin", "c.bin"]
+    assert artifact_cache.stats.evictions == 3
+
+
+def test_streamed_files_are_cached_once_sent_whole(artifact_dir, artifact_cache):
+    artifact_repo = _StreamingRepository(artifact_dir)
+    etag = _send(artifact_repo, "subdir/a.bin", {"Range": "bytes=2-5"})[0].get_etag()[0]
+    assert artifact_cache.stats == (0, 1, 0)
+    # Interrupted responses are not cached
+    with app.test_request_context():
+        response = send_artifact(artifact_repo, "subdir/a.bin")
+        next(response.iter_encoded())
+        response.close()
+    assert artifact_cache.stats == (0, 2, 0)
+    assert _send(artifact_repo, "subdir/a.bin")[1] == _CONTENT
+    assert artifact_cache.stats == (0, 3, 0)
+    assert artifact_repo.reads == [(2, 6), (0, 10), (0, 10)]
+
+    for headers, expected_data in [({}, _CONTENT), ({"Range": "bytes=2-5"}, b"2345")]:
+        response, data = _send(artifact_repo, "subdir/a.bin", headers)
+        assert data == expected_data
+        assert response.get_etag()[0] == etag
+    assert artifact_cache.stats == (2, 3, 0)
+    assert artifact_repo.reads == [(2, 6), (0, 10), (0, 10)]
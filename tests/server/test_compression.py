@@ -0,0 +1,173 @@
+import gzip
+import json
+import tracemalloc
+import zlib
+from unittest import mock
+
+import pytest
+
+from mlflow.entities import Experiment, Metric
+from mlflow.server import app
+from mlflow.server.compression import decompress_request_data
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE
+
+
+@pytest.fixture
+def mock_tracking_store():
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as m:
+        mock_store = mock.MagicMock()
+        m.return_value = mock_store
+        yield mock_store
+
+
+def _list_experiments(client, **headers):
+    return client.get("/api/2.0/mlflow/experiments/list", headers=headers)
+
+
+def test_large_responses_are_compressed(mock_tracking_store):
+    mock_tracking_store.list_experiments.return_value = [
+        Experiment(str(i), "experiment_{}".format(i), "s3://bucket/{}".format(i), "active")
+        for i in range(100)
+    ]
+    client = app.test_client()
+    uncompressed = _list_experiments(client)
+    assert "Content-Encoding" not in uncompressed.headers
+    assert "Accept-Encoding" in uncompressed.vary
+
+    compressed = _list_experiments(client, **{"Accept-Encoding": "gzip, deflate"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert int(compressed.headers["Content-Length"]) < len(uncompressed.data) / 5
+    assert gzip.decompress(compressed.data) == uncompressed.data
+
+    # Responses smaller than the threshold are sent as they are
+    with mock.patch.dict("os.environ", {"MLFLOW_SERVER_COMPRESSION_MIN_SIZE": "1000000"}):
+        response = _list_experiments(client, **{"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.data == uncompressed.data
+
+
+def test_streamed_responses_are_compressed(mock_tracking_store):
+    mock_tracking_store.get_metric_history_bulk.return_value = {
+        "r": {"m": [Metric("m", 0.5, 1, step) for step in range(1000)]}
+    }
+    response = app.test_client().post(
+        "/api/2.0/mlflow/metrics/get-history-bulk",
+        json={"run_ids": ["r"], "metric_keys": ["m"]},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    histories = json.loads(gzip.decompress(response.data))["metric_histories"]
+    assert len(histories[0]["metrics"]) == 1000
+
+
+def test_artifacts_are_not_compressed(tmpdir):
+    tmpdir.join("a.txt").write("x" * 10000)
+    with mock.patch("mlflow.server.handlers._get_tracking_store"), mock.patch(
+        "mlflow.server.handlers._get_artifact_repo",
+        return_value=LocalArtifactRepository(tmpdir.strpath),
+    ):
+        response = app.test_client().get(
+            "/get-artifact",
+            query_string={"run_id": "run", "path": "a.txt"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+    assert "Content-Encoding" not in response.headers
+    assert response.data == b"x" * 10000
+
+
+def test_responses_without_mimetype_are_not_compressed():
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response = app.response_class(b"x" * 10000)
+        response.headers.pop("Content-Type")
+        assert response.mimetype is None
+        response = app.process_response(response)
+    assert "Content-Encoding" not in response.headers
+    assert response.data == b"x" * 10000
+
+
+def test_compressed_log_batch_request_bodies_are_accepted(mock_tracking_store):
+    body = json.dumps({"run_id": "r", "metrics": [{"key": "m", "value": 1.0}] * 100})
+    client = app.test_client()
+    response = client.post(
+        "/api/2.0/mlflow/runs/log-batch",
+        data=gzip.compress(body.encode("utf-8")),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    _, kwargs = mock_tracking_store.log_batch.call_args
+    assert len(kwargs["metrics"]) == 100
+
+    response = client.post(
+        "/api/2.0/mlflow/runs/log-batch",
+        data=body,
+        headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+    )
+    assert response.status_code == 400
+    assert "Unsupported request Content-Encoding 'br'" in response.json["message"]
+
+
+def _gzip_compress_spaces(size):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    chunk = b" " * (1024 * 1024)
+    data = [compressor.compress(chunk) for _ in range(size // len(chunk))]
+    return b"".join(data + [compressor.flush()])
+
+
+def test_decompressed_request_bodies_are_limited(mock_tracking_store):
+    # A small body expanding to 200 MB is rejected without decompressing all of it
+    body = _gzip_compress_spaces(200 * 1024 * 1024)
+    assert len(body) < 250 * 1024
+    client = app.test_client()
+    tracemalloc.start()
+    try:
+        response = client.post(
+            "/api/2.0/mlflow/experiments/create",
+            data=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 50 * 1024 * 1024
+    assert response.status_code == 400
+    assert response.json["error_code"] == "INVALID_PARAMETER_VALUE"
+    assert "at most 16777216 bytes once decompressed" in response.json["message"]
+    mock_tracking_store.create_experiment.assert_not_called()
+
+    with mock.patch.dict("os.environ", {"MLFLOW_SERVER_MAX_REQUEST_SIZE": "10"}):
+        with pytest.raises(MlflowException, match="at most 10 bytes once decompressed"):
+            decompress_request_data(gzip.compress(b"a" * 11), "gzip")
+        assert decompress_request_data(gzip.compress(b"a" * 10), "gzip") == b"a" * 10
+        # Bodies sent as they are do not need to be decompressed
+        assert decompress_request_data(b"a" * 11, None) == b"a" * 11
+    with pytest.raises(MlflowException, match="at most 1000000 bytes once decompressed"):
+        decompress_request_data(body, "gzip", MAX_BATCH_LOG_REQUEST_SIZE)
+
+
+def test_zstd_compression():
+    zstandard = pytest.importorskip("zstandard")
+    data = b'{"metrics": []}' * 100
+    compressed = zstandard.ZstdCompressor().compressobj()
+    compressed = compressed.compress(data) + compressed.flush()
+    assert decompress_request_data(compressed, "zstd") == data
+    with pytest.raises(MlflowException, match="at most 100 bytes once decompressed"):
+        decompress_request_data(compressed, "zstd", 100)
+
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as store:
+        store.return_value.list_experiments.return_value = [
+            Experiment(str(i), "experiment_{}".format(i), "s3://bucket", "active")
+            for i in range(100)
+        ]
+        response = _list_experiments(app.test_client(), **{"Accept-Encoding": "gzip, zstd"})
+    assert response.headers["Content-Encoding"] == "zstd"
+    assert json.loads(zstandard.ZstdDecompressor().decompressobj().decompress(response.data))
+
+
+def test_decompress_request_data_raises_for_malformed_bodies():
+    assert decompress_request_data(b"data", None) == b"data"
+    assert decompress_request_data(gzip.compress(b"data"), "gzip") == b"data"
+    with pytest.raises(MlflowException, match="Malformed gzip-compressed request body"):
+        decompress_request_data(b"data", "gzip")
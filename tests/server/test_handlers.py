@@ -1,3 +1,4 @@
+import gzip
 import json
 import uuid
 
@@ -6,7 +7,7 @@ from unittest import mock
 
 import os
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import Metric, RunTag, ViewType
 from mlflow.entities.model_registry import (
     RegisteredModel,
     ModelVersion,
@@ -19,8 +20,9 @@ from mlflow.server.handlers import (
     get_endpoints,
     _create_experiment,
     _get_request_message,
+    _get_metric_history,
+    _get_metric_history_bulk,
     _search_runs,
-    _log_batch,
     catch_mlflow_exception,
     _create_registered_model,
     _update_registered_model,
@@ -44,7 +46,14 @@ from mlflow.server.handlers import (
 )
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
+from mlflow.utils.proto_json_utils import parse_dict
+from mlflow.protos.service_pb2 import (
+    CreateExperiment,
+    GetMetricHistory,
+    GetMetricHistoryBulk,
+    LogBatch,
+    SearchRuns,
+)
 from mlflow.protos.model_registry_pb2 import (
     CreateRegisteredModel,
     UpdateRegisteredModel,
@@ -76,12 +85,6 @@ def mock_get_request_message():
         yield m
 
 
-@pytest.fixture()
-def mock_get_request_json():
-    with mock.patch("mlflow.server.handlers._get_request_json") as m:
-        yield m
-
-
 @pytest.fixture()
 def mock_tracking_store():
     with mock.patch("mlflow.server.handlers._get_tracking_store") as m:
@@ -144,6 +147,7 @@ def test_all_model_registry_endpoints_available():
 def test_can_parse_json():
     request = mock.MagicMock()
     request.method = "POST"
+    request.headers = {}
     request.get_json = mock.MagicMock()
     request.get_json.return_value = {"name": "hello"}
     msg = _get_request_message(CreateExperiment(), flask_request=request)
@@ -153,6 +157,7 @@ def test_can_parse_json():
 def test_can_parse_post_json_with_unknown_fields():
     request = mock.MagicMock()
     request.method = "POST"
+    request.headers = {}
     request.get_json = mock.MagicMock()
     request.get_json.return_value = {"name": "hello", "WHAT IS THIS FIELD EVEN": "DOING"}
     msg = _get_request_message(CreateExperiment(), flask_request=request)
@@ -167,11 +172,22 @@ def test_can_parse_get_json_with_unknown_fields():
     assert msg.name == "hello"
 
 
+def test_can_parse_gzip_compressed_json():
+    request = mock.MagicMock()
+    request.method = "POST"
+    request.headers = {"Content-Encoding": "gzip"}
+    request.get_data.return_value = gzip.compress(b'{"name": "hello"}')
+    msg = _get_request_message(CreateExperiment(), flask_request=request)
+    assert msg.name == "hello"
+    request.get_json.assert_not_called()
+
+
 # Previous versions of the client sent a doubly string encoded JSON blob,
 # so this test ensures continued compliance with such clients.
 def test_can_parse_json_string():
     request = mock.MagicMock()
     request.method = "POST"
+    request.headers = {}
     request.get_json = mock.MagicMock()
     request.get_json.return_value = '{"name": "hello2"}'
     msg = _get_request_message(CreateExperiment(), flask_request=request)
@@ -189,16 +205,144 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_tracking_s
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
-def test_log_batch_api_req(mock_get_request_json):
-    mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
-    response = _log_batch()
+def test_can_parse_get_metric_history_sampling_arguments():
+    request = mock.MagicMock()
+    request.method = "GET"
+    request.query_string = b"run_id=r&metric_key=m&max_results=100&sampling=min_max"
+    msg = _get_request_message(GetMetricHistory(), flask_request=request)
+    assert msg.max_results == 100
+    assert msg.sampling == "min_max"
+
+
+def test_get_metric_history_passes_sampling_arguments(
+    mock_get_request_message, mock_tracking_store
+):
+    mock_tracking_store.get_metric_history.return_value = []
+    mock_get_request_message.return_value = GetMetricHistory(
+        run_id="r", metric_key="m", max_results=100, sampling="min_max"
+    )
+    _get_metric_history()
+    mock_tracking_store.get_metric_history.assert_called_once_with(
+        "r", "m", max_results=100, sampling="min_max"
+    )
+
+    mock_tracking_store.get_metric_history.reset_mock()
+    mock_get_request_message.return_value = GetMetricHistory(run_id="r", metric_key="m")
+    _get_metric_history()
+    mock_tracking_store.get_metric_history.assert_called_once_with(
+        "r", "m", max_results=None, sampling=None
+    )
+
+
+def test_get_metric_history_bulk(mock_get_request_message, mock_tracking_store):
+    mock_tracking_store.get_metric_history_bulk.return_value = {
+        "r2": {"m": [Metric("m", 0.5, 1, 2), Metric("m", float("nan"), 3, 4)], "n": []},
+        "r1": {"m": [], "n": [Metric("n", 1.0, 5, 6)]},
+    }
+    mock_get_request_message.return_value = GetMetricHistoryBulk(
+        run_ids=["r2", "r1"], metric_keys=["m", "n"], end_step=10, sampling="lttb"
+    )
+    response = _get_metric_history_bulk()
+    mock_tracking_store.get_metric_history_bulk.assert_called_once_with(
+        run_ids=["r2", "r1"],
+        metric_keys=["m", "n"],
+        start_step=None,
+        end_step=10,
+        max_results=None,
+        sampling="lttb",
+    )
+    assert response.status_code == 200
+    response_message = GetMetricHistoryBulk.Response()
+    parse_dict(json.loads(response.get_data()), response_message)
+    assert [
+        (history.run_id, history.metric_key, [(str(m.value), m.step) for m in history.metrics])
+        for history in response_message.metric_histories
+    ] == [
+        ("r2", "m", [("0.5", 2), ("nan", 4)]),
+        ("r2", "n", []),
+        ("r1", "m", []),
+        ("r1", "n", [("1.0", 6)]),
+    ]
+
+
+def test_handlers_negotiate_protobuf_bodies(mock_tracking_store):
+    request_message = LogBatch(run_id="r", metrics=[Metric("m", 0.5, 1, 2).to_proto()])
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=request_message.SerializeToString(),
+            headers={"Content-Type": "application/x-protobuf", "Accept": "application/x-protobuf"},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-protobuf"
+        assert response.get_data() == b""
+        _, kwargs = mock_tracking_store.log_batch.call_args
+        assert kwargs["run_id"] == "r"
+        assert [metric.to_proto() for metric in kwargs["metrics"]] == list(request_message.metrics)
+
+        # JSON remains the default, and both are advertised
+        response = c.post("/api/2.0/mlflow/runs/log-batch", json={"run_id": "r"})
+        assert response.mimetype == "application/json"
+        assert response.headers["X-MLflow-Content-Types"] == (
+            "application/json, application/x-protobuf"
+        )
+
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=b"not a protobuf message",
+            headers={"Content-Type": "application/x-protobuf"},
+        )
+        assert response.status_code == 400
+        assert "Malformed protobuf request body" in json.loads(response.get_data())["message"]
+
+
+def test_get_metric_history_bulk_streams_protobuf_responses(mock_tracking_store):
+    mock_tracking_store.get_metric_history_bulk.return_value = {
+        "r1": {"m": [Metric("m", 0.5, 1, 2)] * 100, "n": []},
+        "r2": {"m": [], "n": [Metric("n", 1.0, 5, 6)]},
+    }
+    request_message = GetMetricHistoryBulk(run_ids=["r1", "r2"], metric_keys=["m", "n"])
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/metrics/get-history-bulk",
+            data=request_message.SerializeToString(),
+            headers={"Content-Type": "application/x-protobuf", "Accept": "application/x-protobuf"},
+        )
+        assert response.mimetype == "application/x-protobuf"
+        response_message = GetMetricHistoryBulk.Response()
+        response_message.ParseFromString(response.get_data())
+    assert [
+        (history.run_id, history.metric_key, len(history.metrics))
+        for history in response_message.metric_histories
+    ] == [("r1", "m", 100), ("r1", "n", 0), ("r2", "m", 0), ("r2", "n", 1)]
+
+
+@pytest.mark.parametrize(
+    "content_type, serialize",
+    [
+        ("application/json", lambda message: message_to_json(message).encode("utf-8")),
+        ("application/x-protobuf", lambda message: message.SerializeToString()),
+    ],
+)
+@pytest.mark.parametrize("compress", [False, True])
+def test_log_batch_api_req(mock_tracking_store, content_type, serialize, compress):
+    # Both formats measure the size of the request body, after decompressing it
+    tags = [
+        RunTag("k%s" % i, "a" * 1000).to_proto() for i in range(MAX_BATCH_LOG_REQUEST_SIZE // 1000)
+    ]
+    data = serialize(LogBatch(run_id="r", tags=tags))
+    assert len(data) > MAX_BATCH_LOG_REQUEST_SIZE
+    headers = {"Content-Type": content_type}
+    if compress:
+        data = gzip.compress(data)
+        headers["Content-Encoding"] = "gzip"
+    with app.test_client() as c:
+        response = c.post("/api/2.0/mlflow/runs/log-batch", data=data, headers=headers)
     assert response.status_code == 400
     json_response = json.loads(response.get_data())
     assert json_response["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
-    assert (
-        "Batched logging API requests must be at most %s bytes" % MAX_BATCH_LOG_REQUEST_SIZE
-        in json_response["message"]
-    )
+    assert "must be at most %s bytes" % MAX_BATCH_LOG_REQUEST_SIZE in json_response["message"]
+    mock_tracking_store.log_batch.assert_not_called()
 
 
 def test_catch_mlflow_exception():
@@ -0,0 +1,31 @@
+from unittest import mock
+
+from flask import request
+
+from mlflow.server import app, READ_PRIMARY_UNTIL_COOKIE
+from mlflow.store.db.read_replicas import ReadReplicaRouter
+
+
+def test_reads_following_writes_of_a_client_are_tracked_with_a_cookie():
+    primary = mock.Mock(**{"connect.return_value": "primary"})
+    replica = mock.Mock(**{"connect.return_value": "replica"})
+    router = ReadReplicaRouter(primary, [replica], read_your_writes_seconds=5)
+
+    def handler():
+        if request.args.get("write"):
+            router.record_write()
+        return router.connect_for_read()
+
+    client = app.test_client()
+    with mock.patch.dict(app.view_functions, {"health": handler}), mock.patch(
+        "time.time", return_value=1000
+    ):
+        assert client.get("/health").data == b"replica"
+        response = client.get("/health?write=true")
+        assert response.headers["Set-Cookie"].startswith(
+            "{}=1005; ".format(READ_PRIMARY_UNTIL_COOKIE)
+        )
+        assert "Max-Age=5" in response.headers["Set-Cookie"]
+        # The client sends the cookie back, whichever worker process serves its next requests
+        assert client.get("/health").data == b"primary"
+        assert app.test_client().get("/health").data == b"replica"
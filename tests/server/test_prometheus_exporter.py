@@ -0,0 +1,145 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+import requests
+import sqlalchemy
+from prometheus_client.parser import text_string_to_metric_families
+
+from mlflow.entities import Metric
+from mlflow.server import PROMETHEUS_EXPORTER_ENV_VAR
+from mlflow.server.prometheus_exporter import (
+    _SentBytesIterable,
+    instrument_engine,
+    instrument_store,
+)
+from mlflow.store.tracking.file_store import FileStore
+from mlflow.tracking import MlflowClient
+from mlflow.utils.file_utils import path_to_local_file_uri
+from tests.tracking.integration_test_utils import _await_server_down_or_die, _init_server
+
+
+@pytest.fixture
+def server_url(tmpdir):
+    backend_uri = "sqlite:///" + tmpdir.join("mlflow.db").strpath
+    artifact_root = tmpdir.mkdir("artifacts").strpath
+    metrics_dir = tmpdir.join("metrics").strpath
+    with mock.patch.dict(os.environ, {PROMETHEUS_EXPORTER_ENV_VAR: metrics_dir}):
+        url, process = _init_server(backend_uri, path_to_local_file_uri(artifact_root))
+    yield url
+    process.terminate()
+    _await_server_down_or_die(process)
+
+
+def _get_samples(url):
+    response = requests.get(url + "/metrics")
+    assert response.status_code == 200
+    return [
+        sample
+        for family in text_string_to_metric_families(response.text)
+        for sample in family.samples
+    ]
+
+
+def _get_value(samples, name, **labels):
+    values = [
+        sample.value
+        for sample in samples
+        if sample.name == name and all(sample.labels.get(k) == v for k, v in labels.items())
+    ]
+    assert values, "No sample {} with labels {}".format(name, labels)
+    return sum(values)
+
+
+def _await_response_size(url, path, expected):
+    # The size of streamed responses is recorded once the server closes them, which may happen
+    # after the client has read their body
+    for _ in range(50):
+        samples = _get_samples(url)
+        if _get_value(samples, "mlflow_response_size_bytes_sum", path=path) == expected:
+            return samples
+        time.sleep(0.1)
+    return samples
+
+
+def test_metrics_cover_endpoints_stores_pools_and_artifacts(server_url, tmpdir):
+    client = MlflowClient(server_url)
+    experiment_id = client.create_experiment("prometheus")
+    run_id = client.create_run(experiment_id).info.run_id
+    client.log_batch(run_id, metrics=[Metric("m", float(i), 0, i) for i in range(10)])
+    assert len(client.get_metric_history(run_id, "m")) == 10
+    local_path = tmpdir.join("artifact.txt")
+    local_path.write("x" * 1000)
+    client.log_artifact(run_id, local_path.strpath)
+    response = requests.get(
+        server_url + "/get-artifact", params={"run_id": run_id, "path": "artifact.txt"}
+    )
+    assert response.content == b"x" * 1000
+
+    samples = _await_response_size(server_url, "_get-artifact", 1000)
+    # Every endpoint is timed, not only a few of them
+    for path in ["runs_log-batch", "metrics_get-history"]:
+        assert (
+            _get_value(samples, "mlflow_requests_by_status_and_path_count", path=path, status="200")
+            == 1
+        )
+    assert _get_value(samples, "mlflow_request_size_bytes_sum", path="runs_log-batch") > 0
+    assert _get_value(samples, "mlflow_response_size_bytes_sum", path="metrics_get-history") > 0
+    assert _get_value(samples, "mlflow_response_size_bytes_sum", path="_get-artifact") == 1000
+    assert _get_value(samples, "mlflow_artifact_bytes_served_total", path="_get-artifact") == 1000
+    for method in ["create_run", "log_batch", "get_metric_history", "get_run"]:
+        duration_count = _get_value(
+            samples, "mlflow_store_method_duration_seconds_count", store="tracking", method=method
+        )
+        assert duration_count >= 1
+    assert _get_value(samples, "mlflow_sqlalchemy_pool_wait_seconds_count") > 0
+    # Connections are checked in once the requests are handled
+    assert _get_value(samples, "mlflow_sqlalchemy_pool_checked_out_connections") == 0
+    # The metrics endpoint itself is not timed
+    assert not any(sample.labels.get("path") == "metrics" for sample in samples)
+
+
+def test_sent_bytes_iterable_records_size_once_closed():
+    histogram, counter = mock.Mock(), mock.Mock()
+    iterable = mock.MagicMock()
+    iterable.__iter__.return_value = iter([b"abc", b"de"])
+    sent = _SentBytesIterable(iterable, histogram, counter)
+    assert b"".join(sent) == b"abcde"
+    histogram.observe.assert_not_called()
+    sent.close()
+    sent.close()
+    histogram.observe.assert_called_once_with(5)
+    assert counter.inc.call_count == 2
+    iterable.close.assert_called_once_with()
+
+
+def test_instrument_store_times_abstract_store_methods(tmpdir):
+    store = FileStore(tmpdir.join("mlruns").strpath)
+    instrumented = instrument_store(store)
+    assert instrumented.root_directory == store.root_directory
+    with mock.patch("mlflow.server.prometheus_exporter._STORE_METHOD_DURATION") as histogram:
+        experiments = instrumented.list_experiments()
+        assert [experiment.name for experiment in experiments] == ["Default"]
+        histogram.labels.assert_called_once_with("tracking", "list_experiments")
+        instrumented._get_experiment_path("0")
+        histogram.labels.assert_called_once_with("tracking", "list_experiments")
+    assert instrument_store(object) is object
+
+
+def test_instrument_engine_keeps_instrumenting_recreated_pools(tmpdir):
+    engine = sqlalchemy.create_engine("sqlite:///" + tmpdir.join("mlflow.db").strpath)
+    with mock.patch(
+        "mlflow.server.prometheus_exporter._POOL_CHECKED_OUT"
+    ) as checked_out, mock.patch("mlflow.server.prometheus_exporter._POOL_WAIT_TIME") as wait_time:
+        instrument_engine(engine)
+        for _ in range(3):
+            # Backend stores check out connections through sessions
+            session = sqlalchemy.orm.sessionmaker(bind=engine)()
+            session.execute("SELECT 1")
+            session.close()
+            # Replaces the pool of the engine
+            engine.dispose()
+    assert checked_out.labels.return_value.inc.call_count == 3
+    assert checked_out.labels.return_value.dec.call_count == 3
+    assert wait_time.labels.return_value.observe.call_count == 3
@@ -0,0 +1,217 @@
+import multiprocessing
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from mlflow.entities import FileInfo
+from mlflow.store.artifact.artifact_cache import (
+    ArtifactCache,
+    get_artifact_cache,
+    get_artifact_cache_key,
+    get_artifact_version,
+    is_artifact_repository_cacheable,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+
+def _write_file(content):
+    def download(dst_dir):
+        path = os.path.join(dst_dir, "file.txt")
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    return download
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_get_downloads_missing_entries_once(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    download = mock.Mock(side_effect=_write_file("content"))
+    for _ in range(3):
+        with cache.get("key", download) as path:
+            assert _read(path) == "content"
+    assert download.call_count == 1
+    assert cache.stats == (2, 1, 0)
+
+    with cache.lookup("key") as path:
+        assert _read(path) == "content"
+    with cache.lookup("other") as path:
+        assert path is None
+    assert cache.stats == (3, 2, 0)
+
+
+def test_get_caches_directories(tmpdir):
+    cache = ArtifactCache(tmpdir.join("cache").strpath)
+
+    def download(dst_dir):
+        os.makedirs(os.path.join(dst_dir, "model", "data"))
+        with open(os.path.join(dst_dir, "model", "data", "weights.bin"), "w") as f:
+            f.write("0123456789")
+        return os.path.join(dst_dir, "model")
+
+    with cache.get("key", download) as path:
+        assert os.listdir(path) == ["data"]
+        assert _read(os.path.join(path, "data", "weights.bin")) == "0123456789"
+    with open(os.path.join(cache.root, "entries", "key", "size")) as f:
+        assert f.read() == "10"
+
+
+def test_failed_downloads_are_not_cached(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    with pytest.raises(IOError, match="download failed"):
+        with cache.get("key", mock.Mock(side_effect=IOError("download failed"))):
+            pass
+    with cache.get("key", _write_file("content")) as path:
+        assert _read(path) == "content"
+    assert os.listdir(os.path.join(cache.root, "staging")) == []
+
+
+def test_least_recently_used_entries_are_evicted(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_bytes=20)
+    for key in ["a", "b"]:
+        with cache.get(key, _write_file("0123456789")):
+            pass
+    # Entries are marked as used with their modification time
+    time.sleep(0.01)
+    with cache.lookup("a"):
+        pass
+    with cache.get("c", _write_file("0123456789")):
+        pass
+    assert sorted(os.listdir(os.path.join(cache.root, "entries"))) == ["a", "c"]
+    assert cache.stats.evictions == 1
+
+    # Entries larger than the cache are evicted once read
+    with cache.get("d", _write_file("x" * 30)) as path:
+        assert _read(path) == "x" * 30
+    assert os.listdir(os.path.join(cache.root, "entries")) == []
+    assert cache.stats.evictions == 4
+
+
+def test_insert_keeps_existing_entries(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    for content in ["first", "second"]:
+        staging_dir = cache.mkdtemp()
+        _write_file(content)(staging_dir)
+        os.rename(os.path.join(staging_dir, "file.txt"), os.path.join(staging_dir, "content"))
+        cache.insert("key", staging_dir)
+        assert not os.path.exists(staging_dir)
+    with cache.lookup("key") as path:
+        assert _read(path) == "first"
+
+
+def test_eviction_waits_for_entries_being_read(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_bytes=1)
+    reading = threading.Event()
+    evicted = threading.Event()
+    cache.max_bytes = 100
+    with cache.get("key", _write_file("content")):
+        pass
+    cache.max_bytes = 1
+
+    def evict():
+        reading.wait()
+        cache.evict()
+        evicted.set()
+
+    thread = threading.Thread(target=evict)
+    thread.start()
+    with cache.lookup("key") as path:
+        reading.set()
+        assert not evicted.wait(0.2)
+        assert _read(path) == "content"
+    thread.join()
+    assert evicted.is_set()
+    assert os.listdir(os.path.join(cache.root, "entries")) == []
+
+
+def _get_from_process(root, results):
+    cache = ArtifactCache(root)
+
+    def download(dst_dir):
+        # Leave time for the other processes to wait for the entry
+        time.sleep(0.5)
+        results.put("downloaded")
+        return _write_file("content")(dst_dir)
+
+    with cache.get("key", download) as path:
+        results.put(_read(path))
+
+
+def test_concurrent_processes_download_entries_once(tmpdir):
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_get_from_process, args=(tmpdir.strpath, results))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert sorted(results.get() for _ in range(5)) == ["content"] * 4 + ["downloaded"]
+
+
+def test_get_artifact_cache_is_configured_by_environment_variables(tmpdir, monkeypatch):
+    monkeypatch.delenv("MLFLOW_ARTIFACT_CACHE_DIR", raising=False)
+    assert get_artifact_cache() is None
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.strpath)
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_MAX_BYTES", "100")
+    cache = get_artifact_cache()
+    assert get_artifact_cache() is cache
+    assert (cache.root, cache.max_bytes) == (tmpdir.strpath, 100)
+
+
+def test_get_artifact_cache_key():
+    s3_repo = S3ArtifactRepository("s3://bucket/path")
+    key = get_artifact_cache_key(s3_repo, "model", [10, "etag"])
+    assert len(key) == 64
+    other_repo = S3ArtifactRepository("s3://bucket/path")
+    assert get_artifact_cache_key(other_repo, "model/", [10, "etag"]) == key
+    assert get_artifact_cache_key(s3_repo, "model", [10, "other"]) != key
+    assert get_artifact_cache_key(s3_repo, "other", [10, "etag"]) != key
+
+    # runs:/ URIs are resolved to the artifact URI of the run
+    with mock.patch(
+        "mlflow.store.artifact.runs_artifact_repo.RunsArtifactRepository.get_underlying_uri",
+        return_value="s3://bucket/path",
+    ):
+        runs_repo = RunsArtifactRepository("runs:/1234/path")
+    assert get_artifact_cache_key(runs_repo, "model", [10, "etag"]) == key
+
+    assert is_artifact_repository_cacheable(runs_repo)
+
+    # Local artifacts are not cached
+    assert not is_artifact_repository_cacheable(LocalArtifactRepository("/tmp/path"))
+    assert get_artifact_cache_key(LocalArtifactRepository("/tmp/path"), "model", 10) is None
+
+
+def test_get_artifact_version():
+    repo = mock.MagicMock(spec=S3ArtifactRepository)
+    repo._is_directory.return_value = True
+    repo._list_artifacts_recursive.return_value = [
+        FileInfo("model/MLmodel", False, 10),
+        FileInfo("model/data", True, None),
+        FileInfo("model/a.bin", False, 20),
+    ]
+    assert get_artifact_version(repo, "model") == [["model/MLmodel", 10], ["model/a.bin", 20]]
+
+    repo._is_directory.return_value = False
+    repo.open_artifact_stream.return_value.__enter__.return_value.size = 10
+    repo.open_artifact_stream.return_value.__enter__.return_value.etag = "etag"
+    assert get_artifact_version(repo, "model/MLmodel") == [10, "etag"]
+
+    repo.open_artifact_stream.side_effect = NotImplementedError()
+    repo.list_artifacts.return_value = [FileInfo("model/MLmodel", False, 10)]
+    assert get_artifact_version(repo, "model/MLmodel") == 10
+    repo.list_artifacts.assert_called_with("model")
+    repo.list_artifacts.return_value = [FileInfo("model/MLmodel", False, None)]
+    assert get_artifact_version(repo, "model/MLmodel") is None
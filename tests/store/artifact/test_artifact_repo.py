@@ -1,8 +1,12 @@
+import os
 import posixpath
+import threading
+import time
 from unittest import mock
 import pytest
 
 from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.utils.file_utils import TempDir
 
@@ -67,3 +71,127 @@ def test_download_artifacts_handles_empty_dir(base_uri, download_arg, list_retur
         repo = ArtifactRepositoryImpl(base_uri)
         with TempDir() as tmp:
             repo.download_artifacts(download_arg, dst_path=tmp.path())
+
+
+class FakeLatencyArtifactRepository(ArtifactRepository):
+    """
+    Read-only artifact repository backed by a dictionary mapping file paths to contents, which
+    sleeps for ``latency`` seconds on every remote call.
+    """
+
+    def __init__(self, files, latency, failing_paths=()):
+        super().__init__("fake://")
+        self.files = files
+        self.latency = latency
+        self.failing_paths = failing_paths
+        self.lock = threading.Lock()
+        self.active_downloads = 0
+        self.max_active_downloads = 0
+
+    def log_artifact(self, local_file, artifact_path=None):
+        raise NotImplementedError()
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        raise NotImplementedError()
+
+    def list_artifacts(self, path):
+        time.sleep(self.latency)
+        prefix = path.rstrip("/") + "/" if path else ""
+        infos = {}
+        for file_path, content in self.files.items():
+            if file_path.startswith(prefix):
+                name = file_path[len(prefix) :].split("/")[0]
+                child_path = prefix + name
+                infos[child_path] = FileInfo(child_path, child_path != file_path, len(content))
+        return sorted(infos.values(), key=lambda f: f.path)
+
+    def _download_file(self, remote_file_path, local_path):
+        with self.lock:
+            self.active_downloads += 1
+            self.max_active_downloads = max(self.max_active_downloads, self.active_downloads)
+        try:
+            time.sleep(self.latency)
+            if remote_file_path in self.failing_paths:
+                raise IOError("Failed to fetch %s" % remote_file_path)
+            with open(local_path, "w") as f:
+                f.write(self.files[remote_file_path])
+        finally:
+            with self.lock:
+                self.active_downloads -= 1
+
+
+def _make_files(num_dirs, num_files_per_dir):
+    return {
+        "model/dir%d/file%d" % (d, f): "content %d %d" % (d, f)
+        for d in range(num_dirs)
+        for f in range(num_files_per_dir)
+    }
+
+
+def test_download_artifacts_downloads_files_concurrently(tmpdir):
+    files = _make_files(num_dirs=4, num_files_per_dir=10)
+    repo = FakeLatencyArtifactRepository(files, latency=0.05)
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS": "8"}):
+        start = time.time()
+        local_dir = repo.download_artifacts("model", dst_path=tmpdir.strpath)
+        elapsed = time.time() - start
+    assert local_dir == os.path.join(tmpdir.strpath, "model")
+    for file_path, content in files.items():
+        with open(os.path.join(tmpdir.strpath, file_path)) as f:
+            assert f.read() == content
+    assert repo.max_active_downloads == 8
+    # 40 sequential downloads would take at least 2 seconds
+    assert elapsed < 1.5
+
+
+def test_download_artifacts_respects_max_workers(tmpdir):
+    repo = FakeLatencyArtifactRepository(_make_files(num_dirs=2, num_files_per_dir=5), latency=0.01)
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS": "1"}):
+        repo.download_artifacts("model", dst_path=tmpdir.strpath)
+    assert repo.max_active_downloads == 1
+
+
+def test_download_artifacts_reports_all_failed_files(tmpdir):
+    files = _make_files(num_dirs=2, num_files_per_dir=3)
+    failing_paths = ["model/dir0/file1", "model/dir1/file2"]
+    repo = FakeLatencyArtifactRepository(files, latency=0, failing_paths=failing_paths)
+    with pytest.raises(MlflowException, match="Failed to download 2 of 6 artifacts") as exc:
+        repo.download_artifacts("model", dst_path=tmpdir.strpath)
+    for failing_path in failing_paths:
+        assert "Failed to fetch " + failing_path in exc.value.message
+    # The files that could be downloaded are still downloaded
+    assert os.path.exists(os.path.join(tmpdir.strpath, "model", "dir0", "file0"))
+
+
+def test_download_artifacts_rejects_invalid_max_workers(tmpdir):
+    repo = FakeLatencyArtifactRepository(_make_files(num_dirs=1, num_files_per_dir=2), latency=0)
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS": "0"}):
+        with pytest.raises(MlflowException, match="must be a positive integer"):
+            repo.download_artifacts("model", dst_path=tmpdir.strpath)
+
+
+def test_upload_files_tracks_progress_and_reports_all_failed_files(tmpdir):
+    local_files = []
+    for i in range(6):
+        local_file = tmpdir.join("file%d" % i)
+        local_file.write("x" * i)
+        local_files.append(local_file.strpath)
+    uploaded = {}
+
+    def upload_file(local_file, remote_path, progress):
+        if local_file.endswith(("file2", "file4")):
+            raise IOError("Failed to send %s" % remote_path)
+        uploaded[remote_path] = local_file
+        progress.update(os.path.getsize(local_file))
+
+    repo = FakeLatencyArtifactRepository({}, latency=0)
+    local_and_remote_paths = [(f, "dst/" + os.path.basename(f)) for f in local_files]
+    progress = repo._upload_files(upload_file, local_and_remote_paths[:2], max_workers=2)
+    assert (progress.transferred_files, progress.total_files) == (2, 2)
+    assert (progress.transferred_bytes, progress.total_bytes) == (1, 1)
+
+    with pytest.raises(MlflowException, match="Failed to upload 2 of 6 artifacts") as exc:
+        repo._upload_files(upload_file, local_and_remote_paths, max_workers=3)
+    assert "Failed to send dst/file2" in exc.value.message
+    assert "Failed to send dst/file4" in exc.value.message
+    assert len(uploaded) == 4
@@ -228,6 +228,9 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_not_blob_con
         f.write("hello world!")
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList(
+        [blob_props_1, blob_props_2]
+    )
     mock_client.get_container_client().download_blob().readinto.side_effect = create_file
 
     # Ensure that the root directory can be downloaded successfully
@@ -236,6 +239,10 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_not_blob_con
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+    # All the blobs under the directory are listed in a single request
+    mock_client.get_container_client().list_blobs.assert_called_once_with(
+        name_starts_with=TEST_ROOT_PATH + "/"
+    )
 
 
 def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_container_root(
@@ -279,6 +286,9 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
         f.write("hello world!")
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList(
+        [blob_props_1, blob_props_2]
+    )
     mock_client.get_container_client().download_blob().readinto.side_effect = create_file
 
     # Ensure that the root directory can be downloaded successfully
@@ -316,8 +326,38 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
             return MockBlobList([])
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList([bad_blob_props])
 
     with pytest.raises(MlflowException) as exc:
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_open_artifact_stream_downloads_byte_ranges_of_opened_version(mock_client):
+    from azure.core import MatchConditions
+    from azure.core.exceptions import ResourceNotFoundError
+
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blob_client = mock_client.get_container_client.return_value.get_blob_client.return_value
+    properties = BlobProperties(name="a.txt")
+    properties.size = 10
+    properties.etag = '"0x8D8F"'
+    blob_client.get_blob_properties.return_value = properties
+    blob_client.download_blob.return_value.chunks.return_value = iter([b"345", b"67"])
+
+    with repo.open_artifact_stream("a.txt") as stream:
+        assert (stream.size, stream.etag) == (10, "0x8D8F")
+        blob_client.download_blob.assert_not_called()
+        assert list(stream.read_range(3, 8)) == [b"345", b"67"]
+    mock_client.get_container_client.assert_called_with("container")
+    mock_client.get_container_client.return_value.get_blob_client.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "a.txt")
+    )
+    blob_client.download_blob.assert_called_once_with(
+        offset=3, length=5, etag='"0x8D8F"', match_condition=MatchConditions.IfNotModified
+    )
+
+    blob_client.get_blob_properties.side_effect = ResourceNotFoundError("not found")
+    with pytest.raises(MlflowException, match="No artifact file found"):
+        repo.open_artifact_stream("missing.txt")
@@ -6,6 +6,7 @@ from unittest import mock
 
 from google.cloud.storage import client as gcs_client
 
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
 from google.auth.exceptions import DefaultCredentialsError
@@ -157,6 +158,28 @@ def test_log_artifacts(gcs_mock, tmpdir):
     )
 
 
+def test_log_artifacts_reports_progress(gcs_mock, tmpdir):
+    progress_updates = []
+    repo = GCSArtifactRepository(
+        "gs://test_bucket/some/path",
+        gcs_mock,
+        max_upload_workers=2,
+        progress_callback=lambda p: progress_updates.append(
+            (p.transferred_files, p.transferred_bytes)
+        ),
+    )
+
+    subd = tmpdir.mkdir("data")
+    subd.join("a.txt").write("A")
+    subd.mkdir("nested").join("b.txt").write("BB")
+    repo.log_artifacts(subd.strpath)
+
+    gcs_mock.Client().bucket().blob.assert_has_calls(
+        [mock.call("some/path/a.txt"), mock.call("some/path/nested/b.txt")], any_order=True
+    )
+    assert max(progress_updates) == (2, 3)
+
+
 def test_download_artifacts_calls_expected_gcs_client_methods(gcs_mock, tmpdir):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
 
@@ -242,3 +265,31 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+def test_open_artifact_stream_downloads_byte_ranges_of_opened_generation(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    blob = gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value
+    blob.size = 10
+    blob.etag = "CJiR3w=="
+    blob.generation = 42
+    blob.download_as_bytes.side_effect = lambda start, end, **kwargs: b"0123456789"[start : end + 1]
+
+    with mock.patch(
+        "mlflow.store.artifact.gcs_artifact_repo._ARTIFACT_STREAM_CHUNK_SIZE", 4
+    ), repo.open_artifact_stream("a.txt") as stream:
+        assert (stream.size, stream.etag) == (10, "CJiR3w==")
+        blob.download_as_bytes.assert_not_called()
+        assert list(stream.read_range(1, 10)) == [b"1234", b"5678", b"9"]
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.assert_called_with("some/path/a.txt")
+    blob.download_as_bytes.assert_has_calls(
+        [
+            mock.call(start=1, end=4, if_generation_match=42),
+            mock.call(start=5, end=8, if_generation_match=42),
+            mock.call(start=9, end=9, if_generation_match=42),
+        ]
+    )
+
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value = None
+    with pytest.raises(MlflowException, match="No artifact file found"):
+        repo.open_artifact_stream("missing.txt")
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 from tempfile import NamedTemporaryFile
@@ -8,6 +9,7 @@ from unittest.mock import call, mock_open
 from pyarrow import HadoopFileSystem
 
 from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.hdfs_artifact_repo import (
     HdfsArtifactRepository,
     _resolve_base_path,
@@ -222,3 +224,28 @@ def test_delete_artifacts(hdfs_system_mock):
     repo = HdfsArtifactRepository("hdfs:/some_path/maybe/path")
     repo.delete_artifacts("artifacts")
     delete_mock.assert_called_once_with("/some_path/maybe/path/artifacts", recursive=True)
+
+
+@mock.patch("pyarrow.hdfs.HadoopFileSystem")
+def test_open_artifact_stream_reads_byte_ranges(hdfs_system_mock):
+    repo = HdfsArtifactRepository("hdfs://host_name:8020/hdfs/path")
+    hdfs = hdfs_system_mock.return_value
+    hdfs.exists.return_value = True
+    hdfs.isdir.return_value = False
+    hdfs.info.return_value = {"size": 10, "last_modified": 1600000000}
+    f = io.BytesIO(b"0123456789")
+    hdfs.open.return_value = f
+
+    with mock.patch(
+        "mlflow.store.artifact.hdfs_artifact_repo._ARTIFACT_STREAM_CHUNK_SIZE", 4
+    ), repo.open_artifact_stream("a.txt") as stream:
+        assert stream.size == 10
+        assert list(stream.read_range(1, 10)) == [b"1234", b"5678", b"9"]
+        hdfs.close.assert_not_called()
+    hdfs.open.assert_called_once_with("/hdfs/path/a.txt", "rb")
+    assert f.closed
+    hdfs.close.assert_called_once_with()
+
+    hdfs.isdir.return_value = True
+    with pytest.raises(MlflowException, match="No artifact file found"):
+        repo.open_artifact_stream("subdir")
@@ -1,6 +1,7 @@
 import os
 import pytest
 import posixpath
+from unittest import mock
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
@@ -187,3 +188,30 @@ def test_delete_artifacts(local_artifact_repo):
         assert os.path.exists(os.path.join(local_artifact_repo._artifact_dir, "b.txt"))
         local_artifact_repo.delete_artifacts()
         assert not os.path.exists(os.path.join(local_artifact_repo._artifact_dir))
+
+
+def test_open_artifact_stream_reads_byte_ranges(local_artifact_repo, local_artifact_root):
+    os.mkdir(os.path.join(local_artifact_root, "subdir"))
+    with open(os.path.join(local_artifact_root, "subdir", "a.txt"), "wb") as f:
+        f.write(b"0123456789")
+
+    with mock.patch(
+        "mlflow.store.artifact.local_artifact_repo._ARTIFACT_STREAM_CHUNK_SIZE", 4
+    ), local_artifact_repo.open_artifact_stream("subdir/a.txt") as stream:
+        assert stream.size == 10
+        assert list(stream.read_range()) == [b"0123", b"4567", b"89"]
+        assert list(stream.read_range(3, 8)) == [b"3456", b"7"]
+        assert list(stream.read_range(10)) == []
+        with pytest.raises(MlflowException, match="Invalid byte range"):
+            stream.read_range(5, 11)
+        etag = stream.etag
+
+    with open(os.path.join(local_artifact_root, "subdir", "a.txt"), "wb") as f:
+        f.write(b"01234567")
+    with local_artifact_repo.open_artifact_stream("subdir/a.txt") as stream:
+        assert stream.etag != etag
+
+    for path in ["subdir", "missing.txt"]:
+        with pytest.raises(MlflowException, match="No artifact file found") as exc:
+            local_artifact_repo.open_artifact_stream(path)
+        assert exc.value.error_code == "RESOURCE_DOES_NOT_EXIST"
@@ -1,9 +1,12 @@
 import os
 import posixpath
 import tarfile
+from unittest import mock
 
 import pytest
+from boto3.s3.transfer import TransferConfig
 
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 
@@ -247,3 +250,91 @@ def test_delete_artifacts(s3_artifact_root, tmpdir):
     repo.delete_artifacts()
     tmpdir_objects = repo.list_artifacts()
     assert not tmpdir_objects
+
+
+def test_log_artifacts_uploads_files_concurrently_and_reports_progress(s3_artifact_root, tmpdir):
+    subdir = tmpdir.mkdir("subdir")
+    for i in range(20):
+        subdir.join("file%d.txt" % i).write("x" * i)
+    subdir.mkdir("nested").join("big.bin").write("y" * (1024 * 1024))
+
+    progress_updates = []
+    repo = S3ArtifactRepository(
+        posixpath.join(s3_artifact_root, "some/path"),
+        max_upload_workers=4,
+        progress_callback=lambda p: progress_updates.append(
+            (p.transferred_files, p.transferred_bytes)
+        ),
+    )
+    upload_file = repo._upload_file
+    with mock.patch.object(repo, "_upload_file", wraps=upload_file) as upload_file_mock:
+        repo.log_artifacts(subdir.strpath)
+    assert upload_file_mock.call_count == 21
+
+    total_bytes = sum(range(20)) + 1024 * 1024
+    assert max(progress_updates) == (21, total_bytes)
+    assert sorted(f.path for f in repo.list_artifacts()) == sorted(
+        ["file%d.txt" % i for i in range(20)] + ["nested"]
+    )
+    downloaded_dir = repo.download_artifacts("nested")
+    assert os.path.getsize(os.path.join(downloaded_dir, "big.bin")) == 1024 * 1024
+
+
+def test_s3_client_keeps_a_connection_for_each_upload_thread(s3_artifact_root):
+    repo = S3ArtifactRepository(s3_artifact_root, max_upload_workers=32)
+    max_request_concurrency = repo._get_transfer_config().max_request_concurrency
+    client_config = repo._get_s3_client()._client_config
+    assert client_config.max_pool_connections == 32 * max_request_concurrency
+
+
+def test_log_artifact_uses_multipart_upload_with_transfer_config_env_vars(
+    s3_artifact_root, tmpdir, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_S3_MULTIPART_THRESHOLD", str(5 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_S3_MULTIPART_CHUNKSIZE", str(5 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_S3_MAX_CONCURRENCY", "3")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    transfer_config = repo._get_transfer_config()
+    assert transfer_config.multipart_threshold == 5 * 1024 * 1024
+    assert transfer_config.multipart_chunksize == 5 * 1024 * 1024
+    assert transfer_config.max_concurrency == 3
+
+    big_file = tmpdir.join("big.bin")
+    big_file.write("z" * (12 * 1024 * 1024))
+    repo.log_artifact(big_file.strpath)
+    bucket, _ = repo.parse_s3_uri(s3_artifact_root)
+    response = repo._get_s3_client().head_object(Bucket=bucket, Key="some/path/big.bin")
+    # Objects uploaded in parts have an ETag suffixed with the number of parts
+    assert response["ETag"].strip('"').endswith("-3")
+
+
+def test_transfer_config_passed_to_constructor_takes_precedence(monkeypatch):
+    monkeypatch.setenv("MLFLOW_S3_MAX_CONCURRENCY", "3")
+    transfer_config = TransferConfig(max_concurrency=7)
+    repo = S3ArtifactRepository("s3://bucket/path", transfer_config=transfer_config)
+    assert repo._get_transfer_config() is transfer_config
+
+
+def test_open_artifact_stream_reads_byte_ranges(s3_artifact_root, tmpdir):
+    file_path = os.path.join(str(tmpdir), "a.txt")
+    with open(file_path, "wb") as f:
+        f.write(b"0123456789")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(file_path, "subdir")
+
+    with repo.open_artifact_stream("subdir/a.txt") as stream:
+        assert stream.size == 10
+        assert stream.etag and '"' not in stream.etag
+        assert b"".join(stream.read_range()) == b"0123456789"
+        assert b"".join(stream.read_range(3, 8)) == b"34567"
+
+        # The ranges of a file overwritten since it was opened cannot be read
+        with open(file_path, "wb") as f:
+            f.write(b"abcdefghij")
+        repo.log_artifact(file_path, "subdir")
+        with pytest.raises(Exception, match="PreconditionFailed|412"):
+            b"".join(stream.read_range(3, 8))
+
+    for path in ["subdir", "missing.txt"]:
+        with pytest.raises(MlflowException, match="No artifact file found"):
+            repo.open_artifact_stream(path)
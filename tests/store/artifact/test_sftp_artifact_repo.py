@@ -1,3 +1,4 @@
+from unittest import mock
 from unittest.mock import MagicMock
 import pytest
 from tempfile import NamedTemporaryFile
@@ -170,3 +171,26 @@ def test_log_artifacts():
 
             with open(posixpath.join(remote_dir, directory, file2), "rb") as remote_content:
                 assert remote_content.read() == file_content_2
+
+
+@pytest.mark.large
+def test_download_files_closes_the_connections_of_worker_threads(tmpdir):
+    connections = []
+
+    def new_connection(**kwargs):
+        connections.append(MagicMock(autospec=pysftp.Connection))
+        return connections[-1]
+
+    with mock.patch("pysftp.Connection", side_effect=new_connection):
+        repo = SFTPArtifactRepository("sftp://test_sftp:22/some/path")
+        repo._download_files(
+            [("file{}".format(i), str(tmpdir.join("file{}".format(i)))) for i in range(4)]
+        )
+
+    repo_connection, *worker_connections = connections
+    assert worker_connections
+    assert sum(c.get.call_count for c in worker_connections) == 4
+    repo_connection.get.assert_not_called()
+    repo_connection.close.assert_not_called()
+    for connection in worker_connections:
+        connection.close.assert_called_once_with()
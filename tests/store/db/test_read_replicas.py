@@ -0,0 +1,101 @@
+import os
+from unittest import mock
+
+import pytest
+import sqlalchemy
+
+from mlflow.store.db import read_replicas
+from mlflow.store.db.read_replicas import ReadReplicaRouter
+
+
+@pytest.fixture(autouse=True)
+def reset_client_session():
+    yield
+    read_replicas.end_client_session()
+
+
+@pytest.fixture
+def engines(tmpdir):
+    return [
+        sqlalchemy.create_engine("sqlite:///" + os.path.join(tmpdir.strpath, name + ".db"))
+        for name in ["primary", "replica1", "replica2"]
+    ]
+
+
+def _read_engine(router):
+    connection = router.connect_for_read()
+    try:
+        return connection.engine
+    finally:
+        connection.close()
+
+
+def test_reads_are_spread_over_replicas(engines):
+    primary, replica1, replica2 = engines
+    router = ReadReplicaRouter(primary, [replica1, replica2], read_your_writes_seconds=0)
+    assert [_read_engine(router) for _ in range(4)] == [replica1, replica2, replica1, replica2]
+    router.record_write()
+    assert _read_engine(router) is replica1
+
+
+def test_reads_follow_writes_of_the_same_client_session(engines):
+    primary, replica, _ = engines
+    router = ReadReplicaRouter(primary, [replica], read_your_writes_seconds=5)
+    with mock.patch("time.time", return_value=1000):
+        read_replicas.start_client_session()
+        router.record_write()
+        assert read_replicas.get_client_session_read_primary_until() == 1005
+        assert _read_engine(router) is primary
+        read_replicas.start_client_session()
+        assert _read_engine(router) is replica
+        read_replicas.end_client_session()
+        assert _read_engine(router) is replica
+
+    # The client session is restored from its state, e.g. in another process
+    read_replicas.start_client_session(1005)
+    with mock.patch("time.time", return_value=1004.9):
+        assert _read_engine(router) is primary
+    with mock.patch("time.time", return_value=1005):
+        assert _read_engine(router) is replica
+
+
+def test_reads_follow_writes_of_the_process_without_client_session(engines):
+    primary, replica, _ = engines
+    router = ReadReplicaRouter(primary, [replica], read_your_writes_seconds=5)
+    with mock.patch("time.time", return_value=1000):
+        router.record_write()
+        assert read_replicas.get_client_session_read_primary_until() is None
+        assert _read_engine(router) is primary
+        read_replicas.start_client_session()
+        assert _read_engine(router) is replica
+        read_replicas.end_client_session()
+    with mock.patch("time.time", return_value=1005):
+        assert _read_engine(router) is replica
+
+
+def test_unreachable_replicas_are_not_used(tmpdir, engines):
+    primary, replica, _ = engines
+    unreachable = sqlalchemy.create_engine(
+        "sqlite:///" + os.path.join(tmpdir.strpath, "missing", "replica.db")
+    )
+    router = ReadReplicaRouter(
+        primary, [unreachable, replica], read_your_writes_seconds=0, unhealthy_seconds=30
+    )
+    with mock.patch("time.time", return_value=1000), mock.patch.object(
+        read_replicas._logger, "warning"
+    ) as mock_warning:
+        assert [_read_engine(router) for _ in range(4)] == [replica] * 4
+    mock_warning.assert_called_once()
+    assert "missing" in mock_warning.call_args[0][1]
+
+    router = ReadReplicaRouter(primary, [unreachable], read_your_writes_seconds=0)
+    with mock.patch("time.time", return_value=1000):
+        assert _read_engine(router) is primary
+    with mock.patch.object(unreachable, "connect", wraps=unreachable.connect) as mock_connect:
+        with mock.patch("time.time", return_value=1029):
+            assert _read_engine(router) is primary
+        mock_connect.assert_not_called()
+        # The replica is tried again once it has been unhealthy for ``unhealthy_seconds``
+        with mock.patch("time.time", return_value=1030):
+            assert _read_engine(router) is primary
+        mock_connect.assert_called_once()
@@ -0,0 +1,111 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from mlflow.store.db.sqlite_writer import SqliteWriter, get_sqlite_writer
+
+
+@contextmanager
+def _make_session():
+    yield "session"
+
+
+def test_get_sqlite_writer_is_shared_per_database():
+    assert get_sqlite_writer("/tmp/a.db") is get_sqlite_writer("/tmp/a.db")
+    assert get_sqlite_writer("/tmp/a.db") is not get_sqlite_writer("/tmp/b.db")
+
+
+def test_write_sessions_are_serialized():
+    writer = SqliteWriter()
+    active = []
+    overlaps = []
+
+    def write():
+        with writer.session(_make_session) as session:
+            assert session == "session"
+            overlaps.append(len(active))
+            active.append(1)
+            # Re-entering from the same thread does not deadlock
+            with writer.session(_make_session):
+                pass
+            active.pop()
+
+    threads = [threading.Thread(target=write) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == [0] * 20
+
+
+def _submit_concurrently(writer, operation, items):
+    """
+    Submit ``items`` from concurrent threads while a first group, ``[None]``, is being written.
+    """
+    first_group_started = threading.Event()
+    release_first_group = threading.Event()
+
+    def write(session, items):
+        if items == [None]:
+            first_group_started.set()
+            release_first_group.wait()
+        else:
+            operation(session, items)
+
+    results = {}
+
+    def submit(item):
+        try:
+            writer.submit(_make_session, write, item)
+            results[item] = None
+        except Exception as e:
+            results[item] = e
+
+    first = threading.Thread(target=submit, args=(None,))
+    first.start()
+    first_group_started.wait()
+    threads = [threading.Thread(target=submit, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    while len(writer._pending[write]) < len(items):
+        time.sleep(0.01)
+    release_first_group.set()
+    for thread in [first] + threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_submits_are_written_in_groups():
+    writer = SqliteWriter()
+    groups = []
+    _submit_concurrently(writer, lambda session, items: groups.append(items), [1, 2, 3, 4, 5])
+    assert len(groups) == 1
+    assert sorted(groups[0]) == [1, 2, 3, 4, 5]
+
+
+def test_groups_are_split_by_max_group_size():
+    writer = SqliteWriter(max_group_size=2)
+    groups = []
+    _submit_concurrently(writer, lambda session, items: groups.append(items), list(range(5)))
+    assert sorted(item for group in groups for item in group) == list(range(5))
+    assert [len(group) for group in groups] == [2, 2, 1]
+
+
+def test_failing_items_only_fail_their_submit():
+    writer = SqliteWriter()
+    writes = []
+
+    def operation(session, items):
+        if "bad" in items:
+            raise ValueError("bad item")
+        writes.extend(items)
+
+    results = _submit_concurrently(writer, operation, ["a", "bad", "b"])
+    assert sorted(writes) == ["a", "b"]
+    assert results["a"] is None and results["b"] is None
+    assert str(results["bad"]) == "bad item"
+
+    with pytest.raises(ValueError, match="bad item"):
+        writer.submit(_make_session, operation, "bad")
@@ -0,0 +1,103 @@
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from mlflow.store.db import store_cache
+from mlflow.store.db import utils as db_utils
+from mlflow.tracking import MlflowClient
+from mlflow.tracking._model_registry import utils as registry_utils
+from mlflow.tracking._tracking_service import utils as tracking_utils
+from mlflow.utils.file_utils import path_to_local_sqlite_uri
+
+
+@pytest.fixture(autouse=True)
+def clear_store_cache():
+    yield
+    store_cache.clear_stores()
+
+
+class _FakeStore(object):
+    def __init__(self, db_uri, *args):
+        self.db_uri = db_uri
+        self.args = args
+
+
+def test_get_or_create_store_returns_same_store_for_same_uri_and_args():
+    store = store_cache.get_or_create_store(_FakeStore, "mysql://host/db", "s3://bucket")
+    assert store_cache.get_or_create_store(_FakeStore, "mysql://host/db", "s3://bucket") is store
+    assert store_cache.get_or_create_store(_FakeStore, "mysql://host/db", "s3://other") is not store
+    assert store_cache.get_or_create_store(_FakeStore, "mysql://host/other") is not store
+
+
+def test_get_or_create_store_keys_relative_sqlite_paths_by_absolute_path(tmpdir):
+    with tmpdir.as_cwd():
+        store = store_cache.get_or_create_store(_FakeStore, "sqlite:///mlruns.db")
+        absolute_uri = path_to_local_sqlite_uri(os.path.join(tmpdir.strpath, "mlruns.db"))
+        assert store_cache.get_or_create_store(_FakeStore, absolute_uri) is store
+        tmpdir.mkdir("subdir").chdir()
+        assert store_cache.get_or_create_store(_FakeStore, "sqlite:///mlruns.db") is not store
+
+
+def test_get_or_create_store_does_not_cache_in_memory_sqlite_databases():
+    for db_uri in ["sqlite://", "sqlite:///:memory:"]:
+        store = store_cache.get_or_create_store(_FakeStore, db_uri)
+        assert store_cache.get_or_create_store(_FakeStore, db_uri) is not store
+
+
+def test_get_or_create_store_creates_store_once_for_concurrent_callers():
+    created = []
+    barrier = threading.Barrier(8)
+
+    class SlowStore(_FakeStore):
+        def __init__(self, db_uri, *args):
+            super().__init__(db_uri, *args)
+            created.append(self)
+
+    stores = []
+
+    def get_store():
+        barrier.wait()
+        stores.append(store_cache.get_or_create_store(SlowStore, "mysql://host/db"))
+
+    threads = [threading.Thread(target=get_store) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert all(store is created[0] for store in stores)
+
+
+def test_clear_stores_removes_stores_of_uri():
+    store = store_cache.get_or_create_store(_FakeStore, "mysql://host/db")
+    other_store = store_cache.get_or_create_store(_FakeStore, "mysql://host/other")
+    store_cache.clear_stores("mysql://host/db")
+    assert store_cache.get_or_create_store(_FakeStore, "mysql://host/db") is not store
+    assert store_cache.get_or_create_store(_FakeStore, "mysql://host/other") is other_store
+    store_cache.clear_stores()
+    assert store_cache.get_or_create_store(_FakeStore, "mysql://host/other") is not other_store
+
+
+def test_stores_created_before_fork_are_not_used_after_fork():
+    store = store_cache.get_or_create_store(_FakeStore, "mysql://host/db")
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        child_store = store_cache.get_or_create_store(_FakeStore, "mysql://host/db")
+        assert child_store is not store
+        assert store_cache.get_or_create_store(_FakeStore, "mysql://host/db") is child_store
+    # The parent's store is kept referenced so that its connections are not closed
+    assert store in store_cache._inherited_stores
+
+
+def test_clients_share_sqlalchemy_stores(tmpdir):
+    db_uri = path_to_local_sqlite_uri(os.path.join(tmpdir.strpath, "mlflow.db"))
+    with mock.patch(
+        "mlflow.store.db.utils._verify_schema", wraps=db_utils._verify_schema
+    ) as verify_schema_mock:
+        client = MlflowClient(tracking_uri=db_uri)
+        other_client = MlflowClient(tracking_uri=db_uri)
+        assert client._tracking_client.store is other_client._tracking_client.store
+        assert verify_schema_mock.call_count == 1
+    assert tracking_utils._get_store(db_uri) is client._tracking_client.store
+    assert registry_utils._get_store(db_uri) is registry_utils._get_store(db_uri)
@@ -1,6 +1,9 @@
 import os
 from unittest import mock, TestCase
 
+import pytest
+
+from mlflow.exceptions import MlflowException
 from mlflow.store.db import utils
 
 
@@ -78,3 +81,38 @@ class TestCreateSqlAlchemyEngineWithRetry(TestCase):
                             mock_create_sqlalchemy_engine.mock_calls
                             == [mock.call("mydb://host:port/")] * utils.MAX_RETRY_COUNT
                         )
+
+
+def test_create_sqlalchemy_engine_configures_sqlite_for_concurrent_writes(tmpdir):
+    db_uri = "sqlite:///" + tmpdir.join("mlflow.db").strpath
+    with mock.patch.dict(os.environ, {}):
+        engine = utils.create_sqlalchemy_engine(db_uri)
+    with engine.connect() as connection:
+        assert connection.execute("PRAGMA journal_mode").scalar() == "wal"
+        # NORMAL
+        assert connection.execute("PRAGMA synchronous").scalar() == 1
+        assert connection.execute("PRAGMA busy_timeout").scalar() == 30000
+        assert connection.connection.isolation_level == "IMMEDIATE"
+
+    with mock.patch.dict(
+        os.environ,
+        {
+            "MLFLOW_SQLALCHEMYSTORE_SQLITE_BUSY_TIMEOUT": "2.5",
+            "MLFLOW_SQLALCHEMYSTORE_SQLITE_JOURNAL_MODE": "delete",
+        },
+    ):
+        engine = utils.create_sqlalchemy_engine(db_uri)
+    with engine.connect() as connection:
+        assert connection.execute("PRAGMA journal_mode").scalar() == "delete"
+        assert connection.execute("PRAGMA busy_timeout").scalar() == 2500
+
+    with mock.patch.dict(os.environ, {}):
+        engine = utils.create_sqlalchemy_engine(db_uri + "?timeout=1")
+    with engine.connect() as connection:
+        assert connection.execute("PRAGMA busy_timeout").scalar() == 1000
+
+
+def test_create_sqlalchemy_engine_rejects_invalid_sqlite_journal_mode():
+    with mock.patch.dict(os.environ, {"MLFLOW_SQLALCHEMYSTORE_SQLITE_JOURNAL_MODE": "WAL; --"}):
+        with pytest.raises(MlflowException, match="Invalid value 'WAL; --'"):
+            utils.create_sqlalchemy_engine("sqlite:///mlflow.db")
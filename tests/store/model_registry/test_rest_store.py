@@ -35,7 +35,7 @@ from mlflow.utils.rest_utils import MlflowHostCreds
 
 @pytest.fixture(scope="class")
 def request_fixture():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         response = mock.MagicMock
         response.status_code = 200
         response.text = "{}"
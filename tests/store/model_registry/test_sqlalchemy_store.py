@@ -1,4 +1,5 @@
 import os
+import shutil
 import unittest
 
 import tempfile
@@ -21,6 +22,11 @@ from mlflow.protos.databricks_pb2 import (
     INVALID_PARAMETER_VALUE,
     RESOURCE_ALREADY_EXISTS,
 )
+from mlflow.store.db import read_replicas
+from mlflow.store.db.utils import (
+    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS,
+    MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS,
+)
 from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
 from tests.helper_functions import random_str
 
@@ -1280,3 +1286,32 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         with self.assertRaises(MlflowException) as exception_context:
             self.store.delete_model_version_tag(name1, "I am not a version", "key")
         assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_read_only_queries_are_served_by_read_replicas(self):
+        self._rm_maker("replicated")
+        self.store.engine.dispose()
+        fd, replica_dbfile = tempfile.mkstemp()
+        os.close(fd)
+        # Replicate the primary database with a copy, which does not receive the subsequent writes
+        shutil.copyfile(self.temp_dbfile, replica_dbfile)
+        env = {
+            MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS: DB_URI + replica_dbfile,
+            MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS: "5",
+        }
+        try:
+            with mock.patch.dict(os.environ, env):
+                store = self._get_store(self.db_url)
+            with mock.patch("time.time", return_value=1000):
+                read_replicas.start_client_session()
+                store.create_registered_model("model")
+                self.assertEqual(store.get_registered_model("model").name, "model")
+                read_replicas.start_client_session()
+                with self.assertRaises(MlflowException) as exception_context:
+                    store.get_registered_model("model")
+                assert exception_context.exception.error_code == ErrorCode.Name(
+                    RESOURCE_DOES_NOT_EXIST
+                )
+                self.assertEqual(store.get_registered_model("replicated").name, "replicated")
+        finally:
+            read_replicas.end_client_session()
+            os.remove(replica_dbfile)
@@ -1,8 +1,15 @@
 import json
+import math
 
-from mlflow.entities import RunTag
+import pytest
+
+from mlflow.entities import Metric, RunTag
+from mlflow.exceptions import MlflowException
 from mlflow.models import Model
+from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST
+from mlflow.utils.metric_sampling import SAMPLING_METHODS, sample_metric_history
 from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
+from mlflow.utils.validation import MAX_TAG_VAL_LENGTH
 
 
 class AbstractStoreTest(object):
@@ -51,6 +58,120 @@ class AbstractStoreTest(object):
         with self.assertRaises(TypeError):
             store.record_logged_model(run_id, m.to_dict())
 
+    def test_delete_logged_models_tag(self):
+        store = self.get_store()
+        run_id = self.create_test_run().info.run_id
+        store.set_tag(run_id, RunTag(MLFLOW_LOGGED_MODELS, json.dumps([])))
+        store.record_logged_model(run_id, Model(artifact_path="model", flavors={"tf": {}}))
+        store.delete_tag(run_id, MLFLOW_LOGGED_MODELS)
+        assert MLFLOW_LOGGED_MODELS not in store.get_run(run_id).data.tags
+        # Models that were only recorded outside of the tag are deleted too
+        store.record_logged_model(run_id, Model(artifact_path="model", flavors={"tf": {}}))
+        store.delete_tag(run_id, MLFLOW_LOGGED_MODELS)
+        assert MLFLOW_LOGGED_MODELS not in store.get_run(run_id).data.tags
+        with pytest.raises(MlflowException, match="No tag with name"):
+            store.delete_tag(run_id, MLFLOW_LOGGED_MODELS)
+
+    def test_record_logged_model_beyond_tag_value_limit(self):
+        store = self.get_store()
+        run_id = self.create_test_run().info.run_id
+        models = [
+            Model(artifact_path="model%s" % i, run_id=run_id, flavors={"f": {"data": "x" * 100}})
+            for i in range(100)
+        ]
+        for m in models:
+            store.record_logged_model(run_id, m)
+        value = json.dumps([m.to_dict() for m in models])
+        assert len(value) > MAX_TAG_VAL_LENGTH
+        assert store.get_run(run_id).data.tags == {MLFLOW_LOGGED_MODELS: value}
+
+    def test_get_metric_history_sampling(self):
+        store = self.get_store()
+        run_id = self.create_test_run().info.run_id
+        # Values with ties and NaN values, logged out of order
+        history = [
+            Metric("m", float("nan") if i % 11 == 0 else float(i * 7 % 13), 1000 - i, i // 2)
+            for i in reversed(range(300))
+        ]
+        store.log_batch(run_id, metrics=history, params=[], tags=[])
+
+        def logged(metrics):
+            return [
+                (m.key, None if math.isnan(m.value) else m.value, m.timestamp, m.step)
+                for m in metrics
+            ]
+
+        assert logged(store.get_metric_history(run_id, "m", max_results=300)) == logged(
+            sample_metric_history(history, None, None)
+        )
+        for sampling in SAMPLING_METHODS:
+            for max_results in [3, 10, 299, 1000]:
+                sampled = store.get_metric_history(run_id, "m", max_results, sampling)
+                assert len(sampled) <= max_results
+                assert logged(sampled) == logged(
+                    sample_metric_history(history, max_results, sampling)
+                )
+        with pytest.raises(MlflowException, match="Invalid sampling method"):
+            store.get_metric_history(run_id, "m", max_results=10, sampling="median")
+
+    def test_get_metric_history_bulk(self):
+        store = self.get_store()
+        experiment_id = self.create_test_run().info.experiment_id
+        run_ids = [store.create_run(experiment_id, "user", 0, []).info.run_id for _ in range(3)]
+        histories = {
+            (run_id, key): [
+                Metric(key, float("nan") if i % 11 == 0 else float(i * j % 13), 1000 - i, i // 2)
+                for i in reversed(range(100 * j))
+            ]
+            for j, run_id in enumerate(run_ids)
+            for key in ["a", "b"]
+            if j > 0
+        }
+        for (run_id, _), history in histories.items():
+            store.log_batch(run_id, metrics=history, params=[], tags=[])
+
+        def logged(metrics):
+            return [
+                (m.key, None if math.isnan(m.value) else m.value, m.timestamp, m.step)
+                for m in metrics
+            ]
+
+        for start_step, end_step, max_results, sampling in [
+            (None, None, None, None),
+            (10, None, None, None),
+            (None, 60, 20, None),
+            (10, 60, 20, "min_max"),
+            (10, 10, 20, "every_nth"),
+        ]:
+            result = store.get_metric_history_bulk(
+                run_ids[::-1] + run_ids[:1],
+                ["b", "a", "c"],
+                start_step=start_step,
+                end_step=end_step,
+                max_results=max_results,
+                sampling=sampling,
+            )
+            assert list(result) == run_ids[::-1]
+            for run_id in run_ids:
+                assert list(result[run_id]) == ["b", "a", "c"]
+                assert result[run_id]["c"] == []
+                for key in ["a", "b"]:
+                    expected = sample_metric_history(
+                        histories.get((run_id, key), []),
+                        max_results,
+                        sampling,
+                        start_step,
+                        end_step,
+                    )
+                    assert logged(result[run_id][key]) == logged(expected)
+        with pytest.raises(MlflowException, match="between 1 and 100 metric keys"):
+            store.get_metric_history_bulk(run_ids, [])
+        with pytest.raises(MlflowException, match="start_step 2 is greater than end_step 1"):
+            store.get_metric_history_bulk(run_ids, ["a"], start_step=2, end_step=1)
+        with pytest.raises(MlflowException) as e:
+            store.get_metric_history_bulk(run_ids + ["unknown-run-id"], ["a"])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
     @staticmethod
     def _verify_logged(store, run_id, metrics, params, tags):
         run = store.get_run(run_id)
@@ -1,9 +1,13 @@
 from unittest import mock
 
+import pytest
+
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.store.tracking.abstract_store import AbstractStore
-from mlflow.entities import ViewType
+from mlflow.entities import Metric, ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
 
 
 class AbstractStoreTestImpl(AbstractStore):
@@ -152,3 +156,39 @@ def test_search_runs():
         store._search_runs.assert_called_once_with(
             [experiment_id], None, view_type, SEARCH_MAX_RESULTS_DEFAULT, None, None
         )
+
+
+def test_get_metric_history_bulk():
+    histories = {
+        ("r1", "a"): [Metric("a", 1.0, 0, 2), Metric("a", 2.0, 0, 1), Metric("a", 3.0, 0, 0)],
+        ("r1", "b"): [],
+        ("r2", "a"): [Metric("a", 4.0, 0, 5)],
+        ("r2", "b"): [Metric("b", 5.0, 0, 1)],
+    }
+
+    def get_metric_history(run_id, metric_key):
+        return histories[(run_id, metric_key)]
+
+    def get_run(run_id):
+        if run_id not in ["r1", "r2"]:
+            raise MlflowException("Run not found", RESOURCE_DOES_NOT_EXIST)
+
+    with mock.patch.object(
+        AbstractStoreTestImpl, "get_metric_history", side_effect=get_metric_history
+    ), mock.patch.object(AbstractStoreTestImpl, "get_run", side_effect=get_run):
+        store = AbstractStoreTestImpl()
+        result = store.get_metric_history_bulk(["r2", "r1"], ["a", "b"], start_step=1)
+        assert list(result) == ["r2", "r1"]
+        assert {
+            (run_id, key): [(m.value, m.step) for m in metrics]
+            for run_id, run_histories in result.items()
+            for key, metrics in run_histories.items()
+        } == {
+            ("r1", "a"): [(2.0, 1), (1.0, 2)],
+            ("r1", "b"): [],
+            ("r2", "a"): [(4.0, 5)],
+            ("r2", "b"): [(5.0, 1)],
+        }
+        assert store.get_metric_history.call_count == 4
+        with pytest.raises(MlflowException, match="Run not found"):
+            store.get_metric_history_bulk(["r1", "r3"], ["a"])
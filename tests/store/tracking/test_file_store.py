@@ -1,4 +1,6 @@
 #!/usr/bin/env python
+import json
+import math
 import os
 import posixpath
 import random
@@ -22,9 +24,13 @@ from mlflow.entities import (
     ExperimentTag,
 )
 from mlflow.exceptions import MlflowException, MissingConfigException
+from mlflow.models import Model
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import file_store, file_store_index
 from mlflow.store.tracking.file_store import FileStore
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.file_utils import write_yaml, read_yaml, path_to_local_file_uri, TempDir
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 from mlflow.protos.databricks_pb2 import (
     ErrorCode,
     RESOURCE_DOES_NOT_EXIST,
@@ -667,6 +673,94 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         assert [r.info.run_id for r in result] == runs[8:]
         assert result.token is None
 
+    def test_search_runs_with_filter_and_order_by_pagination(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_runs_with_filter_and_order_by_pagination")
+        runs = []
+        for i in range(12):
+            run_id = fs.create_run(exp, "user", i, []).info.run_id
+            if i % 4 != 0:
+                fs.log_metric(run_id, Metric("loss", i % 3, 0, 0))
+            fs.log_param(run_id, Param("p", "even" if i % 2 == 0 else "odd"))
+            fs.set_tag(run_id, RunTag("t", str(i)))
+            runs.append(fs.get_run(run_id))
+        filter_string = "params.p = 'even'"
+        order_by = ["metrics.loss DESC", "tags.t"]
+        expected = [
+            r.info.run_id
+            for r in SearchUtils.sort(SearchUtils.filter(runs, filter_string), order_by)
+        ]
+        assert len(expected) == 6
+
+        result = fs.search_runs([exp], filter_string, ViewType.ALL, 4, order_by)
+        assert [r.info.run_id for r in result] == expected[:4]
+        assert result.token is not None
+        result = fs.search_runs([exp], filter_string, ViewType.ALL, 4, order_by, result.token)
+        assert [r.info.run_id for r in result] == expected[4:]
+        assert result.token is None
+        # The returned runs contain all of their metrics, params and tags
+        assert [r.to_dictionary() for r in result] == [
+            fs.get_run(run_id).to_dictionary() for run_id in expected[4:]
+        ]
+
+    def test_search_runs_keyset_pagination_matches_unpaginated_search(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_runs_keyset_pagination")
+        for i, x in enumerate([0.0, float("nan"), None, float("inf"), -1.0, 0.0, float("nan")]):
+            run_id = fs.create_run(exp, "user", i % 3, []).info.run_id
+            if x is not None:
+                fs.log_metric(run_id, Metric("x", x, 0, 0))
+            fs.log_param(run_id, Param("p", str(i % 2)))
+
+        for order_by in [None, ["metrics.x"], ["metrics.x DESC", "params.p"]]:
+            result = fs.search_runs([exp], None, ViewType.ALL, 10, order_by)
+            expected = [r.info.run_id for r in result]
+            run_ids = []
+            result = fs.search_runs([exp], None, ViewType.ALL, 2, order_by)
+            run_ids.extend(r.info.run_id for r in result)
+            while result.token is not None:
+                result = fs.search_runs([exp], None, ViewType.ALL, 2, order_by, result.token)
+                run_ids.extend(r.info.run_id for r in result)
+            assert run_ids == expected
+
+    def test_search_runs_pagination_with_offset_page_token_and_concurrent_runs(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_runs_pagination_with_offset_page_token")
+        runs = [fs.create_run(exp, "user", i, []).info.run_id for i in range(5)]
+        # Offset tokens created by previous versions of MLflow are still accepted
+        offset_token = SearchUtils.create_page_token(1)
+        result = fs.search_runs([exp], None, ViewType.ALL, 2, None, offset_token)
+        assert [r.info.run_id for r in result] == runs[3:1:-1]
+        # A run that is ordered before the runs of the next page does not shift them
+        fs.create_run(exp, "user", 10, [])
+        result = fs.search_runs([exp], None, ViewType.ALL, 2, None, result.token)
+        assert [r.info.run_id for r in result] == runs[1::-1]
+        assert result.token is None
+
+    def test_search_runs_only_reads_runs_on_page(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_runs_only_reads_runs_on_page")
+        for i in range(10):
+            run_id = fs.create_run(exp, "user", i, []).info.run_id
+            fs.log_metric(run_id, Metric("m", i, 0, 0))
+            fs.log_param(run_id, Param("unused", "value"))
+
+        with mock.patch.object(
+            FileStore, "_get_run_from_info", wraps=fs._get_run_from_info
+        ) as get_run_mock, mock.patch.object(
+            FileStore, "_get_param_from_file", wraps=fs._get_param_from_file
+        ) as get_param_mock:
+            result = fs.search_runs([exp], "attributes.status = 'RUNNING'", ViewType.ALL, 3)
+            assert get_run_mock.call_count == 3
+            assert get_param_mock.call_count == 3
+            get_run_mock.reset_mock()
+            get_param_mock.reset_mock()
+            result = fs.search_runs([exp], "metrics.m >= 5", ViewType.ALL, 2, ["metrics.m ASC"])
+            assert get_run_mock.call_count == 2
+            assert get_param_mock.call_count == 2
+        assert [r.data.metrics["m"] for r in result] == [5, 6]
+        assert all(r.data.params == {"unused": "value"} for r in result)
+
     def test_weird_param_names(self):
         WEIRD_PARAM_NAME = "this is/a weird/but valid param"
         fs = FileStore(self.test_root)
@@ -1053,3 +1147,136 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         run = self._create_run(fs)
         fs.log_batch(run.info.run_id, metrics=[], params=[], tags=[])
         self._verify_logged(fs, run.info.run_id, metrics=[], params=[], tags=[])
+
+    def test_record_logged_model_appends_to_logged_models_file(self):
+        fs = FileStore(self.test_root)
+        run = self._create_run(fs)
+        run_id = run.info.run_id
+        models = [
+            Model(artifact_path="model%s" % i, run_id=run_id, flavors={"f": {"i": i}})
+            for i in range(3)
+        ]
+        # Models recorded in the tag by older versions of MLflow are listed first
+        fs.set_tag(run_id, RunTag(MLFLOW_LOGGED_MODELS, json.dumps([models[0].to_dict()])))
+        for model in models[1:]:
+            fs.record_logged_model(run_id, model)
+
+        run_dir = fs._get_run_dir(run.info.experiment_id, run_id)
+        with open(os.path.join(run_dir, FileStore.LOGGED_MODELS_FILE_NAME)) as f:
+            assert [json.loads(line) for line in f] == [m.to_dict() for m in models[1:]]
+        expected_tag = RunTag(MLFLOW_LOGGED_MODELS, json.dumps([m.to_dict() for m in models]))
+        self._verify_logged(fs, run_id, metrics=[], params=[], tags=[expected_tag])
+        assert fs.get_all_tags(run_id) == [expected_tag]
+        (searched_run,) = [
+            r
+            for r in fs.search_runs([run.info.experiment_id], None, ViewType.ALL)
+            if r.info.run_id == run_id
+        ]
+        assert searched_run.data.tags[MLFLOW_LOGGED_MODELS] == expected_tag.value
+
+    def test_search_runs_filters_on_logged_models_tag(self):
+        fs = FileStore(self.test_root)
+        experiment_id = fs.create_experiment("test_search_runs_filters_on_logged_models_tag")
+        run_ids = [fs.create_run(experiment_id, "user", 0, []).info.run_id for _ in range(3)]
+        fs.record_logged_model(run_ids[0], Model(artifact_path="model", flavors={"sklearn": {}}))
+        fs.record_logged_model(run_ids[1], Model(artifact_path="model", flavors={"keras": {}}))
+        fs.set_tag(run_ids[2], RunTag(MLFLOW_LOGGED_MODELS, "set by sklearn"))
+
+        def search(filter_string, order_by=None):
+            runs = fs.search_runs([experiment_id], filter_string, ViewType.ALL, order_by=order_by)
+            return [r.info.run_id for r in runs]
+
+        tag = "tags.`{}`".format(MLFLOW_LOGGED_MODELS)
+        assert sorted(search("{} LIKE '%sklearn%'".format(tag))) == sorted([run_ids[0], run_ids[2]])
+        assert search("{} ILIKE '%KERAS%'".format(tag)) == [run_ids[1]]
+        assert search("{} LIKE '%pytorch%'".format(tag)) == []
+        assert search(None, order_by=["{} DESC".format(tag)]) == run_ids[::-1]
+
+
+class TestFileStoreWithRunIndex(TestFileStore):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {file_store_index._RUN_INDEX_ENV_VAR: "true"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def _assert_run_is_invalid_after_rebuild(self, fs, experiment_id, bad_run_id, all_run_ids):
+        # The run index is not updated when run directories are modified by other means
+        assert len(self._search(fs, experiment_id)) == len(all_run_ids)
+        assert fs._rebuild_run_index(experiment_id) == len(all_run_ids) - 1
+        with pytest.raises(MlflowException):
+            fs.get_run(bad_run_id)
+        assert len(self._search(fs, experiment_id)) == len(all_run_ids) - 1
+        for rid in all_run_ids:
+            if rid != bad_run_id:
+                fs.get_run(rid)
+
+    def test_malformed_run(self):
+        fs = FileStore(self.test_root)
+        exp_id = FileStore.DEFAULT_EXPERIMENT_ID
+        all_run_ids = self.exp_data[exp_id]["runs"]
+        assert len(self._search(fs, exp_id)) == len(all_run_ids)
+
+        bad_run_id = all_run_ids[0]
+        os.remove(os.path.join(self.test_root, exp_id, bad_run_id, "meta.yaml"))
+        self._assert_run_is_invalid_after_rebuild(fs, exp_id, bad_run_id, all_run_ids)
+
+    def test_bad_experiment_id_recorded_for_run(self):
+        fs = FileStore(self.test_root)
+        exp_id = FileStore.DEFAULT_EXPERIMENT_ID
+        all_run_ids = self.exp_data[exp_id]["runs"]
+        assert len(self._search(fs, exp_id)) == len(all_run_ids)
+
+        bad_run_id = all_run_ids[0]
+        path = os.path.join(self.test_root, exp_id, bad_run_id)
+        run_data = read_yaml(path, "meta.yaml")
+        run_data["experiment_id"] = 1
+        write_yaml(path, "meta.yaml", run_data, True)
+        self._assert_run_is_invalid_after_rebuild(fs, exp_id, bad_run_id, all_run_ids)
+
+    def test_run_index_is_maintained_incrementally(self):
+        fs = FileStore(self.test_root)
+        exp_id = fs.create_experiment("test_run_index_is_maintained_incrementally")
+        run_id = fs.create_run(exp_id, "user", 0, []).info.run_id
+        fs.log_metric(run_id, Metric("m", 2, 0, 1))
+        fs.log_metric(run_id, Metric("m", 1, 0, 0))
+        metrics = [Metric("m", 3, 0, 2), Metric("n", float("nan"), 0, 0)]
+        fs.log_batch(run_id, metrics=metrics, params=[], tags=[])
+        fs.update_run_info(run_id, RunStatus.FINISHED, 10)
+        fs.delete_run(run_id)
+
+        run_index = fs._get_run_index(exp_id)
+        run_info = run_index.get_run_info(run_id)
+        assert run_info == fs._get_run_info_from_dir(os.path.join(self.test_root, exp_id, run_id))
+        assert run_info.status == RunStatus.to_string(RunStatus.FINISHED)
+        assert run_info.lifecycle_stage == LifecycleStage.DELETED
+        latest_metrics = {m.key: m for m in run_index.get_latest_metrics(["m", "n"])[run_id]}
+        assert latest_metrics["m"].value == 3 and latest_metrics["m"].step == 2
+        assert math.isnan(latest_metrics["n"].value)
+        assert fs._run_location_index.get_experiment_id(run_id) == exp_id
+
+        # Runs are located and searched without walking the run directories or reading meta.yaml
+        with mock.patch(
+            FILESTORE_PACKAGE + ".find", wraps=file_store.find
+        ) as find_mock, mock.patch.object(
+            FileStore, "_get_run_info_from_dir", side_effect=Exception("unexpected read")
+        ):
+            assert fs.get_run(run_id).info == run_info
+            runs = fs.search_runs([exp_id], "metrics.m > 2", ViewType.ALL)
+            assert [r.info.run_id for r in runs] == [run_id]
+        assert all(call[0][1] != run_id for call in find_mock.call_args_list)
+
+        fs._hard_delete_run(run_id)
+        assert run_index.get_run_info(run_id) is None
+        assert fs._run_location_index.get_experiment_id(run_id) is None
+
+    def test_run_index_is_built_for_existing_runs(self):
+        with mock.patch.dict(os.environ, {file_store_index._RUN_INDEX_ENV_VAR: "false"}):
+            fs = FileStore(self.test_root)
+            exp_id = fs.create_experiment("test_run_index_is_built_for_existing_runs")
+            run_id = fs.create_run(exp_id, "user", 0, []).info.run_id
+            fs.log_metric(run_id, Metric("m", 1, 0, 0))
+        fs = FileStore(self.test_root)
+        runs = fs.search_runs([exp_id], "metrics.m = 1", ViewType.ALL)
+        assert [r.info.run_id for r in runs] == [run_id]
+        assert fs._get_run_index(exp_id).get_run_info(run_id) is not None
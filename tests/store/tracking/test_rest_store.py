@@ -21,6 +21,8 @@ from mlflow.protos.service_pb2 import (
     CreateRun,
     DeleteExperiment,
     DeleteRun,
+    GetMetricHistory,
+    GetMetricHistoryBulk,
     LogBatch,
     LogMetric,
     LogParam,
@@ -57,7 +59,7 @@ class CustomErrorHandlingRestStore(RestStore):
 
 
 class TestRestStore(object):
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_successful_http_request(self, request):
         def mock_request(**kwargs):
             # Filter out None arguments
@@ -80,7 +82,7 @@ class TestRestStore(object):
         experiments = store.list_experiments()
         assert experiments[0].name == "Exp!"
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -92,7 +94,7 @@ class TestRestStore(object):
             store.list_experiments()
         assert "RESOURCE_DOES_NOT_EXIST: No experiment" in str(cm.value)
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request_custom_handler(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -103,7 +105,7 @@ class TestRestStore(object):
         with pytest.raises(MyCoolException):
             store.list_experiments()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_response_with_unknown_fields(self, request):
         experiment_json = {
             "experiment_id": "1",
@@ -139,7 +141,7 @@ class TestRestStore(object):
     def _verify_requests(self, http_request, host_creds, endpoint, method, json_body):
         http_request.assert_any_call(**(self._args(host_creds, endpoint, method, json_body)))
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_requestor(self, request):
         response = mock.MagicMock
         response.status_code = 200
@@ -310,6 +312,77 @@ class TestRestStore(object):
                 mock_http, creds, "runs/log-model", "POST", message_to_json(expected_message)
             )
 
+    def test_get_metric_history(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            response = mock.MagicMock
+            response.text = '{"metrics": [{"key": "m", "value": 0.5, "timestamp": 1, "step": 2}]}'
+            mock_http.return_value = response
+            result = store.get_metric_history("u2", "m", max_results=100, sampling="min_max")
+            expected_message = GetMetricHistory(
+                run_uuid="u2", run_id="u2", metric_key="m", max_results=100, sampling="min_max"
+            )
+            self._verify_requests(
+                mock_http, creds, "metrics/get-history", "GET", message_to_json(expected_message)
+            )
+            assert [(m.key, m.value, m.timestamp, m.step) for m in result] == [("m", 0.5, 1, 2)]
+
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            mock_http.return_value = response
+            store.get_metric_history("u2", "m")
+            expected_message = GetMetricHistory(run_uuid="u2", run_id="u2", metric_key="m")
+            self._verify_requests(
+                mock_http, creds, "metrics/get-history", "GET", message_to_json(expected_message)
+            )
+
+    def test_get_metric_history_bulk(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            response = mock.MagicMock
+            response.status_code = 200
+            response.text = json.dumps(
+                {
+                    "metric_histories": [
+                        {
+                            "run_id": "r1",
+                            "metric_key": "m",
+                            "metrics": [{"key": "m", "value": 0.5, "timestamp": 1, "step": 2}],
+                        },
+                        {"run_id": "r1", "metric_key": "n"},
+                    ]
+                }
+            )
+            mock_http.return_value = response
+            result = store.get_metric_history_bulk(
+                ["r1", "r2"], ["m", "n"], start_step=2, max_results=100, sampling="min_max"
+            )
+            expected_message = GetMetricHistoryBulk(
+                run_ids=["r1", "r2"],
+                metric_keys=["m", "n"],
+                start_step=2,
+                max_results=100,
+                sampling="min_max",
+            )
+            self._verify_requests(
+                mock_http,
+                creds,
+                "metrics/get-history-bulk",
+                "POST",
+                message_to_json(expected_message),
+            )
+            assert {
+                (run_id, key): [(m.key, m.value, m.timestamp, m.step) for m in metrics]
+                for run_id, histories in result.items()
+                for key, metrics in histories.items()
+            } == {
+                ("r1", "m"): [("m", 0.5, 1, 2)],
+                ("r1", "n"): [],
+                ("r2", "m"): [],
+                ("r2", "n"): [],
+            }
+
     @pytest.mark.parametrize("store_class", [RestStore, DatabricksRestStore])
     def test_get_experiment_by_name(self, store_class):
         creds = MlflowHostCreds("https://hello")
@@ -1,6 +1,8 @@
+import multiprocessing
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 import warnings
 
@@ -26,17 +28,24 @@ from mlflow.protos.databricks_pb2 import (
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.store.db.utils import (
     _get_schema_version,
+    _get_alembic_config,
     _get_latest_schema_revision,
     MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW,
+    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS,
+    MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS,
     MLFLOW_SQLALCHEMYSTORE_POOL_SIZE,
 )
+from mlflow.store.db import read_replicas
 from mlflow.store.tracking.dbmodels import models
 from mlflow.store.db.db_types import MYSQL, MSSQL
 from mlflow import entities
 from mlflow.exceptions import MlflowException
+from mlflow.models import Model
+from mlflow.store.tracking import sqlalchemy_store
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
 from tests.resources.db.initial_models import Base as InitialBase
 from tests.integration.utils import invoke_cli_runner
@@ -819,6 +828,79 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             [(m.key, m.value, m.timestamp) for m in actual],
         )
 
+    def test_get_metric_history_sampling_in_database(self):
+        run_id = self._run_factory().info.run_id
+        metrics = [
+            Metric("m", float("nan") if i % 17 == 0 else float(i * 7 % 13), i, i // 3)
+            for i in range(100)
+        ]
+        self.store.log_batch(run_id, metrics=metrics, params=[], tags=[])
+        for sampling in ["every_nth", "min_max"]:
+            with mock.patch.object(self.store, "_can_sample_in_database", return_value=True):
+                in_database = self.store.get_metric_history(run_id, "m", 10, sampling)
+            with mock.patch.object(self.store, "_can_sample_in_database", return_value=False):
+                with_numpy = self.store.get_metric_history(run_id, "m", 10, sampling)
+            assert [(m.timestamp, m.step, str(m.value)) for m in in_database] == [
+                (m.timestamp, m.step, str(m.value)) for m in with_numpy
+            ]
+            assert len(in_database) == 10
+
+    def test_get_metric_history_bulk_queries_runs_in_batches(self):
+        experiment_id = self._experiment_factory("bulk")
+        config = self._get_run_configs(experiment_id)
+        run_ids = [self._run_factory(config=config).info.run_id for _ in range(5)]
+        for i, run_id in enumerate(run_ids):
+            metrics = [Metric(k, float(i * step), step, step) for k in "ab" for step in range(i)]
+            self.store.log_batch(run_id, metrics=metrics, params=[], tags=[])
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.store.engine, "before_cursor_execute", record_statement)
+        try:
+            with mock.patch("mlflow.store.tracking.sqlalchemy_store._MAX_KEYS_PER_QUERY", 2):
+                histories = self.store.get_metric_history_bulk(run_ids, ["a", "b"])
+        finally:
+            sqlalchemy.event.remove(self.store.engine, "before_cursor_execute", record_statement)
+        # A single query for each batch of 2 runs
+        assert len([s for s in statements if "FROM metrics" in s]) == 3
+        for i, run_id in enumerate(run_ids):
+            for key in "ab":
+                assert [(m.key, m.value, m.step) for m in histories[run_id][key]] == [
+                    (key, float(i * step), step) for step in range(i)
+                ]
+
+    def test_get_metric_history_bulk_with_case_insensitive_collation(self):
+        run_id = self._run_factory(
+            self._get_run_configs(self._experiment_factory("bulk"))
+        ).info.run_id
+        metrics = [
+            Metric(k, float(step), step, step) for step in range(4) for k in ["Loss", "loss"]
+        ]
+        self.store.log_batch(run_id, metrics=metrics, params=[], tags=[])
+
+        def order_by_lower_case_key(conn, cursor, statement, parameters, *args):
+            # Order the rows as a case-insensitive collation would, e.g. on MySQL, which
+            # interleaves the rows of keys that only differ by case
+            order_by = 'ORDER BY metrics.run_uuid, metrics."key"'
+            case_insensitive_order_by = 'ORDER BY metrics.run_uuid, lower(metrics."key")'
+            return statement.replace(order_by, case_insensitive_order_by), parameters
+
+        sqlalchemy.event.listen(
+            self.store.engine, "before_cursor_execute", order_by_lower_case_key, retval=True
+        )
+        try:
+            histories = self.store.get_metric_history_bulk([run_id], ["Loss", "loss"])
+        finally:
+            sqlalchemy.event.remove(
+                self.store.engine, "before_cursor_execute", order_by_lower_case_key
+            )
+        for key in ["Loss", "loss"]:
+            assert [(m.key, m.step) for m in histories[run_id][key]] == [
+                (key, step) for step in range(4)
+            ]
+
     def test_list_run_infos(self):
         experiment_id = self._experiment_factory("test_exp")
         r1 = self._run_factory(config=self._get_run_configs(experiment_id)).info.run_id
@@ -1481,6 +1563,114 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         assert [r.info.run_id for r in result] == runs[8:]
         assert result.token is None
 
+    def test_search_runs_skips_runs_deleted_after_selecting_ids(self):
+        exp = self._experiment_factory("test_search_runs_skips_runs_deleted_after_selecting_ids")
+        runs = sorted(
+            [
+                self._run_factory(self._get_run_configs(exp, start_time=10)).info.run_id
+                for r in range(3)
+            ]
+        )
+        load_runs = sqlalchemy_store._load_runs
+
+        def delete_run_and_load_runs(session, run_ids):
+            self.store._hard_delete_run(runs[1])
+            return load_runs(session, run_ids)
+
+        with mock.patch(
+            "mlflow.store.tracking.sqlalchemy_store._load_runs",
+            side_effect=delete_run_and_load_runs,
+        ):
+            result = self.store.search_runs([exp], None, ViewType.ALL)
+        assert [r.info.run_id for r in result] == [runs[0], runs[2]]
+
+    def test_search_runs_keyset_pagination_matches_unpaginated_search(self):
+        exp = self._experiment_factory("test_search_runs_keyset_pagination")
+        for i, (x, p, t) in enumerate(
+            [
+                (0.0, "a", "b"),
+                (float("nan"), "b", None),
+                (None, None, "a"),
+                (float("inf"), "a", "a"),
+                (-1.0, "b", "b"),
+                (0.0, None, None),
+                (float("nan"), "a", "a"),
+                (None, "b", None),
+            ]
+        ):
+            run_id = self._run_factory(self._get_run_configs(exp, start_time=i % 3)).info.run_id
+            metrics = [] if x is None else [entities.Metric("x", x, 0, 0)]
+            params = [] if p is None else [entities.Param("p", p)]
+            tags = [] if t is None else [entities.RunTag("t", t)]
+            self.store.log_batch(run_id, metrics=metrics, params=params, tags=tags)
+
+        for order_by in [
+            None,
+            ["metrics.x"],
+            ["metrics.x DESC", "params.p"],
+            ["params.p DESC", "tags.t"],
+            ["tags.t", "metrics.x DESC"],
+            ["attributes.start_time ASC", "metrics.x"],
+        ]:
+            expected = [
+                r.info.run_id
+                for r in self.store.search_runs([exp], None, ViewType.ALL, order_by=order_by)
+            ]
+            assert len(expected) == 8
+            for max_results in [1, 3]:
+                run_ids = []
+                token = None
+                while True:
+                    result = self.store.search_runs(
+                        [exp], None, ViewType.ALL, max_results, order_by, token
+                    )
+                    run_ids.extend(r.info.run_id for r in result)
+                    token = result.token
+                    if token is None:
+                        break
+                assert run_ids == expected
+
+    def test_search_runs_pages_do_not_shift_when_runs_are_created(self):
+        exp = self._experiment_factory("test_search_runs_pages_do_not_shift")
+        runs = [
+            self._run_factory(self._get_run_configs(exp, start_time=i)).info.run_id
+            for i in range(6)
+        ]
+        result = self.store.search_runs([exp], None, ViewType.ALL, max_results=3)
+        assert [r.info.run_id for r in result] == runs[:2:-1]
+        # A run that is ordered before the runs of the next page does not shift them
+        self._run_factory(self._get_run_configs(exp, start_time=10))
+        result = self.store.search_runs(
+            [exp], None, ViewType.ALL, max_results=3, page_token=result.token
+        )
+        assert [r.info.run_id for r in result] == runs[2::-1]
+
+    def test_search_runs_accepts_offset_page_tokens(self):
+        exp = self._experiment_factory("test_search_runs_accepts_offset_page_tokens")
+        runs = [
+            self._run_factory(self._get_run_configs(exp, start_time=i)).info.run_id
+            for i in range(5)
+        ]
+        result = self.store.search_runs(
+            [exp], None, ViewType.ALL, max_results=2, page_token=SearchUtils.create_page_token(2)
+        )
+        assert [r.info.run_id for r in result] == runs[2:0:-1]
+        result = self.store.search_runs(
+            [exp], None, ViewType.ALL, max_results=2, page_token=result.token
+        )
+        assert [r.info.run_id for r in result] == runs[:1]
+        assert result.token is None
+
+    def test_search_runs_rejects_page_token_of_other_order_by(self):
+        exp = self._experiment_factory("test_search_runs_rejects_page_token_of_other_order_by")
+        for i in range(3):
+            self._run_factory(self._get_run_configs(exp, start_time=i))
+        result = self.store.search_runs([exp], None, ViewType.ALL, max_results=1)
+        with pytest.raises(MlflowException, match="Invalid page token"):
+            self.store.search_runs(
+                [exp], None, ViewType.ALL, 1, ["metrics.x"], page_token=result.token
+            )
+
     def test_log_batch(self):
         experiment_id = self._experiment_factory("log_batch")
         run_id = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
@@ -1563,9 +1753,9 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             raise Exception("Some internal error")
 
         package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
-        with mock.patch(package + ".log_metric") as metric_mock, mock.patch(
-            package + ".log_param"
-        ) as param_mock, mock.patch(package + ".set_tag") as tags_mock:
+        with mock.patch(package + "._log_metrics") as metric_mock, mock.patch(
+            package + "._log_params"
+        ) as param_mock, mock.patch(package + "._set_tags") as tags_mock:
             metric_mock.side_effect = _raise_exception_fn
             param_mock.side_effect = _raise_exception_fn
             tags_mock.side_effect = _raise_exception_fn
@@ -1594,6 +1784,38 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         self.store.log_batch(run.info.run_id, metrics=[], params=params, tags=[])
         self._verify_logged(self.store, run.info.run_id, metrics=[], params=params, tags=[])
 
+    def test_log_batch_params_logged_concurrently(self):
+        # Simulate another client logging the same params between the lookup of existing params
+        # and their insertion, which makes the insertion fail with an integrity error
+        run = self._run_factory()
+        self.store.log_param(run.info.run_id, Param("p-key", "p-val"))
+        self.store.log_param(run.info.run_id, Param("conflict-key", "orig-val"))
+
+        def log_batch_with_stale_params(params):
+            get_param_values = SqlAlchemyStore._get_param_values
+            results = iter([{}])
+            with mock.patch.object(
+                SqlAlchemyStore,
+                "_get_param_values",
+                side_effect=lambda *args: next(results, None) or get_param_values(*args),
+            ):
+                self.store.log_batch(run.info.run_id, metrics=[], params=params, tags=[])
+
+        params = [Param("p-key", "p-val"), Param("other-key", "other-val")]
+        log_batch_with_stale_params(params)
+        self._verify_logged(
+            self.store,
+            run.info.run_id,
+            metrics=[],
+            params=[Param("conflict-key", "orig-val")] + params,
+            tags=[],
+        )
+
+        with self.assertRaises(MlflowException) as e:
+            log_batch_with_stale_params([Param("conflict-key", "new-val")])
+        self.assertIn("Changing param values is not allowed. Param with key=", e.exception.message)
+        assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
     def test_log_batch_tags_idempotency(self):
         run = self._run_factory()
         self.store.log_batch(
@@ -1642,6 +1864,60 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             self.store, run.info.run_id, params=[], metrics=[metric0, metric1], tags=[]
         )
 
+    def test_log_batch_metrics_idempotency(self):
+        run = self._run_factory()
+        metrics = [
+            Metric(key="metric-key", value=1, timestamp=2, step=0),
+            Metric(key="nan-key", value=float("nan"), timestamp=2, step=0),
+            Metric(key="inf-key", value=float("inf"), timestamp=2, step=0),
+        ]
+        self.store.log_batch(run.info.run_id, params=[], metrics=metrics, tags=[])
+        self.store.log_batch(run.info.run_id, params=[], metrics=metrics + metrics, tags=[])
+        self.store.log_metric(run.info.run_id, metrics[0])
+        assert len(self.store.get_metric_history(run.info.run_id, "metric-key")) == 1
+        assert len(self.store.get_metric_history(run.info.run_id, "nan-key")) == 1
+        assert len(self.store.get_metric_history(run.info.run_id, "inf-key")) == 1
+
+    def test_log_batch_updates_latest_metrics(self):
+        run = self._run_factory()
+        self.store.log_batch(
+            run.info.run_id,
+            params=[],
+            metrics=[
+                Metric(key="a", value=1, timestamp=1, step=5),
+                Metric(key="a", value=2, timestamp=2, step=1),
+                Metric(key="b", value=3, timestamp=1, step=0),
+            ],
+            tags=[],
+        )
+        assert self.store.get_run(run.info.run_id).data.metrics == {"a": 1, "b": 3}
+        self.store.log_batch(
+            run.info.run_id,
+            params=[],
+            metrics=[
+                Metric(key="a", value=4, timestamp=3, step=4),
+                Metric(key="b", value=5, timestamp=2, step=0),
+                Metric(key="c", value=6, timestamp=2, step=0),
+            ],
+            tags=[],
+        )
+        assert self.store.get_run(run.info.run_id).data.metrics == {"a": 1, "b": 5, "c": 6}
+
+    def test_log_batch_does_not_log_entities_one_by_one(self):
+        run = self._run_factory()
+        package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
+        with mock.patch(package + ".log_metric") as metric_mock, mock.patch(
+            package + ".log_param"
+        ) as param_mock, mock.patch(package + ".set_tag") as tags_mock:
+            metrics = [Metric("m%s" % i, i, 12345, i) for i in range(100)]
+            params = [Param("p%s" % i, str(i)) for i in range(100)]
+            tags = [RunTag("t%s" % i, str(i)) for i in range(100)]
+            self.store.log_batch(run.info.run_id, metrics=metrics, params=params, tags=tags)
+            metric_mock.assert_not_called()
+            param_mock.assert_not_called()
+            tags_mock.assert_not_called()
+        self._verify_logged(self.store, run.info.run_id, metrics=metrics, params=params, tags=tags)
+
     def test_upgrade_cli_idempotence(self):
         # Repeatedly run `mlflow db upgrade` against our database, verifying that the command
         # succeeds and that the DB has the latest schema
@@ -1852,6 +2128,179 @@ def test_sqlalchemy_store_behaves_as_expected_with_inmemory_sqlite_db():
     assert param.key in fetched_run.data.params
 
 
+def test_read_only_queries_are_served_by_read_replicas(tmpdir):
+    primary_path = tmpdir.join("primary.db").strpath
+    replica_path = tmpdir.join("replica.db").strpath
+    artifact_root = tmpdir.join("artifacts").strpath
+    store = SqlAlchemyStore("sqlite:///" + primary_path, artifact_root)
+    experiment_id = store.create_experiment("replicated")
+    replicated_run_id = store.create_run(experiment_id, "user", 0, []).info.run_id
+    store.engine.dispose()
+    # Replicate the primary database with a copy, which does not receive the subsequent writes
+    shutil.copyfile(primary_path, replica_path)
+
+    env = {
+        MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS: "sqlite:///" + replica_path,
+        MLFLOW_SQLALCHEMYSTORE_READ_YOUR_WRITES_SECONDS: "5",
+    }
+    with mock.patch.dict(os.environ, env):
+        store = SqlAlchemyStore("sqlite:///" + primary_path, artifact_root)
+
+    def get_run_ids():
+        return [r.info.run_id for r in store.search_runs([experiment_id], None, ViewType.ALL)]
+
+    with mock.patch("time.time", return_value=1000):
+        read_replicas.start_client_session()
+        run_id = store.create_run(experiment_id, "user", 0, []).info.run_id
+        # Reads following a write of the same client are served by the primary
+        assert store.get_run(run_id).info.run_id == run_id
+        assert set(get_run_ids()) == {run_id, replicated_run_id}
+        read_primary_until = read_replicas.get_client_session_read_primary_until()
+        # Reads of other clients are served by the replica
+        read_replicas.start_client_session()
+        with pytest.raises(MlflowException, match="Run with id={} not found".format(run_id)):
+            store.get_run(run_id)
+        assert get_run_ids() == [replicated_run_id]
+        assert store.get_run(replicated_run_id).info.run_id == replicated_run_id
+    with mock.patch("time.time", return_value=1005):
+        read_replicas.start_client_session(read_primary_until)
+        assert get_run_ids() == [replicated_run_id]
+    read_replicas.end_client_session()
+
+
+def test_logged_models_migration_moves_models_between_tag_and_table(tmpdir):
+    from alembic import command
+
+    db_url = "sqlite:///" + tmpdir.join("mlflow.db").strpath
+    store = SqlAlchemyStore(db_url, tmpdir.join("artifacts").strpath)
+    experiment_id = store.create_experiment("models")
+    run_id = store.create_run(experiment_id, "user", 0, []).info.run_id
+    other_run_id = store.create_run(experiment_id, "user", 0, []).info.run_id
+    models = [
+        Model(artifact_path="model%s" % i, run_id=run_id, flavors={"f": {"i": i}}) for i in range(3)
+    ]
+    for model in models[:2]:
+        store.record_logged_model(run_id, model)
+    store.engine.dispose()
+
+    def get_logged_models_tags():
+        engine = sqlalchemy.create_engine(db_url)
+        try:
+            return dict(
+                engine.execute(
+                    "SELECT run_uuid, value FROM tags WHERE key = ?",
+                    (mlflow_tags.MLFLOW_LOGGED_MODELS,),
+                ).fetchall()
+            )
+        finally:
+            engine.dispose()
+
+    # Downgrading moves the models back to the tag, as recorded by older versions of MLflow
+    command.downgrade(_get_alembic_config(db_url), "ba9788700f47")
+    expected_value = json.dumps([m.to_dict() for m in models[:2]])
+    assert get_logged_models_tags() == {run_id: expected_value}
+    engine = sqlalchemy.create_engine(db_url)
+    engine.execute(
+        "INSERT INTO tags (key, value, run_uuid) VALUES (?, ?, ?)",
+        (mlflow_tags.MLFLOW_LOGGED_MODELS, "not a list of models", other_run_id),
+    )
+    engine.dispose()
+
+    invoke_cli_runner(mlflow.db.commands, ["upgrade", db_url])
+    assert get_logged_models_tags() == {other_run_id: "not a list of models"}
+    store = SqlAlchemyStore(db_url, tmpdir.join("artifacts").strpath)
+    assert store.get_run(run_id).data.tags[mlflow_tags.MLFLOW_LOGGED_MODELS] == expected_value
+    store.record_logged_model(run_id, models[2])
+    runs = store.search_runs([experiment_id], None, ViewType.ALL)
+    assert {r.info.run_id: r.data.tags[mlflow_tags.MLFLOW_LOGGED_MODELS] for r in runs} == {
+        run_id: json.dumps([m.to_dict() for m in models]),
+        other_run_id: "not a list of models",
+    }
+
+
+def test_search_runs_filters_on_logged_models_tag(tmpdir):
+    store = SqlAlchemyStore("sqlite:///" + tmpdir.join("mlflow.db").strpath, tmpdir.strpath)
+    experiment_id = store.create_experiment("models")
+    run_ids = [store.create_run(experiment_id, "user", 0, []).info.run_id for _ in range(3)]
+    store.record_logged_model(run_ids[0], Model(artifact_path="model", flavors={"sklearn": {}}))
+    store.record_logged_model(run_ids[0], Model(artifact_path="model", flavors={"keras": {}}))
+    store.record_logged_model(run_ids[1], Model(artifact_path="model", flavors={"keras": {}}))
+    store.set_tag(run_ids[2], RunTag(mlflow_tags.MLFLOW_LOGGED_MODELS, "set by sklearn"))
+
+    def search(filter_string):
+        runs = store.search_runs([experiment_id], filter_string, ViewType.ALL)
+        return sorted(r.info.run_id for r in runs)
+
+    tag = "tags.`{}`".format(mlflow_tags.MLFLOW_LOGGED_MODELS)
+    assert search("{} LIKE '%sklearn%'".format(tag)) == sorted([run_ids[0], run_ids[2]])
+    assert search("{} ILIKE '%KERAS%'".format(tag)) == sorted(run_ids[:2])
+    assert search("{} LIKE '%pytorch%'".format(tag)) == []
+    with pytest.raises(MlflowException, match="Only ILIKE and LIKE filters are supported") as e:
+        search("{} = '[]'".format(tag))
+    assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_logged_models_migration_downgrade_fails_when_models_do_not_fit_in_tag(tmpdir):
+    from alembic import command
+
+    db_url = "sqlite:///" + tmpdir.join("mlflow.db").strpath
+    store = SqlAlchemyStore(db_url, tmpdir.join("artifacts").strpath)
+    run_id = store.create_run("0", "user", 0, []).info.run_id
+    for i in range(100):
+        store.record_logged_model(run_id, Model(artifact_path="model%s" % i, flavors={"f": {}}))
+    store.engine.dispose()
+
+    with pytest.raises(MlflowException, match="Cannot downgrade the database.+" + run_id):
+        command.downgrade(_get_alembic_config(db_url), "ba9788700f47")
+    store = SqlAlchemyStore(db_url, tmpdir.join("artifacts").strpath)
+    assert len(json.loads(store.get_run(run_id).data.tags[mlflow_tags.MLFLOW_LOGGED_MODELS])) == 100
+
+
+def _log_metrics_concurrently(db_url, artifact_root, run_id, worker, num_threads, num_metrics):
+    store = SqlAlchemyStore(db_url, artifact_root)
+
+    def log_metrics(thread):
+        for step in range(num_metrics):
+            key = "worker{}_thread{}".format(worker, thread)
+            store.log_metric(run_id, Metric(key, step, int(time.time() * 1000), step))
+
+    threads = [
+        threading.Thread(target=log_metrics, args=(thread,)) for thread in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_sqlite_supports_concurrent_writes_from_several_processes(tmpdir):
+    db_url = "sqlite:///" + tmpdir.join("mlflow.db").strpath
+    artifact_root = tmpdir.join("artifacts").strpath
+    store = SqlAlchemyStore(db_url, artifact_root)
+    run_id = store.create_run("0", "user", 0, []).info.run_id
+    num_processes, num_threads, num_metrics = 8, 8, 50
+
+    # Uncaught exceptions of the threads are reported as warnings, which would not fail the test
+    with mock.patch("threading.excepthook", side_effect=lambda args: os._exit(1)):
+        processes = [
+            multiprocessing.Process(
+                target=_log_metrics_concurrently,
+                args=(db_url, artifact_root, run_id, worker, num_threads, num_metrics),
+            )
+            for worker in range(num_processes)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    assert [process.exitcode for process in processes] == [0] * num_processes
+    metrics = store.get_run(run_id).data.metrics
+    assert len(metrics) == num_processes * num_threads
+    assert set(metrics.values()) == {num_metrics - 1}
+    for key in metrics:
+        assert len(store.get_metric_history(run_id, key)) == num_metrics
+
+
 class TestSqlAlchemyStoreSqliteMigratedDB(TestSqlAlchemyStoreSqlite):
     """
     Test case where user has an existing DB with schema generated before MLflow 1.0,
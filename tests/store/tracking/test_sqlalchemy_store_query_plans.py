@@ -0,0 +1,124 @@
+"""
+Tests verifying that the queries issued by the SQLAlchemyStore for common search and metric history
+shapes are served by indexes on SQLite, rather than by full scans of the tracking tables.
+"""
+import os
+import re
+
+import pytest
+import sqlalchemy
+
+from mlflow.entities import Metric, Param, RunTag, ViewType
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.file_utils import path_to_local_sqlite_uri
+
+# Query plan lines reading every row of a tracking table, e.g. `SCAN TABLE params` on older SQLite
+# versions or `SCAN params` on newer ones. Scans of materialized subqueries are fine.
+_FULL_TABLE_SCAN = re.compile(
+    r"^SCAN (TABLE )?(runs|params|tags|metrics|latest_metrics)\b(?! USING (COVERING )?INDEX)"
+)
+
+
+@pytest.fixture
+def store(tmpdir):
+    db_uri = path_to_local_sqlite_uri(os.path.join(tmpdir.strpath, "mlflow.db"))
+    store = SqlAlchemyStore(db_uri, tmpdir.join("artifacts").strpath)
+    experiment_id = store.create_experiment("query-plans")
+    for i in range(5):
+        run_id = store.create_run(experiment_id, "user", i, []).info.run_id
+        store.log_batch(
+            run_id,
+            metrics=[Metric("m", i * step, step, step) for step in range(3)],
+            params=[Param("p", str(i))],
+            tags=[RunTag("t", str(i))],
+        )
+    yield store
+    store.engine.dispose()
+
+
+def _query_plans(store, func):
+    """
+    Call ``func`` and return the SQLite query plan of each SELECT statement it issued.
+    """
+    statements = []
+
+    def record_select_statement(
+        conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    sqlalchemy.event.listen(store.engine, "before_cursor_execute", record_select_statement)
+    try:
+        func()
+    finally:
+        sqlalchemy.event.remove(store.engine, "before_cursor_execute", record_select_statement)
+
+    plans = []
+    connection = store.engine.raw_connection()
+    try:
+        for statement, parameters in statements:
+            rows = connection.cursor().execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            plans.append((statement, [row[-1] for row in rows]))
+    finally:
+        connection.close()
+    return plans
+
+
+def _assert_no_full_table_scans(plans):
+    assert plans
+    for statement, plan in plans:
+        scans = [line for line in plan if _FULL_TABLE_SCAN.match(line)]
+        assert not scans, "Full table scan in plan {} of query:\n{}".format(plan, statement)
+
+
+_RUNS_INDEX = "index_runs_experiment_id_lifecycle_stage_start_time"
+
+
+def _experiment_id(store):
+    return store.get_experiment_by_name("query-plans").experiment_id
+
+
+@pytest.mark.parametrize(
+    "filter_string, order_by, expected_index",
+    [
+        (None, None, _RUNS_INDEX),
+        ("attributes.status = 'RUNNING'", None, _RUNS_INDEX),
+        ("params.p = '1'", None, "sqlite_autoindex_params_1"),
+        ("params.p LIKE '1%'", None, "sqlite_autoindex_params_1"),
+        ("metrics.m > 0", None, "sqlite_autoindex_latest_metrics_1"),
+        ("tags.t = '1'", None, "sqlite_autoindex_tags_1"),
+        (None, ["metrics.m DESC"], "sqlite_autoindex_latest_metrics_1"),
+        (None, ["params.p"], "sqlite_autoindex_params_1"),
+        (None, ["tags.t"], "sqlite_autoindex_tags_1"),
+    ],
+)
+def test_search_runs_uses_indexes(store, filter_string, order_by, expected_index):
+    experiment_id = _experiment_id(store)
+    plans = _query_plans(
+        store,
+        lambda: store.search_runs(
+            [experiment_id], filter_string, ViewType.ACTIVE_ONLY, order_by=order_by
+        ),
+    )
+    _assert_no_full_table_scans(plans)
+    # The IDs of the matching runs are selected first, then the runs are loaded by ID
+    search_plan = plans[0][1]
+    assert any(_RUNS_INDEX in line for line in search_plan), search_plan
+    assert any(expected_index in line for line in search_plan), search_plan
+    # Params, metrics and tags of the matching runs are loaded by run ID
+    loaded_tables = "\n".join(line for _, plan in plans[1:] for line in plan)
+    for index in ["index_params_run_uuid", "index_latest_metrics_run_uuid", "index_tags_run_uuid"]:
+        assert index in loaded_tables
+
+
+def test_get_metric_history_uses_index(store):
+    run_id = store.search_runs([_experiment_id(store)], None, ViewType.ALL)[0].info.run_id
+    plans = _query_plans(store, lambda: store.get_metric_history(run_id, "m"))
+    _assert_no_full_table_scans(plans)
+    ((_, plan),) = plans
+    assert any(
+        "index_metrics_run_uuid_key_step_timestamp (run_uuid=? AND key=?)" in line for line in plan
+    ), plan
+    # The history is returned in step order without sorting it
+    assert not any("TEMP B-TREE" in line for line in plan), plan
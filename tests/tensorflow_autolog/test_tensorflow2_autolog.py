@@ -659,29 +659,20 @@ def test_flush_queue_is_thread_safe():
     """
     Autologging augments TensorBoard event logging hooks with MLflow `log_metric` API
     calls. To prevent these API calls from blocking TensorBoard event logs, `log_metric`
-    API calls are scheduled via `_flush_queue` on a background thread. Accordingly, this test
-    verifies that `_flush_queue` is thread safe.
+    API calls are scheduled on a background thread and `_flush_queue` waits for them to complete.
+    Accordingly, this test verifies that concurrent calls to `_flush_queue` log each queued
+    metric exactly once.
     """
     from threading import Thread
     from mlflow.entities import Metric
-    from mlflow.tensorflow import _flush_queue, _metric_queue_lock
-
-    metric_queue_item = ("run_id1", Metric("foo", "bar", 100, 1))
-    mlflow.tensorflow._metric_queue.append(metric_queue_item)
-
-    # Verify that, if another thread holds a lock on the metric queue leveraged by
-    # _flush_queue, _flush_queue terminates and does not modify the queue
-    _metric_queue_lock.acquire()
-    flush_thread1 = Thread(target=_flush_queue)
-    flush_thread1.start()
-    flush_thread1.join()
-    assert len(mlflow.tensorflow._metric_queue) == 1
-    assert mlflow.tensorflow._metric_queue[0] == metric_queue_item
-    _metric_queue_lock.release()
-
-    # Verify that, if no other thread holds a lock on the metric queue leveraged by
-    # _flush_queue, _flush_queue flushes the queue as expected
-    flush_thread2 = Thread(target=_flush_queue)
-    flush_thread2.start()
-    flush_thread2.join()
-    assert len(mlflow.tensorflow._metric_queue) == 0
+    from mlflow.tensorflow import _flush_queue, _metric_queue
+
+    metric = Metric("foo", "bar", 100, 1)
+    with patch("mlflow.tracking.MlflowClient.log_batch") as log_batch_mock:
+        _metric_queue.log_batch("run_id1", metrics=[metric])
+        flush_threads = [Thread(target=_flush_queue) for _ in range(5)]
+        for flush_thread in flush_threads:
+            flush_thread.start()
+        for flush_thread in flush_threads:
+            flush_thread.join()
+        log_batch_mock.assert_called_once_with("run_id1", metrics=[metric], params=[], tags=[])
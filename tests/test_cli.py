@@ -1,18 +1,21 @@
 from click.testing import CliRunner
 from unittest import mock
+import importlib
 import os
 import pytest
 import shutil
 import tempfile
 import time
 import subprocess
+import sys
 
 from urllib.request import url2pathname
 from urllib.parse import urlparse, unquote
 
-from mlflow.cli import server, ui
+from mlflow.cli import cli, server, ui, _LAZY_COMMANDS
 from mlflow.server import handlers
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.store.tracking import file_store_index
 from mlflow.store.tracking.file_store import FileStore
 from mlflow.exceptions import MlflowException
 from mlflow.entities import ViewType
@@ -153,6 +156,26 @@ def test_mlflow_gc_file_store_passing_explicit_run_ids(file_store):
         store.get_run(run.info.run_uuid)
 
 
+def test_mlflow_rebuild_run_index(file_store):
+    store = file_store[0]
+    run = _create_run_in_store(store)
+    output = subprocess.check_output(
+        ["mlflow", "rebuild-run-index", "--backend-store-uri", file_store[1]]
+    ).decode("utf-8")
+    assert "Rebuilt the run index of experiment 0 with 1 runs." in output
+    run_index = file_store_index.ExperimentRunIndex(
+        os.path.join(store._get_experiment_path("0"), file_store_index.RUN_INDEX_FILE_NAME)
+    )
+    assert run_index.get_run_info(run.info.run_id) == run.info
+
+
+def test_mlflow_rebuild_run_index_sqlite(sqlite_store):
+    with pytest.raises(subprocess.CalledProcessError):
+        subprocess.check_output(
+            ["mlflow", "rebuild-run-index", "--backend-store-uri", sqlite_store[1]]
+        )
+
+
 def test_mlflow_gc_not_deleted_run(file_store):
     store = file_store[0]
     run = _create_run_in_store(store)
@@ -162,3 +185,28 @@ def test_mlflow_gc_not_deleted_run(file_store):
         )
     runs = store.search_runs(experiment_ids=["0"], filter_string="", run_view_type=ViewType.ALL)
     assert len(runs) == 1
+
+
+def test_mlflow_help_does_not_import_lazy_command_groups():
+    code = (
+        "import sys;"
+        "from click.testing import CliRunner;"
+        "from mlflow.cli import cli;"
+        "result = CliRunner().invoke(cli, ['--help']);"
+        "assert result.exit_code == 0, result.output;"
+        "assert 'sagemaker' in result.output;"
+        "assert not any(m in sys.modules for m in"
+        " ['mlflow.models.cli', 'mlflow.sagemaker.cli', 'mlflow.azureml.cli', 'pandas'])"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+@pytest.mark.parametrize("command", sorted(_LAZY_COMMANDS))
+def test_lazy_command_groups_are_loaded_when_run(command):
+    module_name, short_help = _LAZY_COMMANDS[command]
+    result = CliRunner().invoke(cli, [command, "--help"])
+    assert result.exit_code == 0, result.output
+    # The short help shown by `mlflow --help` must match the one of the group
+    commands = importlib.import_module(module_name).commands
+    assert commands.get_short_help_str() == short_help
+    assert cli.get_command(None, command) is commands
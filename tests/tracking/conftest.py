@@ -3,6 +3,7 @@ import os
 import pytest
 
 import mlflow
+from mlflow.store.db.store_cache import clear_stores
 
 
 @pytest.fixture
@@ -17,3 +18,10 @@ def tmp_wkdir(tmpdir):
 def reset_active_experiment():
     yield
     mlflow.tracking.fluent._active_experiment_id = None
+
+
+@pytest.fixture(autouse=True)
+def clear_store_cache():
+    # Tests reuse database URIs whose stores are mocked or removed between tests
+    yield
+    clear_stores()
@@ -4,11 +4,18 @@ from unittest import mock
 from unittest.mock import ANY
 
 import mlflow
+from mlflow.store.artifact.artifact_cache import get_artifact_cache
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 from mlflow.tracking.artifact_utils import (
     _download_artifact_from_uri,
     _upload_artifacts_to_databricks,
 )
 
+from tests.helper_functions import mock_s3_bucket  # pylint: disable=unused-import
+
+_download_file = S3ArtifactRepository._download_file
+
 
 def test_artifact_can_be_downloaded_from_absolute_uri_successfully(tmpdir):
     artifact_file_name = "artifact.txt"
@@ -94,3 +101,57 @@ def test_upload_artifacts_to_databricks_no_run_id():
             new_source == "dbfs:/databricks/mlflow/tmp-external-source/"
             "4f746cdcc0374da2808917e81bb53323/sourcedir"
         )
+
+
+def test_download_artifact_from_uri_reads_remote_artifacts_through_cache(
+    mock_s3_bucket, tmpdir, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    local_dir = tmpdir.join("model").strpath
+    os.makedirs(os.path.join(local_dir, "data"))
+    for path, content in [("MLmodel", "flavors: {}"), ("data/weights.bin", "0123456789")]:
+        with open(os.path.join(local_dir, path), "w") as f:
+            f.write(content)
+    artifact_uri = "s3://{}/experiment/run/artifacts".format(mock_s3_bucket)
+    get_artifact_repository(artifact_uri).log_artifacts(local_dir, "model")
+
+    with mock.patch.object(
+        S3ArtifactRepository, "_download_file", autospec=True, side_effect=_download_file
+    ) as download_file_mock:
+        for i in range(3):
+            output_path = tmpdir.join("output{}".format(i)).strpath
+            os.makedirs(output_path)
+            local_path = _download_artifact_from_uri(artifact_uri + "/model", output_path)
+            assert local_path == os.path.join(output_path, "model")
+            with open(os.path.join(local_path, "data", "weights.bin")) as f:
+                assert f.read() == "0123456789"
+            # The caller owns the copy of the cached artifact
+            with open(os.path.join(local_path, "data", "weights.bin"), "w") as f:
+                f.write("modified")
+        assert download_file_mock.call_count == 2
+        local_path = _download_artifact_from_uri(artifact_uri + "/model/MLmodel")
+        with open(local_path) as f:
+            assert f.read() == "flavors: {}"
+        assert download_file_mock.call_count == 3
+        assert get_artifact_cache().stats == (2, 2, 0)
+
+        # Artifacts are downloaded again once they change
+        with open(os.path.join(local_dir, "data", "weights.bin"), "w") as f:
+            f.write("9876543210-")
+        get_artifact_repository(artifact_uri).log_artifacts(local_dir, "model")
+        local_path = _download_artifact_from_uri(artifact_uri + "/model")
+        with open(os.path.join(local_path, "data", "weights.bin")) as f:
+            assert f.read() == "9876543210-"
+        assert download_file_mock.call_count == 5
+
+
+def test_download_artifact_from_uri_does_not_version_uncacheable_artifacts(tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    tmpdir.join("artifacts", "a.txt").write("content", ensure=True)
+    with mock.patch(
+        "mlflow.tracking.artifact_utils.get_artifact_version"
+    ) as get_artifact_version_mock:
+        local_path = _download_artifact_from_uri(tmpdir.join("artifacts", "a.txt").strpath)
+    with open(local_path) as f:
+        assert f.read() == "content"
+    get_artifact_version_mock.assert_not_called()
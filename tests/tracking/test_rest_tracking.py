@@ -351,6 +351,28 @@ def test_log_batch(mlflow_client, backend_store_uri):
     assert metric.step == 3
 
 
+def test_get_metric_history_bulk(mlflow_client, backend_store_uri):
+    experiment_id = mlflow_client.create_experiment("Bulk metric histories")
+    run_ids = [mlflow_client.create_run(experiment_id).info.run_id for _ in range(3)]
+    for i, run_id in enumerate(run_ids):
+        metrics = [Metric("loss", float(i * step), 100 + step, step) for step in range(50)]
+        mlflow_client.log_batch(run_id, metrics=metrics)
+    histories = mlflow_client.get_metric_history_bulk(
+        run_ids,
+        ["loss", "accuracy"],
+        start_step=10,
+        end_step=29,
+        max_results=5,
+        sampling="every_nth",
+    )
+    assert list(histories) == run_ids
+    for i, run_id in enumerate(run_ids):
+        assert histories[run_id]["accuracy"] == []
+        assert [(m.key, m.value, m.timestamp, m.step) for m in histories[run_id]["loss"]] == [
+            ("loss", float(i * step), 100 + step, step) for step in range(10, 30, 4)
+        ]
+
+
 def test_log_model(mlflow_client, backend_store_uri):
     experiment_id = mlflow_client.create_experiment("Log models")
     with TempDir(chdr=True):
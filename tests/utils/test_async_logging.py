@@ -0,0 +1,214 @@
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import mlflow
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import MlflowClient
+from mlflow.utils import async_logging
+from mlflow.utils.async_logging import (
+    AsyncLoggingQueue,
+    ON_FULL_DROP,
+    ON_FULL_SPILL,
+    _split_into_batches,
+)
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH, MAX_PARAMS_TAGS_PER_BATCH
+
+
+class _RecordingLogger(object):
+    def __init__(self, delay=0, error=None):
+        self.calls = []
+        self.delay = delay
+        self.error = error
+
+    def __call__(self, run_id, metrics, params, tags):
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        self.calls.append((run_id, list(metrics), list(params), list(tags)))
+
+    def logged_metrics(self, run_id):
+        return [m for call in self.calls if call[0] == run_id for m in call[1]]
+
+
+@pytest.fixture
+def async_logging_enabled():
+    with mock.patch.dict(os.environ, {async_logging._ASYNC_LOGGING_ENV_VAR: "true"}):
+        yield
+
+
+def test_split_into_batches_respects_batch_limits():
+    metrics = [Metric("m", i, 0, i) for i in range(2500)]
+    params = [Param("p%s" % i, "v") for i in range(150)]
+    tags = [RunTag("t%s" % i, "v") for i in range(250)]
+    batches = _split_into_batches("run", metrics, params, tags)
+    for batch in batches:
+        assert len(batch.metrics) <= MAX_METRICS_PER_BATCH
+        assert len(batch.params) <= MAX_PARAMS_TAGS_PER_BATCH
+        assert len(batch.tags) <= MAX_PARAMS_TAGS_PER_BATCH
+        assert len(batch.metrics) + len(batch.params) + len(batch.tags) <= 1000
+    assert sum([b.metrics for b in batches], []) == metrics
+    assert sum([b.params for b in batches], []) == params
+    assert sum([b.tags for b in batches], []) == tags
+
+
+def test_queue_coalesces_entities_per_run():
+    logger = _RecordingLogger()
+    queue = AsyncLoggingQueue(logger, flush_interval=None)
+    for i in range(10):
+        queue.log_batch("run1", metrics=[Metric("m", i, 0, i)])
+        queue.log_batch("run2", params=[Param("p%s" % i, "v")], tags=[RunTag("t", str(i))])
+    queue.flush()
+    assert [call[0] for call in logger.calls] == ["run1", "run2"]
+    assert [m.value for m in logger.logged_metrics("run1")] == list(range(10))
+    assert len(logger.calls[1][2]) == 10
+    assert [t.value for t in logger.calls[1][3]] == [str(i) for i in range(10)]
+
+
+def test_queue_flushes_after_flush_interval():
+    logger = _RecordingLogger()
+    queue = AsyncLoggingQueue(logger, flush_interval=0.1)
+    queue.log_batch("run", metrics=[Metric("m", 1, 0, 0)])
+    for _ in range(50):
+        if logger.calls:
+            break
+        time.sleep(0.1)
+    assert len(logger.logged_metrics("run")) == 1
+
+
+def test_queue_flush_waits_for_pending_entities():
+    logger = _RecordingLogger(delay=0.2)
+    queue = AsyncLoggingQueue(logger, flush_interval=None)
+    queue.log_batch("run", metrics=[Metric("m", 1, 0, 0)])
+    queue.flush()
+    assert len(logger.logged_metrics("run")) == 1
+
+
+def test_queue_blocks_when_full():
+    logger = _RecordingLogger(delay=0.1)
+    queue = AsyncLoggingQueue(logger, max_queue_size=5, flush_interval=None)
+    for i in range(50):
+        queue.log_batch("run", metrics=[Metric("m", i, 0, i)])
+    queue.flush()
+    assert [m.value for m in logger.logged_metrics("run")] == list(range(50))
+    assert queue.num_dropped == 0
+
+
+class _BlockingLogger(_RecordingLogger):
+    """Logger blocking the worker thread in its first call until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.released = threading.Event()
+
+    def __call__(self, run_id, metrics, params, tags):
+        self.entered.set()
+        self.released.wait()
+        super().__call__(run_id, metrics, params, tags)
+
+
+def _fill_queue_while_worker_is_busy(queue, logger, num_batches):
+    # The worker takes the first batch off the queue once it reaches the flush threshold, then
+    # blocks while logging it so that the following batches fill the queue
+    queue.log_batch("run", metrics=[Metric("m", i, 0, i) for i in range(3)])
+    assert logger.entered.wait(10)
+    for i in range(3, 3 + num_batches):
+        queue.log_batch(
+            "run", metrics=[Metric("m", i, 0, i)], params=[Param("p", "v")], tags=[RunTag("t", "v")]
+        )
+
+
+def test_queue_drops_entities_when_full():
+    logger = _BlockingLogger()
+    queue = AsyncLoggingQueue(logger, max_queue_size=3, on_full=ON_FULL_DROP, flush_interval=None)
+    _fill_queue_while_worker_is_busy(queue, logger, num_batches=2)
+    assert queue.num_dropped == 3
+    logger.released.set()
+    queue.flush()
+    assert [m.value for m in logger.logged_metrics("run")] == [0, 1, 2, 3]
+
+
+def test_queue_spills_entities_to_disk_when_full(tmpdir):
+    logger = _BlockingLogger()
+    queue = AsyncLoggingQueue(
+        logger,
+        max_queue_size=3,
+        on_full=ON_FULL_SPILL,
+        flush_interval=None,
+        spill_dir=tmpdir.strpath,
+    )
+    _fill_queue_while_worker_is_busy(queue, logger, num_batches=18)
+    assert tmpdir.listdir()
+    logger.released.set()
+    queue.flush()
+    assert [m.value for m in logger.logged_metrics("run")] == list(range(21))
+    assert queue.num_dropped == 0
+
+    # Spilled batches are only counted once, so that later flushes still wait for pending ones
+    for i in range(21, 30):
+        queue.log_batch("run", metrics=[Metric("m", i, 0, i)])
+    queue.flush()
+    assert [m.value for m in logger.logged_metrics("run")] == list(range(30))
+
+
+def test_queue_flush_raises_logging_errors():
+    queue = AsyncLoggingQueue(_RecordingLogger(error=Exception("boom")), flush_interval=None)
+    queue.log_batch("run", metrics=[Metric("m", 1, 0, 0)])
+    with pytest.raises(MlflowException, match="boom"):
+        queue.flush()
+    # Errors are only reported once
+    queue.flush()
+
+
+def test_queue_rejects_invalid_backpressure_behavior():
+    with pytest.raises(MlflowException, match="Invalid async logging backpressure behavior"):
+        AsyncLoggingQueue(_RecordingLogger(), on_full="explode")
+
+
+def test_client_log_batch_asynchronously():
+    client = MlflowClient()
+    run_id = client.create_run("0").info.run_id
+    client.log_batch(run_id, metrics=[Metric("m", 1, 0, 0)], synchronous=False)
+    mlflow.flush_async_logging()
+    assert client.get_run(run_id).data.metrics == {"m": 1}
+
+
+def test_fluent_api_logs_asynchronously_when_enabled(async_logging_enabled):
+    with mock.patch.object(
+        MlflowClient, "log_metric", side_effect=Exception("should not be called")
+    ), mock.patch.object(
+        MlflowClient, "log_param", side_effect=Exception("should not be called")
+    ), mock.patch.object(
+        MlflowClient, "set_tag", side_effect=Exception("should not be called")
+    ):
+        with mlflow.start_run() as run:
+            for step in range(100):
+                mlflow.log_metric("loss", step, step=step)
+            mlflow.log_metrics({"a": 1, "b": 2})
+            mlflow.log_param("p", "v")
+            mlflow.log_params({"p2": "v2"})
+            mlflow.set_tag("t", "v")
+            mlflow.set_tags({"t2": "v2"})
+
+    # `end_run` is expected to flush pending entities
+    client = MlflowClient()
+    run_data = client.get_run(run.info.run_id).data
+    assert run_data.metrics == {"loss": 99, "a": 1, "b": 2}
+    assert run_data.params == {"p": "v", "p2": "v2"}
+    assert run_data.tags["t"] == "v"
+    assert run_data.tags["t2"] == "v2"
+    assert len(client.get_metric_history(run.info.run_id, "loss")) == 100
+
+
+def test_fluent_api_logs_synchronously_by_default():
+    with mock.patch.object(async_logging.AsyncLoggingQueue, "log_batch") as queue_log_batch_mock:
+        with mlflow.start_run():
+            mlflow.log_metric("m", 1)
+            mlflow.log_metrics({"a": 1})
+            mlflow.log_params({"p": "v"})
+    queue_log_batch_mock.assert_not_called()
@@ -0,0 +1,49 @@
+import pickle
+import subprocess
+import sys
+import types
+
+from mlflow.utils.lazy_load import LazyLoader
+
+
+def test_lazy_loader_imports_module_on_first_attribute_access():
+    module_globals = {}
+    placeholder = LazyLoader("json_module", module_globals, "json")
+    module_globals["json_module"] = placeholder
+    assert isinstance(placeholder, types.ModuleType)
+    assert placeholder.dumps({"a": 1}) == '{"a": 1}'
+    # The placeholder is replaced by the module, and keeps delegating to it
+    import json
+
+    assert module_globals["json_module"] is json
+    assert placeholder.loads is json.loads
+
+
+def test_lazy_loader_can_be_pickled_as_module():
+    placeholder = LazyLoader("json_module", {}, "json")
+    import json
+
+    assert pickle.loads(pickle.dumps(placeholder)) is json
+
+
+def test_import_mlflow_does_not_import_flavors_or_pandas():
+    code = (
+        "import sys, mlflow;"
+        "print(','.join(m for m in ['pandas', 'numpy', 'mlflow.sklearn', 'mlflow.pyfunc',"
+        " 'mlflow.models'] if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+    assert output.strip() == ""
+
+
+def test_flavors_are_imported_on_first_access():
+    code = (
+        "import sys, mlflow;"
+        "from mlflow import sklearn;"
+        "assert 'mlflow.sklearn' not in sys.modules;"
+        "assert sklearn.FLAVOR_NAME == 'sklearn';"
+        "assert mlflow.sklearn is sys.modules['mlflow.sklearn'];"
+        "assert mlflow.pyfunc.FLAVOR_NAME == 'python_function';"
+        "assert mlflow.pyfunc is sys.modules['mlflow.pyfunc']"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
@@ -0,0 +1,126 @@
+import math
+import sqlite3
+
+import numpy as np
+import pytest
+
+from mlflow.entities import Metric
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ErrorCode, INVALID_PARAMETER_VALUE
+from mlflow.utils import metric_sampling
+from mlflow.utils.metric_sampling import (
+    EVERY_NTH,
+    LTTB,
+    MIN_MAX,
+    SAMPLING_METHODS,
+    sample_indices,
+    sample_metric_history,
+    validate_sampling,
+)
+
+
+@pytest.mark.parametrize(
+    "max_results, sampling, expected",
+    [(None, None, None), (10, None, LTTB), (10, MIN_MAX, MIN_MAX), (1, EVERY_NTH, EVERY_NTH)],
+)
+def test_validate_sampling(max_results, sampling, expected):
+    assert validate_sampling(max_results, sampling) == expected
+
+
+@pytest.mark.parametrize(
+    "max_results, sampling, error_message",
+    [
+        (None, LTTB, "without max_results"),
+        (10, "median", "Invalid sampling method 'median'"),
+        (2, LTTB, "It must be an integer of at least 3, but got value 2"),
+        (1, MIN_MAX, "It must be an integer of at least 2, but got value 1"),
+        (0, EVERY_NTH, "It must be an integer of at least 1, but got value 0"),
+        ("10", EVERY_NTH, "It must be an integer of at least 1"),
+    ],
+)
+def test_validate_sampling_rejects_invalid_arguments(max_results, sampling, error_message):
+    with pytest.raises(MlflowException, match=error_message) as e:
+        validate_sampling(max_results, sampling)
+    assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+@pytest.mark.parametrize("num_values", [10, 11, 99, 100, 1001])
+@pytest.mark.parametrize("num_buckets", [1, 3, 10])
+def test_ntile_matches_sql(num_values, num_buckets):
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (i INTEGER)")
+    connection.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(num_values)])
+    expected = [
+        bucket - 1
+        for bucket, in connection.execute(
+            "SELECT NTILE({}) OVER (ORDER BY i) FROM t ORDER BY i".format(num_buckets)
+        )
+    ]
+    connection.close()
+    assert metric_sampling._ntile(num_values, num_buckets).tolist() == expected
+
+
+def test_every_nth():
+    values = np.arange(100, dtype=np.float64)
+    assert sample_indices(values, values, 10, EVERY_NTH).tolist() == list(range(0, 100, 10))
+    assert sample_indices(values, values, 30, EVERY_NTH).tolist() == list(range(0, 100, 4))
+    assert sample_indices(values, values, 1, EVERY_NTH).tolist() == [0]
+
+
+def test_min_max_keeps_extremes_of_each_bucket():
+    steps = np.arange(12, dtype=np.float64)
+    values = np.array([3, 1, 2, 5, float("nan"), 5, 4, 4, 4, float("nan"), float("nan"), 7.0])
+    # Buckets of 3 values: the largest of the second bucket is its first 5, NaN is only kept for
+    # the last bucket, which has no other value, and ties are broken by position
+    assert sample_indices(steps, values, 8, MIN_MAX).tolist() == [0, 1, 3, 6, 11]
+    # An odd number of results is rounded down to a number of buckets
+    assert sample_indices(steps, values, 9, MIN_MAX).tolist() == [0, 1, 3, 6, 11]
+    # Buckets of 4 values
+    assert sample_indices(steps, values, 7, MIN_MAX).tolist() == [1, 3, 5, 6, 8, 11]
+    assert sample_indices(steps, values, 2, MIN_MAX).tolist() == [1, 11]
+
+
+def test_lttb_keeps_first_last_and_spikes():
+    steps = np.arange(1000, dtype=np.float64)
+    values = np.sin(steps / 50)
+    values[333] = 10
+    values[777] = -10
+    indices = sample_indices(steps, values, 50, LTTB)
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+    assert 333 in indices and 777 in indices
+
+
+def test_lttb_handles_non_finite_values():
+    steps = np.arange(100, dtype=np.float64)
+    values = np.ones(100)
+    values[[10, 50]] = float("nan")
+    values[[20, 60]] = float("inf")
+    values[70] = -float("inf")
+    indices = sample_indices(steps, values, 10, LTTB)
+    assert len(indices) == 10
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize("sampling", SAMPLING_METHODS)
+@pytest.mark.parametrize("max_results", [3, 4, 17, 100, 999])
+def test_sample_indices_returns_at_most_max_results(sampling, max_results):
+    steps = np.sort(np.random.RandomState(0).randint(0, 500, 1000)).astype(np.float64)
+    values = np.random.RandomState(1).standard_normal(1000)
+    indices = sample_indices(steps, values, max_results, sampling)
+    assert 0 < len(indices) <= max_results
+    assert np.all(np.diff(indices) > 0)
+    assert indices[0] >= 0 and indices[-1] < 1000
+
+
+def test_sample_metric_history():
+    history = [Metric("m", float(i % 7), 1000 - i, i // 2) for i in reversed(range(100))]
+    assert sample_metric_history(history, None, None) == sorted(
+        history, key=lambda m: (m.step, m.timestamp)
+    )
+    assert len(sample_metric_history(history, 100, LTTB)) == 100
+
+    sampled = sample_metric_history(history, 10, EVERY_NTH)
+    assert [(m.step, m.timestamp) for m in sampled] == [(i, 999 - 2 * i) for i in range(0, 50, 5)]
+    assert all(isinstance(m, Metric) and not math.isnan(m.value) for m in sampled)
@@ -1,8 +1,16 @@
 #!/usr/bin/env python
 
+import gzip
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 import numpy
 import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from mlflow.exceptions import MlflowException, RestException
 from mlflow.pyfunc.scoring_server import NumpyEncoder
@@ -12,13 +20,14 @@ from mlflow.utils.rest_utils import (
     MlflowHostCreds,
     _DEFAULT_HEADERS,
     call_endpoint,
+    _JitteredRetry,
 )
-from mlflow.protos.service_pb2 import GetRun
+from mlflow.protos.service_pb2 import GetRun, LogBatch, Metric
 from tests import helper_functions
 
 
 def test_well_formed_json_error_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 400
@@ -31,7 +40,7 @@ def test_well_formed_json_error_response():
 
 
 def test_non_json_ok_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 200
@@ -56,7 +65,7 @@ def test_non_json_ok_response():
     ],
 )
 def test_malformed_json_error_response(response_mock):
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         request_mock.return_value = response_mock
 
@@ -65,7 +74,7 @@ def test_malformed_json_error_response(response_mock):
             call_endpoint(host_only, "/my/endpoint", "GET", "", response_proto)
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_hostonly(request):
     host_only = MlflowHostCreds("http://my-host")
     response = mock.MagicMock()
@@ -77,7 +86,7 @@ def test_http_request_hostonly(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_cleans_hostname(request):
     # Add a trailing slash, should be removed.
     host_only = MlflowHostCreds("http://my-host/")
@@ -90,7 +99,7 @@ def test_http_request_cleans_hostname(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_basic_auth(request):
     host_only = MlflowHostCreds("http://my-host", username="user", password="pass")
     response = mock.MagicMock()
@@ -104,7 +113,7 @@ def test_http_request_with_basic_auth(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_token(request):
     host_only = MlflowHostCreds("http://my-host", token="my-token")
     response = mock.MagicMock()
@@ -118,7 +127,7 @@ def test_http_request_with_token(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_insecure(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -130,7 +139,7 @@ def test_http_request_with_insecure(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_client_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", client_cert_path="/some/path")
     response = mock.MagicMock()
@@ -142,7 +151,7 @@ def test_http_request_client_cert_path(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_server_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", server_cert_path="/some/path")
     response = mock.MagicMock()
@@ -161,37 +170,204 @@ def test_ignore_tls_verification_not_server_cert_path():
         )
 
 
-@mock.patch("requests.request")
-def test_429_retries(request):
-    host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
+class _ScriptedRequestHandler(BaseHTTPRequestHandler):
+    # Use HTTP/1.1 so that connections are kept alive between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def _respond(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append((self.client_address, dict(self.headers), body))
+        status_code = self.server.status_codes.pop(0) if self.server.status_codes else 200
+        response_body = self.server.response_body
+        self.send_response(status_code)
+        for name, value in self.server.response_headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def scripted_server():
+    """
+    Local HTTP server that responds with the status codes appended to ``status_codes``, then with
+    200, and records the requests it receives.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedRequestHandler)
+    server.daemon_threads = True
+    server.status_codes = []
+    server.requests = []
+    server.response_body = b"{}"
+    server.response_headers = {}
+    server.host_creds = MlflowHostCreds("http://127.0.0.1:%s" % server.server_port)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_request_retries_transient_errors(scripted_server):
+    creds = scripted_server.host_creds
+    scripted_server.status_codes = [429, 503, 500]
+    response = http_request(creds, "/my/endpoint", method="GET", max_retries=3, backoff_factor=0)
+    assert response.status_code == 200
+    assert len(scripted_server.requests) == 4
+    # Errors that are not transient are not retried
+    scripted_server.status_codes = [404]
+    response = http_request(creds, "/my/endpoint", method="POST", backoff_factor=0)
+    assert response.status_code == 404
+    assert len(scripted_server.requests) == 5
+    # Transient errors are retried regardless of the HTTP method
+    scripted_server.status_codes = [503]
+    response = http_request(creds, "/my/endpoint", method="POST", backoff_factor=0)
+    assert response.status_code == 200
+    assert len(scripted_server.requests) == 7
+
+
+def test_http_request_fails_after_max_retries(scripted_server):
+    creds = scripted_server.host_creds
+    scripted_server.status_codes = [503, 503, 503]
+    with pytest.raises(MlflowException, match="failed to return code 200 after 3 tries"):
+        http_request(creds, "/my/endpoint", method="GET", max_retries=2, backoff_factor=0)
+    assert len(scripted_server.requests) == 3
+    # The last rate-limited response is returned once retries are exhausted
+    scripted_server.status_codes = [429, 429]
+    response = http_request(creds, "/my/endpoint", method="GET", max_retries=1, backoff_factor=0)
+    assert response.status_code == 429
+
+
+@mock.patch("requests.Session.request")
+def test_http_request_accepts_deprecated_retry_arguments(request):
+    request.return_value = mock.MagicMock(status_code=200)
+    with mock.patch("mlflow.utils.rest_utils._get_request_session") as get_request_session:
+        get_request_session.return_value = requests.Session()
+        with pytest.warns(FutureWarning, match="deprecated"):
+            http_request(
+                MlflowHostCreds("http://my-host"),
+                "/my/endpoint",
+                retries=3,
+                retry_interval=1,
+                max_rate_limit_interval=60,
+            )
+    get_request_session.assert_called_once_with(2, 1, frozenset([429, 500, 502, 503, 504]))
+    request.assert_called_once_with(
+        url="http://my-host/my/endpoint", verify=True, headers=_DEFAULT_HEADERS
+    )
+
 
-    class MockedResponse(object):
-        def __init__(self, status_code):
-            self.status_code = status_code
-            self.text = "mocked text"
-
-    request.side_effect = [MockedResponse(x) for x in (429, 200)]
-    assert http_request(host_only, "/my/endpoint", max_rate_limit_interval=0).status_code == 429
-    request.side_effect = [MockedResponse(x) for x in (429, 200)]
-    assert http_request(host_only, "/my/endpoint", max_rate_limit_interval=1).status_code == 200
-    request.side_effect = [MockedResponse(x) for x in (429, 429, 200)]
-    assert http_request(host_only, "/my/endpoint", max_rate_limit_interval=1).status_code == 429
-    request.side_effect = [MockedResponse(x) for x in (429, 429, 200)]
-    assert http_request(host_only, "/my/endpoint", max_rate_limit_interval=2).status_code == 200
-    request.side_effect = [MockedResponse(x) for x in (429, 429, 200)]
-    assert http_request(host_only, "/my/endpoint", max_rate_limit_interval=3).status_code == 200
-    # Test that any non 429 code is returned
-    request.side_effect = [MockedResponse(x) for x in (429, 404, 429, 200)]
-    assert http_request(host_only, "/my/endpoint").status_code == 404
-    # Test that retries work as expected
-    request.side_effect = [MockedResponse(x) for x in (429, 503, 429, 200)]
-    with pytest.raises(MlflowException, match="failed to return code 200"):
-        http_request(host_only, "/my/endpoint", retries=1)
-    request.side_effect = [MockedResponse(x) for x in (429, 503, 429, 200)]
-    assert http_request(host_only, "/my/endpoint", retries=2).status_code == 200
-
-
-@mock.patch("requests.request")
+def test_http_request_reuses_connections(scripted_server):
+    for _ in range(10):
+        http_request(scripted_server.host_creds, "/my/endpoint", method="GET")
+    client_addresses = {client_address for client_address, _, _ in scripted_server.requests}
+    assert len(client_addresses) == 1
+
+
+def test_http_request_sends_cookies_back_to_their_host(scripted_server):
+    scripted_server.response_headers = {"Set-Cookie": "mlflow_read_primary_until=1005; Path=/"}
+    http_request(scripted_server.host_creds, "/my/endpoint", method="POST")
+    scripted_server.response_headers = {}
+    http_request(scripted_server.host_creds, "/my/endpoint", method="GET")
+    (_, first_headers, _), (_, second_headers, _) = scripted_server.requests
+    assert "Cookie" not in first_headers
+    assert second_headers["Cookie"] == "mlflow_read_primary_until=1005"
+
+
+def test_call_endpoint_compresses_large_request_bodies(scripted_server):
+    body = {"run_id": "123", "metrics": [{"key": "m", "value": 1}] * 100}
+    with mock.patch.dict(os.environ, {"MLFLOW_HTTP_REQUEST_GZIP_MIN_SIZE": "1000"}):
+        call_endpoint(
+            scripted_server.host_creds,
+            "/my/endpoint",
+            "POST",
+            json.dumps(body),
+            LogBatch.Response(),
+        )
+        call_endpoint(
+            scripted_server.host_creds, "/my/endpoint", "POST", '{"run_id": "1"}', GetRun.Response()
+        )
+    (_, large_headers, large_body), (_, small_headers, small_body) = scripted_server.requests
+    assert large_headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(large_body)) == body
+    assert "Content-Encoding" not in small_headers
+    assert json.loads(small_body) == {"run_id": "1"}
+
+
+def test_http_request_decodes_compressed_responses(scripted_server):
+    scripted_server.response_body = gzip.compress(b'{"key": "value"}')
+    scripted_server.response_headers = {"Content-Encoding": "gzip"}
+    response = http_request(scripted_server.host_creds, "/my/endpoint", method="GET")
+    assert response.json() == {"key": "value"}
+    ((_, headers, _),) = scripted_server.requests
+    assert "gzip" in headers["Accept-Encoding"]
+
+
+def test_call_endpoint_uses_protobuf_once_advertised():
+    creds = MlflowHostCreds("http://my-host")
+    endpoint = "/api/2.0/mlflow/runs/get"
+    request_message = LogBatch(run_id="1", metrics=[Metric(key="m", value=1.0)])
+    json_response = mock.MagicMock(status_code=200, text='{"run": {"info": {"run_id": "1"}}}')
+    json_response.headers = {
+        "Content-Type": "application/json",
+        "X-MLflow-Content-Types": "application/json, application/x-protobuf",
+    }
+    protobuf_response = mock.MagicMock(status_code=200)
+    protobuf_response.content = GetRun.Response(run={"info": {"run_id": "2"}}).SerializeToString()
+    protobuf_response.headers = {"Content-Type": "application/x-protobuf"}
+
+    with mock.patch("requests.Session.request") as request, mock.patch(
+        "mlflow.utils.rest_utils._protobuf_hosts", set()
+    ):
+        request.side_effect = [json_response, protobuf_response, json_response]
+        responses = [
+            call_endpoint(creds, endpoint, "POST", request_message, GetRun.Response())
+            for _ in range(2)
+        ]
+        with mock.patch.dict(os.environ, {"MLFLOW_HTTP_REQUEST_PROTOBUF": "false"}):
+            call_endpoint(creds, endpoint, "POST", request_message, GetRun.Response())
+
+    assert [response.run.info.run_id for response in responses] == ["1", "2"]
+    (_, first), (_, second), (_, third) = request.call_args_list
+    # JSON bodies are sent until the server advertises protobuf ones
+    for kwargs in [first, third]:
+        assert kwargs["json"] == {"run_id": "1", "metrics": [{"key": "m", "value": 1.0}]}
+        assert "Accept" not in kwargs["headers"]
+    assert second["data"] == request_message.SerializeToString()
+    assert second["headers"]["Content-Type"] == "application/x-protobuf"
+    assert second["headers"]["Accept"] == "application/x-protobuf"
+
+
+def test_jittered_retry_only_retries_read_errors_of_idempotent_methods():
+    retry = _JitteredRetry(total=5, read=5, status_forcelist=[503])
+    error = ReadTimeoutError(None, "/my/endpoint", "Read timed out")
+    assert retry.increment(method="GET", url="/my/endpoint", error=error).read == 4
+    with pytest.raises(ReadTimeoutError):
+        retry.increment(method="POST", url="/my/endpoint", error=error)
+    assert retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 404)
+
+
+def test_jittered_retry_backoff_time():
+    retry = _JitteredRetry(total=5, backoff_factor=1)
+    for _ in range(3):
+        retry = retry.increment(method="GET", url="/my/endpoint")
+    backoff_times = [retry.get_backoff_time() for _ in range(100)]
+    max_backoff_time = Retry.get_backoff_time(retry)
+    assert all(max_backoff_time / 2 <= t <= max_backoff_time for t in backoff_times)
+    assert len(set(backoff_times)) > 1
+
+
+@mock.patch("requests.Session.request")
 def test_http_request_wrapper(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -544,6 +544,81 @@ def test_pagination(page_token, max_results, matching_runs, expected_next_page_t
     assert decoded_next_page_token == expected_next_page_token
 
 
+def _create_run(run_id, start_time, metrics=(), params=()):
+    return Run(
+        run_info=RunInfo(
+            run_uuid=run_id,
+            run_id=run_id,
+            experiment_id=0,
+            user_id="user-id",
+            status=RunStatus.to_string(RunStatus.FINISHED),
+            start_time=start_time,
+            end_time=None,
+            lifecycle_stage=LifecycleStage.ACTIVE,
+        ),
+        run_data=RunData(metrics=list(metrics), params=list(params), tags=[]),
+    )
+
+
+@pytest.mark.parametrize(
+    "order_by, expected_sort_values",
+    [
+        (None, [5, "r"]),
+        (["metrics.m"], [0, 1.5, 5, "r"]),
+        (["metrics.nan", "metrics.missing DESC"], [2, None, 2, None, 5, "r"]),
+        (["metrics.nan DESC", "metrics.missing"], [1, None, 1, None, 5, "r"]),
+        (["params.p DESC", "attributes.start_time"], [0, "v", 0, 5, "r"]),
+    ],
+)
+def test_get_sort_values_for_run(order_by, expected_sort_values):
+    run = _create_run(
+        "r",
+        start_time=5,
+        metrics=[Metric("m", 1.5, 0, 0), Metric("nan", float("nan"), 0, 0)],
+        params=[Param("p", "v")],
+    )
+    assert SearchUtils.get_sort_values_for_run(run, order_by) == expected_sort_values
+    assert SearchUtils.get_sort_key_from_sort_values(
+        order_by, expected_sort_values
+    ) == SearchUtils.get_sort_key_for_runs(order_by)(run)
+
+
+def test_sort_orders_missing_and_nan_values_consistently():
+    runs = [
+        _create_run("nan", 0, metrics=[Metric("m", float("nan"), 0, 0)]),
+        _create_run("missing", 0),
+        _create_run("value", 0, metrics=[Metric("m", 1.0, 0, 0)]),
+    ]
+    assert [r.info.run_id for r in SearchUtils.sort(runs, ["metrics.m"])] == [
+        "value",
+        "missing",
+        "nan",
+    ]
+    assert [r.info.run_id for r in SearchUtils.sort(runs, ["metrics.m DESC"])] == [
+        "value",
+        "nan",
+        "missing",
+    ]
+
+
+def test_search_runs_page_tokens():
+    order_by = ["metrics.m DESC"]
+    token = SearchUtils.create_page_token_for_search_runs([0, 1.5, 5, "r"], order_by)
+    assert SearchUtils.parse_page_token_for_search_runs(token, order_by) == (0, [0, 1.5, 5, "r"])
+    assert SearchUtils.parse_page_token_for_search_runs(None, order_by) == (0, None)
+    assert SearchUtils.parse_page_token_for_search_runs(
+        SearchUtils.create_page_token(7), order_by
+    ) == (7, None)
+
+    with pytest.raises(MlflowException, match="Invalid page token, it was created for"):
+        SearchUtils.parse_page_token_for_search_runs(token, ["metrics.m"])
+    bad_token = base64.b64encode(json.dumps({"after": [0, 1.5], "order_by": order_by}).encode())
+    with pytest.raises(MlflowException, match="Invalid page token"):
+        SearchUtils.parse_page_token_for_search_runs(bad_token, order_by)
+    with pytest.raises(MlflowException, match="Invalid page token"):
+        SearchUtils.parse_start_offset_from_page_token(token)
+
+
 @pytest.mark.parametrize(
     "page_token, error_message",
     [
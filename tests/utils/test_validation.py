@@ -15,6 +15,7 @@ from mlflow.utils.validation import (
     _validate_experiment_artifact_location,
     _validate_db_type_string,
     _validate_experiment_name,
+    _validate_metric_history_bulk_args,
 )
 
 GOOD_METRIC_OR_PARAM_NAMES = [
@@ -205,3 +206,20 @@ def test_db_type():
         with pytest.raises(MlflowException) as e:
             _validate_db_type_string(db_type)
         assert "Invalid database engine" in e.value.message
+
+
+def test_validate_metric_history_bulk_args():
+    _validate_metric_history_bulk_args(["a"] * 1000, ["m"] * 100, None, None)
+    _validate_metric_history_bulk_args(["a"], ["m"], 3, 3)
+    for run_ids, metric_keys, start_step, end_step, error_message in [
+        ([], ["m"], None, None, "between 1 and 1000 run IDs. Got 0 run IDs"),
+        (["a"] * 1001, ["m"], None, None, "between 1 and 1000 run IDs. Got 1001 run IDs"),
+        (["a"], None, None, None, "between 1 and 100 metric keys. Got 0 metric keys"),
+        (["a"], ["m"] * 101, None, None, "between 1 and 100 metric keys. Got 101 metric keys"),
+        (["a/b"], ["m"], None, None, "Invalid run ID"),
+        (["a"], ["../m"], None, None, "Invalid metric name"),
+        (["a"], ["m"], 3, 2, "start_step 3 is greater than end_step 2"),
+    ]:
+        with pytest.raises(MlflowException, match=error_message) as e:
+            _validate_metric_history_bulk_args(run_ids, metric_keys, start_step, end_step)
+        assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)